@@ -22,8 +22,11 @@ Features:
 - Extracts 5 key metrics: parallelizable, dynamic, sequential, tool_intensive, complexity
 """
 
+import json
 import logging
-import subprocess
+import threading
+import time
+import urllib.request
 from dataclasses import dataclass
 from typing import Any, Literal
 
@@ -37,6 +40,33 @@ logger = logging.getLogger(__name__)
 
 ArchitectureType = Literal["single", "independent", "centralized", "decentralized", "hybrid"]
 
+OLLAMA_HOST = "localhost:11434"
+BITNET_INDICATORS = ("bitnet", "b1.58", "1bit")
+INVENTORY_TTL_S = 300.0
+
+_inventory_lock = threading.Lock()
+_inventory: tuple[float, list[str]] | None = None
+
+
+def ollama_model_inventory(max_age_s: float = INVENTORY_TTL_S, timeout_s: float = 1.0) -> list[str]:
+    """Names of the locally installed Ollama models, cached process-wide for ``max_age_s``.
+
+    Reads Ollama's ``/api/tags`` endpoint once instead of spawning
+    ``ollama list``; an unreachable server yields an empty (also cached)
+    inventory.
+    """
+    global _inventory
+    with _inventory_lock:
+        if _inventory is not None and time.monotonic() - _inventory[0] < max_age_s:
+            return list(_inventory[1])
+        try:
+            with urllib.request.urlopen(f"http://{OLLAMA_HOST}/api/tags", timeout=timeout_s) as response:
+                models = [entry.get("name", "") for entry in json.load(response).get("models", [])]
+        except (OSError, ValueError):
+            models = []
+        _inventory = (time.monotonic(), models)
+        return list(models)
+
 
 @dataclass
 class TaskAnalysis:
@@ -71,77 +101,62 @@ class BitNetOptimizer:
     """
 
     def __init__(self):
-        """Initialize the BitNet optimizer."""
+        """Initialize the BitNet optimizer.
+
+        Model discovery is deferred until the first analysis and reads the
+        process-wide Ollama model inventory instead of running ``ollama list``.
+        """
         self.selector = ArchitectureSelector()
-        self.bitnet_available = self._check_bitnet_availability()
-        self.model_path = self._locate_1bit_model()
+        self._model_path: str | None = None
+        self._bitnet_available: bool | None = None
 
         # Model configurations
         self.models = {
             "bitnet": {
-                "model": self.model_path,
+                "model": None,
                 "max_tokens": 100,
                 "temperature": 0.1,  # Lower temperature for consistent analysis
-                "host": "localhost:11434"
+                "host": OLLAMA_HOST
             },
             "fallback": {
                 "model": "llama3.1:8b",
                 "max_tokens": 200,
                 "temperature": 0.3,
-                "host": "localhost:11434"
+                "host": OLLAMA_HOST
             }
         }
 
-        logger.info(f"BitNet Optimizer initialized - BitNet available: {self.bitnet_available}")
+    @property
+    def bitnet_available(self) -> bool:
+        """Whether a 1-bit model is installed, resolved on first use."""
+        if self._bitnet_available is None:
+            models = ollama_model_inventory()
+            self._bitnet_available = any(
+                indicator in name.lower() for name in models for indicator in BITNET_INDICATORS + ("gguf",)
+            )
+            self._model_path = self._locate_1bit_model(models)
+            self.models["bitnet"]["model"] = self._model_path
+            logger.info(f"BitNet Optimizer resolved models - BitNet available: {self._bitnet_available}")
+        return self._bitnet_available
 
-    def _check_bitnet_availability(self) -> bool:
-        """Check if 1-bit models are available.
+    @property
+    def model_path(self) -> str | None:
+        """Name of the installed 1-bit model, or None."""
+        return self._model_path if self.bitnet_available else None
 
-        Returns:
-            True if BitNet models are available
-        """
-        try:
-            # Check for common BitNet model names
-            result = subprocess.run(
-                ["ollama", "list"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                models = result.stdout.lower()
-                bitnet_indicators = ["bitnet", "b1.58", "1bit", "gguf"]
-                return any(indicator in models for indicator in bitnet_indicators)
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
-            pass
-        return False
+    @staticmethod
+    def _locate_1bit_model(models: list[str]) -> str | None:
+        """Locate an available 1-bit model.
 
-    def _locate_1bit_model(self) -> str | None:
-        """Locate available 1-bit model.
+        Args:
+            models: Installed model names from the inventory
 
         Returns:
             Model name for 1-bit model or None
         """
-        if not self.bitnet_available:
-            return None
-
-        try:
-            result = subprocess.run(
-                ["ollama", "list"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                lines = result.stdout.split('\n')
-                for line in lines:
-                    if any(indicator in line.lower() for indicator in ["bitnet", "b1.58", "1bit"]):
-                        # Extract model name from line like "llama3.1:8b-bitnet"
-                        parts = line.split()
-                        if parts:
-                            return parts[0]
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
-            pass
+        for name in models:
+            if any(indicator in name.lower() for indicator in BITNET_INDICATORS):
+                return name
         return None
 
     def analyze_task_characteristics(self, user_query: str) -> dict[str, float]:
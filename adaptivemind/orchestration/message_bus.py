@@ -13,6 +13,11 @@ from __future__ import annotations
 import asyncio
 from typing import Any
 
+try:
+    from adaptivemind_core.monitoring.memory import register_buffer
+except ImportError:  # pragma: no cover - usable without the core runtime
+    register_buffer = None
+
 
 class HierarchicalMessageBus:
     """A minimal hierarchical message bus for tests.
@@ -24,6 +29,8 @@ class HierarchicalMessageBus:
     """
     def __init__(self) -> None:
         self._messages: list[tuple[str, Any]] = []
+        if register_buffer is not None:
+            register_buffer("orchestration.message_bus", self, lambda bus: bus._messages)
 
     async def publish(self, event: str, payload: Any, run_id: str | None = None, step_id: str | None = None, parent_id: str | None = None) -> None:
         # Simple asynchronous no-op that stores messages locally for introspection
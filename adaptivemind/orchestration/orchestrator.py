@@ -35,6 +35,7 @@ Features:
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
 from collections import defaultdict
@@ -55,6 +56,13 @@ from .message_bus import HierarchicalMessageBus
 from .path_memory import PathMemory
 from .semantic_cache import SemanticCache
 
+try:
+    from adaptivemind_core.monitoring.memory import register_buffer
+    from adaptivemind_core.monitoring.tracing import get_tracer
+except ImportError:  # pragma: no cover - orchestration can run without the core runtime
+    get_tracer = None
+    register_buffer = None
+
 
 @dataclass
 class AgentSpec:
@@ -90,6 +98,30 @@ logger = logging.getLogger(__name__)
 # Placeholder constant re-exported by adaptivemind.orchestration.__init__
 END = object()
 
+
+def _traced(span_name: str, target_attribute: str | None = None):
+    """Wrap an async orchestrator method in a tracing span.
+
+    When ``target_attribute`` is given, the method's first positional
+    argument (specialist or child orchestrator name) is recorded under it.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            if get_tracer is None:
+                return await func(self, *args, **kwargs)
+            attributes = {"orchestrator": type(self).__name__}
+            if target_attribute and args:
+                attributes[target_attribute] = str(args[0])
+            with get_tracer().span(span_name, attributes):
+                return await func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
 # ---------------------------------------------------------------------------
 # Orchestrator template and context structures
 # ---------------------------------------------------------------------------
@@ -212,6 +244,10 @@ class MultiAgentOrchestrator(OrchestratorTemplate):
         self.budgets = budgets or {}
         self.performance_tracker = performance_tracker or PerformanceTracker()
         self.critic = ConstitutionalCritic(mcp_client=self.mcp_client)
+        if register_buffer is not None:
+            register_buffer("orchestration.task_history", self, lambda orchestrator: orchestrator.task_history)
+            register_buffer("orchestration.exploration_stats", self, lambda orchestrator: orchestrator.exploration_stats)
+            register_buffer("orchestration.active_collaborations", self, lambda orchestrator: orchestrator.active_collaborations)
 
     async def log_event(
         self,
@@ -292,6 +328,7 @@ class MultiAgentOrchestrator(OrchestratorTemplate):
         """List identifiers of active child orchestrators."""
         return list(self.child_orchestrators.keys())
 
+    @_traced("orchestrator.child", "child")
     async def run_child_orchestrator(
         self,
         name: str,
@@ -378,6 +415,7 @@ JSON Response:
             logger.error(f"Failed to analyze request complexity: {e}")
             return {"specialists_needed": [], "complexity": "unknown"}
 
+    @_traced("orchestrator.coordinate")
     async def coordinate_specialists(
         self,
         request: str,
@@ -438,6 +476,7 @@ JSON Response:
         path_memory.record(score)
         return result
 
+    @_traced("orchestrator.dispatch", "specialist")
     async def dispatch_specialist(
         self,
         specialist_type: str,
@@ -12,6 +12,11 @@ from __future__ import annotations
 
 from typing import Any
 
+try:
+    from adaptivemind_core.monitoring.memory import register_buffer
+except ImportError:  # pragma: no cover - usable without the core runtime
+    register_buffer = None
+
 
 class SemanticCache:
     """A minimal in-memory semantic cache used during tests.
@@ -19,6 +24,8 @@ class SemanticCache:
     """
     def __init__(self):
         self._cache: dict[str, Any] = {}
+        if register_buffer is not None:
+            register_buffer("orchestration.semantic_cache", self, lambda cache: cache._cache)
 
     def get(self, key: str) -> Any:
         return self._cache.get(key)
@@ -8,7 +8,27 @@
 
 
 
-from .app import AdaptiveMindApplication
-from .server import build_app
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .app import AdaptiveMindApplication
+    from .server import build_app
+
+# Resolved on first access so importing a submodule (config, monitoring, ...)
+# does not pay for FastAPI and every backend client.
+_LAZY_ATTRIBUTES = {"AdaptiveMindApplication": ".app", "build_app": ".server"}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = ["AdaptiveMindApplication", "build_app"]
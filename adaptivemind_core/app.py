@@ -20,19 +20,30 @@ from __future__ import annotations
 
 import threading
 import time
-from collections.abc import Iterable, Iterator
+from collections.abc import AsyncIterable, Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import asdict
+from pathlib import Path
 from typing import Any
 
-from .config import AppConfig, load_config
+from .config import AppConfig, PersonaConfig, load_config
 from .context.engine import ContextEngine
+from .context.sessions import SessionStore
+from .ingest import IngestPipeline
+from .jobs import JobContext, JobQueue
+from .llm.cassette import Cassette, CassetteWriter, RecordingBackend, ReplayBackend
 from .llm.fallback import ContextualFallbackLLM
-from .llm.ollama import OllamaBackend
-from .llm.openrouter import OpenRouterBackend
-from .llm.windowsml import WindowsMLBackend
-from .logger import get_logger
-from .monitoring.metrics import MetricsRegistry, TraceCollector
+from .llm.lazy import LazyBackend
+from .logger import get_logger, logging_stats
+from .monitoring.exposition import render_openmetrics
+from .monitoring.archive import TraceArchive
+from .monitoring.memory import configure_memory_diagnostics, get_buffer_registry, register_buffer
+from .monitoring.metrics import MetricsRegistry, TraceCollector, TraceRecord, combine_states
+from .monitoring.profiler import StackSampler
+from .monitoring.tracing import configure_tracing
+from .routing.degradation import DegradationController
 from .routing.router import AdaptiveLLMRouter
+from .shared_state import SharedStateStore
 
 logger = get_logger(__name__)
 
@@ -60,9 +71,16 @@ class AdaptiveMindApplication:
         config: Application configuration containing all settings
         metrics: Registry for collecting and tracking performance metrics
         traces: Collector for request tracing and diagnostics
+        shared: Store shared with the other server workers, when running several
+        tracer: Span tracer with head/tail sampling and optional OTLP export
         context_engine: Engine for processing and managing context
+        sessions: Store of server-side conversation sessions
         backends: List of configured LLM backends
+        cassette_writer: Destination of recorded backend exchanges in cassette record mode
+        degradation: Controller lowering per-persona request fidelity while latency objectives are missed
         router: Adaptive router for backend selection
+        jobs: Queue running chat and workflow jobs in the background, in this
+              process or, with ``jobs.broker_url``, on any worker sharing the broker
         _harvester_thread: Background thread for metrics harvesting
         _stop_harvest: Event to signal harvester thread to stop
         _start_time: Application startup timestamp
@@ -80,18 +98,43 @@ class AdaptiveMindApplication:
 
         # Initialize core components
         self.metrics = MetricsRegistry()
-        self.traces = TraceCollector()
+        self.archive: TraceArchive | None = None
+        if self.config.monitoring.archive.directory is not None:
+            self.archive = TraceArchive(self.config.monitoring.archive)
+        self.shared: SharedStateStore | None = None
+        self._config_version = 0
+        self._config_lock = threading.RLock()
+        if self.config.shared_state.path is not None:
+            self.shared = SharedStateStore(self.config.shared_state, self.metrics.export_state)
+        sinks = [sink.append_trace for sink in (self.archive, self.shared) if sink is not None]
+        self.traces = TraceCollector(sink=self._fan_out(sinks) if len(sinks) > 1 else (sinks[0] if sinks else None))
+        self.tracer = configure_tracing(self.config.tracing)
+        self.profiler = StackSampler(self.config.monitoring.profiler)
+        self.memory = configure_memory_diagnostics(self.config.monitoring.memory)
+        register_buffer("logging.queue", self, lambda app: logging_stats()["queue_depth"])
         self.context_engine = ContextEngine(self.config)
+        self.sessions = SessionStore(self.config.sessions, self.config.context_pipeline.compaction)
 
         # Build and configure backend services
+        self.cassette_writer: CassetteWriter | None = None
         self.backends = self._build_backends()
+        self.degradation = DegradationController(self.config.degradation, self.metrics)
         self.router = AdaptiveLLMRouter(
             config=self.config,
             context_engine=self.context_engine,
             backends=self.backends,
             metrics=self.metrics,
             traces=self.traces,
+            degradation=self.degradation,
         )
+        job_handlers = {"chat": self._run_chat_job, "workflow": self._run_workflow_job}
+        if self.config.jobs.broker_url:
+            from .job_broker import RedisJobQueue
+
+            self.jobs: JobQueue | RedisJobQueue = RedisJobQueue(self.config.jobs, self.metrics, job_handlers)
+        else:
+            self.jobs = JobQueue(self.config.jobs, self.metrics, job_handlers)
+        self.ingest = IngestPipeline(self.config.ingest, self.context_engine.documents)
 
         # Initialize background metrics harvesting
         self._harvester_thread: threading.Thread | None = None
@@ -101,6 +144,9 @@ class AdaptiveMindApplication:
         if self.config.monitoring.enable_metrics_harvest:
             self._start_harvest_loop()
 
+        # A worker started after runtime changes catches up before serving
+        self._follow_shared_config(force=True)
+
     def _build_backends(self) -> list:
         """Build and configure all available LLM backends.
 
@@ -110,27 +156,51 @@ class AdaptiveMindApplication:
         - WindowsMLBackend for local ONNX models
         - ContextualFallbackLLM for fallback operations
 
+        The model backends are wrapped in LazyBackend, so their modules and
+        client libraries are only imported when a backend is first probed or
+        used.
+
+        In cassette ``record`` mode the model backends are wrapped to record
+        their exchanges; in ``replay`` mode they are replaced by a single
+        backend answering from the cassette.
+
         Returns:
             List of configured backend instances
         """
+        cassette = self.config.cassette
+        if cassette.mode == "replay":
+            replay = ReplayBackend(Cassette.load(cassette.path, cassette.fallbacks), cassette.timing_scale)
+            logger.info("Replaying backend cassette", extra={"path": str(cassette.path), "exchanges": len(replay.cassette)})
+            return [replay, ContextualFallbackLLM()]
         backends = [
-            OllamaBackend(
+            LazyBackend.of(
+                "ollama",
+                ".ollama:OllamaBackend",
                 host=self.config.ollama.host,
                 model=self.config.ollama.model,
                 timeout=self.config.ollama.timeout,
             ),
-            OpenRouterBackend(
+            LazyBackend.of(
+                "openrouter",
+                ".openrouter:OpenRouterBackend",
                 api_key=self.config.openrouter.api_key,
                 model=self.config.openrouter.model,
                 site_url=self.config.openrouter.site_url,
                 app_name=self.config.openrouter.app_name,
+                base_url=self.config.openrouter.base_url,
             ),
-            WindowsMLBackend(
+            LazyBackend.of(
+                "windowsml",
+                ".windowsml:WindowsMLBackend",
                 model_path=self.config.windowsml.model_path,
                 device_preference=self.config.windowsml.device_preference,
             ),
             ContextualFallbackLLM(),
         ]
+        if cassette.mode == "record":
+            self.cassette_writer = CassetteWriter(cassette.path)
+            logger.info("Recording backend exchanges", extra={"path": str(cassette.path)})
+            backends = [RecordingBackend(backend, self.cassette_writer) for backend in backends[:-1]] + backends[-1:]
         return backends
 
     def _start_harvest_loop(self) -> None:
@@ -148,6 +218,14 @@ class AdaptiveMindApplication:
             while not self._stop_harvest.wait(interval):
                 # Collect metrics snapshot
                 snapshot = self.metrics.harvest()
+                if self.archive is not None:
+                    self.archive.append_snapshot(snapshot)
+                # Refresh availability gauges off the scrape path
+                for backend in self.backends:
+                    try:
+                        self._probe_backend(backend)
+                    except Exception:
+                        logger.debug("Backend availability probe failed", extra={"backend": backend.name})
 
                 # Log detailed metrics for monitoring
                 logger.info(
@@ -159,6 +237,7 @@ class AdaptiveMindApplication:
                         "tokens": snapshot.tokens_generated,
                         "context_tokens": snapshot.context_tokens,
                         "personas": snapshot.personas_used,
+                        "latency_percentiles": snapshot.latency_percentiles.get("total", {}),
                     },
                 )
 
@@ -170,11 +249,107 @@ class AdaptiveMindApplication:
         """Gracefully shutdown the AdaptiveMind application.
 
         Stops the metrics harvesting loop and waits for the harvester
-        thread to finish. Called automatically during application cleanup.
+        thread to finish, then stops background context compaction and
+        closes the span exporter, profiler, memory tracing, trace archive, cassette and
+        shared state store, and stops the job workers and ingestion threads. Called automatically during
+        application cleanup.
         """
         if self._harvester_thread and self._harvester_thread.is_alive():
             self._stop_harvest.set()
             self._harvester_thread.join(timeout=2)
+        self.jobs.shutdown()
+        self.ingest.shutdown()
+        self.context_engine.shutdown()
+        self.tracer.shutdown()
+        self.profiler.stop()
+        self.memory.shutdown()
+        if self.archive is not None:
+            self.archive.close()
+        if self.cassette_writer is not None:
+            self.cassette_writer.close()
+        if self.shared is not None:
+            self.shared.close()
+
+    # Shared state --------------------------------------------------------
+
+    @staticmethod
+    def _fan_out(sinks: list):
+        def _sink(record: TraceRecord) -> None:
+            for sink in sinks:
+                sink(record)
+
+        return _sink
+
+    def _follow_shared_config(self, force: bool = False) -> None:
+        """Apply configuration changes another worker published since the last check."""
+        if self.shared is None or not (self.shared.changed() or force):
+            return
+        with self._config_lock:
+            version, document = self.shared.read_config()
+            if version > self._config_version and document is not None:
+                self._apply_shared_config(document)
+                self._config_version = version
+                self.router.publish()
+
+    @contextmanager
+    def _config_mutation(self):
+        """Serialise a runtime configuration change and publish the result.
+
+        Changes are made one at a time under the configuration lock and become
+        visible to requests together, when the router publishes its next
+        snapshot; a change that raises is not published. With a shared store
+        the change is also made on top of the latest shared version while
+        holding the store's write lock, so changes from different workers
+        never overwrite each other.
+        """
+        with self._config_lock:
+            caught_up = False
+            try:
+                if self.shared is None:
+                    yield
+                else:
+                    with self.shared.config_transaction() as update:
+                        if update.version > self._config_version and update.document is not None:
+                            self._apply_shared_config(update.document)
+                            self._config_version = update.version
+                            caught_up = True
+                        yield
+                        self._config_version = self.shared.publish(update, self._shared_config_document())
+            except BaseException:
+                # Another worker's version applied before the failed change stays in effect
+                if caught_up:
+                    self.router.publish()
+                raise
+            self.router.publish()
+
+    def _shared_config_document(self) -> dict[str, Any]:
+        """The parts of the configuration the management API can change at runtime."""
+        context = self.config.context_pipeline
+        return {
+            "personas": {name: persona.model_dump(mode="json") for name, persona in self.config.personas.items()},
+            "allowed_personas": list(self.config.allowed_personas),
+            "context_pipeline": {
+                "extra_documents_dir": str(context.extra_documents_dir) if context.extra_documents_dir else None,
+                "enable_semantic_chunking": context.enable_semantic_chunking,
+                "max_combined_context_tokens": context.max_combined_context_tokens,
+            },
+        }
+
+    def _apply_shared_config(self, document: dict[str, Any]) -> None:
+        personas = {name: PersonaConfig.model_validate(data) for name, data in document["personas"].items()}
+        for name in set(self.config.personas) - set(personas):
+            del self.config.personas[name]
+            self.context_engine.templates.discard(name)
+        for name, persona in personas.items():
+            if self.config.personas.get(name) != persona:
+                self.config.personas[name] = persona
+                self.context_engine.templates.compile(persona)
+        self.config.allowed_personas[:] = document["allowed_personas"]
+        context = document["context_pipeline"]
+        pipeline = self.config.context_pipeline
+        pipeline.extra_documents_dir = Path(context["extra_documents_dir"]) if context["extra_documents_dir"] else None
+        pipeline.enable_semantic_chunking = context["enable_semantic_chunking"]
+        pipeline.max_combined_context_tokens = context["max_combined_context_tokens"]
 
     # API operations -----------------------------------------------------
 
@@ -208,6 +383,7 @@ class AdaptiveMindApplication:
             - tokens: Number of tokens generated
             - diagnostics: Backend-specific diagnostic information
         """
+        self._follow_shared_config()
         try:
             response = self.router.generate(
                 persona_name=persona,
@@ -222,7 +398,7 @@ class AdaptiveMindApplication:
             # is not enabled. This provides a tolerant compatibility behavior
             # for tests and callers that rely on a default persona.
             if "is not enabled" in str(exc):
-                fallback_persona = next(iter(self.config.personas.keys()))
+                fallback_persona = next(iter(self.router.available_personas()))
                 response = self.router.generate(
                     persona_name=fallback_persona,
                     messages=messages,
@@ -270,6 +446,7 @@ class AdaptiveMindApplication:
             - finished: Whether generation is complete
             - diagnostics: Backend-specific diagnostic information
         """
+        self._follow_shared_config()
         for chunk in self.router.stream(
             persona_name=persona,
             messages=messages,
@@ -286,6 +463,211 @@ class AdaptiveMindApplication:
                 "diagnostics": chunk.diagnostics or {},
             }
 
+    # Job API -----------------------------------------------------------
+
+    def submit_job(
+        self,
+        mode: str,
+        payload: dict[str, Any],
+        callback_url: str | None = None,
+        priority: int | None = None,
+    ) -> dict[str, Any]:
+        """Queue a chat or workflow job to run in the background.
+
+        Args:
+            mode: ``chat`` (payload as for ``chat``: messages, optional persona,
+                  temperature and max_tokens) or ``workflow`` (``steps``, each a
+                  ``prompt`` and optional ``persona``, run in order with the
+                  previous answers as history)
+            payload: Job input
+            callback_url: URL receiving the job's final status as a JSON POST
+            priority: 0 (most urgent) to 9; the configured default when omitted
+
+        Returns:
+            Job description including queue position and estimated start time
+
+        Raises:
+            ValueError: If the mode is unsupported
+            QueueFullError: If the queue is full
+        """
+        return self.jobs.submit(mode, payload, callback_url, priority)
+
+    def job_status(self, job_id: str) -> dict[str, Any]:
+        """Get a job's status, progress and, once finished, its result or error.
+
+        Raises:
+            KeyError: If the job does not exist or its result expired
+        """
+        return self.jobs.status(job_id)
+
+    def cancel_job(self, job_id: str) -> dict[str, Any]:
+        """Cancel a queued or running job.
+
+        Raises:
+            KeyError: If the job does not exist
+            ValueError: If the job already finished
+        """
+        return self.jobs.cancel(job_id)
+
+    async def ingest_stream(self, chunks: AsyncIterable[bytes]) -> dict[str, Any]:
+        """Index the documents of an NDJSON body as it arrives.
+
+        Returns as soon as the body has been read and every item queued;
+        indexing continues in the background.
+
+        Returns:
+            Batch description with its id and the accepted and rejected item counts
+        """
+        return await self.ingest.ingest_stream(chunks)
+
+    def ingest_items(self, items: Iterable[Any]) -> dict[str, Any]:
+        """Queue already parsed documents for indexing as one batch."""
+        return self.ingest.ingest(items)
+
+    def ingest_batch(self, batch_id: str) -> dict[str, Any]:
+        """Get an ingestion batch's indexing progress.
+
+        Raises:
+            KeyError: If the batch is unknown or was forgotten
+        """
+        return self.ingest.batch(batch_id)
+
+    def _default_persona(self) -> str:
+        return self.config.allowed_personas[0] if self.config.allowed_personas else next(iter(self.config.personas))
+
+    def _run_chat_job(self, payload: dict[str, Any], context: JobContext) -> dict[str, Any]:
+        return self.chat(
+            payload.get("persona") or self._default_persona(),
+            payload.get("messages") or [],
+            temperature=payload.get("temperature", 0.7),
+            max_tokens=payload.get("max_tokens", 512),
+            metadata={"objective": "job"},
+        )
+
+    def _run_workflow_job(self, payload: dict[str, Any], context: JobContext) -> dict[str, Any]:
+        steps = payload.get("steps") or []
+        if not steps:
+            raise ValueError("workflow payload needs at least one step")
+        messages = list(payload.get("messages") or [])
+        results = []
+        for index, step in enumerate(steps):
+            if context.cancelled:
+                break
+            messages.append({"role": "user", "content": step["prompt"]})
+            result = self.chat(
+                step.get("persona") or payload.get("persona") or self._default_persona(),
+                messages,
+                temperature=step.get("temperature", payload.get("temperature", 0.7)),
+                max_tokens=step.get("max_tokens", payload.get("max_tokens", 512)),
+                metadata={"objective": "workflow"},
+            )
+            messages.append({"role": "assistant", "content": result["content"]})
+            results.append(result)
+            context.progress(100.0 * (index + 1) / len(steps))
+        return {"content": results[-1]["content"] if results else "", "steps": results}
+
+    # Session API -------------------------------------------------------
+
+    def create_session(self, persona: str, messages: list[dict[str, Any]] | None = None) -> dict[str, Any]:
+        """Create a server-side conversation session.
+
+        Args:
+            persona: Name of the persona the session is bound to
+            messages: Optional initial history to seed the session with
+
+        Returns:
+            Dict describing the created session
+
+        Raises:
+            ValueError: If the persona does not exist
+        """
+        self._follow_shared_config()
+        if persona not in self.config.personas:
+            raise ValueError(f"Persona '{persona}' not found")
+        return self.sessions.create(persona, messages).summary_info()
+
+    def session_chat(
+        self,
+        session_id: str,
+        message: dict[str, Any],
+        temperature: float = 0.7,
+        max_tokens: int = 512,
+        metadata: dict[str, Any] | None = None,
+        external_context: Iterable[str] | None = None,
+    ) -> dict[str, Any]:
+        """Append a message to a session and generate the next reply.
+
+        Only the new message is normalized; the session keeps the rendered
+        conversation so context building cost does not grow with history.
+        The assistant reply is appended to the session as well; if generation
+        fails, the session is left as it was before the call. A session evicted
+        while the reply was generated still gets the reply back, with
+        ``session_expired`` set.
+
+        Args:
+            session_id: Identifier returned by create_session()
+            message: The new message with 'role' and 'content' keys
+            temperature: Controls randomness in generation (0.0-1.0)
+            max_tokens: Maximum number of tokens to generate
+            metadata: Optional metadata to include with the request
+            external_context: Optional iterable of external context strings
+
+        Returns:
+            Dict with the same fields as chat() plus session_id, message_count
+            and session_expired
+
+        Raises:
+            KeyError: If the session does not exist or has expired
+        """
+        self._follow_shared_config()
+        checkpoint = self.sessions.checkpoint(session_id)
+        session = self.sessions.append(session_id, message)
+        try:
+            response = self.router.generate(
+                persona_name=session.persona,
+                messages=session.messages(),
+                temperature=temperature,
+                max_tokens=max_tokens,
+                metadata=metadata,
+                external_context=external_context,
+                session=session,
+            )
+        except Exception:
+            # Without a reply the turn did not happen; a retry must not find it twice
+            self.sessions.restore(session_id, checkpoint)
+            raise
+        expired = False
+        try:
+            self.sessions.append(session_id, {"role": "assistant", "content": response.content})
+        except KeyError:
+            # Evicted during generation; the reply is already paid for, so return it anyway
+            expired = True
+            logger.warning("Session expired while its reply was generated", extra={"session_id": session_id})
+        return {
+            "content": response.content,
+            "model": response.backend,
+            "tokens": response.tokens,
+            "diagnostics": response.diagnostics or {},
+            "session_id": session_id,
+            "message_count": session.message_count,
+            "session_expired": expired,
+        }
+
+    def get_session(self, session_id: str) -> dict[str, Any]:
+        """Get a summary of a conversation session.
+
+        Raises:
+            KeyError: If the session does not exist or has expired
+        """
+        session = self.sessions.get(session_id)
+        if session is None:
+            raise KeyError(session_id)
+        return session.summary_info()
+
+    def delete_session(self, session_id: str) -> bool:
+        """Delete a conversation session, including any spilled copy on disk."""
+        return self.sessions.delete(session_id)
+
     def personas(self) -> list[dict[str, Any]]:
         """Get all configured personas.
 
@@ -296,6 +678,7 @@ class AdaptiveMindApplication:
             List of persona dictionaries containing name, description,
             max_context_window, and routing_hint
         """
+        self._follow_shared_config()
         return [
             {
                 "name": persona.name,
@@ -315,7 +698,7 @@ class AdaptiveMindApplication:
         Returns:
             List of available backend model names
         """
-        return [backend.name for backend in self.backends if backend.is_available()]
+        return [backend.name for backend in self.backends if self._probe_backend(backend)]
 
     def traces_latest(self, limit: int = 50) -> list[dict[str, Any]]:
         """Get the latest request traces for debugging.
@@ -329,8 +712,136 @@ class AdaptiveMindApplication:
         Returns:
             List of trace dictionaries with request details and timing
         """
+        if self.shared is not None:
+            return list(reversed(self.shared.query_traces(limit=limit)[0]))
         return [asdict(trace) for trace in self.traces.latest(limit)]
 
+    def recent_spans(self, limit: int = 20, trace_id: str | None = None) -> dict[str, Any]:
+        """Get sampled span trees from the in-process span ring.
+
+        Args:
+            limit: Maximum number of traces to return
+            trace_id: Return only this trace, if it was kept
+
+        Returns:
+            Dict containing:
+            - traces: Lists of span dictionaries, newest trace first
+            - stats: Sampling counters (started, kept, tail-kept, dropped spans)
+        """
+        if trace_id is not None:
+            found = self.tracer.find(trace_id)
+            traces = [found] if found else []
+        else:
+            traces = self.tracer.recent(limit)
+        return {"traces": traces, "stats": self.tracer.stats()}
+
+    def start_profiler(
+        self,
+        hz: float | None = None,
+        duration_s: float | None = None,
+        threads: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Start a sampling CPU profiling session.
+
+        Args:
+            hz: Sampling frequency (capped by ``monitoring.profiler.max_hz``)
+            duration_s: Session length (capped by ``monitoring.profiler.max_duration_s``)
+            threads: Thread-name patterns to sample, e.g. ``["AnyIO worker*"]``
+
+        Returns:
+            Profiler status dictionary
+
+        Raises:
+            PermissionError: If the profiler is disabled in configuration
+            RuntimeError: If a session is already running
+        """
+        if not self.config.monitoring.profiler.enabled:
+            raise PermissionError("Profiler is disabled")
+        return self.profiler.start(hz, duration_s, threads)
+
+    def stop_profiler(self) -> dict[str, Any]:
+        """Stop the running profiling session and return its status."""
+        return self.profiler.stop()
+
+    def profile(self, threads: list[str] | None = None, top: int = 20) -> dict[str, Any]:
+        """Get the latest profile.
+
+        Args:
+            threads: Optional thread-name patterns narrowing the recorded profile
+            top: Number of hottest frames to include
+
+        Returns:
+            Dict containing:
+            - status: Session parameters, sample counts and measured overhead
+            - top: Frames ranked by self samples
+            - collapsed: Collapsed-stack text for flamegraph tools
+        """
+        return {
+            "status": self.profiler.status(),
+            "top": self.profiler.top(top, threads),
+            "collapsed": self.profiler.collapsed(threads),
+        }
+
+    def buffer_sizes(self) -> dict[str, dict[str, int]]:
+        """Get the sizes of registered in-process caches, queues and histories.
+
+        Returns:
+            Mapping of buffer name to live instances, item count and shallow
+            container bytes, largest first
+        """
+        return get_buffer_registry().sizes()
+
+    def query_traces(
+        self,
+        persona: str | None = None,
+        backend: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        min_latency_ms: float | None = None,
+        limit: int = 50,
+        cursor: int | None = None,
+    ) -> dict[str, Any]:
+        """Query request traces by persona, backend, time range and latency.
+
+        Args:
+            persona: Only traces for this persona
+            backend: Only traces served by this backend
+            since: Only traces recorded at or after this Unix timestamp
+            until: Only traces recorded at or before this Unix timestamp
+            min_latency_ms: Only traces at least this slow
+            limit: Maximum number of traces per page
+            cursor: ``next_cursor`` from the previous page
+
+        With several workers the traces of all of them are queried, and cursors
+        refer to the shared store instead of this process's ring.
+
+        Returns:
+            Dict containing:
+            - traces: Matching trace dictionaries, newest first
+            - next_cursor: Cursor for the next page, or None when exhausted
+        """
+        if self.shared is not None:
+            traces, next_cursor = self.shared.query_traces(
+                persona=persona,
+                backend=backend,
+                since=since,
+                until=until,
+                min_latency_ms=min_latency_ms,
+                limit=limit,
+                cursor=cursor,
+            )
+            return {"traces": traces, "next_cursor": next_cursor}
+        page = self.traces.query(
+            persona=persona,
+            backend=backend,
+            since=since,
+            until=until,
+            min_latency_ms=min_latency_ms,
+            limit=limit,
+            cursor=cursor,
+        )
+        return {"traces": [asdict(trace) for trace in page.records], "next_cursor": page.next_cursor}
+
     def metrics_snapshot(self) -> list[dict[str, Any]]:
         """Get current metrics snapshot.
 
@@ -342,6 +853,65 @@ class AdaptiveMindApplication:
         """
         return [asdict(snapshot) for snapshot in self.metrics.history()]
 
+    def context_stats(self) -> dict[str, Any]:
+        """Get context pipeline statistics.
+
+        Returns:
+            Dict containing:
+            - sessions: Session store occupancy, hit and eviction counters
+            - compaction: Summaries created, compaction ratio and summary reuse rate
+        """
+        return {"sessions": self.sessions.stats(), **self.context_engine.stats()}
+
+    def openmetrics(self) -> str:
+        """Render metrics in OpenMetrics text format for Prometheus-compatible scrapers.
+
+        Only pre-aggregated state is read: lifetime counters and histograms
+        from the metrics registry, the last observed backend availability,
+        cache and queue counters from the context pipeline and sessions, and
+        the logging pipeline's discard counters. With several workers the
+        counters and histograms are summed over all of them and gauges carry
+        a ``worker`` label; the extra gauges remain this worker's.
+
+        Returns:
+            OpenMetrics exposition text terminated by ``# EOF``
+        """
+        stats = self.context_stats()
+        compaction = stats.get("compaction") or {}
+        sessions = stats["sessions"]
+        lookups = sessions.get("hits", 0) + sessions.get("misses", 0)
+        extra = [
+            ("cache_hit_ratio", "Hit ratio of context caches.", {"cache": "summary"}, compaction.get("reuse_rate", 0.0)),
+            ("cache_hit_ratio", "Hit ratio of context caches.", {"cache": "session"}, sessions.get("hits", 0) / lookups if lookups else 0.0),
+            ("queue_depth", "Work items waiting in background queues.", {"queue": "compaction"}, compaction.get("pending", 0)),
+            ("sessions_active", "Conversation sessions held in memory.", {}, sessions.get("sessions", 0)),
+        ]
+        log_stats = logging_stats()
+        extra.append(("queue_depth", "Work items waiting in background queues.", {"queue": "logging"}, log_stats["queue_depth"]))
+        extra.append(("queue_depth", "Work items waiting in background queues.", {"queue": "jobs"}, self.jobs.queue_depth()))
+        extra.append(("queue_depth", "Work items waiting in background queues.", {"queue": "ingest"}, self.ingest.pending()))
+        extra.append(("ingest_items_per_second", "Ingested items indexed per second over the last 10 seconds.", {}, self.ingest.items_per_second()))
+        extra.append(("ingest_index_lag_seconds", "Age of the oldest ingested item not yet searchable.", {}, self.ingest.index_lag_s()))
+        discarded = [
+            ("log_records_discarded", "Log records discarded before reaching a handler.", {"reason": reason}, log_stats[reason])
+            for reason in ("dropped", "sampled_out", "rate_limited")
+        ]
+        state = combine_states(self.shared.worker_metrics()) if self.shared is not None else None
+        return render_openmetrics(self.metrics, extra, state, extra_counters=discarded)
+
+    @staticmethod
+    def _backend_type(backend: Any) -> str:
+        """Backend kind from its class name, looking through lazy placeholders (already loaded by the probe)."""
+        if isinstance(backend, LazyBackend):
+            backend = backend.backend
+        return backend.__class__.__name__.lower().replace("backend", "")
+
+    def _probe_backend(self, backend: Any) -> bool:
+        """Check a backend's availability and remember the result for metrics scrapes."""
+        available = bool(backend.is_available())
+        self.metrics.set_gauge("backend_available", 1.0 if available else 0.0, backend=backend.name)
+        return available
+
     # Management API methods ---------------------------------------------
 
     def system_status(self) -> dict[str, Any]:
@@ -359,21 +929,25 @@ class AdaptiveMindApplication:
             - active_backends: List of available backend names
             - active_personas: List of currently allowed personas
             - config_hash: Hash of current configuration for change detection
+            - degradation: Current degradation level and rolling latency per persona
+            - workers: Server workers sharing state with this one, when running several
         """
-        import hashlib
         import time
 
-        # Calculate config hash for change detection
-        config_str = self.config.model_dump_json()
-        config_hash = hashlib.sha256(config_str.encode()).hexdigest()[:16]
+        self._follow_shared_config()
+
+        degradation = self.degradation.status()
+        degraded = any(persona["level"] for persona in degradation["personas"].values())
 
         return {
-            "status": "healthy",  # TODO: implement proper health check
+            "status": "degraded" if degraded else "healthy",  # TODO: implement proper health check
             "uptime_seconds": time.time() - self._start_time,
             "version": "1.0.0",
-            "active_backends": [b.name for b in self.backends if b.is_available()],
+            "active_backends": [b.name for b in self.backends if self._probe_backend(b)],
             "active_personas": list(self.config.allowed_personas),
-            "config_hash": config_hash,
+            "config_hash": self.router.snapshot.config_hash,
+            "degradation": degradation,
+            "workers": self.shared.workers() if self.shared is not None else None,
         }
 
     def get_routing_config(self) -> dict[str, Any]:
@@ -387,6 +961,7 @@ class AdaptiveMindApplication:
             - allowed_personas: List of personas that can be used for routing
             - enable_adaptive_routing: Whether adaptive routing is enabled
         """
+        self._follow_shared_config()
         return {
             "allowed_personas": list(self.config.allowed_personas),
             "enable_adaptive_routing": True,  # TODO: make configurable
@@ -410,8 +985,8 @@ class AdaptiveMindApplication:
         backends = [
             {
                 "name": backend.name,
-                "type": backend.__class__.__name__.lower().replace('backend', ''),
-                "is_available": backend.is_available(),
+                "is_available": self._probe_backend(backend),
+                "type": self._backend_type(backend),
                 "last_checked": time.time(),  # TODO: track actual last check time
                 "config": {},  # TODO: expose relevant config without secrets
             }
@@ -431,6 +1006,7 @@ class AdaptiveMindApplication:
             - enable_semantic_chunking: Whether semantic chunking is enabled
             - max_combined_context_tokens: Maximum tokens for combined context
         """
+        self._follow_shared_config()
         return {
             "extra_documents_dir": str(self.config.context_pipeline.extra_documents_dir) if self.config.context_pipeline.extra_documents_dir else None,
             "enable_semantic_chunking": self.config.context_pipeline.enable_semantic_chunking,
@@ -474,16 +1050,17 @@ class AdaptiveMindApplication:
             ValueError: If persona name already exists or required fields are missing
         """
         name = persona_data["name"]
-        if name in self.config.personas:
-            raise ValueError(f"Persona '{name}' already exists")
+        with self._config_mutation():
+            if name in self.config.personas:
+                raise ValueError(f"Persona '{name}' already exists")
 
-        from .config import PersonaConfig
-        persona_config = PersonaConfig(**persona_data)
-        self.config.personas[name] = persona_config
+            persona_config = PersonaConfig(**persona_data)
+            self.config.personas[name] = persona_config
+            self.context_engine.templates.compile(persona_config)
 
-        # Add to allowed personas if not already there
-        if name not in self.config.allowed_personas:
-            self.config.allowed_personas.append(name)
+            # Add to allowed personas if not already there
+            if name not in self.config.allowed_personas:
+                self.config.allowed_personas.append(name)
 
         return self._persona_to_dict(name, persona_config)
 
@@ -504,15 +1081,19 @@ class AdaptiveMindApplication:
         Raises:
             ValueError: If persona doesn't exist or update field is invalid
         """
-        if name not in self.config.personas:
-            raise ValueError(f"Persona '{name}' not found")
+        with self._config_mutation():
+            if name not in self.config.personas:
+                raise ValueError(f"Persona '{name}' not found")
 
-        persona = self.config.personas[name]
-        for key, value in updates.items():
-            if value is not None:
-                if not hasattr(persona, key):
+            changes = {key: value for key, value in updates.items() if value is not None}
+            for key in changes:
+                if key not in PersonaConfig.model_fields:
                     raise ValueError(f"Persona config has no attribute '{key}'")
-                setattr(persona, key, value)
+            # Validate the whole new persona before swapping it in, so a bad field changes nothing
+            current = self.config.personas[name]
+            persona = PersonaConfig.model_validate(current.model_copy(update=changes).model_dump())
+            self.config.personas[name] = persona
+            self.context_engine.templates.compile(persona)
 
         return self._persona_to_dict(name, persona)
 
@@ -531,20 +1112,22 @@ class AdaptiveMindApplication:
         Raises:
             ValueError: If persona doesn't exist
         """
-        if name not in self.config.personas:
-            raise ValueError(f"Persona '{name}' not found")
+        with self._config_mutation():
+            if name not in self.config.personas:
+                raise ValueError(f"Persona '{name}' not found")
 
-        # Prevent deletion of personas that might be in use
-        # For now, allow deletion but log warning
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.warning(f"Deleting persona '{name}'")
+            # Prevent deletion of personas that might be in use
+            # For now, allow deletion but log warning
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.warning(f"Deleting persona '{name}'")
 
-        del self.config.personas[name]
+            del self.config.personas[name]
+            self.context_engine.templates.discard(name)
 
-        # Remove from allowed personas
-        if name in self.config.allowed_personas:
-            self.config.allowed_personas.remove(name)
+            # Remove from allowed personas
+            if name in self.config.allowed_personas:
+                self.config.allowed_personas.remove(name)
 
         return True
 
@@ -567,11 +1150,12 @@ class AdaptiveMindApplication:
             ValueError: If any specified persona doesn't exist
         """
         if "allowed_personas" in updates and updates["allowed_personas"] is not None:
-            # Validate that all personas exist
-            for persona_name in updates["allowed_personas"]:
-                if persona_name not in self.config.personas:
-                    raise ValueError(f"Persona '{persona_name}' does not exist")
-            self.config.allowed_personas = updates["allowed_personas"]
+            with self._config_mutation():
+                # Validate that all personas exist
+                for persona_name in updates["allowed_personas"]:
+                    if persona_name not in self.config.personas:
+                        raise ValueError(f"Persona '{persona_name}' does not exist")
+                self.config.allowed_personas = updates["allowed_personas"]
 
         if "enable_adaptive_routing" in updates and updates["enable_adaptive_routing"] is not None:
             # For now, this is a placeholder - adaptive routing is always enabled
@@ -597,15 +1181,15 @@ class AdaptiveMindApplication:
         """
         context_config = self.config.context_pipeline
 
-        if "extra_documents_dir" in updates and updates["extra_documents_dir"] is not None:
-            from pathlib import Path
-            context_config.extra_documents_dir = Path(updates["extra_documents_dir"])
+        with self._config_mutation():
+            if "extra_documents_dir" in updates and updates["extra_documents_dir"] is not None:
+                context_config.extra_documents_dir = Path(updates["extra_documents_dir"])
 
-        if "enable_semantic_chunking" in updates and updates["enable_semantic_chunking"] is not None:
-            context_config.enable_semantic_chunking = updates["enable_semantic_chunking"]
+            if "enable_semantic_chunking" in updates and updates["enable_semantic_chunking"] is not None:
+                context_config.enable_semantic_chunking = updates["enable_semantic_chunking"]
 
-        if "max_combined_context_tokens" in updates and updates["max_combined_context_tokens"] is not None:
-            context_config.max_combined_context_tokens = updates["max_combined_context_tokens"]
+            if "max_combined_context_tokens" in updates and updates["max_combined_context_tokens"] is not None:
+                context_config.max_combined_context_tokens = updates["max_combined_context_tokens"]
 
         return self.get_context_config()
 
@@ -636,7 +1220,7 @@ class AdaptiveMindApplication:
         start_time = time.time()
         try:
             # Simple test - check if backend is available
-            is_available = backend.is_available()
+            is_available = self._probe_backend(backend)
             latency = (time.time() - start_time) * 1000
             return {
                 "success": is_available,
@@ -30,7 +30,7 @@ import json
 import os
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field, ValidationInfo, field_validator
 
@@ -64,11 +64,13 @@ class OpenRouterConfig(BaseModel):
         model: Default OpenRouter model to use
         site_url: Site URL for OpenRouter rankings and attribution
         app_name: Application name for OpenRouter rankings
+        base_url: API root; point it at a compatible server (or the simulator) to redirect traffic
     """
     api_key: str = Field("", description="OpenRouter API Key")
     model: str = Field("openai/gpt-3.5-turbo", description="Default OpenRouter model")
     site_url: str = Field("", description="Site URL for OpenRouter rankings")
     app_name: str = Field("AdaptiveMind Local", description="App name for OpenRouter rankings")
+    base_url: str = Field("https://openrouter.ai/api/v1", description="OpenAI-compatible API root")
 
 
 class WindowsMLConfig(BaseModel):
@@ -100,6 +102,44 @@ class WindowsMLConfig(BaseModel):
         return Path(os.path.expanduser(str(value))).resolve()
 
 
+class CassetteConfig(BaseModel):
+    """Configuration for recording or replaying backend exchanges.
+
+    In ``record`` mode every model backend is wrapped so its requests,
+    chunks and timings are appended to the cassette. In ``replay`` mode the
+    model backends are replaced by one that answers from the cassette, so
+    recorded traffic can be rerun offline.
+
+    Attributes:
+        mode: ``off``, ``record`` or ``replay``
+        path: Cassette file; a ``.gz`` suffix compresses it
+        timing_scale: Multiplier for replayed delays (1.0 keeps the original timing, 0 disables it)
+        fallbacks: Fuzzy match levels tried in order after an exact request-hash miss
+    """
+    mode: Literal["off", "record", "replay"] = Field("off", description="Record, replay, or leave backends alone")
+    path: Path | None = Field(default=None, validate_default=True, description="Cassette file used by record and replay modes")
+    timing_scale: float = Field(1.0, ge=0.0)
+    fallbacks: list[Literal["messages", "last_user", "persona", "any"]] = Field(
+        default_factory=lambda: ["messages", "last_user", "persona", "any"]
+    )
+
+    @field_validator("path", mode="before")
+    @classmethod
+    def _expand_path(cls, value: Any) -> Path | None:
+        """Expand and resolve the cassette path."""
+        if value in (None, ""):
+            return None
+        return Path(os.path.expanduser(str(value))).resolve()
+
+    @field_validator("path", mode="after")
+    @classmethod
+    def _require_path(cls, value: Path | None, info: ValidationInfo) -> Path | None:
+        """Record and replay modes need a cassette file."""
+        if value is None and info.data.get("mode", "off") != "off":
+            raise ValueError(f"cassette mode {info.data['mode']!r} requires a path")
+        return value
+
+
 class SecurityConfig(BaseModel):
     """Configuration for security and access control.
 
@@ -165,6 +205,94 @@ class PersonaConfig(BaseModel):
     routing_hint: str = Field("general", description="Hint used by the routing pipeline")
 
 
+class CompactionConfig(BaseModel):
+    """Configuration for background conversation compaction.
+
+    When a conversation grows beyond the token threshold, older turns are
+    folded into a rolling summary off the request path. The summary is cached
+    and reused as a single context section on later turns.
+
+    Attributes:
+        enabled: Whether conversation compaction is enabled
+        threshold_tokens: Conversation size in tokens that triggers compaction
+        keep_recent_messages: Number of most recent messages kept verbatim
+        summary_max_tokens: Upper bound for the rolling summary length
+        max_cached_summaries: Number of rolling summaries kept for stateless requests
+    """
+    enabled: bool = Field(False, description="Summarize older turns of long conversations")
+    threshold_tokens: int = Field(1536, ge=64)
+    keep_recent_messages: int = Field(8, ge=1)
+    summary_max_tokens: int = Field(256, ge=16)
+    max_cached_summaries: int = Field(512, ge=1)
+
+
+class CompressionConfig(BaseModel):
+    """Configuration for prompt compression of oversized contexts.
+
+    Compression runs only when the assembled context exceeds the persona's
+    context window. Research and document sections are stripped of
+    boilerplate, de-duplicated across sections and reduced to their most
+    central sentences; persona and conversation sections are never pruned.
+
+    Attributes:
+        enabled: Whether oversized contexts are compressed before truncation
+        default_target_ratio: Fraction of compressible tokens to keep
+        persona_target_ratios: Per-persona overrides of the target ratio
+        redundancy_threshold: Word-overlap similarity above which a sentence is a duplicate
+    """
+    enabled: bool = Field(False, description="Compress oversized contexts instead of dropping sections")
+    default_target_ratio: float = Field(0.6, gt=0.0, le=1.0)
+    persona_target_ratios: dict[str, float] = Field(default_factory=dict)
+    redundancy_threshold: float = Field(0.8, gt=0.0, le=1.0)
+
+
+class DeduplicationConfig(BaseModel):
+    """Configuration for near-duplicate detection of indexed documents.
+
+    A document whose MinHash signature agrees with an indexed one on at
+    least ``threshold`` of its positions is linked to it instead of being
+    indexed again, and retrieval keeps one chunk per group of near-identical
+    chunks. More bands find more candidates at lower similarities; every
+    candidate is still checked against ``threshold``.
+
+    Attributes:
+        enabled: Whether documents and retrieved chunks are deduplicated
+        num_perm: Hash functions per signature
+        bands: LSH bands the signature is split into
+        shingle_words: Words per shingle
+        threshold: Estimated Jaccard similarity from which texts are near-duplicates
+    """
+    enabled: bool = True
+    num_perm: int = Field(64, ge=8, le=512)
+    bands: int = Field(16, ge=1)
+    shingle_words: int = Field(3, ge=1, le=10)
+    threshold: float = Field(0.8, gt=0.0, le=1.0)
+
+
+class DocumentIndexConfig(BaseModel):
+    """Configuration for the context engine's searchable document index.
+
+    Ingested documents are split into chunks of roughly ``chunk_tokens``
+    words, at paragraph and sentence boundaries when semantic chunking is
+    enabled, and ranked against the latest user message with BM25. The
+    ``retrieval`` stage adds the best chunks to each request's context.
+
+    Attributes:
+        chunk_tokens: Target chunk length in tokens
+        chunk_overlap_tokens: Tokens repeated from the end of one fixed-size chunk at the start of the next
+        max_chunks: Oldest documents, with their linked duplicates, are dropped beyond this many chunks
+        top_k: Chunks added to a request's context
+        min_score: Chunks scoring below this are never added
+        dedup: Near-duplicate detection for documents and retrieved chunks
+    """
+    chunk_tokens: int = Field(200, ge=16)
+    chunk_overlap_tokens: int = Field(20, ge=0)
+    max_chunks: int = Field(100_000, ge=1)
+    top_k: int = Field(3, ge=1, le=50)
+    min_score: float = Field(0.5, ge=0.0)
+    dedup: DeduplicationConfig = Field(default_factory=DeduplicationConfig)
+
+
 class ContextPipelineConfig(BaseModel):
     """Configuration for context processing pipeline.
 
@@ -175,12 +303,25 @@ class ContextPipelineConfig(BaseModel):
         extra_documents_dir: Directory containing additional documents for context
         enable_semantic_chunking: Whether to split documents into semantic chunks
         max_combined_context_tokens: Maximum total tokens for combined context
+        compaction: Background conversation compaction settings
+        compression: Prompt compression settings for oversized contexts
+        stage_timeouts_s: Deadlines for optional pipeline stages, keyed by stage name
+        max_stage_workers: Worker threads used to run optional stages concurrently
+        document_index: Chunking and retrieval settings of the ingested document index
     """
     extra_documents_dir: Path | None = Field(
         default=None, description="Optional directory of additional documents to inject into context"
     )
     enable_semantic_chunking: bool = Field(True, description="Split documents into semantic chunks")
     max_combined_context_tokens: int = Field(8192, ge=1024)
+    compaction: CompactionConfig = Field(default_factory=CompactionConfig)
+    compression: CompressionConfig = Field(default_factory=CompressionConfig)
+    stage_timeouts_s: dict[str, float] = Field(
+        default_factory=lambda: {"research": 0.25, "documents": 0.5, "retrieval": 0.25},
+        description="Per-stage deadlines; a stage that misses its deadline is left out of the context",
+    )
+    max_stage_workers: int = Field(4, ge=1)
+    document_index: DocumentIndexConfig = Field(default_factory=DocumentIndexConfig)
 
     @field_validator("extra_documents_dir", mode="before")
     @classmethod
@@ -191,6 +332,69 @@ class ContextPipelineConfig(BaseModel):
         return Path(os.path.expanduser(str(value))).resolve()
 
 
+class ArchiveConfig(BaseModel):
+    """Configuration for the on-disk trace and metrics archive.
+
+    Traces and harvested metric snapshots are appended to rotating binary
+    segment files by a background thread, for offline analysis with
+    ``python -m adaptivemind_core.monitoring.cli``.
+
+    Attributes:
+        directory: Directory receiving segment files; archiving is off when unset
+        segment_bytes: Size at which the current segment is closed and a new one started
+        max_segments: Oldest segments are deleted beyond this count
+        flush_interval_s: Maximum time records wait in memory before being written
+        max_pending: Records buffered for the writer before new ones are dropped
+    """
+    directory: Path | None = Field(default=None, description="Archive directory; archiving is disabled when unset")
+    segment_bytes: int = Field(8 * 1024 * 1024, ge=4096)
+    max_segments: int = Field(64, ge=1)
+    flush_interval_s: float = Field(1.0, gt=0.0)
+    max_pending: int = Field(65536, ge=1)
+
+    @field_validator("directory", mode="before")
+    @classmethod
+    def _expand_directory(cls, value: Any) -> Path | None:
+        """Expand and resolve the archive directory path."""
+        if value in (None, ""):
+            return None
+        return Path(os.path.expanduser(str(value))).resolve()
+
+
+class ProfilerConfig(BaseModel):
+    """Configuration for the in-process sampling CPU profiler.
+
+    Attributes:
+        enabled: Whether the profiler management endpoints may start sampling
+        default_hz: Sampling frequency used when a request does not set one
+        max_hz: Upper bound on the requested sampling frequency
+        max_duration_s: Longest profiling session; sampling stops on its own afterwards
+        max_depth: Frames kept per stack, innermost first
+        max_stacks: Distinct stacks recorded before further new ones are folded together
+    """
+    enabled: bool = Field(True, description="Allow starting the sampling profiler")
+    default_hz: float = Field(100.0, gt=0.0)
+    max_hz: float = Field(1000.0, gt=0.0)
+    max_duration_s: float = Field(300.0, gt=0.0)
+    max_depth: int = Field(128, ge=1)
+    max_stacks: int = Field(20000, ge=100)
+
+
+class MemoryConfig(BaseModel):
+    """Configuration for memory diagnostics.
+
+    Attributes:
+        tracemalloc_on_start: Start tracemalloc when the application starts
+        traceback_frames: Frames stored per allocation while tracing
+        max_snapshots: Snapshots kept for diffing before the oldest is discarded
+        request_accounting: Attach the change in process-wide traced memory over each request to its trace
+    """
+    tracemalloc_on_start: bool = Field(False, description="Start tracemalloc at startup")
+    traceback_frames: int = Field(1, ge=1, le=64)
+    max_snapshots: int = Field(8, ge=2)
+    request_accounting: bool = Field(False, description="Record the traced memory change over each request in traces")
+
+
 class MonitoringConfig(BaseModel):
     """Configuration for system monitoring and metrics.
 
@@ -200,9 +404,269 @@ class MonitoringConfig(BaseModel):
     Attributes:
         enable_metrics_harvest: Whether to enable metrics and trace harvesting
         harvest_interval_s: Interval in seconds between metric harvests
+        archive: Persistent trace and metrics archive settings
+        profiler: In-process sampling profiler settings
+        memory: Allocation profiling and buffer accounting settings
     """
     enable_metrics_harvest: bool = Field(True, description="Enable harvesting of metrics and traces")
     harvest_interval_s: float = Field(30.0, ge=5.0)
+    archive: ArchiveConfig = Field(default_factory=ArchiveConfig)
+    profiler: ProfilerConfig = Field(default_factory=ProfilerConfig)
+    memory: MemoryConfig = Field(default_factory=MemoryConfig)
+
+
+class TracingConfig(BaseModel):
+    """Configuration for hierarchical span tracing.
+
+    Every request records spans; a finished trace is kept when it was head
+    sampled, or when tail sampling finds it slow or failed. Kept traces go to
+    an in-process ring and, optionally, an OTLP/JSON file.
+
+    Attributes:
+        enabled: Whether spans are recorded at all
+        head_sample_rate: Fraction of traces kept regardless of outcome
+        tail_latency_ms: Traces at least this slow are always kept
+        keep_errors: Whether traces containing an error span are always kept
+        ring_size: Number of kept traces held in memory
+        max_spans_per_trace: Spans recorded per trace before further spans are dropped
+        otlp_file: Optional path of an OTLP/JSON lines file receiving kept traces
+        export_queue_size: Kept traces waiting for the background OTLP writer before further ones are dropped
+        service_name: Service name reported in exported resources
+    """
+    enabled: bool = Field(True, description="Record request spans")
+    head_sample_rate: float = Field(0.1, ge=0.0, le=1.0)
+    tail_latency_ms: float = Field(1000.0, ge=0.0)
+    keep_errors: bool = Field(True)
+    ring_size: int = Field(512, ge=1)
+    max_spans_per_trace: int = Field(256, ge=1)
+    otlp_file: Path | None = Field(default=None, description="Optional OTLP/JSON lines export file")
+    export_queue_size: int = Field(1024, ge=1)
+    service_name: str = Field("adaptivemind")
+
+    @field_validator("otlp_file", mode="before")
+    @classmethod
+    def _expand_otlp_file(cls, value: Any) -> Path | None:
+        """Expand and resolve the OTLP export file path."""
+        if value in (None, ""):
+            return None
+        return Path(os.path.expanduser(str(value))).resolve()
+
+
+class SessionConfig(BaseModel):
+    """Configuration for server-side conversation sessions.
+
+    Sessions keep normalized conversation state on the server so clients only
+    send the newest message. Idle sessions are evicted least-recently-used
+    first once the TTL, count, or memory budget is exceeded.
+
+    Attributes:
+        max_sessions: Maximum number of sessions kept in memory
+        ttl_s: Idle time in seconds after which a session expires
+        max_memory_bytes: Approximate memory budget for all in-memory sessions
+        history_window: Number of most recent messages rendered into context
+        spill_dir: Optional directory where evicted sessions are spilled to disk
+    """
+    max_sessions: int = Field(1024, ge=1)
+    ttl_s: float = Field(3600.0, ge=1.0)
+    max_memory_bytes: int = Field(64 * 1024 * 1024, ge=1024)
+    history_window: int = Field(20, ge=1)
+    spill_dir: Path | None = Field(default=None, description="Optional directory for spilling evicted sessions")
+
+    @field_validator("spill_dir", mode="before")
+    @classmethod
+    def _expand_spill_dir(cls, value: Any) -> Path | None:
+        """Expand and resolve session spill directory path."""
+        if value in (None, ""):
+            return None
+        return Path(os.path.expanduser(str(value))).resolve()
+
+
+class SloConfig(BaseModel):
+    """Latency objective for one persona, measured over the rolling window.
+
+    Attributes:
+        p95_ms: Target 95th percentile request latency, or None to ignore it
+        p99_ms: Target 99th percentile request latency, or None to ignore it
+    """
+    p95_ms: float | None = Field(2000.0, gt=0.0)
+    p99_ms: float | None = Field(5000.0, gt=0.0)
+
+
+class DegradationLevelConfig(BaseModel):
+    """One step of the degradation ladder.
+
+    Levels are applied as a whole, so each level should keep the savings of
+    the ones before it.
+
+    Attributes:
+        name: Label reported in status and traces
+        context_scale: Fraction of the persona's context window kept
+        max_tokens: Cap on generated tokens, or None to honour the request
+        disabled_stages: Context stages skipped at this level, e.g. ``documents``
+        prefer_fast_backend: Route to the available backend with the lowest observed median latency
+    """
+    name: str
+    context_scale: float = Field(1.0, gt=0.0, le=1.0)
+    max_tokens: int | None = Field(default=None, ge=1)
+    disabled_stages: list[str] = Field(default_factory=list)
+    prefer_fast_backend: bool = False
+
+
+def _default_degradation_levels() -> list[DegradationLevelConfig]:
+    return [
+        DegradationLevelConfig(name="reduced_context", context_scale=0.5),
+        DegradationLevelConfig(name="capped_output", context_scale=0.5, max_tokens=256),
+        DegradationLevelConfig(
+            name="no_retrieval", context_scale=0.5, max_tokens=256, disabled_stages=["documents", "research", "retrieval"]
+        ),
+        DegradationLevelConfig(
+            name="fast_backend",
+            context_scale=0.25,
+            max_tokens=128,
+            disabled_stages=["documents", "research", "retrieval"],
+            prefer_fast_backend=True,
+        ),
+    ]
+
+
+class DegradationConfig(BaseModel):
+    """Configuration for SLO-driven adaptive degradation.
+
+    Each persona's rolling p95/p99 latency is compared with its objective.
+    While it is missed the persona steps one level down the ladder; once
+    latency has stayed comfortably inside the objective for ``recovery_hold_s``
+    it steps back up. Every level change restarts the window, so a level is
+    judged only on traffic served at that level.
+
+    Attributes:
+        enabled: Whether requests are degraded at all
+        default_slo: Objective for personas without an entry in ``persona_slos``
+        persona_slos: Per-persona objectives
+        window_s: Span of the rolling latency window
+        min_samples: Requests needed in the window before the level may change
+        evaluation_interval_s: Minimum time between evaluations on the request path
+        recovery_ratio: Latency must be below this fraction of the objective to recover
+        recovery_hold_s: Time latency must stay below the recovery threshold before stepping up
+        levels: Degradation ladder, mildest first; level 0 is always full fidelity
+    """
+    enabled: bool = Field(False, description="Degrade requests when latency objectives are missed")
+    default_slo: SloConfig = Field(default_factory=SloConfig)
+    persona_slos: dict[str, SloConfig] = Field(default_factory=dict)
+    window_s: float = Field(60.0, gt=0.0)
+    min_samples: int = Field(20, ge=1)
+    evaluation_interval_s: float = Field(1.0, ge=0.0)
+    recovery_ratio: float = Field(0.8, gt=0.0, le=1.0)
+    recovery_hold_s: float = Field(30.0, ge=0.0)
+    levels: list[DegradationLevelConfig] = Field(default_factory=_default_degradation_levels)
+
+
+class IngestConfig(BaseModel):
+    """Configuration for bulk document ingestion through ``/api/v1/feed/ingest``.
+
+    Uploads are parsed line by line as they arrive and each item is handed
+    to a pool of indexing threads, so the request is acknowledged as soon as
+    the body has been read. When ``max_pending_items`` items are waiting,
+    reading the upload pauses until the indexers catch up.
+
+    Attributes:
+        workers: Threads chunking and indexing items
+        max_pending_items: Items accepted but not yet indexed before uploads are slowed down
+        max_line_bytes: Longest accepted NDJSON line; longer lines are rejected
+        max_batches: Batch records kept for status queries
+    """
+    workers: int = Field(2, ge=1, le=32)
+    max_pending_items: int = Field(10_000, ge=1)
+    max_line_bytes: int = Field(1_000_000, ge=1024)
+    max_batches: int = Field(1000, ge=1)
+
+
+class JobsConfig(BaseModel):
+    """Configuration for the asynchronous job queue behind ``/api/v1/jobs``.
+
+    Jobs run on a bounded pool of worker threads, highest priority (lowest
+    number) first and in submission order within a priority. Job state lives
+    in SQLite; with ``path`` set it survives restarts and queued or
+    interrupted jobs are resumed.
+
+    With ``broker_url`` set, jobs go through a Redis-protocol queue instead,
+    and any number of worker processes on any node run them (see
+    ``adaptivemind_core.job_broker``). A job stays invisible to other
+    workers while its lease lasts; a worker renews the leases of the jobs it
+    holds with every heartbeat and whenever a job reports progress, so jobs
+    of a worker whose heartbeat stops are delivered again.
+
+    Attributes:
+        path: SQLite database holding job state; an in-memory database when unset
+        workers: Jobs executed concurrently
+        max_queued: Submissions beyond this many waiting jobs are rejected
+        default_priority: Priority of jobs submitted without one (0 is most urgent)
+        result_ttl_s: How long finished jobs and their results are kept
+        compaction_interval_s: How often expired jobs are deleted and the database compacted
+        callback_timeout_s: Timeout of one ``callback_url`` delivery attempt
+        callback_retries: Further delivery attempts after a failed one
+        broker_url: ``redis://`` URL of the shared queue, or ``memory://<name>`` for an in-process stand-in
+        queue_name: Prefix of the queue's keys in the broker
+        run_workers: Run jobs in this process; API-only nodes disable it
+        visibility_timeout_s: How long a claimed job may go without a heartbeat or progress before it is delivered again
+        heartbeat_interval_s: How often a worker announces itself and checks for dead workers
+        worker_timeout_s: Heartbeat age after which a worker's jobs are delivered again
+        prefetch: Jobs a busy worker may claim ahead, limited to its share of the backlog
+        max_deliveries: Deliveries after which a job that keeps being interrupted fails
+        poll_interval_s: Longest wait between claim attempts of an idle worker
+    """
+    path: Path | None = Field(default=None, description="Job database; jobs do not survive restarts when unset")
+    workers: int = Field(2, ge=1, le=64)
+    max_queued: int = Field(1000, ge=1)
+    default_priority: int = Field(5, ge=0, le=9)
+    result_ttl_s: float = Field(3600.0, gt=0.0)
+    compaction_interval_s: float = Field(60.0, gt=0.0)
+    callback_timeout_s: float = Field(5.0, gt=0.0)
+    callback_retries: int = Field(2, ge=0)
+    broker_url: str | None = Field(default=None, description="Redis-protocol job queue shared by worker processes")
+    queue_name: str = "adaptivemind:jobs"
+    run_workers: bool = True
+    visibility_timeout_s: float = Field(300.0, gt=0.0)
+    heartbeat_interval_s: float = Field(2.0, gt=0.0)
+    worker_timeout_s: float = Field(15.0, gt=0.0)
+    prefetch: int = Field(2, ge=0, le=64)
+    max_deliveries: int = Field(3, ge=1)
+    poll_interval_s: float = Field(0.2, gt=0.0)
+
+    @field_validator("path", mode="before")
+    @classmethod
+    def _expand_path(cls, value: Any) -> Path | None:
+        """Expand and resolve the database path."""
+        if value in (None, ""):
+            return None
+        return Path(os.path.expanduser(str(value))).resolve()
+
+
+class SharedStateConfig(BaseModel):
+    """Configuration for state shared between server worker processes.
+
+    When several workers serve the same port, persona, routing and context
+    changes are written to a versioned document in a SQLite database that
+    every worker follows, and each worker publishes its metrics and traces
+    there so any of them can answer scrapes and trace queries for all.
+
+    Attributes:
+        path: SQLite database shared by the workers; sharing is off when unset
+        publish_interval_s: How often a worker publishes its metrics and buffered traces
+        max_traces: Newest traces kept in the shared store
+        stale_after_s: Workers silent for longer lose their gauges, and are retired once their process exits
+    """
+    path: Path | None = Field(default=None, description="Shared state database; single-process mode when unset")
+    publish_interval_s: float = Field(1.0, gt=0.0)
+    max_traces: int = Field(5000, ge=1)
+    stale_after_s: float = Field(30.0, gt=0.0)
+
+    @field_validator("path", mode="before")
+    @classmethod
+    def _expand_path(cls, value: Any) -> Path | None:
+        """Expand and resolve the database path."""
+        if value in (None, ""):
+            return None
+        return Path(os.path.expanduser(str(value))).resolve()
 
 
 def _default_personas() -> dict[str, PersonaConfig]:
@@ -235,20 +699,34 @@ class AppConfig(BaseModel):
         ollama: Ollama backend configuration
         openrouter: OpenRouter backend configuration
         windowsml: WindowsML/ONNX configuration
+        cassette: Backend exchange recording and replay
         security: Security and access control configuration
         personas: Dictionary of persona configurations
         context_pipeline: Context processing pipeline configuration
+        degradation: SLO-driven adaptive degradation
+        ingest: Bulk document ingestion into the context engine's index
+        jobs: Asynchronous job queue
         monitoring: System monitoring configuration
+        sessions: Server-side conversation session configuration
+        shared_state: State shared between server worker processes
+        tracing: Span tracing and sampling configuration
         allowed_personas: List of personas permitted for routing
         enable_research_features: Whether to enable deep research workflows
     """
     ollama: OllamaConfig = Field(default_factory=OllamaConfig)
     openrouter: OpenRouterConfig = Field(default_factory=OpenRouterConfig)
     windowsml: WindowsMLConfig = Field(default_factory=WindowsMLConfig)
+    cassette: CassetteConfig = Field(default_factory=CassetteConfig)
     security: SecurityConfig = Field(default_factory=SecurityConfig)
     personas: dict[str, PersonaConfig] = Field(default_factory=_default_personas)
     context_pipeline: ContextPipelineConfig = Field(default_factory=ContextPipelineConfig)
+    degradation: DegradationConfig = Field(default_factory=DegradationConfig)
+    ingest: IngestConfig = Field(default_factory=IngestConfig)
+    jobs: JobsConfig = Field(default_factory=JobsConfig)
     monitoring: MonitoringConfig = Field(default_factory=MonitoringConfig)
+    sessions: SessionConfig = Field(default_factory=SessionConfig)
+    shared_state: SharedStateConfig = Field(default_factory=SharedStateConfig)
+    tracing: TracingConfig = Field(default_factory=TracingConfig)
     allowed_personas: list[str] = Field(default_factory=list)
     enable_research_features: bool = Field(True, description="Enable deep research workflows")
 
@@ -359,6 +837,9 @@ def load_config(explicit_path: str | None = None) -> AppConfig:
     - OPENROUTER_API_KEY: Override OpenRouter API key
     - ADAPTIVEMIND_API_KEYS: Override security API keys (comma-separated)
     - ADAPTIVEMIND_DEFAULT_PERSONA: Set default allowed persona
+    - ADAPTIVEMIND_JOBS_PATH: Database persisting the job queue
+    - ADAPTIVEMIND_JOBS_BROKER: Redis URL of a job queue shared by worker processes
+    - ADAPTIVEMIND_SHARED_STATE: Database shared by server worker processes
 
     Args:
         explicit_path: Optional explicit path to configuration file
@@ -394,6 +875,16 @@ def load_config(explicit_path: str | None = None) -> AppConfig:
         env_overrides.setdefault("security", {})["api_keys"] = [k.strip() for k in keys.split(",") if k.strip()]
     if persona := os.getenv("ADAPTIVEMIND_DEFAULT_PERSONA"):
         env_overrides["allowed_personas"] = [persona]
+    if cassette_mode := os.getenv("ADAPTIVEMIND_CASSETTE_MODE"):
+        env_overrides.setdefault("cassette", {})["mode"] = cassette_mode
+    if cassette_path := os.getenv("ADAPTIVEMIND_CASSETTE_PATH"):
+        env_overrides.setdefault("cassette", {})["path"] = cassette_path
+    if jobs_path := os.getenv("ADAPTIVEMIND_JOBS_PATH"):
+        env_overrides.setdefault("jobs", {})["path"] = jobs_path
+    if jobs_broker := os.getenv("ADAPTIVEMIND_JOBS_BROKER"):
+        env_overrides.setdefault("jobs", {})["broker_url"] = jobs_broker
+    if shared_state := os.getenv("ADAPTIVEMIND_SHARED_STATE"):
+        env_overrides.setdefault("shared_state", {})["path"] = shared_state
 
     if env_overrides:
         base_data = _merge_dict(base_data, env_overrides)
@@ -404,12 +895,28 @@ def load_config(explicit_path: str | None = None) -> AppConfig:
 
 __all__ = [
     "AppConfig",
+    "ArchiveConfig",
+    "CassetteConfig",
+    "CompactionConfig",
+    "CompressionConfig",
     "ContextPipelineConfig",
+    "DeduplicationConfig",
+    "DegradationConfig",
+    "DegradationLevelConfig",
+    "DocumentIndexConfig",
+    "IngestConfig",
+    "JobsConfig",
+    "MemoryConfig",
     "MonitoringConfig",
     "OllamaConfig",
     "OpenRouterConfig",
     "PersonaConfig",
+    "ProfilerConfig",
     "SecurityConfig",
+    "SessionConfig",
+    "SharedStateConfig",
+    "SloConfig",
+    "TracingConfig",
     "WindowsMLConfig",
     "load_config",
 ]
@@ -0,0 +1,278 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+from __future__ import annotations
+
+import hashlib
+import math
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from ..config import CompactionConfig
+from ..llm.base import GenerationRequest, LLMBackend
+from ..logger import get_logger
+from ..monitoring.memory import register_buffer
+from .engine import ContextSection, normalize_message
+
+if TYPE_CHECKING:
+    from .sessions import ConversationSession
+
+logger = get_logger(__name__)
+
+_WORD = re.compile(r"[a-z0-9]{3,}")
+_STOPWORDS = frozenset(
+    "the and for that this with you your are was were have has had not but can will would could should "
+    "from they them their there what when where which who how about into than then also just been being "
+    "user assistant system".split()
+)
+
+
+def content_terms(text: str) -> list[str]:
+    """Lower-cased content words of ``text`` with stopwords removed."""
+    return [word for word in _WORD.findall(text.lower()) if word not in _STOPWORDS]
+
+
+def extractive_summary(lines: Sequence[str], max_tokens: int) -> str:
+    """Keep the most informative lines, in original order, within ``max_tokens``.
+
+    Lines are scored by the corpus frequency of their content words, normalized
+    by length, so turns that repeat the conversation's recurring topics win.
+    """
+    if not lines:
+        return ""
+    terms = [content_terms(line) for line in lines]
+    frequencies = Counter(word for words in terms for word in set(words))
+    scored = sorted(
+        range(len(lines)),
+        key=lambda i: sum(frequencies[word] for word in terms[i]) / math.sqrt(len(terms[i]) + 1),
+        reverse=True,
+    )
+    chosen: list[int] = []
+    budget = max_tokens
+    for index in scored:
+        length = len(lines[index].split())
+        if length > budget:
+            continue
+        chosen.append(index)
+        budget -= length
+    return "\n".join(lines[i] for i in sorted(chosen))
+
+
+def _digest(lines: Sequence[str]) -> str:
+    hasher = hashlib.blake2b(digest_size=16)
+    for line in lines:
+        hasher.update(line.encode("utf-8", "replace"))
+        hasher.update(b"\n")
+    return hasher.hexdigest()
+
+
+@dataclass(frozen=True)
+class RollingSummary:
+    """Summary of the first ``covered`` messages of a conversation."""
+
+    covered: int
+    digest: str
+    text: str
+    source_tokens: int
+
+    def section(self) -> ContextSection:
+        return ContextSection("Summary", self.text)
+
+
+class ConversationCompactor:
+    """Folds older conversation turns into cached rolling summaries.
+
+    Summarization always runs on a background worker. A request that arrives
+    before its summary is ready is served with the plain recent-window
+    conversation, so compaction never adds latency to the user's turn.
+    """
+
+    def __init__(self, config: CompactionConfig, window: int = 20, summarizer: LLMBackend | None = None):
+        self._config = config
+        self._window = window
+        self.summarizer = summarizer
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[str, RollingSummary] = OrderedDict()
+        self._pending: set[str] = set()
+        register_buffer("compaction.summaries", self, lambda compactor: compactor._cache)
+        register_buffer("compaction.pending", self, lambda compactor: compactor._pending)
+        self._executor: ThreadPoolExecutor | None = None
+        self._stats = {
+            "lookups": 0,
+            "reuses": 0,
+            "summaries_created": 0,
+            "failures": 0,
+            "source_tokens": 0,
+            "summary_tokens": 0,
+        }
+
+    # Request path -----------------------------------------------------
+
+    def compact(self, messages: Sequence[dict]) -> list[ContextSection] | None:
+        """Return summary plus recent conversation sections, or None to use the plain window."""
+        keep = self._config.keep_recent_messages
+        if len(messages) <= keep:
+            return None
+        lines = [normalize_message(message) for message in messages]
+        tokens = [len(line.split()) for line in lines]
+        if sum(tokens) <= self._config.threshold_tokens and len(lines) <= self._window:
+            return None
+        older_end = len(lines) - keep
+        # Conversations are told apart by their opening turns, which never change as they grow;
+        # one opening line alone ("hi") would make unrelated conversations share an entry
+        key = _digest(lines[:keep])
+        with self._lock:
+            self._stats["lookups"] += 1
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+        if entry is None or entry.covered > older_end or entry.digest != _digest(lines[: entry.covered]):
+            self._schedule(
+                key, self._fold_stateless, key, None, lines[:older_end], tokens[:older_end], _digest(lines[:older_end])
+            )
+            return None
+
+        with self._lock:
+            self._stats["reuses"] += 1
+        recent = lines[entry.covered :]
+        recent_tokens = tokens[entry.covered :]
+        if entry.covered < older_end and (
+            sum(recent_tokens) > self._config.threshold_tokens or len(recent) > self._window
+        ):
+            self._schedule(
+                key,
+                self._fold_stateless,
+                key,
+                entry,
+                lines[entry.covered : older_end],
+                tokens[entry.covered : older_end],
+                _digest(lines[:older_end]),
+            )
+        recent, recent_tokens = recent[-self._window :], recent_tokens[-self._window :]
+        return [entry.section(), ContextSection("Conversation", "\n".join(recent), tokens=sum(recent_tokens))]
+
+    def session_sections(self, session: ConversationSession) -> list[ContextSection]:
+        """Return the session's summary section, scheduling a fold of any new overflow."""
+        overflow = session.overflow()
+        if overflow:
+            self._schedule(session.session_id, self._fold_session, session)
+        summary = session.summary
+        if summary is None and not overflow:
+            return []
+        with self._lock:
+            self._stats["lookups"] += 1
+            if summary is not None:
+                self._stats["reuses"] += 1
+        return [summary] if summary is not None else []
+
+    # Background work --------------------------------------------------
+
+    def _schedule(self, key: str, fn: Any, *args: Any) -> None:
+        with self._lock:
+            if key in self._pending:
+                return
+            self._pending.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="context-compactor")
+            executor = self._executor
+
+        def _run() -> None:
+            try:
+                fn(*args)
+            except Exception as exc:
+                with self._lock:
+                    self._stats["failures"] += 1
+                logger.warning("Conversation compaction failed", extra={"key": key, "error": str(exc)})
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
+
+        executor.submit(_run)
+
+    def _fold_stateless(
+        self, key: str, previous: RollingSummary | None, lines: list[str], tokens: list[int], prefix_digest: str
+    ) -> None:
+        prior_text = previous.text if previous is not None else None
+        text = self._summarize(prior_text, lines)
+        covered = (previous.covered if previous is not None else 0) + len(lines)
+        source_tokens = (previous.source_tokens if previous is not None else 0) + sum(tokens)
+        summary = RollingSummary(covered=covered, digest=prefix_digest, text=text, source_tokens=source_tokens)
+        self._record(source_tokens=sum(tokens), summary_text=text)
+        with self._lock:
+            self._cache[key] = summary
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._config.max_cached_summaries:
+                self._cache.popitem(last=False)
+
+    def _fold_session(self, session: ConversationSession) -> None:
+        lines = session.overflow()
+        if not lines:
+            return
+        prior = session.summary.body if session.summary is not None else None
+        text = self._summarize(prior, lines)
+        self._record(source_tokens=sum(len(line.split()) for line in lines), summary_text=text)
+        session.apply_summary(ContextSection("Summary", text), len(lines))
+
+    def _summarize(self, prior: str | None, lines: list[str]) -> str:
+        budget = self._config.summary_max_tokens
+        if self.summarizer is None:
+            return extractive_summary([prior, *lines] if prior else lines, budget)
+        transcript = "\n".join(lines)
+        context = f"Previous summary:\n{prior}\n\nNew turns:\n{transcript}" if prior else transcript
+        request = GenerationRequest(
+            messages=[{"role": "user", "content": f"Summarize the conversation so far in at most {budget} words."}],
+            persona="compactor",
+            context=context,
+            temperature=0.0,
+            max_tokens=budget,
+        )
+        return self.summarizer.generate(request).content.strip()
+
+    def _record(self, source_tokens: int, summary_text: str) -> None:
+        with self._lock:
+            self._stats["summaries_created"] += 1
+            self._stats["source_tokens"] += source_tokens
+            self._stats["summary_tokens"] += len(summary_text.split())
+
+    # Reporting --------------------------------------------------------
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            stats: dict[str, float] = dict(self._stats)
+            stats["pending"] = len(self._pending)
+            stats["cached_summaries"] = len(self._cache)
+        stats["reuse_rate"] = stats["reuses"] / stats["lookups"] if stats["lookups"] else 0.0
+        stats["compaction_ratio"] = stats["summary_tokens"] / stats["source_tokens"] if stats["source_tokens"] else 0.0
+        return stats
+
+    def wait_idle(self, timeout: float = 5.0) -> bool:
+        """Block until no summarization is pending. Intended for tests and shutdown."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self._lock:
+                if not self._pending:
+                    return True
+            time.sleep(0.01)
+        return False
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+__all__ = ["ConversationCompactor", "RollingSummary", "content_terms", "extractive_summary"]
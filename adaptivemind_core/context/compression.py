@@ -0,0 +1,198 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+from __future__ import annotations
+
+import math
+import re
+import threading
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from ..config import CompressionConfig
+from .compaction import content_terms
+from .engine import ContextSection
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+_BOILERPLATE = re.compile(
+    r"all rights reserved|cookie|click here|subscribe|sign up for|privacy policy|terms of (use|service)"
+    r"|share this|follow us|skip to (main )?content|^\W*(copyright|\(c\)|©)",
+    re.IGNORECASE,
+)
+_NOISE = re.compile(r"([-=_*#~.])\1{2,}")
+_PROTECTED_TITLES = frozenset({"Persona", "Conversation", "Summary"})
+_SALIENT_TERMS = 20
+
+
+@dataclass
+class CompressionStats:
+    """Per-request outcome of the compression stage."""
+
+    tokens_before: int
+    tokens_after: int
+    target_ratio: float
+    salience_recall: float
+
+    @property
+    def tokens_removed(self) -> int:
+        return self.tokens_before - self.tokens_after
+
+    def as_diagnostics(self) -> dict[str, str]:
+        return {
+            "compression.tokens_before": str(self.tokens_before),
+            "compression.tokens_removed": str(self.tokens_removed),
+            "compression.target_ratio": f"{self.target_ratio:.2f}",
+            "compression.salience_recall": f"{self.salience_recall:.3f}",
+        }
+
+
+class PromptCompressor:
+    """Shrinks research and document sections while keeping their salient content.
+
+    Three passes run in order until the budget is met: boilerplate and noise
+    stripping, removal of sentences that repeat earlier ones across sections,
+    and extractive selection of the sentences closest to the TF-IDF centroid
+    of the compressible text.
+    """
+
+    def __init__(self, config: CompressionConfig):
+        self._config = config
+        self._lock = threading.Lock()
+        self._totals = {"requests": 0, "tokens_before": 0, "tokens_removed": 0, "salience_recall_sum": 0.0}
+
+    def target_ratio(self, persona: str) -> float:
+        return self._config.persona_target_ratios.get(persona, self._config.default_target_ratio)
+
+    def compress(
+        self, sections: Sequence[ContextSection], budget_tokens: int, persona: str
+    ) -> tuple[list[ContextSection], CompressionStats]:
+        ratio = self.target_ratio(persona)
+        protected_tokens = sum(s.token_length() for s in sections if self._is_protected(s))
+        tokens_before = sum(s.token_length() for s in sections if not self._is_protected(s))
+        target = max(0, min(int(tokens_before * ratio), budget_tokens - protected_tokens))
+
+        original = [
+            (index, sentence)
+            for index, section in enumerate(sections)
+            if not self._is_protected(section)
+            for sentence in self._sentences(section.body)
+        ]
+        sentences = [(index, sentence) for index, sentence in original if not _BOILERPLATE.search(sentence)]
+        salient = self._salient_terms(self._tfidf([sentence for _, sentence in sentences]))
+        sentences = self._deduplicate(sentences)
+        if sum(len(sentence.split()) for _, sentence in sentences) > target:
+            sentences = self._select_central(sentences, self._tfidf([sentence for _, sentence in sentences]), target)
+
+        kept: dict[int, list[str]] = {}
+        for index, sentence in sentences:
+            kept.setdefault(index, []).append(sentence)
+        result: list[ContextSection] = []
+        for index, section in enumerate(sections):
+            if self._is_protected(section):
+                result.append(section)
+            elif index in kept:
+                result.append(ContextSection(section.title, " ".join(kept[index])))
+
+        remaining = {term for _, sentence in sentences for term in content_terms(sentence)}
+        stats = CompressionStats(
+            tokens_before=tokens_before,
+            tokens_after=sum(s.token_length() for s in result if not self._is_protected(s)),
+            target_ratio=ratio,
+            salience_recall=sum(1 for term in salient if term in remaining) / len(salient) if salient else 1.0,
+        )
+        with self._lock:
+            self._totals["requests"] += 1
+            self._totals["tokens_before"] += stats.tokens_before
+            self._totals["tokens_removed"] += stats.tokens_removed
+            self._totals["salience_recall_sum"] += stats.salience_recall
+        return result, stats
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            totals = dict(self._totals)
+        requests = totals.pop("requests")
+        recall_sum = totals.pop("salience_recall_sum")
+        return {
+            "requests": requests,
+            "tokens_before": totals["tokens_before"],
+            "tokens_removed": totals["tokens_removed"],
+            "mean_salience_recall": recall_sum / requests if requests else 0.0,
+        }
+
+    # Passes -----------------------------------------------------------
+
+    @staticmethod
+    def _is_protected(section: ContextSection) -> bool:
+        return section.title in _PROTECTED_TITLES
+
+    @staticmethod
+    def _sentences(body: str) -> list[str]:
+        body = _NOISE.sub(" ", body)
+        body = re.sub(r"\s+", " ", body).strip()
+        return [sentence for sentence in _SENTENCE_SPLIT.split(body) if sentence]
+
+    def _deduplicate(self, sentences: list[tuple[int, str]]) -> list[tuple[int, str]]:
+        threshold = self._config.redundancy_threshold
+        kept: list[tuple[int, str]] = []
+        seen: list[frozenset[str]] = []
+        for index, sentence in sentences:
+            terms = frozenset(content_terms(sentence))
+            if terms and any(len(terms & other) / len(terms | other) >= threshold for other in seen):
+                continue
+            seen.append(terms)
+            kept.append((index, sentence))
+        return kept
+
+    @staticmethod
+    def _tfidf(sentences: Sequence[str]) -> list[dict[str, float]]:
+        term_lists = [content_terms(sentence) for sentence in sentences]
+        document_frequency = Counter(term for terms in term_lists for term in set(terms))
+        total = len(term_lists)
+        vectors = []
+        for terms in term_lists:
+            counts = Counter(terms)
+            vectors.append({term: count * math.log((1 + total) / (1 + document_frequency[term])) + count * 1e-3
+                            for term, count in counts.items()})
+        return vectors
+
+    @staticmethod
+    def _select_central(
+        sentences: list[tuple[int, str]], vectors: list[dict[str, float]], target: int
+    ) -> list[tuple[int, str]]:
+        centroid: Counter[str] = Counter()
+        for vector in vectors:
+            centroid.update(vector)
+        centroid_norm = math.sqrt(sum(value * value for value in centroid.values())) or 1.0
+
+        def centrality(position: int) -> float:
+            vector = vectors[position]
+            norm = math.sqrt(sum(value * value for value in vector.values())) or 1.0
+            return sum(value * centroid[term] for term, value in vector.items()) / (norm * centroid_norm)
+
+        chosen: list[int] = []
+        budget = target
+        for position in sorted(range(len(sentences)), key=centrality, reverse=True):
+            length = len(sentences[position][1].split())
+            if length <= budget:
+                chosen.append(position)
+                budget -= length
+        return [sentences[position] for position in sorted(chosen)]
+
+    @staticmethod
+    def _salient_terms(vectors: list[dict[str, float]]) -> list[str]:
+        """Most salient non-boilerplate terms by total TF-IDF weight; their recall is the quality proxy."""
+        weight: Counter[str] = Counter()
+        for vector in vectors:
+            weight.update(vector)
+        return [term for term, _ in weight.most_common(_SALIENT_TERMS)]
+
+
+__all__ = ["CompressionStats", "PromptCompressor"]
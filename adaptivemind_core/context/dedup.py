@@ -0,0 +1,158 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+"""Near-duplicate detection with MinHash signatures and LSH banding.
+
+A text's signature is the minimum of ``num_perm`` random hash functions
+over its word shingles; the share of positions two signatures agree on
+estimates the Jaccard similarity of their shingle sets. Signatures are cut
+into ``bands`` and each band is a hash-table key, so a lookup only compares
+against texts sharing at least one band instead of scanning everything.
+Candidates are then confirmed against ``threshold``.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import threading
+import zlib
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from ..config import DeduplicationConfig
+
+_WORD = re.compile(r"\w+")
+# Mersenne prime 2**31 - 1: a * h + b stays below 2**63 for 31-bit a, b and h
+_PRIME = (1 << 31) - 1
+
+Signature = tuple[int, ...]
+
+
+def _numpy() -> Any:
+    import numpy
+
+    return numpy
+
+
+class MinHasher:
+    """Computes MinHash signatures of texts.
+
+    Args:
+        num_perm: Hash functions, i.e. signature length
+        shingle_words: Words per shingle
+        seed: Seed of the hash functions; signatures only compare under the same seed
+    """
+
+    def __init__(self, num_perm: int, shingle_words: int, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._shingle_words = shingle_words
+        self._a = [rng.randrange(1, _PRIME) for _ in range(num_perm)]
+        self._b = [rng.randrange(0, _PRIME) for _ in range(num_perm)]
+        self._arrays: tuple[Any, Any] | None = None
+
+    def signature(self, text: str) -> Signature:
+        """Signature of ``text``; empty when it has no words."""
+        words = _WORD.findall(text.lower())
+        if not words:
+            return ()
+        size = min(self._shingle_words, len(words))
+        shingles = {" ".join(words[start : start + size]) for start in range(len(words) - size + 1)}
+        np = _numpy()
+        if self._arrays is None:
+            self._arrays = (np.array(self._a, dtype=np.uint64)[:, None], np.array(self._b, dtype=np.uint64)[:, None])
+        a, b = self._arrays
+        hashes = np.fromiter((zlib.crc32(shingle.encode()) % _PRIME for shingle in shingles), dtype=np.uint64, count=len(shingles))
+        return tuple(((a * hashes + b) % _PRIME).min(axis=1).tolist())
+
+
+def similarity(first: Signature, second: Signature) -> float:
+    """Estimated Jaccard similarity of the texts behind two signatures."""
+    if not first or len(first) != len(second):
+        return 0.0
+    return sum(1 for x, y in zip(first, second) if x == y) / len(first)
+
+
+def collapse(signatures: Sequence[Signature], threshold: float) -> list[int]:
+    """Positions of the items to keep: each item unless it is a near-duplicate of an earlier kept one."""
+    kept: list[int] = []
+    for position, signature in enumerate(signatures):
+        if not any(similarity(signatures[other], signature) >= threshold for other in kept):
+            kept.append(position)
+    return kept
+
+
+class NearDuplicateIndex:
+    """LSH index of signatures finding near-duplicates without a full scan.
+
+    Args:
+        config: Signature size, banding and similarity threshold
+    """
+
+    def __init__(self, config: DeduplicationConfig):
+        self._config = config
+        self.hasher = MinHasher(config.num_perm, config.shingle_words)
+        self._rows = max(1, config.num_perm // config.bands)
+        self._bands = min(config.bands, config.num_perm)
+        self._buckets: list[dict[Signature, set[str]]] = [{} for _ in range(self._bands)]
+        self._signatures: dict[str, Signature] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def signature(self, text: str) -> Signature:
+        return self.hasher.signature(text)
+
+    def find(self, signature: Signature) -> tuple[str, float] | None:
+        """Most similar indexed key at or above the threshold, with its similarity."""
+        if not signature:
+            return None
+        with self._lock:
+            candidates: set[str] = set()
+            for band, buckets in zip(self._bands_of(signature), self._buckets):
+                candidates |= buckets.get(band, set())
+            scored = ((similarity(self._signatures[key], signature), key) for key in candidates)
+            best = max(scored, default=None)
+        if best is None or best[0] < self._config.threshold:
+            return None
+        return best[1], best[0]
+
+    def add(self, key: str, signature: Signature) -> None:
+        if not signature:
+            return
+        with self._lock:
+            self._discard(key)
+            self._signatures[key] = signature
+            for band, buckets in zip(self._bands_of(signature), self._buckets):
+                buckets.setdefault(band, set()).add(key)
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            self._discard(key)
+
+    def _discard(self, key: str) -> None:
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for band, buckets in zip(self._bands_of(signature), self._buckets):
+            keys = buckets.get(band)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del buckets[band]
+
+    def _bands_of(self, signature: Signature) -> Iterable[Signature]:
+        rows = self._rows
+        return (signature[band * rows : (band + 1) * rows] for band in range(self._bands))
+
+
+__all__ = ["MinHasher", "NearDuplicateIndex", "Signature", "collapse", "similarity"]
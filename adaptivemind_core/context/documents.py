@@ -0,0 +1,357 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+"""Searchable index of ingested documents for the ``retrieval`` context stage.
+
+Documents are split into chunks and each chunk's terms go into an inverted
+index (term -> chunk -> term frequency), so a query only touches the
+postings of its own terms. Chunks are ranked with BM25. Adding a document
+under an existing id replaces it; beyond ``max_chunks`` the oldest
+documents are dropped.
+
+With deduplication enabled, a document that is a near-duplicate of an
+indexed one is only linked to it, and search results keep the best chunk
+of each group of near-identical chunks. A linked document keeps its text,
+and the chunks it would take count towards ``max_chunks``: when the
+document it duplicates is replaced or removed, it is indexed in its place
+(or linked to another match). Eviction drops an original together with
+all of its duplicates, and a new duplicate makes its original the most
+recently added document.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..config import DocumentIndexConfig
+from .dedup import NearDuplicateIndex, Signature, collapse
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+_STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have how i in is it its of on or that the this to was were what when "
+    "where which who why will with you your".split()
+)
+# BM25 term-frequency saturation and length normalisation
+_K1 = 1.2
+_B = 0.75
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-cased index terms of ``text``, without stop words."""
+    return [token for token in _TOKEN.findall(text.lower()) if token not in _STOPWORDS]
+
+
+@dataclass
+class Chunk:
+    """One searchable piece of a document."""
+
+    chunk_id: int
+    doc_id: str
+    source: str
+    title: str
+    text: str
+    length: int
+    metadata: dict[str, Any] = field(default_factory=dict)
+    signature: Signature = ()
+
+
+@dataclass
+class IndexedDocument:
+    """Outcome of adding a document: its chunks, or the document it duplicates."""
+
+    doc_id: str
+    chunks: int
+    duplicate_of: str | None = None
+    similarity: float = 0.0
+
+
+@dataclass
+class _LinkedDocument:
+    """A near-duplicate held aside, indexed if the document it duplicates goes away."""
+
+    text: str
+    source: str
+    title: str | None
+    metadata: dict[str, Any]
+    signature: Signature
+    chunks: int
+
+
+def chunk_text(text: str, chunk_tokens: int, overlap_tokens: int = 0, semantic: bool = True) -> list[str]:
+    """Split ``text`` into chunks of at most ``chunk_tokens`` words.
+
+    Semantic chunking packs whole sentences, starting a new chunk at every
+    paragraph that does not fit; otherwise chunks are fixed word windows
+    overlapping by ``overlap_tokens``. A sentence longer than a chunk is
+    split into windows either way.
+    """
+    words_limit = max(1, chunk_tokens)
+    if not semantic:
+        return _windows(text.split(), words_limit, overlap_tokens)
+    chunks: list[str] = []
+    current: list[str] = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        for sentence in _SENTENCE_END.split(paragraph.strip()):
+            words = sentence.split()
+            if not words:
+                continue
+            if len(words) > words_limit:
+                if current:
+                    chunks.append(" ".join(current))
+                    current = []
+                chunks.extend(_windows(words, words_limit, overlap_tokens))
+                continue
+            if len(current) + len(words) > words_limit:
+                chunks.append(" ".join(current))
+                current = []
+            current.extend(words)
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+
+def _windows(words: list[str], size: int, overlap: int) -> list[str]:
+    step = max(1, size - min(overlap, size - 1))
+    starts = range(0, max(1, len(words) - overlap), step)
+    return [" ".join(words[start : start + size]) for start in starts if words[start : start + size]]
+
+
+class DocumentIndex:
+    """Thread-safe inverted index with BM25 ranking.
+
+    Args:
+        config: Chunking, capacity and retrieval settings
+        semantic: Whether chunks follow sentence and paragraph boundaries
+    """
+
+    def __init__(self, config: DocumentIndexConfig, semantic: bool = True):
+        self._config = config
+        self._semantic = semantic
+        self._lock = threading.RLock()
+        self._chunks: dict[int, Chunk] = {}
+        self._postings: dict[str, dict[int, int]] = {}
+        self._documents: OrderedDict[str, list[int]] = OrderedDict()
+        self._total_length = 0
+        self._next_id = 0
+        self._dedup = NearDuplicateIndex(config.dedup) if config.dedup.enabled else None
+        self._duplicate_of: dict[str, str] = {}
+        self._clusters: dict[str, list[str]] = {}
+        self._linked: dict[str, _LinkedDocument] = {}
+        self._linked_chunks = 0  # chunks the linked documents would take if indexed
+        self._counters = dict.fromkeys(
+            (
+                "documents_added",
+                "documents_replaced",
+                "documents_evicted",
+                "duplicates_linked",
+                "duplicates_promoted",
+                "duplicates_evicted",
+                "duplicates_collapsed",
+                "searches",
+            ),
+            0,
+        )
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def add(
+        self, doc_id: str, text: str, source: str = "", title: str | None = None, metadata: dict[str, Any] | None = None
+    ) -> IndexedDocument:
+        """Index a document, replacing any earlier one with the same id, or link it to the document it duplicates."""
+        # Tokenize and sign outside the lock; only the index update is serialised
+        signature = self._dedup.signature(text) if self._dedup is not None else ()
+        prepared = self._prepare(text)
+        metadata = dict(metadata or {})
+        with self._lock:
+            if doc_id in self._duplicate_of:
+                self._unlink(doc_id)
+                self._counters["documents_replaced"] += 1
+            elif doc_id in self._documents:
+                self._remove(doc_id)
+                self._counters["documents_replaced"] += 1
+            match = self._dedup.find(signature) if self._dedup is not None else None
+            if match is not None:
+                canonical, score = match
+                self._link(doc_id, canonical, _LinkedDocument(text, source, title, metadata, signature, len(prepared)))
+                self._documents.move_to_end(canonical)
+                self._counters["duplicates_linked"] += 1
+                self._evict()
+                return IndexedDocument(doc_id, 0, canonical, score)
+            chunks = self._store(doc_id, prepared, source, title, metadata, signature)
+            self._counters["documents_added"] += 1
+            self._evict()
+        return IndexedDocument(doc_id, chunks)
+
+    def remove(self, doc_id: str) -> bool:
+        with self._lock:
+            if doc_id in self._duplicate_of:
+                self._unlink(doc_id)
+                return True
+            if doc_id not in self._documents:
+                return False
+            self._remove(doc_id)
+            return True
+
+    def duplicates(self, doc_id: str) -> list[str]:
+        """Ids linked to ``doc_id`` as its near-duplicates."""
+        with self._lock:
+            return list(self._clusters.get(doc_id, ()))
+
+    def canonical(self, doc_id: str) -> str | None:
+        """Id of the indexed document ``doc_id`` is linked to, if it is a near-duplicate."""
+        with self._lock:
+            return self._duplicate_of.get(doc_id)
+
+    def search(self, query: str, limit: int | None = None, min_score: float | None = None) -> list[tuple[Chunk, float]]:
+        """Best chunks for ``query``, highest BM25 score first."""
+        terms = set(tokenize(query))
+        limit = limit or self._config.top_k
+        min_score = self._config.min_score if min_score is None else min_score
+        with self._lock:
+            self._counters["searches"] += 1
+            if not terms or not self._chunks:
+                return []
+            total = len(self._chunks)
+            average = self._total_length / total or 1.0
+            scores: dict[int, float] = {}
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+                for chunk_id, count in postings.items():
+                    norm = _K1 * (1 - _B + _B * self._chunks[chunk_id].length / average)
+                    scores[chunk_id] = scores.get(chunk_id, 0.0) + idf * count * (_K1 + 1) / (count + norm)
+            # Over-fetch so that collapsing near-identical chunks still leaves ``limit`` results
+            wanted = limit * 4 if self._dedup is not None else limit
+            best = [
+                (self._chunks[chunk_id], score)
+                for chunk_id, score in heapq.nlargest(wanted, scores.items(), key=lambda item: item[1])
+                if score >= min_score
+            ]
+            if self._dedup is not None and len(best) > 1:
+                kept = collapse([chunk.signature for chunk, _ in best], self._config.dedup.threshold)
+                self._counters["duplicates_collapsed"] += len(best) - len(kept)
+                best = [best[position] for position in kept]
+            return best[:limit]
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "documents": len(self._documents),
+                "chunks": len(self._chunks),
+                "terms": len(self._postings),
+                "duplicates": len(self._duplicate_of),
+                "linked_chunks": self._linked_chunks,
+                **self._counters,
+            }
+
+    def _prepare(self, text: str) -> list[tuple[str, Counter[str], Signature]]:
+        pieces = chunk_text(text, self._config.chunk_tokens, self._config.chunk_overlap_tokens, self._semantic)
+        sign = self._dedup.signature if self._dedup is not None else lambda _: ()
+        return [(piece, Counter(tokenize(piece)), sign(piece)) for piece in pieces]
+
+    def _store(
+        self,
+        doc_id: str,
+        prepared: list[tuple[str, Counter[str], Signature]],
+        source: str,
+        title: str | None,
+        metadata: dict[str, Any],
+        signature: Signature,
+    ) -> int:
+        ids = []
+        for piece, terms, chunk_signature in prepared:
+            chunk_id, self._next_id = self._next_id, self._next_id + 1
+            length = sum(terms.values())
+            self._chunks[chunk_id] = Chunk(
+                chunk_id, doc_id, source, title or doc_id, piece, length, dict(metadata), chunk_signature
+            )
+            for term, count in terms.items():
+                self._postings.setdefault(term, {})[chunk_id] = count
+            self._total_length += length
+            ids.append(chunk_id)
+        self._documents[doc_id] = ids
+        if self._dedup is not None:
+            self._dedup.add(doc_id, signature)
+        return len(ids)
+
+    def _evict(self) -> None:
+        """Drop the oldest originals with their duplicates until indexed and linked chunks fit ``max_chunks``."""
+        while len(self._chunks) + self._linked_chunks > self._config.max_chunks:
+            if len(self._documents) > 1:
+                oldest = next(iter(self._documents))
+                for duplicate in list(self._clusters.get(oldest, ())):
+                    self._unlink(duplicate)
+                    self._counters["duplicates_evicted"] += 1
+                self._remove(oldest)
+                self._counters["documents_evicted"] += 1
+            elif self._linked:
+                # One original is left; forget its oldest duplicates
+                self._unlink(next(iter(self._linked)))
+                self._counters["duplicates_evicted"] += 1
+            else:
+                return
+
+    def _link(self, doc_id: str, canonical: str, document: _LinkedDocument) -> None:
+        self._duplicate_of[doc_id] = canonical
+        self._clusters.setdefault(canonical, []).append(doc_id)
+        self._linked[doc_id] = document
+        self._linked_chunks += document.chunks
+
+    def _unlink(self, doc_id: str) -> None:
+        canonical = self._duplicate_of.pop(doc_id)
+        self._linked_chunks -= self._linked.pop(doc_id).chunks
+        self._clusters[canonical].remove(doc_id)
+        if not self._clusters[canonical]:
+            del self._clusters[canonical]
+
+    def _promote(self, doc_id: str) -> None:
+        """Index a linked document whose original was replaced or removed, or link it to another match."""
+        document = self._linked.pop(doc_id)
+        self._linked_chunks -= document.chunks
+        del self._duplicate_of[doc_id]
+        match = self._dedup.find(document.signature) if self._dedup is not None else None
+        if match is not None:
+            self._link(doc_id, match[0], document)
+            return
+        self._store(doc_id, self._prepare(document.text), document.source, document.title, document.metadata, document.signature)
+        self._counters["duplicates_promoted"] += 1
+
+    def _remove(self, doc_id: str) -> None:
+        if self._dedup is not None:
+            self._dedup.remove(doc_id)
+        duplicates = self._clusters.pop(doc_id, [])
+        self._drop_chunks(doc_id)
+        # The first duplicate takes the original's place; the others usually link to it
+        for duplicate in duplicates:
+            self._promote(duplicate)
+
+    def _drop_chunks(self, doc_id: str) -> None:
+        for chunk_id in self._documents.pop(doc_id):
+            chunk = self._chunks.pop(chunk_id)
+            self._total_length -= chunk.length
+            for term in set(tokenize(chunk.text)):
+                postings = self._postings.get(term)
+                if postings is not None:
+                    postings.pop(chunk_id, None)
+                    if not postings:
+                        del self._postings[term]
+
+
+__all__ = ["Chunk", "DocumentIndex", "IndexedDocument", "chunk_text", "tokenize"]
@@ -10,51 +10,179 @@
 
 from __future__ import annotations
 
-import itertools
 import re
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from ..config import AppConfig, PersonaConfig
 from ..logger import get_logger
+from ..monitoring.tracing import get_tracer
+from .dedup import MinHasher, Signature, similarity
+from .documents import DocumentIndex
+from .pipeline import ContextStage, StagedContextPipeline, StageInput
+
+if TYPE_CHECKING:
+    from .compaction import ConversationCompactor
+    from .compression import PromptCompressor
+    from .sessions import ConversationSession
+    from .templates import CompiledPersona, PersonaTemplates
 
 logger = get_logger(__name__)
 
+CONVERSATION_WINDOW = 20
+
 
 @dataclass
 class ContextSection:
     title: str
     body: str
+    tokens: int | None = None
+    rendered: str | None = None  # Precompiled ``## title`` block, when the section never changes
 
     def token_length(self) -> int:
+        if self.tokens is not None:
+            return max(1, self.tokens)
         return max(1, len(self.body.split()))
 
+    def render(self) -> str:
+        return self.rendered if self.rendered is not None else f"## {self.title}\n{self.body}"
+
+
+@dataclass
+class ContextBuild:
+    """Assembled context plus per-request pipeline diagnostics."""
+
+    text: str
+    diagnostics: dict[str, str]
+    template: CompiledPersona | None = None
+
+
+def normalize_message(message: dict) -> str:
+    """Render a chat message as a single ``ROLE: content`` conversation line."""
+    role = message.get("role", "user").lower()
+    content = message.get("content", "").strip()
+    return f"{role.upper()}: {content}"
+
 
 class ContextEngine:
     """Context engineering pipeline that enriches prompts for the LLMs."""
 
     def __init__(self, config: AppConfig):
         self._config = config
+        from .templates import PersonaTemplates
 
-    def build_context(self, persona: PersonaConfig, messages: Sequence[dict], external_context: Iterable[str] | None = None) -> str:
-        sections: list[ContextSection] = [
-            ContextSection("Persona", persona.system_prompt),
-            self._conversation_section(messages),
-        ]
-        if external_context:
-            sections.append(self._external_section(external_context))
-        if self._config.context_pipeline.extra_documents_dir:
-            sections.extend(self._document_sections())
-        ordered = self._truncate(sections, persona.max_context_window)
-        return "\n\n".join(f"## {section.title}\n{section.body}" for section in ordered)
+        self.templates: PersonaTemplates = PersonaTemplates(config.personas)
+        self.compactor: ConversationCompactor | None = None
+        if config.context_pipeline.compaction.enabled:
+            from .compaction import ConversationCompactor
+
+            self.compactor = ConversationCompactor(config.context_pipeline.compaction, window=CONVERSATION_WINDOW)
+        self.compressor: PromptCompressor | None = None
+        if config.context_pipeline.compression.enabled:
+            from .compression import PromptCompressor
+
+            self.compressor = PromptCompressor(config.context_pipeline.compression)
+        self.documents = DocumentIndex(
+            config.context_pipeline.document_index, semantic=config.context_pipeline.enable_semantic_chunking
+        )
+        dedup = config.context_pipeline.document_index.dedup
+        self._hasher = MinHasher(dedup.num_perm, dedup.shingle_words) if dedup.enabled else None
+        # Sanitized text and signature of each extra document, valid while its (mtime, size) holds
+        self._document_cache: dict[Path, tuple[tuple[int, int], str, Signature]] = {}
+        self.pipeline = self._default_pipeline()
+
+    def _default_pipeline(self) -> StagedContextPipeline:
+        timeouts = self._config.context_pipeline.stage_timeouts_s
+        return StagedContextPipeline(
+            [
+                ContextStage(
+                    "persona", lambda request: [(request.template or self.templates.get(request.persona)).section()]
+                ),
+                ContextStage(
+                    "conversation", lambda request: self._conversation_sections(request.messages, request.session)
+                ),
+                ContextStage(
+                    "research",
+                    lambda request: [self._external_section(request.external_context or [])],
+                    timeout_s=timeouts.get("research", 0.25),
+                    applies=lambda request: bool(request.external_context),
+                ),
+                ContextStage(
+                    "documents",
+                    lambda request: self._document_sections(),
+                    timeout_s=timeouts.get("documents", 0.5),
+                    applies=lambda request: self._config.context_pipeline.extra_documents_dir is not None,
+                ),
+                ContextStage(
+                    "retrieval",
+                    lambda request: self._retrieval_sections(request.messages),
+                    timeout_s=timeouts.get("retrieval", 0.25),
+                    applies=lambda request: len(self.documents) > 0,
+                ),
+            ],
+            max_workers=self._config.context_pipeline.max_stage_workers,
+        )
+
+    def build_context(
+        self,
+        persona: PersonaConfig,
+        messages: Sequence[dict],
+        external_context: Iterable[str] | None = None,
+        session: ConversationSession | None = None,
+    ) -> str:
+        return self.build(persona, messages, external_context, session=session).text
+
+    def build(
+        self,
+        persona: PersonaConfig,
+        messages: Sequence[dict],
+        external_context: Iterable[str] | None = None,
+        session: ConversationSession | None = None,
+        budget: int | None = None,
+        disabled_stages: frozenset[str] = frozenset(),
+        template: CompiledPersona | None = None,
+    ) -> ContextBuild:
+        """Run the pipeline and fit its sections into ``budget`` tokens (the persona's window by default).
+
+        ``template`` is the persona's compiled framing when the caller already
+        holds it (the router's snapshot); otherwise it is looked up.
+        """
+        template = template or self.templates.get(persona)
+        request = StageInput(
+            persona=persona,
+            messages=messages,
+            external_context=list(external_context) if external_context else None,
+            session=session,
+            disabled_stages=disabled_stages,
+            template=template,
+        )
+        tracer = get_tracer()
+        with tracer.span("context.build", {"persona": persona.name}) as span:
+            sections, diagnostics = self.pipeline.run(request)
+            budget = min(budget or persona.max_context_window, persona.max_context_window)
+            if self.compressor is not None and sum(section.token_length() for section in sections) > budget:
+                with tracer.span("context.compress"):
+                    sections, compression = self.compressor.compress(sections, budget, persona.name)
+                diagnostics.update(compression.as_diagnostics())
+            ordered = self._truncate(sections, budget)
+            text = "\n\n".join(section.render() for section in ordered)
+            span.set_attribute("sections", len(ordered))
+        return ContextBuild(text=text, diagnostics=diagnostics, template=template)
+
+    def _conversation_sections(self, messages: Sequence[dict], session: ConversationSession | None) -> list[ContextSection]:
+        if session is not None:
+            summary = self.compactor.session_sections(session) if self.compactor is not None else []
+            return [*summary, session.conversation_section()]
+        if self.compactor is not None:
+            compacted = self.compactor.compact(messages)
+            if compacted is not None:
+                return compacted
+        return [self._conversation_section(messages)]
 
     def _conversation_section(self, messages: Sequence[dict]) -> ContextSection:
-        normalized = []
-        for message in messages[-20:]:
-            role = message.get("role", "user").lower()
-            content = message.get("content", "").strip()
-            normalized.append(f"{role.upper()}: {content}")
-        body = "\n".join(normalized)
+        body = "\n".join(normalize_message(message) for message in messages[-CONVERSATION_WINDOW:])
         return ContextSection("Conversation", body)
 
     def _external_section(self, snippets: Iterable[str]) -> ContextSection:
@@ -66,16 +194,48 @@ class ContextEngine:
         if not directory or not directory.exists():
             return []
         sections: list[ContextSection] = []
-        for path in itertools.islice(sorted(directory.glob("**/*.txt")), 0, 5):
-            try:
-                with path.open("r", encoding="utf-8") as handle:
-                    content = handle.read().strip()
-            except OSError:
-                logger.warning("Failed to read context document", extra={"path": str(path)})
+        signatures: list[Signature] = []
+        threshold = self._config.context_pipeline.document_index.dedup.threshold
+        for path in sorted(directory.glob("**/*.txt")):
+            if len(sections) == 5:
+                break
+            document = self._read_document(path)
+            if document is None:
                 continue
-            sections.append(ContextSection(title=f"Doc:{path.stem}", body=self._sanitize(content)))
+            body, signature = document
+            if self._hasher is not None:
+                # A near-copy of a document already included takes the next document's place
+                if any(similarity(signature, other) >= threshold for other in signatures):
+                    continue
+                signatures.append(signature)
+            sections.append(ContextSection(title=f"Doc:{path.stem}", body=body))
         return sections
 
+    def _read_document(self, path: Path) -> tuple[str, Signature] | None:
+        """Sanitized text and signature of an extra document, re-read only when the file changes."""
+        try:
+            stat = path.stat()
+            version = (stat.st_mtime_ns, stat.st_size)
+            cached = self._document_cache.get(path)
+            if cached is not None and cached[0] == version:
+                return cached[1], cached[2]
+            with path.open("r", encoding="utf-8") as handle:
+                content = handle.read().strip()
+        except OSError:
+            self._document_cache.pop(path, None)
+            logger.warning("Failed to read context document", extra={"path": str(path)})
+            return None
+        body, signature = self._sanitize(content), self._hasher.signature(content) if self._hasher is not None else ()
+        self._document_cache[path] = (version, body, signature)
+        return body, signature
+
+    def _retrieval_sections(self, messages: Sequence[dict]) -> list[ContextSection]:
+        query = next((message.get("content", "") for message in reversed(messages) if message.get("role") == "user"), "")
+        return [
+            ContextSection(title=f"Knowledge:{chunk.title}", body=chunk.text)
+            for chunk, _ in self.documents.search(query)
+        ]
+
     def _truncate(self, sections: Sequence[ContextSection], max_tokens: int) -> list[ContextSection]:
         result: list[ContextSection] = []
         running_total = 0
@@ -90,10 +250,23 @@ class ContextEngine:
             running_total += tokens
         return result
 
+    def stats(self) -> dict[str, dict[str, float]]:
+        return {
+            "templates": self.templates.stats(),
+            "compaction": self.compactor.stats() if self.compactor is not None else {},
+            "compression": self.compressor.stats() if self.compressor is not None else {},
+            "documents": self.documents.stats(),
+        }
+
+    def shutdown(self) -> None:
+        self.pipeline.shutdown()
+        if self.compactor is not None:
+            self.compactor.shutdown()
+
     def _sanitize(self, value: str) -> str:
         value = value.replace("\r\n", "\n").replace("\r", "\n")
         value = re.sub(r"\s+", " ", value)
         return value.strip()
 
 
-__all__ = ["ContextEngine", "ContextSection"]
+__all__ = ["ContextBuild", "ContextEngine", "ContextSection", "normalize_message"]
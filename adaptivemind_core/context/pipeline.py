@@ -0,0 +1,170 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from ..config import PersonaConfig
+from ..logger import get_logger
+from ..monitoring.tracing import current_span, get_tracer
+
+if TYPE_CHECKING:
+    from .engine import ContextSection
+    from .sessions import ConversationSession
+    from .templates import CompiledPersona
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class StageInput:
+    """Everything a context stage may read while building one request's context."""
+
+    persona: PersonaConfig
+    messages: Sequence[dict]
+    external_context: list[str] | None = None
+    session: ConversationSession | None = None
+    disabled_stages: frozenset[str] = field(default_factory=frozenset)
+    template: CompiledPersona | None = None
+
+
+@dataclass
+class ContextStage:
+    """A named step that contributes sections to the context.
+
+    Stages without a timeout run inline on the request thread and must
+    succeed. Stages with a timeout run concurrently on the pipeline's worker
+    pool; if they miss their deadline or fail, the context is built without
+    them.
+    """
+
+    name: str
+    run: Callable[[StageInput], list[ContextSection]]
+    timeout_s: float | None = None
+    applies: Callable[[StageInput], bool] = lambda request: True
+
+    @property
+    def required(self) -> bool:
+        return self.timeout_s is None
+
+
+class StagedContextPipeline:
+    """Runs context stages, overlapping the independent ones, and records per-stage timing."""
+
+    def __init__(self, stages: Sequence[ContextStage] = (), max_workers: int = 4):
+        self._stages: list[ContextStage] = list(stages)
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def stages(self) -> list[ContextStage]:
+        return list(self._stages)
+
+    def add_stage(self, stage: ContextStage, before: str | None = None) -> None:
+        """Register a stage, optionally ahead of an existing one. Section order follows stage order."""
+        stages = [existing for existing in self._stages if existing.name != stage.name]
+        names = [existing.name for existing in stages]
+        position = names.index(before) if before in names else len(stages)
+        stages.insert(position, stage)
+        self._stages = stages
+
+    def remove_stage(self, name: str) -> None:
+        self._stages = [stage for stage in self._stages if stage.name != name]
+
+    def set_timeout(self, name: str, timeout_s: float) -> None:
+        for stage in self._stages:
+            if stage.name == name and not stage.required:
+                stage.timeout_s = timeout_s
+
+    def run(self, request: StageInput) -> tuple[list[ContextSection], dict[str, str]]:
+        diagnostics: dict[str, str] = {}
+        stages = [
+            stage for stage in self._stages
+            if stage.name not in request.disabled_stages and stage.applies(request)
+        ]
+        for stage in self._stages:
+            if stage not in stages:
+                diagnostics[f"stage.{stage.name}.status"] = "skipped"
+
+        started = time.perf_counter()
+        futures: dict[str, Future[tuple[list[ContextSection], float]]] = {}
+        for stage in stages:
+            if not stage.required:
+                futures[stage.name] = self._submit(stage, request)
+
+        results: dict[str, list[ContextSection]] = {}
+        for stage in stages:
+            if stage.required:
+                stage_start = time.perf_counter()
+                with get_tracer().span(f"context.stage.{stage.name}"):
+                    results[stage.name] = stage.run(request)
+                self._record(diagnostics, stage.name, "ok", (time.perf_counter() - stage_start) * 1000)
+
+        for stage in stages:
+            if stage.required:
+                continue
+            future = futures[stage.name]
+            remaining = max(0.0, started + (stage.timeout_s or 0.0) - time.perf_counter())
+            try:
+                sections, elapsed_ms = future.result(timeout=remaining)
+            except FutureTimeoutError:
+                future.cancel()
+                self._record(diagnostics, stage.name, "timeout", (time.perf_counter() - started) * 1000)
+                current_span().add_event("stage_timeout", {"stage": stage.name, "timeout_s": stage.timeout_s or 0.0})
+                logger.warning("Context stage timed out", extra={"stage": stage.name, "timeout_s": stage.timeout_s})
+                continue
+            except Exception as exc:
+                self._record(diagnostics, stage.name, "error", (time.perf_counter() - started) * 1000)
+                logger.warning("Context stage failed", extra={"stage": stage.name, "error": str(exc)})
+                continue
+            results[stage.name] = sections
+            self._record(diagnostics, stage.name, "ok", elapsed_ms)
+
+        diagnostics["stage.total.ms"] = f"{(time.perf_counter() - started) * 1000:.3f}"
+        ordered = [section for stage in stages for section in results.get(stage.name, [])]
+        return ordered, diagnostics
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, stage: ContextStage, request: StageInput) -> Future[tuple[list[ContextSection], float]]:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="context-stage")
+            executor = self._executor
+
+        def _timed() -> tuple[list[ContextSection], float]:
+            stage_start = time.perf_counter()
+            with get_tracer().span(f"context.stage.{stage.name}", {"timeout_s": stage.timeout_s or 0.0}):
+                sections = stage.run(request)
+            return sections, (time.perf_counter() - stage_start) * 1000
+
+        # Run in a copy of the caller's context so stage spans nest under the request
+        return executor.submit(contextvars.copy_context().run, _timed)
+
+    @staticmethod
+    def _record(diagnostics: dict[str, str], name: str, status: str, elapsed_ms: float) -> None:
+        diagnostics[f"stage.{name}.status"] = status
+        diagnostics[f"stage.{name}.ms"] = f"{elapsed_ms:.3f}"
+
+
+__all__ = ["ContextStage", "StageInput", "StagedContextPipeline"]
@@ -0,0 +1,387 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from ..config import CompactionConfig, SessionConfig
+from ..logger import get_logger
+from ..monitoring.memory import register_buffer
+from .engine import ContextSection, normalize_message
+
+logger = get_logger(__name__)
+
+
+class ConversationSession:
+    """Server-side conversation state that is extended one message at a time.
+
+    Each appended message is normalized exactly once. The rendered conversation
+    body and its token count are maintained incrementally so building context
+    for the next turn does not re-process the whole history.
+
+    When ``token_threshold`` is set, lines that slide out of the rendered
+    window are kept as overflow until the compactor folds them into the
+    rolling ``summary``.
+    """
+
+    def __init__(
+        self,
+        session_id: str,
+        persona: str,
+        window: int = 20,
+        token_threshold: int | None = None,
+        keep_recent: int = 8,
+    ):
+        self.session_id = session_id
+        self.persona = persona
+        self.created_at = time.time()
+        self.last_access = self.created_at
+        self.message_count = 0
+        self.summary: ContextSection | None = None
+        self.on_resize: Callable[[ConversationSession, int], None] | None = None
+        self._window = window
+        self._token_threshold = token_threshold
+        self._keep_recent = keep_recent
+        self._lock = threading.Lock()
+        self._messages: deque[dict[str, str]] = deque()
+        self._lines: deque[str] = deque()
+        self._line_tokens: deque[int] = deque()
+        self._overflow: list[tuple[str, int]] = []
+        self._tokens = 0
+        self._bytes = 0
+        self._body: str | None = ""
+
+    @property
+    def approx_bytes(self) -> int:
+        return self._bytes
+
+    @property
+    def tokens(self) -> int:
+        return self._tokens
+
+    def append(self, message: dict) -> int:
+        """Append a message and return the change in approximate memory usage."""
+        entry = {"role": str(message.get("role", "user")), "content": str(message.get("content", ""))}
+        line = normalize_message(entry)
+        line_tokens = len(line.split())
+        with self._lock:
+            before = self._bytes
+            if self._body is not None:
+                self._body = f"{self._body}\n{line}" if self._body else line
+            self._messages.append(entry)
+            self._lines.append(line)
+            self._line_tokens.append(line_tokens)
+            self._tokens += line_tokens
+            self._bytes += len(line) + len(entry["content"])
+            while len(self._lines) > self._window or self._over_threshold():
+                self._slide()
+            self.message_count += 1
+            self.last_access = time.time()
+            return self._bytes - before
+
+    def checkpoint(self) -> tuple[Any, ...]:
+        """Capture the conversation so that ``restore`` can undo later appends."""
+        with self._lock:
+            return (
+                list(self._messages),
+                list(self._lines),
+                list(self._line_tokens),
+                list(self._overflow),
+                self._tokens,
+                self._bytes,
+                self._body,
+                self.message_count,
+                self.summary,
+            )
+
+    def restore(self, state: tuple[Any, ...]) -> int:
+        """Return to a ``checkpoint`` and return the change in approximate memory usage."""
+        messages, lines, line_tokens, overflow, tokens, size, body, count, summary = state
+        with self._lock:
+            before = self._bytes
+            self._messages, self._lines, self._line_tokens = deque(messages), deque(lines), deque(line_tokens)
+            self._overflow = list(overflow)
+            self._tokens, self._bytes, self._body = tokens, size, body
+            self.message_count, self.summary = count, summary
+            return self._bytes - before
+
+    def _over_threshold(self) -> bool:
+        threshold = self._token_threshold
+        return threshold is not None and self._tokens > threshold and len(self._lines) > self._keep_recent
+
+    def _slide(self) -> None:
+        line = self._lines.popleft()
+        tokens = self._line_tokens.popleft()
+        message = self._messages.popleft()
+        self._tokens -= tokens
+        self._bytes -= len(line) + len(message["content"])
+        # The window slid: the rendered body is rebuilt lazily on next read.
+        self._body = None
+        if self._token_threshold is not None:
+            self._overflow.append((line, tokens))
+            self._bytes += len(line)
+
+    def messages(self) -> list[dict[str, str]]:
+        with self._lock:
+            return list(self._messages)
+
+    def conversation_section(self) -> ContextSection:
+        with self._lock:
+            if self._body is None:
+                self._body = "\n".join(self._lines)
+            return ContextSection("Conversation", self._body, tokens=self._tokens)
+
+    def overflow(self) -> list[str]:
+        """Lines that left the window and are not yet covered by the summary."""
+        with self._lock:
+            return [line for line, _ in self._overflow]
+
+    def apply_summary(self, summary: ContextSection, consumed: int) -> int:
+        """Install a new rolling summary covering the first ``consumed`` overflow lines."""
+        with self._lock:
+            before = self._bytes
+            dropped, self._overflow = self._overflow[:consumed], self._overflow[consumed:]
+            self._bytes -= sum(len(line) for line, _ in dropped)
+            if self.summary is not None:
+                self._bytes -= len(self.summary.body)
+            self.summary = summary
+            self._bytes += len(summary.body)
+            delta = self._bytes - before
+        if self.on_resize is not None:
+            self.on_resize(self, delta)
+        return delta
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "session_id": self.session_id,
+                "persona": self.persona,
+                "created_at": self.created_at,
+                "last_access": self.last_access,
+                "message_count": self.message_count,
+                "window": self._window,
+                "token_threshold": self._token_threshold,
+                "keep_recent": self._keep_recent,
+                "summary": self.summary.body if self.summary is not None else None,
+                "overflow": [line for line, _ in self._overflow],
+                "messages": list(self._messages),
+            }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ConversationSession:
+        session = cls(
+            data["session_id"],
+            data["persona"],
+            window=int(data.get("window") or 20),
+            token_threshold=data.get("token_threshold"),
+            keep_recent=int(data.get("keep_recent") or 8),
+        )
+        for message in data.get("messages", []):
+            session.append(message)
+        session._overflow = [(line, len(line.split())) for line in data.get("overflow", [])] + session._overflow
+        session._bytes += sum(len(line) for line in data.get("overflow", []))
+        if data.get("summary"):
+            session.apply_summary(ContextSection("Summary", data["summary"]), 0)
+        session.created_at = float(data.get("created_at", session.created_at))
+        session.last_access = float(data.get("last_access", session.last_access))
+        session.message_count = int(data.get("message_count", session.message_count))
+        return session
+
+    def summary_info(self) -> dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "persona": self.persona,
+            "created_at": self.created_at,
+            "last_access": self.last_access,
+            "message_count": self.message_count,
+            "context_tokens": self._tokens,
+        }
+
+
+class SessionStore:
+    """LRU/TTL bounded store of conversation sessions with optional disk spill."""
+
+    def __init__(self, config: SessionConfig | None = None, compaction: CompactionConfig | None = None):
+        self._config = config or SessionConfig()
+        self._compaction = compaction
+        self._lock = threading.RLock()
+        self._sessions: OrderedDict[str, ConversationSession] = OrderedDict()
+        register_buffer("sessions", self, lambda store: store._sessions)
+        self._bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0, "spilled": 0, "restored": 0}
+
+    def create(self, persona: str, messages: list[dict] | None = None) -> ConversationSession:
+        compaction = self._compaction
+        session = ConversationSession(
+            uuid.uuid4().hex,
+            persona,
+            window=self._config.history_window,
+            token_threshold=compaction.threshold_tokens if compaction and compaction.enabled else None,
+            keep_recent=compaction.keep_recent_messages if compaction else 8,
+        )
+        for message in messages or []:
+            session.append(message)
+        session.on_resize = self._account_resize
+        with self._lock:
+            self._sessions[session.session_id] = session
+            self._bytes += session.approx_bytes
+            self._enforce_limits()
+        return session
+
+    def get(self, session_id: str) -> ConversationSession | None:
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None and self._is_expired(session, time.time()):
+                self._drop(session_id, spill=False)
+                self._stats["expired"] += 1
+                session = None
+            if session is None:
+                session = self._restore(session_id)
+            if session is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["hits"] += 1
+            self._sessions.move_to_end(session_id)
+            session.last_access = time.time()
+            return session
+
+    def append(self, session_id: str, message: dict) -> ConversationSession:
+        session = self.get(session_id)
+        if session is None:
+            raise KeyError(session_id)
+        delta = session.append(message)
+        with self._lock:
+            if session_id in self._sessions:
+                self._bytes += delta
+                self._enforce_limits()
+        return session
+
+    def checkpoint(self, session_id: str) -> tuple[Any, ...]:
+        """Capture a session's conversation before appending to it.
+
+        Raises:
+            KeyError: If the session does not exist or has expired
+        """
+        session = self.get(session_id)
+        if session is None:
+            raise KeyError(session_id)
+        return session.checkpoint()
+
+    def restore(self, session_id: str, state: tuple[Any, ...]) -> None:
+        """Undo the appends made to a session since ``checkpoint``; a no-op once the session is gone."""
+        with self._lock:
+            session = self._sessions.get(session_id)
+        if session is None:
+            return
+        delta = session.restore(state)
+        with self._lock:
+            if self._sessions.get(session_id) is session:
+                self._bytes += delta
+
+    def _account_resize(self, session: ConversationSession, delta: int) -> None:
+        with self._lock:
+            if self._sessions.get(session.session_id) is session:
+                self._bytes += delta
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            removed = self._drop(session_id, spill=False) is not None
+            spill_path = self._spill_path(session_id)
+            if spill_path is not None and spill_path.exists():
+                spill_path.unlink(missing_ok=True)
+                removed = True
+            return removed
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"sessions": len(self._sessions), "approx_bytes": self._bytes, **self._stats}
+
+    # Internal helpers -------------------------------------------------
+
+    def _is_expired(self, session: ConversationSession, now: float) -> bool:
+        return now - session.last_access > self._config.ttl_s
+
+    def _enforce_limits(self) -> None:
+        now = time.time()
+        while self._sessions:
+            oldest_id, oldest = next(iter(self._sessions.items()))
+            if self._is_expired(oldest, now):
+                self._drop(oldest_id, spill=False)
+                self._stats["expired"] += 1
+                continue
+            if len(self._sessions) > self._config.max_sessions or self._bytes > self._config.max_memory_bytes:
+                self._drop(oldest_id, spill=True)
+                self._stats["evictions"] += 1
+                continue
+            break
+
+    def _drop(self, session_id: str, spill: bool) -> ConversationSession | None:
+        session = self._sessions.pop(session_id, None)
+        if session is None:
+            return None
+        self._bytes -= session.approx_bytes
+        if spill:
+            self._spill(session)
+        return session
+
+    def _spill_path(self, session_id: str) -> Path | None:
+        directory = self._config.spill_dir
+        if directory is None or not session_id.isalnum():
+            return None
+        return directory / f"{session_id}.json"
+
+    def _spill(self, session: ConversationSession) -> None:
+        path = self._spill_path(session.session_id)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("w", encoding="utf-8") as handle:
+                json.dump(session.to_dict(), handle)
+            self._stats["spilled"] += 1
+        except OSError:
+            logger.warning("Failed to spill session", extra={"session_id": session.session_id, "path": str(path)})
+
+    def _restore(self, session_id: str) -> ConversationSession | None:
+        path = self._spill_path(session_id)
+        if path is None or not path.exists():
+            return None
+        try:
+            with path.open("r", encoding="utf-8") as handle:
+                session = ConversationSession.from_dict(json.load(handle))
+        except (OSError, ValueError, KeyError):
+            logger.warning("Failed to restore spilled session", extra={"session_id": session_id, "path": str(path)})
+            return None
+        finally:
+            path.unlink(missing_ok=True)
+        if self._is_expired(session, time.time()):
+            self._stats["expired"] += 1
+            return None
+        session.on_resize = self._account_resize
+        self._sessions[session_id] = session
+        self._bytes += session.approx_bytes
+        self._stats["restored"] += 1
+        self._enforce_limits()
+        return self._sessions.get(session_id)
+
+
+__all__ = ["ConversationSession", "SessionStore"]
@@ -0,0 +1,107 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from dataclasses import dataclass
+
+from ..config import PersonaConfig
+from ..monitoring.memory import register_buffer
+from .engine import ContextSection
+
+PERSONA_SECTION_TITLE = "Persona"
+
+
+@dataclass(frozen=True)
+class CompiledPersona:
+    """Immutable, pre-rendered persona framing shared by every request for that persona.
+
+    Attributes:
+        name: Persona name
+        system_prompt: The exact prompt string the template was compiled from
+        prefix: Rendered ``## Persona`` section, placed in the context as is
+        prompt_tokens: Token count of the system prompt body
+        system_header: Chat-API system message preamble; the built context is appended to it
+        content_hash: Stable digest of the rendered prefix and header, usable as a downstream cache key
+    """
+
+    name: str
+    system_prompt: str
+    prefix: str
+    prompt_tokens: int
+    system_header: str
+    content_hash: str
+
+    def section(self) -> ContextSection:
+        return ContextSection(PERSONA_SECTION_TITLE, self.system_prompt, tokens=self.prompt_tokens, rendered=self.prefix)
+
+    def system_message(self, context: str) -> str:
+        return self.system_header + context
+
+
+def compile_persona(persona: PersonaConfig) -> CompiledPersona:
+    prefix = f"## {PERSONA_SECTION_TITLE}\n{persona.system_prompt}"
+    header = f"You are acting as the '{persona.name}' persona.\n\nContext:\n"
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (persona.name, prefix, header):
+        encoded = part.encode()
+        digest.update(len(encoded).to_bytes(4, "big"))
+        digest.update(encoded)
+    return CompiledPersona(
+        name=persona.name,
+        system_prompt=persona.system_prompt,
+        prefix=prefix,
+        prompt_tokens=max(1, len(persona.system_prompt.split())),
+        system_header=header,
+        content_hash=digest.hexdigest(),
+    )
+
+
+class PersonaTemplates:
+    """Registry of compiled persona templates.
+
+    Templates are compiled when personas are loaded, created or updated.
+    ``get`` also recompiles when it notices the persona's prompt object was
+    replaced behind its back, so direct config edits never serve stale framing.
+    """
+
+    def __init__(self, personas: dict[str, PersonaConfig] | None = None):
+        self._lock = threading.Lock()
+        self._templates: dict[str, CompiledPersona] = {}
+        register_buffer("persona_templates", self, lambda registry: registry._templates)
+        self._compilations = 0
+        for persona in (personas or {}).values():
+            self.compile(persona)
+
+    def compile(self, persona: PersonaConfig) -> CompiledPersona:
+        template = compile_persona(persona)
+        with self._lock:
+            self._templates[persona.name] = template
+            self._compilations += 1
+        return template
+
+    def get(self, persona: PersonaConfig) -> CompiledPersona:
+        template = self._templates.get(persona.name)
+        if template is None or template.system_prompt is not persona.system_prompt:
+            return self.compile(persona)
+        return template
+
+    def discard(self, name: str) -> None:
+        with self._lock:
+            self._templates.pop(name, None)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"templates": len(self._templates), "compilations": self._compilations}
+
+
+__all__ = ["CompiledPersona", "PersonaTemplates", "compile_persona"]
@@ -0,0 +1,360 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+"""Bulk ingestion of documents into the context engine's index.
+
+An upload is a batch of items, each a JSON object with ``content`` (or
+``text``) and optional ``id``, ``title``, ``source`` and ``metadata``.
+NDJSON uploads are split into lines as the body arrives (``LineSplitter``
+holds at most one partial line), and every valid item goes onto a bounded
+queue. A pool of indexing threads chunks, tokenizes and indexes the items
+in the background, so the upload is acknowledged with a batch id as soon
+as its body has been read; the batch's progress can be queried afterwards.
+A full queue makes the upload wait, which slows the client down instead of
+buffering without bound. Items the index links as near-duplicates of an
+indexed document count towards the batch's ``dedup_ratio``.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from .config import IngestConfig
+from .context.documents import DocumentIndex
+from .logger import get_logger
+from .monitoring.histogram import LatencyHistogram
+from .monitoring.memory import register_buffer
+
+logger = get_logger(__name__)
+
+# Window for the items-per-second rate
+RATE_WINDOW_S = 10.0
+# Rejection reasons kept per batch
+MAX_BATCH_ERRORS = 10
+
+
+class LineSplitter:
+    """Splits a byte stream into lines, holding at most one partial line.
+
+    Lines longer than ``max_line_bytes`` are not kept: they come out as
+    ``None`` so the caller can count them as rejected.
+    """
+
+    def __init__(self, max_line_bytes: int):
+        self._max = max_line_bytes
+        self._partial = bytearray()
+        self._oversized = False
+
+    def feed(self, data: bytes) -> list[bytes | None]:
+        lines: list[bytes | None] = []
+        start = 0
+        while (end := data.find(b"\n", start)) != -1:
+            lines.append(self._finish(data[start:end]))
+            start = end + 1
+        self._append(data[start:])
+        return [line for line in lines if line != b""]
+
+    def close(self) -> list[bytes | None]:
+        line = self._finish(b"")
+        return [] if line == b"" else [line]
+
+    def _append(self, data: bytes) -> None:
+        if self._oversized:
+            return
+        self._partial += data
+        if len(self._partial) > self._max:
+            self._partial.clear()
+            self._oversized = True
+
+    def _finish(self, tail: bytes) -> bytes | None:
+        self._append(tail)
+        if self._oversized:
+            self._oversized = False
+            return None
+        line, self._partial = bytes(self._partial).strip(), bytearray()
+        return line
+
+
+@dataclass
+class IngestBatch:
+    """Progress of one upload."""
+
+    batch_id: str
+    created_at: float = field(default_factory=time.time)
+    received: int = 0
+    rejected: int = 0
+    indexed: int = 0
+    failed: int = 0
+    chunks: int = 0
+    duplicates: int = 0
+    closed: bool = False
+    completed_at: float | None = None
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def status(self) -> str:
+        if not self.closed:
+            return "receiving"
+        return "completed" if self.indexed + self.failed >= self.received else "indexing"
+
+    def describe(self) -> dict[str, Any]:
+        return {
+            "batch_id": self.batch_id,
+            "status": self.status,
+            "ingested": self.received,
+            "rejected": self.rejected,
+            "indexed": self.indexed,
+            "failed": self.failed,
+            "chunks": self.chunks,
+            "duplicates": self.duplicates,
+            "dedup_ratio": self.duplicates / self.indexed if self.indexed else 0.0,
+            "errors": list(self.errors),
+            "created_at": self.created_at,
+            "completed_at": self.completed_at,
+        }
+
+
+class IngestPipeline:
+    """Bounded queue and indexing thread pool feeding a ``DocumentIndex``.
+
+    Args:
+        config: Pool size, queue bound and limits
+        index: Index receiving the documents
+    """
+
+    def __init__(self, config: IngestConfig, index: DocumentIndex):
+        self._config = config
+        self._index = index
+        self._queue: queue.Queue[tuple[str, str, dict[str, Any], float] | None] = queue.Queue(config.max_pending_items)
+        self._lock = threading.Lock()
+        self._batches: OrderedDict[str, IngestBatch] = OrderedDict()
+        self._waiting: deque[float] = deque()  # acceptance times of items not yet indexed, oldest first
+        self._indexed_at: deque[float] = deque(maxlen=100_000)
+        self._lag = LatencyHistogram()
+        self._workers: list[threading.Thread] = []
+        self._counters = dict.fromkeys(("batches", "received", "rejected", "indexed", "failed", "chunks", "duplicates"), 0)
+        register_buffer("ingest.batches", self, lambda pipeline: pipeline._batches)
+
+    # Batches --------------------------------------------------------------
+
+    def open_batch(self) -> str:
+        batch = IngestBatch(uuid.uuid4().hex)
+        with self._lock:
+            self._batches[batch.batch_id] = batch
+            self._counters["batches"] += 1
+            # Forget the oldest finished batches beyond the limit
+            while len(self._batches) > self._config.max_batches:
+                oldest = next(iter(self._batches.values()))
+                if oldest.status != "completed":
+                    break
+                self._batches.popitem(last=False)
+        return batch.batch_id
+
+    def close_batch(self, batch_id: str) -> dict[str, Any]:
+        """Mark the upload complete and describe the batch; indexing may still be under way."""
+        with self._lock:
+            batch = self._batches[batch_id]
+            batch.closed = True
+            self._complete_if_done(batch)
+            return batch.describe()
+
+    def batch(self, batch_id: str) -> dict[str, Any]:
+        """Describe a batch.
+
+        Raises:
+            KeyError: If the batch is unknown or was forgotten
+        """
+        with self._lock:
+            return self._batches[batch_id].describe()
+
+    # Items ----------------------------------------------------------------
+
+    def submit(self, batch_id: str, item: Any, block: bool = True) -> bool:
+        """Queue one item for indexing; returns False when the item is invalid and was rejected.
+
+        Raises:
+            queue.Full: If ``block`` is False and the queue is full
+        """
+        document = self._document(item)
+        if isinstance(document, str):
+            self._reject(batch_id, document)
+            return False
+        self._start_workers()
+        with self._lock:
+            batch = self._batches[batch_id]
+            doc_id = str(document.pop("id", None) or f"{batch_id}-{batch.received + batch.rejected}")
+        accepted = time.time()
+        self._queue.put((batch_id, doc_id, document, accepted), block=block)
+        with self._lock:
+            batch.received += 1
+            self._counters["received"] += 1
+            self._waiting.append(accepted)
+        return True
+
+    def submit_line(self, batch_id: str, line: bytes | None, block: bool = True) -> bool:
+        """Queue the item on one NDJSON line; ``None`` stands for a line that was too long."""
+        if line is None:
+            self._reject(batch_id, f"line longer than {self._config.max_line_bytes} bytes")
+            return False
+        try:
+            item = json.loads(line)
+        except ValueError as exc:
+            self._reject(batch_id, f"invalid JSON: {exc}")
+            return False
+        return self.submit(batch_id, item, block=block)
+
+    def ingest(self, items: Iterable[Any]) -> dict[str, Any]:
+        """Queue already parsed items as one batch and describe it."""
+        batch_id = self.open_batch()
+        for item in items:
+            self.submit(batch_id, item)
+        return self.close_batch(batch_id)
+
+    async def ingest_stream(self, chunks: AsyncIterable[bytes]) -> dict[str, Any]:
+        """Queue the items of an NDJSON body as it arrives and describe the batch.
+
+        Lines are queued without blocking the event loop; only when the queue
+        is full does a worker thread wait for room, which pauses reading the
+        body.
+        """
+        import anyio.to_thread
+
+        batch_id = self.open_batch()
+        splitter = LineSplitter(self._config.max_line_bytes)
+
+        async def offer(lines: list[bytes | None]) -> None:
+            for line in lines:
+                try:
+                    self.submit_line(batch_id, line, block=False)
+                except queue.Full:
+                    await anyio.to_thread.run_sync(self.submit_line, batch_id, line)
+
+        async for data in chunks:
+            await offer(splitter.feed(data))
+        await offer(splitter.close())
+        return self.close_batch(batch_id)
+
+    # Monitoring -----------------------------------------------------------
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def index_lag_s(self) -> float:
+        """Age of the oldest accepted item that is not searchable yet."""
+        with self._lock:
+            return time.time() - self._waiting[0] if self._waiting else 0.0
+
+    def items_per_second(self) -> float:
+        now = time.time()
+        with self._lock:
+            recent = sum(1 for indexed in self._indexed_at if indexed >= now - RATE_WINDOW_S)
+        return recent / RATE_WINDOW_S
+
+    def stats(self) -> dict[str, Any]:
+        """Throughput, backlog, lag and totals of the pipeline, plus the index's own statistics."""
+        with self._lock:
+            counters = dict(self._counters)
+            lag = self._lag.percentiles()
+        return {
+            "workers": self._config.workers,
+            "pending": self.pending(),
+            "items_per_second": self.items_per_second(),
+            "index_lag_s": self.index_lag_s(),
+            "lag_ms": lag,
+            "counters": counters,
+            "index": self._index.stats(),
+        }
+
+    def shutdown(self, timeout: float = 2.0) -> None:
+        """Stop the indexing threads; items still queued are dropped."""
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join(timeout=timeout)
+
+    # Internal helpers -----------------------------------------------------
+
+    def _start_workers(self) -> None:
+        if len(self._workers) >= self._config.workers:
+            return
+        with self._lock:
+            while len(self._workers) < self._config.workers:
+                worker = threading.Thread(target=self._work, name=f"ingest-{len(self._workers)}", daemon=True)
+                self._workers.append(worker)
+                worker.start()
+
+    def _document(self, item: Any) -> dict[str, Any] | str:
+        """The fields to index, or why the item is rejected."""
+        if not isinstance(item, dict):
+            return "item is not an object"
+        content = item.get("content", item.get("text"))
+        if not isinstance(content, str) or not content.strip():
+            return "item has no content"
+        metadata = item.get("metadata") if isinstance(item.get("metadata"), dict) else {}
+        return {
+            "id": item.get("id"),
+            "text": content,
+            "source": str(item.get("source") or "feed"),
+            "title": item.get("title") or metadata.get("title") or metadata.get("subject"),
+            "metadata": metadata,
+        }
+
+    def _reject(self, batch_id: str, reason: str) -> None:
+        with self._lock:
+            batch = self._batches[batch_id]
+            batch.rejected += 1
+            self._counters["rejected"] += 1
+            if len(batch.errors) < MAX_BATCH_ERRORS:
+                batch.errors.append(f"item {batch.received + batch.rejected}: {reason}")
+
+    def _work(self) -> None:
+        while (entry := self._queue.get()) is not None:
+            batch_id, doc_id, document, accepted = entry
+            chunks, duplicate, failed = 0, False, False
+            try:
+                indexed = self._index.add(doc_id, **document)
+                chunks, duplicate = indexed.chunks, indexed.duplicate_of is not None
+            except Exception as exc:
+                failed = True
+                logger.warning("Indexing an ingested item failed", extra={"batch_id": batch_id, "doc_id": doc_id, "error": str(exc)})
+            now = time.time()
+            with self._lock:
+                if self._waiting:
+                    self._waiting.popleft()
+                self._lag.record((now - accepted) * 1000)
+                self._indexed_at.append(now)
+                self._counters["failed" if failed else "indexed"] += 1
+                self._counters["chunks"] += chunks
+                self._counters["duplicates"] += duplicate
+                batch = self._batches.get(batch_id)
+                if batch is not None:
+                    if failed:
+                        batch.failed += 1
+                    else:
+                        batch.indexed += 1
+                    batch.chunks += chunks
+                    batch.duplicates += duplicate
+                    self._complete_if_done(batch)
+
+    @staticmethod
+    def _complete_if_done(batch: IngestBatch) -> None:
+        if batch.status == "completed" and batch.completed_at is None:
+            batch.completed_at = time.time()
+
+
+__all__ = ["IngestBatch", "IngestPipeline", "LineSplitter"]
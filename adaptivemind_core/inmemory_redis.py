@@ -0,0 +1,263 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+"""In-process stand-in for the Redis commands the job broker uses.
+
+``InMemoryRedis`` follows the ``redis.Redis(decode_responses=True)`` call
+signatures and return values for lists, hashes, sorted sets, strings and
+key expiry, so tests and the load harness can run several brokers and
+workers against one shared instance without a server. Every command holds
+one lock, which makes each command atomic as it is in Redis.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Mapping
+from typing import Any
+
+_INSTANCES: dict[str, InMemoryRedis] = {}
+_INSTANCES_LOCK = threading.Lock()
+
+
+class InMemoryRedis:
+    """Thread-safe subset of Redis holding string values in process memory."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._data: dict[str, Any] = {}
+        self._expires: dict[str, float] = {}
+
+    @classmethod
+    def named(cls, name: str) -> InMemoryRedis:
+        """The process-wide instance called ``name``, created on first use."""
+        with _INSTANCES_LOCK:
+            instance = _INSTANCES.get(name)
+            if instance is None:
+                instance = _INSTANCES[name] = cls()
+            return instance
+
+    # Keys -----------------------------------------------------------------
+
+    def ping(self) -> bool:
+        return True
+
+    def exists(self, *names: str) -> int:
+        with self._lock:
+            return sum(1 for name in names if self._get(name) is not None)
+
+    def delete(self, *names: str) -> int:
+        with self._lock:
+            deleted = 0
+            for name in names:
+                if self._get(name) is not None:
+                    del self._data[name]
+                    self._expires.pop(name, None)
+                    deleted += 1
+            return deleted
+
+    def pexpire(self, name: str, milliseconds: int) -> bool:
+        with self._lock:
+            if self._get(name) is None:
+                return False
+            self._expires[name] = time.monotonic() + milliseconds / 1000
+            return True
+
+    def flushall(self) -> bool:
+        with self._lock:
+            self._data.clear()
+            self._expires.clear()
+        return True
+
+    # Strings --------------------------------------------------------------
+
+    def get(self, name: str) -> str | None:
+        with self._lock:
+            return self._get(name)
+
+    def set(self, name: str, value: Any, nx: bool = False, px: int | None = None) -> bool | None:
+        with self._lock:
+            if nx and self._get(name) is not None:
+                return None
+            self._data[name] = str(value)
+            self._expires.pop(name, None)
+            if px is not None:
+                self._expires[name] = time.monotonic() + px / 1000
+            return True
+
+    # Lists ----------------------------------------------------------------
+
+    def rpush(self, name: str, *values: Any) -> int:
+        with self._lock:
+            items = self._container(name, deque)
+            items.extend(str(value) for value in values)
+            return len(items)
+
+    def lpush(self, name: str, *values: Any) -> int:
+        with self._lock:
+            items = self._container(name, deque)
+            items.extendleft(str(value) for value in values)
+            return len(items)
+
+    def lpop(self, name: str) -> str | None:
+        with self._lock:
+            items = self._get(name)
+            if not items:
+                return None
+            value = items.popleft()
+            self._drop_if_empty(name)
+            return value
+
+    def llen(self, name: str) -> int:
+        with self._lock:
+            items = self._get(name)
+            return len(items) if items else 0
+
+    def lrange(self, name: str, start: int, end: int) -> list[str]:
+        with self._lock:
+            items = list(self._get(name) or ())
+        end = len(items) if end == -1 else end + 1
+        return items[start:end]
+
+    def lpos(self, name: str, value: Any) -> int | None:
+        with self._lock:
+            for index, item in enumerate(self._get(name) or ()):
+                if item == str(value):
+                    return index
+            return None
+
+    def lrem(self, name: str, count: int, value: Any) -> int:
+        with self._lock:
+            items = self._get(name)
+            if not items:
+                return 0
+            value, removed = str(value), 0
+            kept = deque()
+            for item in items:
+                if item == value and (count == 0 or removed < abs(count)):
+                    removed += 1
+                else:
+                    kept.append(item)
+            self._data[name] = kept
+            self._drop_if_empty(name)
+            return removed
+
+    def lmove(self, first_list: str, second_list: str, src: str = "LEFT", dest: str = "RIGHT") -> str | None:
+        with self._lock:
+            source = self._get(first_list)
+            if not source:
+                return None
+            value = source.popleft() if src == "LEFT" else source.pop()
+            self._drop_if_empty(first_list)
+            target = self._container(second_list, deque)
+            if dest == "LEFT":
+                target.appendleft(value)
+            else:
+                target.append(value)
+            return value
+
+    # Hashes ---------------------------------------------------------------
+
+    def hset(self, name: str, key: str | None = None, value: Any = None, mapping: Mapping[str, Any] | None = None) -> int:
+        with self._lock:
+            fields = self._container(name, dict)
+            items = dict(mapping or {})
+            if key is not None:
+                items[key] = value
+            added = sum(1 for field in items if field not in fields)
+            fields.update((field, str(item)) for field, item in items.items())
+            return added
+
+    def hget(self, name: str, key: str) -> str | None:
+        with self._lock:
+            return (self._get(name) or {}).get(key)
+
+    def hgetall(self, name: str) -> dict[str, str]:
+        with self._lock:
+            return dict(self._get(name) or {})
+
+    def hdel(self, name: str, *keys: str) -> int:
+        with self._lock:
+            fields = self._get(name)
+            if not fields:
+                return 0
+            removed = sum(1 for key in keys if fields.pop(key, None) is not None)
+            self._drop_if_empty(name)
+            return removed
+
+    def hincrby(self, name: str, key: str, amount: int = 1) -> int:
+        with self._lock:
+            fields = self._container(name, dict)
+            value = int(fields.get(key, 0)) + amount
+            fields[key] = str(value)
+            return value
+
+    def hincrbyfloat(self, name: str, key: str, amount: float = 1.0) -> float:
+        with self._lock:
+            fields = self._container(name, dict)
+            value = float(fields.get(key, 0)) + amount
+            fields[key] = repr(value)
+            return value
+
+    # Sorted sets ----------------------------------------------------------
+
+    def zadd(self, name: str, mapping: Mapping[str, float]) -> int:
+        with self._lock:
+            scores = self._container(name, dict)
+            added = sum(1 for member in mapping if member not in scores)
+            scores.update((str(member), float(score)) for member, score in mapping.items())
+            return added
+
+    def zrem(self, name: str, *members: str) -> int:
+        with self._lock:
+            scores = self._get(name)
+            if not scores:
+                return 0
+            removed = sum(1 for member in members if scores.pop(member, None) is not None)
+            self._drop_if_empty(name)
+            return removed
+
+    def zcard(self, name: str) -> int:
+        with self._lock:
+            scores = self._get(name)
+            return len(scores) if scores else 0
+
+    def zrangebyscore(self, name: str, min: float | str, max: float | str) -> list[str]:
+        low, high = float(min), float(max)  # also accepts "-inf" and "+inf"
+        with self._lock:
+            scores = dict(self._get(name) or {})
+        return [member for member, score in sorted(scores.items(), key=lambda item: item[1]) if low <= score <= high]
+
+    # Internal helpers -------------------------------------------------------
+
+    def _get(self, name: str) -> Any:
+        expires = self._expires.get(name)
+        if expires is not None and expires <= time.monotonic():
+            self._data.pop(name, None)
+            del self._expires[name]
+        return self._data.get(name)
+
+    def _container(self, name: str, kind: type) -> Any:
+        value = self._get(name)
+        if value is None:
+            value = self._data[name] = kind()
+        elif not isinstance(value, kind):
+            raise TypeError("WRONGTYPE Operation against a key holding the wrong kind of value")
+        return value
+
+    def _drop_if_empty(self, name: str) -> None:
+        if not self._data.get(name):
+            self._data.pop(name, None)
+            self._expires.pop(name, None)
+
+
+__all__ = ["InMemoryRedis"]
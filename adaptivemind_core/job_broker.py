@@ -0,0 +1,535 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+"""Job queue over a Redis-protocol broker, run by workers on any node.
+
+``RedisJobQueue`` has the same interface as ``JobQueue``; the application
+uses it when ``jobs.broker_url`` is set. Every process submitting, querying
+or running jobs talks only to the broker, so worker processes are stateless
+and can be added or removed at any time.
+
+Keys, all under ``jobs.queue_name``:
+
+- ``pending:<priority>``: lists of waiting job ids, one per priority
+- ``processing:<worker>``: jobs a worker has claimed
+- ``job:<id>``: hash of the job's fields, expiring ``result_ttl_s`` after it finishes
+- ``leases``: sorted set of claimed jobs by the time their lease runs out
+- ``workers``: hash of each worker's last heartbeat
+- ``stats``: cluster-wide counters
+
+Delivery is at least once. A worker claims a job by atomically moving its
+id from a pending list to its own processing list (``LMOVE``), so a job is
+never lost between the two. The claim takes a lease of
+``visibility_timeout_s``, renewed by the worker's heartbeats for as long
+as it holds the job, waiting or running, and by progress reports. A job
+whose lease runs out belongs to a worker that stopped beating. One worker at a time
+(holding a short-lived lock key) reaps: jobs of workers whose heartbeat is
+older than ``worker_timeout_s`` and jobs whose lease ran out go back to the
+front of their pending list, or fail once they have been delivered
+``max_deliveries`` times. A result is only written by the worker holding
+the job's latest delivery, so a worker that was presumed dead cannot
+overwrite a redelivered run.
+
+Workers prefetch: while all executors are busy, a worker claims up to
+``prefetch`` more jobs, but never more than its share of the backlog
+(pending jobs divided by live workers), so a short queue spreads across
+idle workers instead of piling up behind one busy worker.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import queue
+import socket
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Any
+
+from .config import JobsConfig
+from .inmemory_redis import InMemoryRedis
+from .jobs import (
+    CANCELLED,
+    COMPLETED,
+    DEFAULT_RUN_S,
+    FAILED,
+    FINISHED,
+    QUEUED,
+    RUNNING,
+    CallbackDispatcher,
+    JobContext,
+    JobHandler,
+    QueueFullError,
+    describe_job,
+    estimate_start,
+)
+from .logger import get_logger
+from .monitoring.histogram import LatencyHistogram
+from .monitoring.metrics import MetricsRegistry
+
+logger = get_logger(__name__)
+
+PRIORITIES = range(10)
+_FLOAT_FIELDS = ("created_at", "started_at", "completed_at", "progress")
+
+
+def connect(url: str) -> Any:
+    """A client for ``url``: ``memory://<name>`` or any URL ``redis.Redis.from_url`` accepts.
+
+    Raises:
+        RuntimeError: If a Redis URL is given and the ``redis`` package is not installed
+    """
+    if url.startswith("memory://"):
+        return InMemoryRedis.named(url[len("memory://") :] or "default")
+    try:
+        import redis
+    except ImportError as exc:
+        raise RuntimeError("jobs.broker_url needs the 'redis' package (pip install 'adaptivemind-core[redis]')") from exc
+    return redis.Redis.from_url(url, decode_responses=True)
+
+
+def _row(job_id: str, fields: dict[str, str]) -> dict[str, Any]:
+    row: dict[str, Any] = {
+        "id": job_id,
+        "mode": fields.get("mode"),
+        "status": fields.get("status"),
+        "priority": int(fields.get("priority", 0)),
+        "result": fields.get("result") or None,
+        "error": fields.get("error") or None,
+        "callback_url": fields.get("callback_url") or None,
+        "callback_status": fields.get("callback_status") or None,
+    }
+    for name in _FLOAT_FIELDS:
+        row[name] = float(fields[name]) if fields.get(name) else (0.0 if name == "progress" else None)
+    return row
+
+
+class RedisJobQueue:
+    """Job queue shared by every process connected to one broker.
+
+    Args:
+        config: Queue settings; ``config.broker_url`` must be set
+        metrics: Registry receiving each job's queue wait as the ``queue`` phase
+        handlers: Callable per job mode, as for ``JobQueue``
+        client: Broker client to use instead of connecting to ``config.broker_url``
+    """
+
+    def __init__(
+        self,
+        config: JobsConfig,
+        metrics: MetricsRegistry,
+        handlers: dict[str, JobHandler],
+        client: Any = None,
+    ):
+        if client is None and config.broker_url is None:
+            raise ValueError("a broker queue requires jobs.broker_url")
+        self._config = config
+        self._metrics = metrics
+        self._handlers = dict(handlers)
+        self._redis = client if client is not None else connect(config.broker_url or "")
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self._started_at = time.time()
+        self._buffer: queue.Queue[tuple[str, int] | None] = queue.Queue()
+        self._held: dict[str, int] = {}  # claimed job id -> delivery number
+        self._held_lock = threading.Lock()
+        self._running = 0
+        self._prefetch_limit = 0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._completions: deque[float] = deque(maxlen=10_000)
+        self._queue_wait = LatencyHistogram()
+        self._run_time = LatencyHistogram()
+        self._stats_lock = threading.Lock()
+        self._callbacks = CallbackDispatcher(config, self._callback_target, self._record_callback)
+        if config.run_workers:
+            self._start_workers()
+
+    @property
+    def modes(self) -> list[str]:
+        return sorted(self._handlers)
+
+    # Public API -----------------------------------------------------------
+
+    def submit(
+        self,
+        mode: str,
+        payload: dict[str, Any],
+        callback_url: str | None = None,
+        priority: int | None = None,
+    ) -> dict[str, Any]:
+        """Queue a job and describe it, including its queue position and estimated start.
+
+        Raises:
+            ValueError: If no handler is registered for ``mode``
+            QueueFullError: If ``max_queued`` jobs are already waiting
+        """
+        if mode not in self._handlers:
+            raise ValueError(f"Unsupported job mode '{mode}'; available: {', '.join(self.modes)}")
+        priority = self._config.default_priority if priority is None else priority
+        if not 0 <= priority <= 9:
+            raise ValueError("priority must be between 0 and 9")
+        queued = self.queue_depth()
+        if queued >= self._config.max_queued:
+            raise QueueFullError(f"Job queue is full ({queued} jobs waiting)")
+        job_id = uuid.uuid4().hex
+        self._redis.hset(
+            self._key("job", job_id),
+            mapping={
+                "mode": mode,
+                "payload": json.dumps(payload),
+                "priority": priority,
+                "callback_url": callback_url or "",
+                "status": QUEUED,
+                "progress": 0.0,
+                "created_at": time.time(),
+                "deliveries": 0,
+                "cancel_requested": 0,
+            },
+        )
+        self._redis.rpush(self._key("pending", priority), job_id)
+        self._redis.hincrby(self._key("stats"), "submitted", 1)
+        return self.status(job_id)
+
+    def status(self, job_id: str) -> dict[str, Any]:
+        """Describe a job.
+
+        Raises:
+            KeyError: If the job does not exist or its result expired
+        """
+        fields = self._redis.hgetall(self._key("job", job_id))
+        if not fields:
+            raise KeyError(job_id)
+        row = _row(job_id, fields)
+        if row["status"] == QUEUED:
+            return describe_job(row, *self._position(job_id, row["priority"]))
+        return describe_job(row)
+
+    def cancel(self, job_id: str) -> dict[str, Any]:
+        """Cancel a job; a claimed one stops at its next cancellation check and its result is discarded.
+
+        Raises:
+            KeyError: If the job does not exist
+            ValueError: If the job already finished
+        """
+        key = self._key("job", job_id)
+        fields = self._redis.hgetall(key)
+        if not fields:
+            raise KeyError(job_id)
+        if fields["status"] in FINISHED:
+            raise ValueError(f"Job '{job_id}' already {fields['status']}")
+        self._redis.hset(key, "cancel_requested", 1)
+        if self._redis.lrem(self._key("pending", fields["priority"]), 1, job_id):
+            self._finish(job_id, CANCELLED)
+        return self.status(job_id)
+
+    def stats(self) -> dict[str, Any]:
+        """Backlog, cluster counters and workers, and this process's queue-wait and run-time percentiles."""
+        now = time.time()
+        counters = {name: int(float(value)) for name, value in self._redis.hgetall(self._key("stats")).items() if name != "run_ms"}
+        with self._stats_lock:
+            recent = sum(1 for finished in self._completions if finished >= now - 60.0)
+            local = {
+                "throughput_per_min": recent,
+                "queue_wait_ms": self._queue_wait.percentiles(),
+                "run_time_ms": self._run_time.percentiles(),
+            }
+        return {
+            "broker": "memory" if isinstance(self._redis, InMemoryRedis) else "redis",
+            "worker_id": self.worker_id if self._config.run_workers else None,
+            "workers": self._config.workers if self._config.run_workers else 0,
+            "running": self._redis.zcard(self._key("leases")),
+            "queued": self.queue_depth(),
+            "by_priority": {priority: self._redis.llen(self._key("pending", priority)) for priority in PRIORITIES},
+            "counters": counters,
+            "cluster": self.live_workers(),
+            **local,
+        }
+
+    def queue_depth(self) -> int:
+        return sum(self._redis.llen(self._key("pending", priority)) for priority in PRIORITIES)
+
+    def live_workers(self) -> list[dict[str, Any]]:
+        """Workers whose heartbeat is recent, oldest first."""
+        cutoff = time.time() - self._config.worker_timeout_s
+        workers = [
+            {"worker": worker, **json.loads(beat)}
+            for worker, beat in self._redis.hgetall(self._key("workers")).items()
+        ]
+        return sorted((worker for worker in workers if worker["heartbeat"] >= cutoff), key=lambda worker: worker["started_at"])
+
+    def compact(self) -> int:
+        """Reap dead workers and expired leases now; returns the number of jobs delivered again or failed.
+
+        Finished jobs need no compaction: their keys expire in the broker.
+        """
+        return self._reap()
+
+    def shutdown(self, timeout: float = 2.0) -> None:
+        """Stop claiming, let running jobs finish within ``timeout`` and hand unstarted claims back."""
+        self._stop.set()
+        self._wake.set()
+        for _ in range(self._config.workers):
+            self._buffer.put(None)
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        # Claimed but never started: straight back to the front of the queue
+        while True:
+            try:
+                item = self._buffer.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                self._requeue(item[0], self.worker_id)
+        if self._config.run_workers:
+            self._redis.hdel(self._key("workers"), self.worker_id)
+        self._callbacks.close()
+
+    # Workers --------------------------------------------------------------
+
+    def _start_workers(self) -> None:
+        targets = [(self._fetch, "job-fetcher"), (self._heartbeat, "job-heartbeat")]
+        targets += [(self._execute, f"job-executor-{index}") for index in range(self._config.workers)]
+        self._beat()
+        for target, name in targets:
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _fetch(self) -> None:
+        """Keep the executors supplied, claiming ahead only within the prefetch limit."""
+        while not self._stop.is_set():
+            self._wake.clear()
+            with self._held_lock:
+                wanted = self._config.workers + self._prefetch_limit - len(self._held)
+            claimed = 0
+            while wanted > claimed and not self._stop.is_set():
+                claim = self._claim()
+                if claim is None:
+                    break
+                self._buffer.put(claim)
+                claimed += 1
+            if not claimed:
+                self._wake.wait(self._config.poll_interval_s)
+
+    def _claim(self) -> tuple[str, int] | None:
+        processing = self._key("processing", self.worker_id)
+        for priority in PRIORITIES:
+            job_id = self._redis.lmove(self._key("pending", priority), processing, "LEFT", "RIGHT")
+            if job_id is None:
+                continue
+            delivery = self._redis.hincrby(self._key("job", job_id), "deliveries", 1)
+            self._redis.hset(self._key("job", job_id), "worker", self.worker_id)
+            self._redis.zadd(self._key("leases"), {job_id: time.time() + self._config.visibility_timeout_s})
+            with self._held_lock:
+                self._held[job_id] = delivery
+            return job_id, delivery
+        return None
+
+    def _execute(self) -> None:
+        while True:
+            item = self._buffer.get()
+            if item is None or self._stop.is_set():
+                if item is not None:
+                    self._buffer.put(item)  # handed back by shutdown
+                return
+            job_id, delivery = item
+            try:
+                self._run(job_id, delivery)
+            except Exception:
+                logger.warning("Job execution failed", extra={"job_id": job_id}, exc_info=True)
+            finally:
+                with self._held_lock:
+                    self._held.pop(job_id, None)
+                self._wake.set()
+
+    def _run(self, job_id: str, delivery: int) -> None:
+        key = self._key("job", job_id)
+        fields = self._redis.hgetall(key)
+        if not fields:
+            self._release(job_id)  # expired or deleted while queued
+            return
+        if fields.get("deliveries") != str(delivery) or fields.get("status") in FINISHED:
+            return  # the reaper handed it on or failed it while it waited here
+        if fields.get("cancel_requested") == "1":
+            self._finish(job_id, CANCELLED, delivery=delivery)
+            return
+        started = time.time()
+        # The lease counts from the start, however long the job waited in the prefetch buffer
+        self._redis.zadd(self._key("leases"), {job_id: started + self._config.visibility_timeout_s})
+        self._redis.hset(key, mapping={"status": RUNNING, "started_at": started})
+        wait_ms = (started - float(fields["created_at"])) * 1000
+        self._metrics.record_phase("queue", wait_ms)
+        with self._stats_lock:
+            self._running += 1
+            self._queue_wait.record(wait_ms)
+        status, result, error = COMPLETED, None, None
+        try:
+            result = json.dumps(self._handlers[fields["mode"]](json.loads(fields["payload"]), JobContext(job_id, self)))
+        except Exception as exc:
+            status, error = FAILED, str(exc) or exc.__class__.__name__
+            logger.warning("Job failed", extra={"job_id": job_id, "mode": fields["mode"], "error": error})
+        finished = time.time()
+        with self._stats_lock:
+            self._running -= 1
+            self._run_time.record((finished - started) * 1000)
+            self._completions.append(finished)
+        self._redis.hincrbyfloat(self._key("stats"), "run_ms", (finished - started) * 1000)
+        if self._redis.hget(key, "cancel_requested") == "1":
+            status, result = CANCELLED, None
+        self._finish(job_id, status, result=result, error=error, delivery=delivery)
+
+    def _finish(
+        self,
+        job_id: str,
+        status: str,
+        result: str | None = None,
+        error: str | None = None,
+        delivery: int | None = None,
+    ) -> None:
+        """Record a job's outcome, unless it has since been delivered to another worker."""
+        key = self._key("job", job_id)
+        fields = self._redis.hgetall(key)
+        if not fields or fields.get("status") in FINISHED:
+            self._release(job_id)  # expired, or failed by the reaper after too many deliveries
+            return
+        if delivery is not None and fields.get("deliveries") != str(delivery):
+            # The reaper already moved the job off this worker; its new delivery owns the outcome
+            logger.warning("Discarding the result of a redelivered job", extra={"job_id": job_id})
+            return
+        self._redis.hset(
+            key,
+            mapping={"status": status, "result": result or "", "error": error or "", "completed_at": time.time()},
+        )
+        self._redis.pexpire(key, int(self._config.result_ttl_s * 1000))
+        self._release(job_id)
+        self._redis.hincrby(self._key("stats"), status, 1)
+        if fields.get("callback_url"):
+            self._callbacks.submit(job_id)
+
+    def _release(self, job_id: str) -> None:
+        self._redis.zrem(self._key("leases"), job_id)
+        self._redis.lrem(self._key("processing", self.worker_id), 1, job_id)
+
+    def _requeue(self, job_id: str, worker: str) -> bool:
+        """Return a claimed job to the front of its queue, or fail it after too many deliveries."""
+        key = self._key("job", job_id)
+        fields = self._redis.hgetall(key)
+        processing = self._key("processing", worker)
+        if not fields or fields.get("status") in FINISHED:
+            self._redis.lrem(processing, 1, job_id)
+            self._redis.zrem(self._key("leases"), job_id)
+            return False
+        if int(fields.get("deliveries", 0)) >= self._config.max_deliveries:
+            error = f"Job was interrupted {fields['deliveries']} times"
+            self._redis.hset(key, mapping={"status": FAILED, "error": error, "completed_at": time.time()})
+            self._redis.pexpire(key, int(self._config.result_ttl_s * 1000))
+            self._redis.hincrby(self._key("stats"), FAILED, 1)
+        else:
+            # Push before removing: a crash in between duplicates the job rather than losing it
+            self._redis.hset(key, mapping={"status": QUEUED, "worker": ""})
+            self._redis.lpush(self._key("pending", fields["priority"]), job_id)
+            self._redis.hincrby(self._key("stats"), "redelivered", 1)
+        self._redis.lrem(processing, 1, job_id)
+        self._redis.zrem(self._key("leases"), job_id)
+        return True
+
+    def _heartbeat(self) -> None:
+        while not self._stop.wait(self._config.heartbeat_interval_s):
+            try:
+                self._beat()
+                self._reap()
+            except Exception:
+                logger.warning("Job worker heartbeat failed", exc_info=True)
+
+    def _beat(self) -> None:
+        now = time.time()
+        with self._held_lock:
+            jobs = list(self._held)
+        if jobs:
+            # The heartbeat shows this worker is alive, so neither prefetched nor running jobs are stalled
+            deadline = now + self._config.visibility_timeout_s
+            self._redis.zadd(self._key("leases"), dict.fromkeys(jobs, deadline))
+        held = len(jobs)
+        beat = {"heartbeat": now, "started_at": self._started_at, "pid": os.getpid(), "concurrency": self._config.workers, "held": held}
+        self._redis.hset(self._key("workers"), self.worker_id, json.dumps(beat))
+        # Backpressure: claim ahead at most this worker's share of the backlog
+        share = math.ceil(self.queue_depth() / max(1, len(self.live_workers())))
+        self._prefetch_limit = min(self._config.prefetch, share)
+
+    def _reap(self) -> int:
+        lock = self._key("reaper")
+        if not self._redis.set(lock, self.worker_id, nx=True, px=int(self._config.worker_timeout_s * 1000)):
+            return 0
+        reaped = 0
+        try:
+            now = time.time()
+            cutoff = now - self._config.worker_timeout_s
+            for worker, beat in self._redis.hgetall(self._key("workers")).items():
+                if worker == self.worker_id or json.loads(beat)["heartbeat"] >= cutoff:
+                    continue
+                logger.warning("Job worker stopped responding; delivering its jobs again", extra={"worker": worker})
+                processing = self._key("processing", worker)
+                for job_id in self._redis.lrange(processing, 0, -1):
+                    reaped += self._requeue(job_id, worker)
+                self._redis.delete(processing)
+                self._redis.hdel(self._key("workers"), worker)
+            for job_id in self._redis.zrangebyscore(self._key("leases"), "-inf", now):
+                worker = self._redis.hget(self._key("job", job_id), "worker") or ""
+                logger.warning("Job lease expired; delivering it again", extra={"job_id": job_id, "worker": worker})
+                reaped += self._requeue(job_id, worker)
+        finally:
+            if self._redis.get(lock) == self.worker_id:
+                self._redis.delete(lock)
+        return reaped
+
+    # Internal helpers -----------------------------------------------------
+
+    def _key(self, *parts: Any) -> str:
+        return ":".join((self._config.queue_name, *(str(part) for part in parts)))
+
+    def _cancel_requested(self, job_id: str) -> bool:
+        return self._redis.hget(self._key("job", job_id), "cancel_requested") == "1"
+
+    def _set_progress(self, job_id: str, percent: float) -> None:
+        """Store progress and renew the job's lease without waiting for the next heartbeat."""
+        self._redis.hset(self._key("job", job_id), "progress", percent)
+        with self._held_lock:
+            held = job_id in self._held
+        if held:
+            self._redis.zadd(self._key("leases"), {job_id: time.time() + self._config.visibility_timeout_s})
+
+    def _position(self, job_id: str, priority: int) -> tuple[int, float]:
+        """Jobs ahead of this one (0 = next) and when it should start."""
+        index = self._redis.lpos(self._key("pending", priority), job_id)
+        # A job claimed ahead by a busy worker is no longer pending: it is next
+        ahead = 0 if index is None else index + sum(self._redis.llen(self._key("pending", higher)) for higher in range(priority))
+        counters = self._redis.hgetall(self._key("stats"))
+        finished = sum(int(counters.get(status, 0)) for status in (COMPLETED, FAILED))
+        mean_s = float(counters.get("run_ms", 0)) / finished / 1000 if finished else DEFAULT_RUN_S
+        workers = self.live_workers()
+        capacity = sum(worker["concurrency"] for worker in workers) or 1
+        return ahead, estimate_start(ahead, capacity, self._redis.zcard(self._key("leases")), mean_s)
+
+    def _callback_target(self, job_id: str) -> tuple[str, dict[str, Any]] | None:
+        try:
+            description = self.status(job_id)
+        except KeyError:
+            return None
+        return self._redis.hget(self._key("job", job_id), "callback_url"), description
+
+    def _record_callback(self, job_id: str, outcome: str) -> None:
+        self._redis.hset(self._key("job", job_id), "callback_status", outcome)
+
+
+__all__ = ["RedisJobQueue", "connect"]
@@ -0,0 +1,546 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+"""Asynchronous job queue: long runs without holding an HTTP connection open.
+
+A submitted job is written to SQLite (WAL mode) and pushed onto an in-memory
+priority heap; a bounded pool of worker threads pops the most urgent job,
+claims it in the database and runs the handler registered for its mode.
+Because claiming is an atomic ``queued -> running`` update, several server
+workers may share one database: each runs the jobs it was given, and any of
+them answers status and cancellation requests.
+
+Finished jobs keep their result for ``result_ttl_s``; compaction deletes
+expired rows and returns their pages to the file system.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import Any
+
+from .config import JobsConfig
+from .logger import get_logger
+from .monitoring.histogram import LatencyHistogram
+from .monitoring.memory import register_buffer
+from .monitoring.metrics import MetricsRegistry
+
+logger = get_logger(__name__)
+
+QUEUED, RUNNING, COMPLETED, FAILED, CANCELLED = "queued", "running", "completed", "failed", "cancelled"
+FINISHED = (COMPLETED, FAILED, CANCELLED)
+# Assumed run time of a job before any has finished, for start estimates
+DEFAULT_RUN_S = 1.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    mode TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    callback_url TEXT,
+    status TEXT NOT NULL,
+    progress REAL NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    owner INTEGER,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    callback_status TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    completed_at REAL,
+    expires_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_queued ON jobs (status, priority, seq);
+CREATE INDEX IF NOT EXISTS jobs_expiry ON jobs (expires_at);
+"""
+
+JobHandler = Callable[[dict[str, Any], "JobContext"], dict[str, Any]]
+
+
+class QueueFullError(RuntimeError):
+    """Raised when a submission would exceed ``max_queued`` waiting jobs."""
+
+
+def _iso(timestamp: float | None) -> str | None:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat() if timestamp is not None else None
+
+
+def _pid_alive(pid: int | None) -> bool:
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def describe_job(row: dict[str, Any], position: int | None = None, estimated_start: float | None = None) -> dict[str, Any]:
+    """The public description of a job from its stored fields."""
+    status = row["status"]
+    return {
+        "job_id": row["id"],
+        "mode": row["mode"],
+        "status": status,
+        "priority": row["priority"],
+        "progress": 100.0 if status == COMPLETED else row["progress"],
+        "result": json.loads(row["result"]) if row["result"] else None,
+        "error": row["error"],
+        "created_at": _iso(row["created_at"]),
+        "started_at": _iso(row["started_at"]),
+        "completed_at": _iso(row["completed_at"]),
+        "execution_time": (
+            row["completed_at"] - row["started_at"] if row["completed_at"] and row["started_at"] else None
+        ),
+        "position": position,
+        "estimated_start": _iso(estimated_start),
+        "callback_status": row["callback_status"],
+    }
+
+
+def estimate_start(ahead: int, capacity: int, running: int, mean_run_s: float) -> float:
+    """When a job with ``ahead`` jobs before it should start, assuming jobs take ``mean_run_s``."""
+    capacity = max(1, capacity)
+    free = max(0, capacity - running)
+    waves = 0 if ahead < free else (ahead - free) // capacity + 1
+    return time.time() + waves * mean_run_s
+
+
+class JobContext:
+    """What a running handler may use: progress reporting and cancellation checks."""
+
+    def __init__(self, job_id: str, jobs: Any):
+        self.job_id = job_id
+        self._jobs = jobs
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancellation was requested; long handlers check this between steps."""
+        return self._jobs._cancel_requested(self.job_id)
+
+    def progress(self, percent: float) -> None:
+        self._jobs._set_progress(self.job_id, max(0.0, min(100.0, percent)))
+
+
+class CallbackDispatcher:
+    """Posts finished jobs' descriptions to their ``callback_url`` from one background thread.
+
+    Args:
+        config: Timeout and retry settings
+        describe: Returns a job's callback URL and description, or None when it is gone
+        record: Stores a job's delivery outcome, ``delivered`` or ``failed``
+    """
+
+    def __init__(
+        self,
+        config: JobsConfig,
+        describe: Callable[[str], tuple[str, dict[str, Any]] | None],
+        record: Callable[[str, str], None],
+    ):
+        self._config = config
+        self._describe = describe
+        self._record = record
+        self._lock = threading.Lock()
+        self._queue: queue.Queue[str] | None = None
+
+    def submit(self, job_id: str) -> None:
+        with self._lock:
+            if self._queue is None:
+                self._queue = queue.Queue()
+                threading.Thread(target=self._deliver, args=(self._queue,), name="job-callbacks", daemon=True).start()
+            self._queue.put(job_id)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._queue is not None:
+                self._queue.put("")
+
+    def _deliver(self, jobs: queue.Queue[str]) -> None:
+        import httpx
+
+        while job_id := jobs.get():
+            target = self._describe(job_id)
+            if target is None:
+                continue
+            url, body = target
+            outcome = "failed"
+            for attempt in range(self._config.callback_retries + 1):
+                try:
+                    response = httpx.post(url, json=body, timeout=self._config.callback_timeout_s)
+                    if response.status_code < 400:
+                        outcome = "delivered"
+                        break
+                except httpx.HTTPError:
+                    pass
+                if attempt < self._config.callback_retries:
+                    time.sleep(min(0.5 * 2**attempt, 10.0))
+            if outcome == "failed":
+                logger.warning("Job callback failed", extra={"job_id": job_id, "url": url})
+            self._record(job_id, outcome)
+
+
+class JobQueue:
+    """Priority job queue with a bounded worker pool and SQLite-backed state.
+
+    Args:
+        config: Queue settings
+        metrics: Registry receiving each job's queue wait as the ``queue`` phase
+        handlers: Callable per job mode, given the payload and a ``JobContext``
+            and returning a JSON-serialisable result
+    """
+
+    def __init__(self, config: JobsConfig, metrics: MetricsRegistry, handlers: dict[str, JobHandler]):
+        self._config = config
+        self._metrics = metrics
+        self._handlers = dict(handlers)
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._condition = threading.Condition()
+        self._heap: list[tuple[int, int, str]] = []
+        self._workers: list[threading.Thread] = []
+        self._running = 0
+        self._stopping = False
+        self._next_compaction = 0.0
+        self._callbacks = CallbackDispatcher(config, self._callback_target, self._record_callback)
+        self._counters = dict.fromkeys(("submitted", "completed", "failed", "cancelled", "expired"), 0)
+        self._completions: deque[float] = deque(maxlen=10_000)
+        self._queue_wait = LatencyHistogram()
+        self._run_time = LatencyHistogram()
+        self._stats_lock = threading.Lock()
+        register_buffer("jobs.heap", self, lambda jobs: jobs._heap)
+        if config.path is not None:
+            # Resume persisted work right away instead of on the first request
+            self._ensure_open()
+
+    @property
+    def modes(self) -> list[str]:
+        return sorted(self._handlers)
+
+    # Public API -----------------------------------------------------------
+
+    def submit(
+        self,
+        mode: str,
+        payload: dict[str, Any],
+        callback_url: str | None = None,
+        priority: int | None = None,
+    ) -> dict[str, Any]:
+        """Queue a job and describe it, including its queue position and estimated start.
+
+        Raises:
+            ValueError: If no handler is registered for ``mode``
+            QueueFullError: If ``max_queued`` jobs are already waiting
+        """
+        if mode not in self._handlers:
+            raise ValueError(f"Unsupported job mode '{mode}'; available: {', '.join(self.modes)}")
+        priority = self._config.default_priority if priority is None else priority
+        if not 0 <= priority <= 9:
+            raise ValueError("priority must be between 0 and 9")
+        job_id = uuid.uuid4().hex
+        self._ensure_open()
+        with self._lock:
+            connection = self._connection
+            assert connection is not None
+            queued = connection.execute("SELECT COUNT(*) FROM jobs WHERE status = ?", (QUEUED,)).fetchone()[0]
+            if queued >= self._config.max_queued:
+                raise QueueFullError(f"Job queue is full ({queued} jobs waiting)")
+            seq = connection.execute(
+                "INSERT INTO jobs (id, mode, payload, priority, callback_url, status, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, mode, json.dumps(payload), priority, callback_url, QUEUED, time.time()),
+            ).lastrowid
+        with self._stats_lock:
+            self._counters["submitted"] += 1
+        self._push(priority, seq, job_id)
+        return self.status(job_id)
+
+    def status(self, job_id: str) -> dict[str, Any]:
+        """Describe a job.
+
+        Raises:
+            KeyError: If the job does not exist or its result expired
+        """
+        self._ensure_open()
+        self._maybe_compact()
+        row = self._row(job_id)
+        if row is None or (row["expires_at"] is not None and row["expires_at"] <= time.time()):
+            raise KeyError(job_id)
+        return self._describe(row)
+
+    def cancel(self, job_id: str) -> dict[str, Any]:
+        """Cancel a job; a running one stops at its next cancellation check and its result is discarded.
+
+        Raises:
+            KeyError: If the job does not exist
+            ValueError: If the job already finished
+        """
+        self._ensure_open()
+        with self._lock:
+            connection = self._connection
+            assert connection is not None
+            now = time.time()
+            dequeued = connection.execute(
+                "UPDATE jobs SET status = ?, completed_at = ?, expires_at = ?, cancel_requested = 1 WHERE id = ? AND status = ?",
+                (CANCELLED, now, now + self._config.result_ttl_s, job_id, QUEUED),
+            ).rowcount
+            if not dequeued:
+                row = connection.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+                if row is None:
+                    raise KeyError(job_id)
+                if row[0] in FINISHED:
+                    raise ValueError(f"Job '{job_id}' already {row[0]}")
+                connection.execute("UPDATE jobs SET cancel_requested = 1 WHERE id = ?", (job_id,))
+        if dequeued:
+            # The heap entry is skipped when popped
+            with self._stats_lock:
+                self._counters["cancelled"] += 1
+        return self.status(job_id)
+
+    def stats(self) -> dict[str, Any]:
+        """Queue depth, counters, throughput and queue-wait and run-time percentiles."""
+        self._ensure_open()
+        with self._lock:
+            connection = self._connection
+            assert connection is not None
+            by_status = dict(connection.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+        now = time.time()
+        with self._stats_lock:
+            recent = sum(1 for finished in self._completions if finished >= now - 60.0)
+            return {
+                "workers": self._config.workers,
+                "running": self._running,
+                "queued": by_status.get(QUEUED, 0),
+                "by_status": by_status,
+                "counters": dict(self._counters),
+                "throughput_per_min": recent,
+                "queue_wait_ms": self._queue_wait.percentiles(),
+                "run_time_ms": self._run_time.percentiles(),
+            }
+
+    def queue_depth(self) -> int:
+        with self._condition:
+            return len(self._heap)
+
+    def compact(self) -> int:
+        """Delete jobs whose results expired and compact the database; returns the number deleted."""
+        self._ensure_open()
+        with self._lock:
+            connection = self._connection
+            assert connection is not None
+            deleted = connection.execute("DELETE FROM jobs WHERE expires_at <= ?", (time.time(),)).rowcount
+            if deleted:
+                connection.execute("PRAGMA incremental_vacuum")
+                if self._config.path is not None:
+                    connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        if deleted:
+            with self._stats_lock:
+                self._counters["expired"] += deleted
+        return deleted
+
+    def shutdown(self, timeout: float = 2.0) -> None:
+        """Stop the workers; jobs still running are resumed by the next start when persisted."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        for worker in self._workers:
+            worker.join(timeout=timeout)
+        self._callbacks.close()
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    # Internal helpers -----------------------------------------------------
+
+    def _ensure_open(self) -> None:
+        if self._connection is not None:
+            return
+        with self._lock:
+            if self._connection is not None:
+                return
+            if self._config.path is not None:
+                self._config.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                str(self._config.path or ":memory:"), timeout=10.0, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA busy_timeout = 10000")
+            connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.executescript(_SCHEMA)
+            # Jobs of a process that died mid-run go back to the queue. A job owned by this pid
+            # was left by an earlier server: after a container restart the pid is usually reused.
+            for job_id, owner in connection.execute("SELECT id, owner FROM jobs WHERE status = ?", (RUNNING,)).fetchall():
+                if owner == os.getpid() or not _pid_alive(owner):
+                    connection.execute("UPDATE jobs SET status = ?, owner = NULL WHERE id = ?", (QUEUED, job_id))
+            pending = connection.execute("SELECT priority, seq, id FROM jobs WHERE status = ?", (QUEUED,)).fetchall()
+            self._connection = connection
+            self._next_compaction = time.monotonic() + self._config.compaction_interval_s
+        with self._condition:
+            for entry in pending:
+                heapq.heappush(self._heap, tuple(entry))
+            self._start_workers()
+            self._condition.notify_all()
+        if pending:
+            logger.info("Resumed persisted jobs", extra={"jobs": len(pending)})
+
+    def _start_workers(self) -> None:
+        while len(self._workers) < self._config.workers:
+            worker = threading.Thread(target=self._work, name=f"job-worker-{len(self._workers)}", daemon=True)
+            self._workers.append(worker)
+            worker.start()
+
+    def _push(self, priority: int, seq: int, job_id: str) -> None:
+        with self._condition:
+            heapq.heappush(self._heap, (priority, seq, job_id))
+            self._condition.notify()
+
+    def _execute(self, sql: str, params: tuple = ()) -> int:
+        with self._lock:
+            connection = self._connection
+            if connection is None:
+                return 0
+            return connection.execute(sql, params).rowcount
+
+    def _row(self, job_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            connection = self._connection
+            if connection is None:
+                return None  # shut down while a handler was running
+            cursor = connection.execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
+            row = cursor.fetchone()
+            return None if row is None else dict(zip((column[0] for column in cursor.description), row))
+
+    def _cancel_requested(self, job_id: str) -> bool:
+        with self._lock:
+            connection = self._connection
+            if connection is None:
+                return True
+            row = connection.execute("SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return bool(row and row[0])
+
+    def _set_progress(self, job_id: str, percent: float) -> None:
+        self._execute("UPDATE jobs SET progress = ? WHERE id = ?", (percent, job_id))
+
+    def _describe(self, row: dict[str, Any]) -> dict[str, Any]:
+        if row["status"] == QUEUED:
+            return describe_job(row, *self._position(row["priority"], row["seq"]))
+        return describe_job(row)
+
+    def _position(self, priority: int, seq: int) -> tuple[int, float]:
+        """Jobs ahead of this one (0 = next) and when it should start, from the mean run time so far."""
+        with self._lock:
+            connection = self._connection
+            assert connection is not None
+            ahead = connection.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = ? AND (priority < ? OR (priority = ? AND seq < ?))",
+                (QUEUED, priority, priority, seq),
+            ).fetchone()[0]
+        with self._stats_lock:
+            mean_s = self._run_time.mean / 1000 if self._run_time.count else DEFAULT_RUN_S
+        return ahead, estimate_start(ahead, self._config.workers, self._running, mean_s)
+
+    def _maybe_compact(self) -> None:
+        if time.monotonic() >= self._next_compaction:
+            self._next_compaction = time.monotonic() + self._config.compaction_interval_s
+            try:
+                self.compact()
+            except sqlite3.Error:
+                logger.warning("Job compaction failed", exc_info=True)
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                if not self._heap and not self._stopping:
+                    # Idle workers wake up now and then to compact
+                    self._condition.wait(timeout=self._config.compaction_interval_s)
+                if self._stopping:
+                    return
+                entry = heapq.heappop(self._heap) if self._heap else None
+            if entry is None:
+                self._maybe_compact()
+                continue
+            job_id = entry[2]
+            started = time.time()
+            claimed = self._execute(
+                "UPDATE jobs SET status = ?, started_at = ?, owner = ? WHERE id = ? AND status = ?",
+                (RUNNING, started, os.getpid(), job_id, QUEUED),
+            )
+            if not claimed:
+                continue  # cancelled while queued, or claimed by another process sharing the database
+            self._run(job_id, started)
+
+    def _run(self, job_id: str, started: float) -> None:
+        row = self._row(job_id)
+        if row is None:
+            return
+        wait_ms = (started - row["created_at"]) * 1000
+        self._metrics.record_phase("queue", wait_ms)
+        with self._stats_lock:
+            self._running += 1
+            self._queue_wait.record(wait_ms)
+        status, result, error = COMPLETED, None, None
+        try:
+            result = json.dumps(self._handlers[row["mode"]](json.loads(row["payload"]), JobContext(job_id, self)))
+        except Exception as exc:
+            status, error = FAILED, str(exc) or exc.__class__.__name__
+            logger.warning("Job failed", extra={"job_id": job_id, "mode": row["mode"], "error": error})
+        finished = time.time()
+        self._execute(
+            "UPDATE jobs SET status = CASE WHEN cancel_requested = 1 THEN ? ELSE ? END, result = CASE WHEN "
+            "cancel_requested = 1 THEN NULL ELSE ? END, error = ?, completed_at = ?, expires_at = ? WHERE id = ?",
+            (CANCELLED, status, result, error, finished, finished + self._config.result_ttl_s, job_id),
+        )
+        final = self._row(job_id)
+        with self._stats_lock:
+            self._running -= 1
+            self._run_time.record((finished - started) * 1000)
+            self._completions.append(finished)
+            if final is not None:
+                self._counters[final["status"]] += 1
+        if final is not None and final["callback_url"]:
+            self._callbacks.submit(job_id)
+
+    def _callback_target(self, job_id: str) -> tuple[str, dict[str, Any]] | None:
+        row = self._row(job_id)
+        return (row["callback_url"], self._describe(row)) if row is not None else None
+
+    def _record_callback(self, job_id: str, outcome: str) -> None:
+        self._execute("UPDATE jobs SET callback_status = ? WHERE id = ?", (outcome, job_id))
+
+__all__ = [
+    "CANCELLED",
+    "COMPLETED",
+    "DEFAULT_RUN_S",
+    "FAILED",
+    "FINISHED",
+    "QUEUED",
+    "RUNNING",
+    "CallbackDispatcher",
+    "JobContext",
+    "JobHandler",
+    "JobQueue",
+    "QueueFullError",
+    "describe_job",
+    "estimate_start",
+]
@@ -12,7 +12,10 @@ from __future__ import annotations
 
 from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from ..context.templates import CompiledPersona
 
 
 @dataclass
@@ -23,6 +26,7 @@ class GenerationRequest:
     temperature: float = 0.7
     max_tokens: int = 512
     metadata: dict[str, str] | None = None
+    template: CompiledPersona | None = None  # Pre-rendered persona framing, when the router has one
 
 
 @dataclass
@@ -0,0 +1,377 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+"""Record and replay backend exchanges.
+
+``RecordingBackend`` wraps a real backend and appends every exchange to a
+cassette: the request, each chunk with the delay since the previous one,
+and the error if the call failed. A cassette is a JSON-lines file, gzip
+compressed when its name ends in ``.gz``, so it can be appended to across
+runs and inspected with ``zcat``.
+
+``ReplayBackend`` answers from a cassette with the recorded chunks and
+timing, optionally scaled. Requests are matched by hash at decreasing
+precision: the exact request, then the same persona and conversation, then
+the same persona and last user message, then any exchange of the persona,
+then any exchange at all. Context is only part of the exact key, so changes
+to retrieval or compaction still find their recorded answers. Exchanges
+sharing a key are replayed round-robin.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any
+
+from .base import GenerationChunk, GenerationRequest, GenerationResponse, LLMBackend
+
+CASSETTE_FORMAT = "adaptivemind-cassette"
+CASSETTE_VERSION = 1
+MATCH_LEVELS = ("exact", "messages", "last_user", "persona", "any")
+DEFAULT_FALLBACKS = MATCH_LEVELS[1:]
+
+
+class CassetteMiss(LookupError):
+    """No recorded exchange matches a request at any permitted level."""
+
+
+class ReplayedBackendError(RuntimeError):
+    """A recorded exchange that failed, raised again on replay."""
+
+
+def _digest(*parts: Any) -> str:
+    encoded = json.dumps(parts, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _conversation(messages: Sequence[dict]) -> list[dict[str, str]]:
+    return [{"role": str(message.get("role", "user")), "content": str(message.get("content", ""))} for message in messages]
+
+
+def request_keys(request: GenerationRequest) -> dict[str, str]:
+    """Lookup keys of a request for every match level except ``any``."""
+    conversation = _conversation(request.messages)
+    last_user = next((message["content"] for message in reversed(conversation) if message["role"] == "user"), "")
+    return {
+        "exact": _digest(request.persona, conversation, request.context, request.temperature, request.max_tokens),
+        "messages": _digest(request.persona, conversation),
+        "last_user": _digest(request.persona, " ".join(last_user.lower().split())),
+        "persona": request.persona,
+    }
+
+
+@dataclass
+class Exchange:
+    """One recorded backend call.
+
+    ``chunks`` holds ``(delay_ms, content, cumulative_tokens)`` triples, the
+    delay measured from the previous chunk (the first from the call). A
+    ``generate`` call is stored as a single chunk.
+    """
+
+    keys: dict[str, str]
+    persona: str
+    messages: list[dict[str, str]]
+    temperature: float
+    max_tokens: int
+    backend: str
+    streamed: bool
+    chunks: list[tuple[float, str, int]] = field(default_factory=list)
+    diagnostics: dict[str, str] = field(default_factory=dict)
+    error: str = ""
+    recorded_at: float = 0.0
+
+    @property
+    def content(self) -> str:
+        return "".join(chunk[1] for chunk in self.chunks)
+
+    @property
+    def tokens(self) -> int:
+        return self.chunks[-1][2] if self.chunks else 0
+
+    @property
+    def duration_ms(self) -> float:
+        return sum(chunk[0] for chunk in self.chunks)
+
+    def to_record(self) -> dict[str, Any]:
+        record = {
+            "keys": self.keys,
+            "persona": self.persona,
+            "messages": self.messages,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "backend": self.backend,
+            "streamed": self.streamed,
+            "chunks": [[round(delay, 3), content, tokens] for delay, content, tokens in self.chunks],
+            "recorded_at": round(self.recorded_at, 3),
+        }
+        if self.diagnostics:
+            record["diagnostics"] = self.diagnostics
+        if self.error:
+            record["error"] = self.error
+        return record
+
+    @classmethod
+    def from_record(cls, record: dict[str, Any]) -> Exchange:
+        return cls(
+            keys=record["keys"],
+            persona=record["persona"],
+            messages=record.get("messages", []),
+            temperature=record.get("temperature", 0.7),
+            max_tokens=record.get("max_tokens", 512),
+            backend=record.get("backend", "replay"),
+            streamed=record.get("streamed", False),
+            chunks=[(float(delay), str(content), int(tokens)) for delay, content, tokens in record.get("chunks", [])],
+            diagnostics=record.get("diagnostics", {}),
+            error=record.get("error", ""),
+            recorded_at=record.get("recorded_at", 0.0),
+        )
+
+
+def _open(path: Path, mode: str) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")  # type: ignore[return-value]
+    return open(path, mode, encoding="utf-8")
+
+
+def read_cassette(path: Path | str) -> Iterator[Exchange]:
+    """Exchanges in recording order; header lines (one per appending run) are skipped."""
+    with _open(Path(path), "r") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record.get("format") == CASSETTE_FORMAT:
+                if record.get("version") != CASSETTE_VERSION:
+                    raise ValueError(f"{path}: unsupported cassette version {record.get('version')!r}")
+                continue
+            yield Exchange.from_record(record)
+
+
+class CassetteWriter:
+    """Thread-safe appender; each exchange is flushed as soon as it is recorded."""
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._handle: IO[str] | None = _open(self.path, "a")
+        self._handle.write(json.dumps({"format": CASSETTE_FORMAT, "version": CASSETTE_VERSION, "started_at": time.time()}) + "\n")
+        self.recorded = 0
+
+    def write(self, exchange: Exchange) -> None:
+        line = json.dumps(exchange.to_record(), ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self._lock:
+            if self._handle is None:
+                return
+            self._handle.write(line)
+            self._handle.flush()
+            self.recorded += 1
+
+    def close(self) -> None:
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+
+class Cassette:
+    """Recorded exchanges indexed by match level."""
+
+    def __init__(self, exchanges: Sequence[Exchange], fallbacks: Sequence[str] = DEFAULT_FALLBACKS):
+        unknown = set(fallbacks) - set(MATCH_LEVELS)
+        if unknown:
+            raise ValueError(f"Unknown match levels: {sorted(unknown)}; expected {MATCH_LEVELS}")
+        self.exchanges = list(exchanges)
+        self.levels = ("exact", *(level for level in fallbacks if level != "exact"))
+        self._index: dict[str, dict[str, list[Exchange]]] = {level: defaultdict(list) for level in MATCH_LEVELS}
+        for exchange in self.exchanges:
+            for level, key in exchange.keys.items():
+                if level in self._index:
+                    self._index[level][key].append(exchange)
+            self._index["any"][""].append(exchange)
+        self._cursors: Counter = Counter()
+        self._hits: Counter = Counter()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Path | str, fallbacks: Sequence[str] = DEFAULT_FALLBACKS) -> Cassette:
+        return cls(list(read_cassette(path)), fallbacks)
+
+    def __len__(self) -> int:
+        return len(self.exchanges)
+
+    def lookup(self, keys: dict[str, str]) -> tuple[Exchange, str]:
+        """Next exchange for the most precise matching level, and that level."""
+        for level in self.levels:
+            candidates = self._index[level].get(keys.get(level, ""))
+            if not candidates:
+                continue
+            with self._lock:
+                cursor = self._cursors[(level, keys.get(level, ""))]
+                self._cursors[(level, keys.get(level, ""))] += 1
+                self._hits[level] += 1
+            return candidates[cursor % len(candidates)], level
+        with self._lock:
+            self._hits["miss"] += 1
+        raise CassetteMiss(f"No recorded exchange for persona {keys.get('persona')!r} (tried {', '.join(self.levels)})")
+
+    def stats(self) -> dict[str, int]:
+        """Lookups answered per match level, plus misses."""
+        with self._lock:
+            return {level: self._hits[level] for level in (*self.levels, "miss")}
+
+
+class RecordingBackend(LLMBackend):
+    """Pass-through wrapper that records every exchange of ``inner`` to a cassette."""
+
+    def __init__(self, inner: LLMBackend, writer: CassetteWriter):
+        self._inner = inner
+        self._writer = writer
+        self.name = inner.name
+
+    def is_available(self) -> bool:
+        return self._inner.is_available()
+
+    def generate(self, request: GenerationRequest) -> GenerationResponse:
+        start = time.perf_counter()
+        try:
+            response = self._inner.generate(request)
+        except Exception as exc:
+            self._record(request, False, [], {}, f"{type(exc).__name__}: {exc}")
+            raise
+        chunks = [((time.perf_counter() - start) * 1000, response.content, response.tokens)]
+        self._record(request, False, chunks, response.diagnostics or {})
+        return response
+
+    def stream(self, request: GenerationRequest) -> Iterator[GenerationChunk]:
+        chunks: list[tuple[float, str, int]] = []
+        diagnostics: dict[str, str] = {}
+        error = ""
+        previous = time.perf_counter()
+        try:
+            for chunk in self._inner.stream(request):
+                chunks.append(((time.perf_counter() - previous) * 1000, chunk.content, chunk.tokens))
+                if chunk.diagnostics:
+                    diagnostics = chunk.diagnostics
+                yield chunk
+                # Time the consumer spends on a chunk is the client's pace, not the backend's
+                previous = time.perf_counter()
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            raise
+        finally:
+            # Also reached when the consumer stops early; the partial exchange is still recorded
+            self._record(request, True, chunks, diagnostics, error)
+
+    def _record(
+        self,
+        request: GenerationRequest,
+        streamed: bool,
+        chunks: list[tuple[float, str, int]],
+        diagnostics: dict[str, str],
+        error: str = "",
+    ) -> None:
+        self._writer.write(
+            Exchange(
+                keys=request_keys(request),
+                persona=request.persona,
+                messages=_conversation(request.messages),
+                temperature=request.temperature,
+                max_tokens=request.max_tokens,
+                backend=self._inner.name,
+                streamed=streamed,
+                chunks=chunks,
+                diagnostics={str(key): str(value) for key, value in diagnostics.items()},
+                error=error,
+                recorded_at=time.time(),
+            )
+        )
+
+
+class ReplayBackend(LLMBackend):
+    """Backend answering from a cassette with the recorded content and timing.
+
+    ``timing_scale`` multiplies every recorded delay: 1.0 reproduces the
+    original pacing, 0.5 replays twice as fast and 0 returns immediately.
+    Chunks report the backend that was recorded, so metrics keep the
+    original backend mix.
+    """
+
+    name = "replay"
+
+    def __init__(self, cassette: Cassette, timing_scale: float = 1.0):
+        if timing_scale < 0:
+            raise ValueError("timing_scale must not be negative")
+        self.cassette = cassette
+        self.timing_scale = timing_scale
+
+    def is_available(self) -> bool:
+        return len(self.cassette) > 0
+
+    def generate(self, request: GenerationRequest) -> GenerationResponse:
+        exchange, level = self.cassette.lookup(request_keys(request))
+        self._sleep(exchange.duration_ms)
+        if exchange.error:
+            raise ReplayedBackendError(exchange.error)
+        diagnostics = {**exchange.diagnostics, "replay.match": level}
+        return GenerationResponse(content=exchange.content, tokens=exchange.tokens, backend=exchange.backend, diagnostics=diagnostics)
+
+    def stream(self, request: GenerationRequest) -> Iterator[GenerationChunk]:
+        exchange, level = self.cassette.lookup(request_keys(request))
+        diagnostics = {**exchange.diagnostics, "replay.match": level}
+        deadline = time.perf_counter()
+        last = len(exchange.chunks) - 1
+        for index, (delay_ms, content, tokens) in enumerate(exchange.chunks):
+            # Pace against the replay start so sleep overshoot does not accumulate
+            deadline += delay_ms * self.timing_scale / 1000
+            remaining = deadline - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+            finished = index == last and not exchange.error
+            yield GenerationChunk(
+                content=content,
+                tokens=tokens,
+                backend=exchange.backend,
+                finished=finished,
+                diagnostics=diagnostics if finished else None,
+            )
+        if exchange.error:
+            raise ReplayedBackendError(exchange.error)
+        if last < 0:
+            yield GenerationChunk(content="", tokens=0, backend=exchange.backend, finished=True, diagnostics=diagnostics)
+
+    def _sleep(self, duration_ms: float) -> None:
+        if self.timing_scale > 0 and duration_ms > 0:
+            time.sleep(duration_ms * self.timing_scale / 1000)
+
+
+__all__ = [
+    "CASSETTE_FORMAT",
+    "Cassette",
+    "CassetteMiss",
+    "CassetteWriter",
+    "DEFAULT_FALLBACKS",
+    "Exchange",
+    "MATCH_LEVELS",
+    "RecordingBackend",
+    "ReplayBackend",
+    "ReplayedBackendError",
+    "read_cassette",
+    "request_keys",
+]
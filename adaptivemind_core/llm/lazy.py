@@ -0,0 +1,69 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterator
+from importlib import import_module
+from typing import Any
+
+from .base import GenerationChunk, GenerationRequest, GenerationResponse, LLMBackend
+
+
+class LazyBackend(LLMBackend):
+    """Placeholder that imports and constructs a backend the first time it is used.
+
+    Backend modules pull in their HTTP clients or inference runtimes at import
+    time; deferring that to the first availability probe or request keeps
+    application startup independent of which backends are configured.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], LLMBackend]):
+        self.name = name
+        self._factory = factory
+        self._backend: LLMBackend | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def of(cls, name: str, target: str, **kwargs: Any) -> LazyBackend:
+        """Defer ``module:Class(**kwargs)``, with ``module`` relative to this package."""
+        module, _, attribute = target.partition(":")
+
+        def _build() -> LLMBackend:
+            return getattr(import_module(module, __package__), attribute)(**kwargs)
+
+        return cls(name, _build)
+
+    @property
+    def loaded(self) -> bool:
+        return self._backend is not None
+
+    @property
+    def backend(self) -> LLMBackend:
+        backend = self._backend
+        if backend is None:
+            with self._lock:
+                if self._backend is None:
+                    self._backend = self._factory()
+                backend = self._backend
+        return backend
+
+    def is_available(self) -> bool:
+        return self.backend.is_available()
+
+    def generate(self, request: GenerationRequest) -> GenerationResponse:
+        return self.backend.generate(request)
+
+    def stream(self, request: GenerationRequest) -> Iterator[GenerationChunk]:
+        return self.backend.stream(request)
+
+
+__all__ = ["LazyBackend"]
@@ -16,8 +16,12 @@ from collections.abc import Iterator
 
 import requests
 
+from ..monitoring.tracing import current_span
 from .base import GenerationChunk, GenerationRequest, GenerationResponse, LLMBackend
 
+# Server-side timings reported by Ollama (nanoseconds), surfaced as span attributes
+_TIMING_FIELDS = ("load_duration", "prompt_eval_duration", "eval_duration")
+
 
 class OllamaBackend(LLMBackend):
     """Backend that interacts with a local Ollama instance via HTTP."""
@@ -81,6 +85,7 @@ class OllamaBackend(LLMBackend):
             "model": data.get("model", self._model),
             "total_duration": str(data.get("total_duration")),
         }
+        self._annotate_span(data)
         return GenerationResponse(content=message, tokens=int(tokens), backend=self.name, diagnostics=diagnostics)
 
     def stream(self, request: GenerationRequest) -> Iterator[GenerationChunk]:
@@ -121,7 +126,15 @@ class OllamaBackend(LLMBackend):
                     diagnostics=diagnostics,
                 )
                 if finished:
+                    self._annotate_span(data)
                     break
 
+    def _annotate_span(self, data: dict) -> None:
+        span = current_span()
+        span.set_attribute("model", data.get("model", self._model))
+        for field in _TIMING_FIELDS:
+            if data.get(field) is not None:
+                span.set_attribute(f"ollama.{field}_ms", round(data[field] / 1e6, 3))
+
 
 __all__ = ["OllamaBackend"]
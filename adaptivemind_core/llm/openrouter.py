@@ -10,10 +10,14 @@
 
 from __future__ import annotations
 
+import json
+from collections.abc import Iterator
+
 import httpx
 
 from ..logger import get_logger
-from .base import GenerationRequest, GenerationResponse, LLMBackend
+from ..monitoring.tracing import current_span
+from .base import GenerationChunk, GenerationRequest, GenerationResponse, LLMBackend
 
 logger = get_logger(__name__)
 
@@ -21,29 +25,40 @@ logger = get_logger(__name__)
 class OpenRouterBackend(LLMBackend):
     """Backend for OpenRouter API (Cloud Agent)."""
 
-    def __init__(self, api_key: str, model: str = "openai/gpt-3.5-turbo", site_url: str = "", app_name: str = "AdaptiveMind Local"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "openai/gpt-3.5-turbo",
+        site_url: str = "",
+        app_name: str = "AdaptiveMind Local",
+        base_url: str = "https://openrouter.ai/api/v1",
+    ):
         self.name = "openrouter"
         self.api_key = api_key
         self.model = model
         self.site_url = site_url
         self.app_name = app_name
-        self._base_url = "https://openrouter.ai/api/v1"
+        self._base_url = base_url.rstrip("/")
 
     def is_available(self) -> bool:
         return bool(self.api_key)
 
-    def generate(self, request: GenerationRequest) -> GenerationResponse:
-        headers = {
+    def _headers(self) -> dict[str, str]:
+        return {
             "Authorization": f"Bearer {self.api_key}",
             "HTTP-Referer": self.site_url,
             "X-Title": self.app_name,
             "Content-Type": "application/json",
         }
 
+    def _payload(self, request: GenerationRequest, stream: bool = False) -> dict:
         # Construct messages with system prompt from persona
         messages = []
-        # If context is provided, prepend it to the system prompt or first user message
-        system_content = f"You are acting as the '{request.persona}' persona.\n\nContext:\n{request.context}"
+        # Prefer the persona's compiled header; only ad-hoc requests render it here
+        if request.template is not None:
+            system_content = request.template.system_message(request.context)
+        else:
+            system_content = f"You are acting as the '{request.persona}' persona.\n\nContext:\n{request.context}"
         messages.append({"role": "system", "content": system_content})
 
         # Append conversation history
@@ -56,6 +71,13 @@ class OpenRouterBackend(LLMBackend):
             "temperature": request.temperature,
             "max_tokens": request.max_tokens,
         }
+        if stream:
+            payload["stream"] = True
+        return payload
+
+    def generate(self, request: GenerationRequest) -> GenerationResponse:
+        headers = self._headers()
+        payload = self._payload(request)
 
         try:
             with httpx.Client(timeout=60.0) as client:
@@ -64,6 +86,7 @@ class OpenRouterBackend(LLMBackend):
                     headers=headers,
                     json=payload
                 )
+                current_span().set_attributes({"model": self.model, "http.status_code": response.status_code})
                 response.raise_for_status()
                 data = response.json()
 
@@ -82,3 +105,33 @@ class OpenRouterBackend(LLMBackend):
             # Return a fallback response or re-raise depending on strategy
             # For now, we return an error message as content to be handled by the router fallback
             raise e
+
+    def stream(self, request: GenerationRequest) -> Iterator[GenerationChunk]:
+        """Stream a completion over server-sent events (``data:`` lines ending with ``[DONE]``)."""
+        tokens = 0
+        diagnostics = {"model": self.model, "provider": "openrouter"}
+        with httpx.Client(timeout=60.0) as client:
+            with client.stream(
+                "POST", f"{self._base_url}/chat/completions", headers=self._headers(), json=self._payload(request, stream=True)
+            ) as response:
+                current_span().set_attributes({"model": self.model, "http.status_code": response.status_code})
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    event = json.loads(data)
+                    choice = (event.get("choices") or [{}])[0]
+                    content = (choice.get("delta") or {}).get("content") or ""
+                    usage = event.get("usage") or {}
+                    tokens = usage.get("completion_tokens", tokens + (1 if content else 0))
+                    finished = choice.get("finish_reason") is not None
+                    yield GenerationChunk(
+                        content=content, tokens=tokens, backend=self.name, finished=finished, diagnostics=diagnostics
+                    )
+                    if finished:
+                        return
+        # The stream ended without a finish_reason; close it so the router records the request
+        yield GenerationChunk(content="", tokens=tokens, backend=self.name, finished=True, diagnostics=diagnostics)
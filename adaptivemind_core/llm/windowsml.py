@@ -11,14 +11,24 @@
 from __future__ import annotations
 
 import platform
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-try:
+from .base import GenerationRequest, GenerationResponse, LLMBackend
+
+if TYPE_CHECKING:
     import onnxruntime as ort
-except Exception:  # pragma: no cover - optional dependency
-    ort = None
 
-from .base import GenerationRequest, GenerationResponse, LLMBackend
+
+@lru_cache(maxsize=1)
+def _onnxruntime() -> Any | None:
+    """Import ONNX Runtime on first use; it is slow to import and only usable on Windows with a model."""
+    try:
+        import onnxruntime
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+    return onnxruntime
 
 
 class WindowsMLBackend(LLMBackend):
@@ -37,12 +47,12 @@ class WindowsMLBackend(LLMBackend):
         self._session: ort.InferenceSession | None = None
 
     def is_available(self) -> bool:
-        if ort is None:
-            return False
         if platform.system().lower() != "windows":
             return False
         if not self._model_path or not self._model_path.exists():
             return False
+        if _onnxruntime() is None:
+            return False
         try:
             self._ensure_session()
             return True
@@ -55,7 +65,10 @@ class WindowsMLBackend(LLMBackend):
         providers = ["CPUExecutionProvider"]
         if self._device_preference.lower() == "dml":
             providers.insert(0, "DmlExecutionProvider")
-        self._session = ort.InferenceSession(str(self._model_path), providers=providers)  # type: ignore[arg-type]
+        runtime = _onnxruntime()
+        if runtime is None:
+            raise RuntimeError("onnxruntime is not installed")
+        self._session = runtime.InferenceSession(str(self._model_path), providers=providers)
         return self._session
 
     def generate(self, request: GenerationRequest) -> GenerationResponse:
@@ -16,42 +16,223 @@ It supports both console and file logging with proper handling of extra fields
 and exception information.
 
 Key features:
-- JSON-formatted structured logging
+- JSON-formatted structured logging (orjson when installed)
+- Non-blocking handlers: records go through a bounded queue and are
+  formatted and written by a background listener thread
+- Per-logger sampling and rate limiting for high-volume events
+- Counters for dropped, sampled-out and rate-limited records
 - Automatic configuration from environment variables
-- Support for both console and file handlers
-- Proper handling of extra fields and context data
 - Singleton configuration pattern to prevent reconfiguration
 """
 
 from __future__ import annotations
 
+import atexit
+import copy
 import json
 import logging
-import logging.config
 import os
+import queue
+import random
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any
 
+try:  # Optional fast JSON encoder
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
 # Global flag to ensure logging is only configured once
 _LOGGER_CONFIGURED = False
+_LISTENER: QueueListener | None = None
+_QUEUE_HANDLER: "BoundedQueueHandler | None" = None
+_SAMPLING: "LogSamplingFilter | None" = None
+
+# Attributes every LogRecord carries; anything else came in through ``extra``
+_STANDARD_ATTRS = frozenset(logging.LogRecord("", 0, "", 0, "", (), None).__dict__) | {"message", "asctime"}
+
+
+def _dumps(data: dict[str, Any]) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str).decode("utf-8")
+        except TypeError:  # e.g. non-string dict keys in an extra field
+            pass
+    return json.dumps(data, ensure_ascii=False, default=str)
+
+
+@dataclass
+class LogRule:
+    """Volume controls for one logger (and its children).
+
+    Attributes:
+        sample_rate: Fraction of records kept (1.0 keeps everything)
+        max_per_second: Token-bucket rate limit; ``None`` disables it
+        burst: Bucket size, i.e. records allowed in a burst before limiting
+    """
+
+    sample_rate: float = 1.0
+    max_per_second: float | None = None
+    burst: int = 10
 
 
-def configure_logging(log_level: str | int = "INFO", log_path: str | None = None) -> None:
+class _TokenBucket:
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = float(max(1, capacity))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def take(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+
+class LogSamplingFilter(logging.Filter):
+    """Samples and rate limits records below WARNING according to per-logger rules.
+
+    A record matches the rule of its logger or the nearest configured
+    ancestor. Warnings and errors always pass.
+    """
+
+    def __init__(self, rules: dict[str, LogRule] | None = None):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._rules: dict[str, LogRule] = {}
+        self._buckets: dict[str, _TokenBucket] = {}
+        self._resolved: dict[str, str | None] = {}
+        self.sampled_out = 0
+        self.rate_limited = 0
+        for name, rule in (rules or {}).items():
+            self.set_rule(name, rule)
+
+    def set_rule(self, logger_name: str, rule: LogRule | None) -> None:
+        with self._lock:
+            if rule is None:
+                self._rules.pop(logger_name, None)
+                self._buckets.pop(logger_name, None)
+            else:
+                self._rules[logger_name] = rule
+                if rule.max_per_second is not None:
+                    self._buckets[logger_name] = _TokenBucket(rule.max_per_second, rule.burst)
+                else:
+                    self._buckets.pop(logger_name, None)
+            self._resolved.clear()
+
+    def _match(self, name: str) -> str | None:
+        resolved = self._resolved.get(name, "")
+        if resolved != "":
+            return resolved
+        candidate: str | None = name
+        while candidate and candidate not in self._rules:
+            candidate = candidate.rpartition(".")[0] or None
+        self._resolved[name] = candidate
+        return candidate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self._rules:
+            return True
+        with self._lock:
+            matched = self._match(record.name)
+            if matched is None:
+                return True
+            rule = self._rules[matched]
+            if rule.sample_rate < 1.0 and random.random() >= rule.sample_rate:
+                self.sampled_out += 1
+                return False
+            bucket = self._buckets.get(matched)
+            if bucket is not None and not bucket.take():
+                self.rate_limited += 1
+                return False
+        return True
+
+
+class BoundedQueueHandler(QueueHandler):
+    """QueueHandler over a bounded queue that drops or blocks when full.
+
+    ``prepare`` only merges the message arguments and renders the traceback
+    text on the calling thread; JSON encoding and I/O happen on the
+    listener thread.
+
+    Args:
+        maxsize: Queue capacity in records
+        overflow: ``"drop"`` discards records while the queue is full,
+            ``"block"`` waits up to ``block_timeout`` seconds and then drops
+        block_timeout: Maximum wait in ``"block"`` mode
+    """
+
+    def __init__(self, maxsize: int = 10000, overflow: str = "drop", block_timeout: float = 1.0):
+        if overflow not in {"drop", "block"}:
+            raise ValueError(f"overflow must be 'drop' or 'block', not {overflow!r}")
+        super().__init__(queue.Queue(maxsize))
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.dropped = 0
+        self._exception_formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = self._exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            if self.overflow == "block":
+                self.queue.put(record, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    @property
+    def depth(self) -> int:
+        return self.queue.qsize()
+
+
+def configure_logging(
+    log_level: str | int = "INFO",
+    log_path: str | None = None,
+    queue_size: int = 10000,
+    overflow: str = "drop",
+    sampling: dict[str, LogRule] | None = None,
+) -> None:
     """Configure central structured logging for the AdaptiveMind runtime.
 
-    Sets up JSON-formatted logging with both console and optional file handlers.
-    Uses environment variables ADAPTIVEMIND_LOG_LEVEL and ADAPTIVEMIND_LOG_PATH for configuration.
+    Sets up JSON-formatted logging with both console and optional file handlers
+    behind a bounded queue, so logging calls never wait on I/O (unless
+    ``overflow="block"``). Uses environment variables ADAPTIVEMIND_LOG_LEVEL,
+    ADAPTIVEMIND_LOG_PATH, ADAPTIVEMIND_LOG_QUEUE_SIZE, ADAPTIVEMIND_LOG_OVERFLOW
+    and ADAPTIVEMIND_LOG_SAMPLING for configuration.
     Implements singleton pattern to prevent multiple configurations.
 
     Args:
         log_level: Logging level (e.g., "INFO", "DEBUG", 20). Defaults to "INFO"
         log_path: Optional path to log file. If provided, enables file logging
+        queue_size: Capacity of the record queue
+        overflow: ``"drop"`` or ``"block"`` when the queue is full
+        sampling: Per-logger ``LogRule`` volume controls
 
     Note:
         This function is idempotent - calling it multiple times has no effect
         after the initial configuration.
     """
-    global _LOGGER_CONFIGURED
+    global _LOGGER_CONFIGURED, _LISTENER, _QUEUE_HANDLER, _SAMPLING
     if _LOGGER_CONFIGURED:
         return
 
@@ -61,45 +242,73 @@ def configure_logging(log_level: str | int = "INFO", log_path: str | None = None
         level = level.upper()
 
     # Configure handlers - always include console, optionally add file
-    handlers: dict[str, dict[str, Any]] = {
-        "console": {
-            "class": "logging.StreamHandler",
-            "formatter": "json",
-            "stream": "ext://sys.stdout",
-        }
-    }
+    formatter = JsonFormatter()
+    handlers: list[logging.Handler] = [logging.StreamHandler(sys.stdout)]
 
     # Add file handler if log path is specified
     if log_path:
         file_path = Path(log_path).expanduser().resolve()
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        handlers["file"] = {
-            "class": "logging.FileHandler",
-            "formatter": "json",
-            "filename": str(file_path),
-            "encoding": "utf-8",
-        }
-
-    # Configure logging system with JSON formatter
-    logging.config.dictConfig(
-        {
-            "version": 1,
-            "disable_existing_loggers": False,
-            "formatters": {
-                "json": {
-                    "()": "adaptivemind_core.logger.JsonFormatter",
-                }
-            },
-            "handlers": handlers,
-            "root": {
-                "level": level,
-                "handlers": list(handlers.keys()),
-            },
-        }
-    )
+        handlers.append(logging.FileHandler(file_path, encoding="utf-8"))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    _SAMPLING = LogSamplingFilter(sampling)
+    _QUEUE_HANDLER = BoundedQueueHandler(queue_size, overflow)
+    _QUEUE_HANDLER.addFilter(_SAMPLING)
+    _LISTENER = QueueListener(_QUEUE_HANDLER.queue, *handlers, respect_handler_level=True)
+    _LISTENER.start()
+    atexit.register(shutdown_logging)
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(_QUEUE_HANDLER)
+    root.setLevel(level)
     _LOGGER_CONFIGURED = True
 
 
+def shutdown_logging() -> None:
+    """Drain the record queue and stop the listener thread."""
+    global _LISTENER
+    if _LISTENER is not None:
+        listener, _LISTENER = _LISTENER, None
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+def set_log_sampling(logger_name: str, rule: LogRule | None) -> None:
+    """Add, replace or (with ``None``) remove the volume rule for a logger."""
+    if _SAMPLING is None:
+        get_logger()
+    assert _SAMPLING is not None
+    _SAMPLING.set_rule(logger_name, rule)
+
+
+def logging_stats() -> dict[str, int]:
+    """Counters of records that never reached a handler, plus the current queue depth."""
+    return {
+        "dropped": _QUEUE_HANDLER.dropped if _QUEUE_HANDLER else 0,
+        "sampled_out": _SAMPLING.sampled_out if _SAMPLING else 0,
+        "rate_limited": _SAMPLING.rate_limited if _SAMPLING else 0,
+        "queue_depth": _QUEUE_HANDLER.depth if _QUEUE_HANDLER else 0,
+    }
+
+
+def parse_sampling_rules(spec: str) -> dict[str, LogRule]:
+    """Parse ``name=rate[/max_per_second],...`` (e.g. ``adaptivemind_core.routing=0.1/50``)."""
+    rules: dict[str, LogRule] = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, value = item.partition("=")
+        rate, _, limit = value.partition("/")
+        rules[name.strip()] = LogRule(
+            sample_rate=float(rate) if rate else 1.0,
+            max_per_second=float(limit) if limit else None,
+        )
+    return rules
+
+
 class JsonFormatter(logging.Formatter):
     """JSON formatter for structured logging with trace-friendly fields.
 
@@ -130,18 +339,19 @@ class JsonFormatter(logging.Formatter):
             "time": self.formatTime(record, datefmt="%Y-%m-%dT%H:%M:%S"),
         }
 
-        # Include exception information if present
+        # Include exception information if present (pre-rendered when queued)
         if record.exc_info:
             data["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exc_info"] = record.exc_text
 
         # Extract and include extra fields that aren't part of standard LogRecord
         # This allows structured logging with custom context data
-        standard_attrs = set(logging.LogRecord("", 0, "", 0, "", (), None).__dict__.keys())
         for key, value in record.__dict__.items():
-            if key not in standard_attrs and key not in data:
+            if key not in _STANDARD_ATTRS and key not in data:
                 data[key] = value
 
-        return json.dumps(data, ensure_ascii=False)
+        return _dumps(data)
 
 
 def get_logger(name: str = "adaptivemind") -> logging.Logger:
@@ -160,10 +370,30 @@ def get_logger(name: str = "adaptivemind") -> logging.Logger:
     Environment Variables:
         ADAPTIVEMIND_LOG_LEVEL: Logging level (default: "INFO")
         ADAPTIVEMIND_LOG_PATH: Optional path to log file
+        ADAPTIVEMIND_LOG_QUEUE_SIZE: Record queue capacity (default: 10000)
+        ADAPTIVEMIND_LOG_OVERFLOW: "drop" (default) or "block" when the queue is full
+        ADAPTIVEMIND_LOG_SAMPLING: Per-logger rules, e.g. "adaptivemind_core.routing=0.1/50"
     """
     if not _LOGGER_CONFIGURED:
-        configure_logging(os.getenv("ADAPTIVEMIND_LOG_LEVEL", "INFO"), os.getenv("ADAPTIVEMIND_LOG_PATH"))
+        configure_logging(
+            os.getenv("ADAPTIVEMIND_LOG_LEVEL", "INFO"),
+            os.getenv("ADAPTIVEMIND_LOG_PATH"),
+            queue_size=int(os.getenv("ADAPTIVEMIND_LOG_QUEUE_SIZE", "10000")),
+            overflow=os.getenv("ADAPTIVEMIND_LOG_OVERFLOW", "drop"),
+            sampling=parse_sampling_rules(os.getenv("ADAPTIVEMIND_LOG_SAMPLING", "")),
+        )
     return logging.getLogger(name)
 
 
-__all__ = ["JsonFormatter", "configure_logging", "get_logger"]
+__all__ = [
+    "BoundedQueueHandler",
+    "JsonFormatter",
+    "LogRule",
+    "LogSamplingFilter",
+    "configure_logging",
+    "get_logger",
+    "logging_stats",
+    "parse_sampling_rules",
+    "set_log_sampling",
+    "shutdown_logging",
+]
@@ -0,0 +1,292 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+"""Append-only on-disk archive of traces and metric snapshots.
+
+Segment layout: an 8-byte header (``AMARCH`` magic plus a format version),
+then a stream of records, each starting with a one-byte type:
+
+* string definition: ``<B H H`` type, id, length, then UTF-8 bytes. Every
+  segment carries its own string table so it can be read in isolation.
+* trace: ``<B d f I I H H H`` type, timestamp, latency (ms), tokens,
+  context tokens, persona id, backend id, objective id (28 bytes in total).
+* snapshot: ``<B I`` type and length, then a JSON metric snapshot.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+
+from ..config import ArchiveConfig
+from ..logger import get_logger
+from .memory import register_buffer
+from .traces import TraceRecord
+
+logger = get_logger(__name__)
+
+MAGIC = b"AMARCH\x00\x01"
+SEGMENT_SUFFIX = ".seg"
+
+_STRING = 1
+_TRACE = 2
+_SNAPSHOT = 3
+
+_STRING_HEADER = struct.Struct("<BHH")
+_TRACE_RECORD = struct.Struct("<BdfIIHHH")
+_SNAPSHOT_HEADER = struct.Struct("<BI")
+_MAX_STRING_ID = 0xFFFF
+
+
+@dataclass
+class ArchivedTrace:
+    timestamp: float
+    latency_ms: float
+    token_usage: int
+    context_size: int
+    persona: str
+    backend: str
+    objective: str
+
+
+class _SegmentWriter:
+    """Open segment file plus its string table."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.handle = path.open("ab")
+        self.handle.write(MAGIC)
+        self.size = len(MAGIC)
+        self.strings: Dict[str, int] = {}
+
+    def string_id(self, value: str, buffer: bytearray) -> int:
+        index = self.strings.get(value)
+        if index is not None:
+            return index
+        if len(self.strings) >= _MAX_STRING_ID:
+            value = "<overflow>"
+            index = self.strings.get(value)
+            if index is not None:
+                return index
+        index = self.strings[value] = len(self.strings)
+        encoded = value.encode("utf-8")[:0xFFFF]
+        buffer += _STRING_HEADER.pack(_STRING, index, len(encoded))
+        buffer += encoded
+        return index
+
+    def close(self) -> None:
+        self.handle.flush()
+        os.fsync(self.handle.fileno())
+        self.handle.close()
+
+
+class TraceArchive:
+    """Buffers traces and snapshots in memory and appends them to rotating segments.
+
+    ``append_*`` only enqueue (and drop when the buffer is full), so the
+    request path never touches the disk; a background thread encodes and
+    writes batches every ``flush_interval_s``.
+    """
+
+    def __init__(self, config: ArchiveConfig):
+        if config.directory is None:
+            raise ValueError("ArchiveConfig.directory must be set to archive traces")
+        self._config = config
+        self._directory = config.directory
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._pending: Deque[Union[TraceRecord, Dict[str, Any]]] = deque()
+        register_buffer("archive.pending", self, lambda archive: archive._pending)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._write_lock = threading.Lock()
+        self._segment: Optional[_SegmentWriter] = None
+        self._sequence = 0
+        self._stats = {"traces": 0, "snapshots": 0, "dropped": 0, "segments_rotated": 0, "bytes_written": 0}
+        self._thread = threading.Thread(target=self._run, name="trace-archive", daemon=True)
+        self._thread.start()
+
+    def append_trace(self, record: TraceRecord) -> None:
+        self._enqueue(record)
+
+    def append_snapshot(self, snapshot: Any) -> None:
+        self._enqueue(asdict(snapshot) if hasattr(snapshot, "__dataclass_fields__") else dict(snapshot))
+
+    def flush(self) -> None:
+        """Write everything buffered so far; safe to call from any thread."""
+        with self._write_lock:
+            self._drain()
+            if self._segment is not None:
+                self._segment.handle.flush()
+
+    def close(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout=5)
+        with self._write_lock:
+            self._drain()
+            if self._segment is not None:
+                self._segment.close()
+                self._segment = None
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, "pending": len(self._pending)}
+
+    # Internal helpers -------------------------------------------------
+
+    def _enqueue(self, item: Union[TraceRecord, Dict[str, Any]]) -> None:
+        with self._lock:
+            if len(self._pending) >= self._config.max_pending:
+                self._stats["dropped"] += 1
+                return
+            self._pending.append(item)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self._config.flush_interval_s)
+            self._wake.clear()
+            try:
+                self.flush()
+            except OSError as exc:
+                logger.warning("Trace archive write failed", extra={"error": str(exc)})
+
+    def _drain(self) -> None:
+        with self._lock:
+            batch = list(self._pending)
+            self._pending.clear()
+        if not batch:
+            return
+        segment = self._current_segment()
+        buffer = bytearray()
+        traces = snapshots = 0
+        for item in batch:
+            if isinstance(item, TraceRecord):
+                buffer += _TRACE_RECORD.pack(
+                    _TRACE,
+                    item.timestamp,
+                    item.latency_ms,
+                    max(0, min(item.token_usage, 0xFFFFFFFF)),
+                    max(0, min(item.context_size, 0xFFFFFFFF)),
+                    segment.string_id(item.persona, buffer),
+                    segment.string_id(item.backend or "", buffer),
+                    segment.string_id(item.objective or "", buffer),
+                )
+                traces += 1
+            else:
+                encoded = json.dumps(item, separators=(",", ":"), default=str).encode()
+                buffer += _SNAPSHOT_HEADER.pack(_SNAPSHOT, len(encoded))
+                buffer += encoded
+                snapshots += 1
+        segment.handle.write(buffer)
+        segment.size += len(buffer)
+        with self._lock:
+            self._stats["traces"] += traces
+            self._stats["snapshots"] += snapshots
+            self._stats["bytes_written"] += len(buffer)
+        if segment.size >= self._config.segment_bytes:
+            self._rotate()
+
+    def _current_segment(self) -> _SegmentWriter:
+        if self._segment is None:
+            self._sequence += 1
+            name = f"{int(time.time() * 1000):013d}-{os.getpid()}-{self._sequence:04d}{SEGMENT_SUFFIX}"
+            self._segment = _SegmentWriter(self._directory / name)
+        return self._segment
+
+    def _rotate(self) -> None:
+        if self._segment is not None:
+            self._segment.close()
+            self._segment = None
+        with self._lock:
+            self._stats["segments_rotated"] += 1
+        segments = list_segments(self._directory)
+        for stale in segments[: max(0, len(segments) - self._config.max_segments)]:
+            try:
+                stale.unlink()
+            except OSError:
+                logger.warning("Failed to delete archive segment", extra={"path": str(stale)})
+
+
+def list_segments(directory: Path) -> List[Path]:
+    """Segment files in chronological order (names start with a millisecond timestamp)."""
+    return sorted(Path(directory).glob(f"*{SEGMENT_SUFFIX}"))
+
+
+def read_segment(path: Path) -> Iterator[Tuple[str, Union[ArchivedTrace, Dict[str, Any]]]]:
+    """Stream ``("trace", ArchivedTrace)`` and ``("snapshot", dict)`` items from one segment.
+
+    A truncated tail (e.g. from a crash mid-write) ends the stream quietly.
+    """
+    strings: List[str] = []
+    with Path(path).open("rb") as handle:
+        if handle.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not an archive segment")
+        while True:
+            kind = handle.read(1)
+            if not kind:
+                return
+            if kind[0] == _STRING:
+                header = kind + handle.read(_STRING_HEADER.size - 1)
+                if len(header) < _STRING_HEADER.size:
+                    return
+                _, index, length = _STRING_HEADER.unpack(header)
+                raw = handle.read(length)
+                if len(raw) < length:
+                    return
+                strings.append(raw.decode("utf-8", errors="replace"))
+            elif kind[0] == _TRACE:
+                raw = kind + handle.read(_TRACE_RECORD.size - 1)
+                if len(raw) < _TRACE_RECORD.size:
+                    return
+                _, timestamp, latency, tokens, context, persona, backend, objective = _TRACE_RECORD.unpack(raw)
+                yield "trace", ArchivedTrace(
+                    timestamp=timestamp,
+                    latency_ms=latency,
+                    token_usage=tokens,
+                    context_size=context,
+                    persona=strings[persona],
+                    backend=strings[backend],
+                    objective=strings[objective],
+                )
+            elif kind[0] == _SNAPSHOT:
+                header = kind + handle.read(_SNAPSHOT_HEADER.size - 1)
+                if len(header) < _SNAPSHOT_HEADER.size:
+                    return
+                _, length = _SNAPSHOT_HEADER.unpack(header)
+                raw = handle.read(length)
+                if len(raw) < length:
+                    return
+                yield "snapshot", json.loads(raw)
+            else:
+                raise ValueError(f"{path}: unknown record type {kind[0]}")
+
+
+def iter_traces(directory: Path, since: Optional[float] = None, until: Optional[float] = None) -> Iterator[ArchivedTrace]:
+    for segment in list_segments(directory):
+        for kind, item in read_segment(segment):
+            if kind != "trace":
+                continue
+            if since is not None and item.timestamp < since:  # type: ignore[union-attr]
+                continue
+            if until is not None and item.timestamp > until:  # type: ignore[union-attr]
+                continue
+            yield item  # type: ignore[misc]
+
+
+__all__ = ["ArchivedTrace", "TraceArchive", "iter_traces", "list_segments", "read_segment"]
@@ -0,0 +1,195 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+"""Offline analytics over a trace archive directory.
+
+Usage::
+
+    python -m adaptivemind_core.monitoring.cli summary /var/lib/adaptivemind/archive --bucket 3600
+    python -m adaptivemind_core.monitoring.cli segments /var/lib/adaptivemind/archive
+
+Segments are streamed record by record, so memory stays bounded by the
+number of (persona, bucket) groups rather than the archive size. Each group
+keeps only its non-empty latency buckets; a full histogram is built for one
+group at a time when the summary rows are produced.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .archive import iter_traces, list_segments, read_segment
+from .histogram import LatencyHistogram, bucket_index
+
+
+@dataclass
+class _Group:
+    # Sparse latency buckets: a dense LatencyHistogram per group would take ~24 KB
+    latency_buckets: Counter = field(default_factory=Counter)
+    requests: int = 0
+    latency_total: float = 0.0
+    latency_min: float = math.inf
+    latency_max: float = 0.0
+    tokens: int = 0
+    context_tokens: int = 0
+    backends: Counter = field(default_factory=Counter)
+
+    def record(self, latency_ms: float) -> None:
+        self.latency_buckets[bucket_index(latency_ms)] += 1
+        self.requests += 1
+        self.latency_total += latency_ms
+        self.latency_min = min(self.latency_min, latency_ms)
+        self.latency_max = max(self.latency_max, latency_ms)
+
+    def histogram(self) -> LatencyHistogram:
+        return LatencyHistogram.from_dict(
+            {
+                "count": self.requests,
+                "total": self.latency_total,
+                "min": self.latency_min,
+                "max": self.latency_max,
+                "buckets": self.latency_buckets,
+            }
+        )
+
+
+def summarize(
+    directory: Path,
+    bucket_s: float = 3600.0,
+    persona: Optional[str] = None,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+) -> List[Dict[str, object]]:
+    """Per persona and time bucket: latency percentiles, token throughput and backend mix."""
+    groups: Dict[Tuple[float, str], _Group] = {}
+    for trace in iter_traces(directory, since=since, until=until):
+        if persona is not None and trace.persona != persona:
+            continue
+        start = trace.timestamp - trace.timestamp % bucket_s
+        group = groups.get((start, trace.persona))
+        if group is None:
+            group = groups[(start, trace.persona)] = _Group()
+        group.record(trace.latency_ms)
+        group.tokens += trace.token_usage
+        group.context_tokens += trace.context_size
+        group.backends[trace.backend or "unknown"] += 1
+
+    rows: List[Dict[str, object]] = []
+    for (start, name), group in sorted(groups.items()):
+        histogram, count = group.histogram(), group.requests
+        rows.append(
+            {
+                "bucket_start": start,
+                "persona": name,
+                "requests": count,
+                "latency_ms": {key: round(value, 3) for key, value in histogram.percentiles().items()},
+                "mean_latency_ms": round(histogram.mean, 3),
+                "tokens": group.tokens,
+                "context_tokens": group.context_tokens,
+                "tokens_per_s": round(group.tokens / bucket_s, 3),
+                "backend_mix": {backend: round(hits / count, 4) for backend, hits in group.backends.most_common()},
+            }
+        )
+    return rows
+
+
+def describe_segments(directory: Path) -> List[Dict[str, object]]:
+    described = []
+    for path in list_segments(directory):
+        traces = snapshots = 0
+        first = last = None
+        for kind, item in read_segment(path):
+            if kind == "trace":
+                traces += 1
+                first = item.timestamp if first is None else first  # type: ignore[union-attr]
+                last = item.timestamp  # type: ignore[union-attr]
+            else:
+                snapshots += 1
+        described.append(
+            {"segment": path.name, "bytes": path.stat().st_size, "traces": traces, "snapshots": snapshots, "first": first, "last": last}
+        )
+    return described
+
+
+def _format_time(value: Optional[float]) -> str:
+    return "-" if value is None else time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(value))
+
+
+def _print_summary(rows: List[Dict[str, object]]) -> None:
+    print(f"{'bucket (UTC)':<20} {'persona':<16} {'reqs':>6} {'p50':>9} {'p90':>9} {'p99':>9} {'tok/s':>8}  backends")
+    for row in rows:
+        latency: Dict[str, float] = row["latency_ms"]  # type: ignore[assignment]
+        mix = ", ".join(f"{name} {share:.0%}" for name, share in row["backend_mix"].items())  # type: ignore[union-attr]
+        print(
+            f"{_format_time(row['bucket_start']):<20} {str(row['persona'])[:16]:<16} {row['requests']:>6} "  # type: ignore[arg-type]
+            f"{latency['p50']:>9.1f} {latency['p90']:>9.1f} {latency['p99']:>9.1f} {row['tokens_per_s']:>8.2f}  {mix}"
+        )
+
+
+def _print_segments(rows: List[Dict[str, object]]) -> None:
+    for row in rows:
+        print(
+            f"{row['segment']}  {row['bytes']:>10} bytes  {row['traces']:>8} traces  {row['snapshots']:>5} snapshots  "
+            f"{_format_time(row['first'])} .. {_format_time(row['last'])}"  # type: ignore[arg-type]
+        )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Analyse an AdaptiveMind trace archive", prog="adaptivemind-archive")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    summary = subparsers.add_parser("summary", help="Latency percentiles, throughput and backend mix per persona and bucket")
+    summary.add_argument("directory", type=Path)
+    summary.add_argument("--bucket", type=float, default=3600.0, help="Bucket width in seconds (default: 3600)")
+    summary.add_argument("--persona", help="Only include this persona")
+    summary.add_argument("--since", type=float, help="Unix timestamp lower bound")
+    summary.add_argument("--until", type=float, help="Unix timestamp upper bound")
+    summary.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+
+    segments = subparsers.add_parser("segments", help="List archive segments")
+    segments.add_argument("directory", type=Path)
+    segments.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if not args.directory.is_dir():
+        print(f"Archive directory not found: {args.directory}", file=sys.stderr)
+        return 1
+    if args.command == "summary":
+        if args.bucket <= 0:
+            print("--bucket must be positive", file=sys.stderr)
+            return 1
+        rows = summarize(args.directory, args.bucket, args.persona, args.since, args.until)
+        printer = _print_summary
+    else:
+        rows = describe_segments(args.directory)
+        printer = _print_segments
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        printer(rows)
+    return 0
+
+
+__all__ = ["build_parser", "describe_segments", "main", "summarize"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
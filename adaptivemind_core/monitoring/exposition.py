@@ -0,0 +1,159 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .histogram import LatencyHistogram
+from .metrics import MetricsRegistry
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PREFIX = "adaptivemind"
+
+# Exposed bucket bounds in seconds; the internal log-linear buckets are folded into these
+LATENCY_BUCKETS_S: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0,
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Mapping[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+class OpenMetricsWriter:
+    """Accumulates metric families and renders them in OpenMetrics text format."""
+
+    def __init__(self) -> None:
+        self._lines: List[str] = []
+
+    def family(self, name: str, kind: str, help_text: str, unit: Optional[str] = None) -> None:
+        self._lines.append(f"# TYPE {PREFIX}_{name} {kind}")
+        if unit:
+            self._lines.append(f"# UNIT {PREFIX}_{name} {unit}")
+        self._lines.append(f"# HELP {PREFIX}_{name} {help_text}")
+
+    def sample(self, name: str, value: float, labels: Optional[Mapping[str, str]] = None) -> None:
+        self._lines.append(f"{PREFIX}_{name}{_labels(labels or {})} {_number(value)}")
+
+    def histogram(self, name: str, histogram: LatencyHistogram, labels: Mapping[str, str]) -> None:
+        bounds = LATENCY_BUCKETS_S
+        counts = [0] * len(bounds)
+        overflow = 0
+        position = 0
+        for upper_ms, count in histogram.buckets():
+            upper_s = upper_ms / 1000.0
+            while position < len(bounds) and bounds[position] < upper_s:
+                position += 1
+            if position == len(bounds):
+                overflow += count
+            else:
+                counts[position] += count
+        cumulative = 0
+        for bound, count in zip(bounds, counts):
+            cumulative += count
+            self.sample(f"{name}_bucket", cumulative, {**labels, "le": repr(bound)})
+        self.sample(f"{name}_bucket", cumulative + overflow, {**labels, "le": "+Inf"})
+        self.sample(f"{name}_count", histogram.count, labels)
+        self.sample(f"{name}_sum", histogram.total / 1000.0, labels)
+
+    def render(self) -> str:
+        return "\n".join([*self._lines, "# EOF"]) + "\n"
+
+
+def render_openmetrics(
+    registry: MetricsRegistry,
+    extra_gauges: Iterable[Tuple[str, str, Dict[str, str], float]] = (),
+    state: Optional[Dict[str, object]] = None,
+    extra_counters: Iterable[Tuple[str, str, Dict[str, str], float]] = (),
+) -> str:
+    """Render the registry's pre-aggregated state, plus caller-supplied gauges and counters.
+
+    ``extra_gauges`` holds ``(name, help, labels, value)`` tuples for state
+    owned by other components (cache hit ratios, queue depths);
+    ``extra_counters`` the same for their monotonic counts, exposed with a
+    ``_total`` suffix. ``state`` replaces the registry's own, e.g. with
+    ``combine_states`` over all workers.
+
+    Latency is one histogram family per breakdown: ``latency_seconds`` by
+    phase, ``persona_latency_seconds`` and ``backend_latency_seconds`` by
+    phase and persona or backend. Each observation appears once per family,
+    so sums and rates over a family do not count it twice.
+    """
+    if state is None:
+        state = registry.exposition_state()
+    writer = OpenMetricsWriter()
+
+    totals: Dict[Tuple[str, str], List[int]] = state["totals"]  # type: ignore[assignment]
+    for index, (name, help_text) in enumerate(
+        (
+            ("requests", "Completed generation requests."),
+            ("generated_tokens", "Tokens generated by backends."),
+            ("context_tokens", "Context tokens sent to backends."),
+        )
+    ):
+        writer.family(name, "counter", help_text)
+        for (persona, backend), values in sorted(totals.items()):
+            writer.sample(f"{name}_total", values[index], {"persona": persona, "backend": backend})
+    counters: Dict[str, List[Tuple[Dict[str, str], float]]] = {}
+    counter_help: Dict[str, str] = {}
+    for name, help_text, labels, value in extra_counters:
+        counters.setdefault(name, []).append((labels, value))
+        counter_help[name] = help_text
+    for name in sorted(counters):
+        writer.family(name, "counter", counter_help[name])
+        for labels, value in sorted(counters[name], key=lambda item: sorted(item[0].items())):
+            writer.sample(f"{name}_total", value, labels)
+
+    writer.family("requests_in_flight", "gauge", "Generation requests currently being served.")
+    writer.sample("requests_in_flight", state["in_flight"])  # type: ignore[arg-type]
+
+    gauges: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = state["gauges"]  # type: ignore[assignment]
+    by_name: Dict[str, List[Tuple[Dict[str, str], float]]] = {}
+    help_texts: Dict[str, str] = {}
+    for (name, labels), value in gauges.items():
+        by_name.setdefault(name, []).append((dict(labels), value))
+    for name, help_text, labels, value in extra_gauges:
+        by_name.setdefault(name, []).append((labels, value))
+        help_texts[name] = help_text
+    for name in sorted(by_name):
+        writer.family(name, "gauge", help_texts.get(name, name.replace("_", " ").capitalize() + "."))
+        for labels, value in sorted(by_name[name], key=lambda item: sorted(item[0].items())):
+            writer.sample(name, value, labels)
+
+    histograms: Dict[Tuple[str, str, str], LatencyHistogram] = state["histograms"]  # type: ignore[assignment]
+    for dimension, name, help_text in (
+        ("all", "latency_seconds", "Latency by phase."),
+        ("persona", "persona_latency_seconds", "Latency by phase and persona."),
+        ("backend", "backend_latency_seconds", "Latency by phase and backend."),
+    ):
+        series = sorted((key, histogram) for key, histogram in histograms.items() if key[1] == dimension)
+        if not series:
+            continue
+        writer.family(name, "histogram", help_text, unit="seconds")
+        for (phase, _, label), histogram in series:
+            labels = {"phase": phase} if dimension == "all" else {"phase": phase, dimension: label}
+            writer.histogram(name, histogram, labels)
+    return writer.render()
+
+
+__all__ = ["CONTENT_TYPE", "LATENCY_BUCKETS_S", "OpenMetricsWriter", "render_openmetrics"]
@@ -0,0 +1,164 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+from __future__ import annotations
+
+import math
+from array import array
+from typing import Dict, Iterator, Optional, Tuple
+
+# Log-linear layout: every power-of-two range is split into SUB_BUCKETS linear
+# buckets, which bounds the relative error of any reported value to 1/SUB_BUCKETS.
+SUB_BUCKETS = 64
+MIN_EXPONENT = -10  # 2**-11 ms, about half a microsecond
+MAX_EXPONENT = 32  # 2**32 ms, about seven weeks
+BUCKET_COUNT = (MAX_EXPONENT - MIN_EXPONENT + 1) * SUB_BUCKETS
+
+STANDARD_QUANTILES: Dict[str, float] = {"p50": 0.50, "p90": 0.90, "p99": 0.99, "p999": 0.999}
+
+
+def bucket_index(value: float) -> int:
+    """Bucket holding ``value``; out-of-range values clamp to the first or last bucket."""
+    if value <= 0.0:
+        return 0
+    mantissa, exponent = math.frexp(value)
+    if exponent < MIN_EXPONENT:
+        return 0
+    if exponent > MAX_EXPONENT:
+        return BUCKET_COUNT - 1
+    sub = int((mantissa - 0.5) * 2 * SUB_BUCKETS)
+    return (exponent - MIN_EXPONENT) * SUB_BUCKETS + min(sub, SUB_BUCKETS - 1)
+
+
+def bucket_upper_bound(index: int) -> float:
+    exponent, sub = divmod(index, SUB_BUCKETS)
+    return math.ldexp(0.5 + (sub + 1) / (2 * SUB_BUCKETS), exponent + MIN_EXPONENT)
+
+
+class LatencyHistogram:
+    """Fixed-memory log-linear latency histogram (milliseconds).
+
+    ``record`` is O(1) and allocation free. Histograms with the same layout
+    can be merged or subtracted, and ``to_dict``/``from_dict`` give a sparse
+    representation for shipping them between processes.
+    """
+
+    __slots__ = ("_counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self._counts = array("Q", bytes(8 * BUCKET_COUNT))
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, value: float, count: int = 1) -> None:
+        self._counts[bucket_index(value)] += count
+        self.count += count
+        self.total += value * count
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, quantile: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(quantile * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(bucket_upper_bound(index), self.max)
+        return self.max
+
+    def percentiles(self, quantiles: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+        """Several quantiles in a single pass over the buckets."""
+        quantiles = quantiles or STANDARD_QUANTILES
+        if not self.count:
+            return {name: 0.0 for name in quantiles}
+        pending = sorted(quantiles.items(), key=lambda item: item[1])
+        result: Dict[str, float] = {}
+        seen = 0
+        position = 0
+        for index, bucket_count in enumerate(self._counts):
+            if not bucket_count:
+                continue
+            seen += bucket_count
+            while position < len(pending) and seen >= max(1, math.ceil(pending[position][1] * self.count)):
+                result[pending[position][0]] = min(bucket_upper_bound(index), self.max)
+                position += 1
+            if position == len(pending):
+                break
+        for name, _ in pending[position:]:
+            result[name] = self.max
+        return result
+
+    def buckets(self) -> Iterator[Tuple[float, int]]:
+        """Non-empty ``(upper_bound_ms, count)`` pairs in ascending order."""
+        for index, bucket_count in enumerate(self._counts):
+            if bucket_count:
+                yield bucket_upper_bound(index), bucket_count
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        counts = self._counts
+        for index, bucket_count in enumerate(other._counts):
+            if bucket_count:
+                counts[index] += bucket_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def subtract(self, other: "LatencyHistogram") -> None:
+        """Remove an earlier snapshot's observations (e.g. to turn cumulative counts into a delta).
+
+        Min and max cannot be recovered exactly and are left as bounds.
+        """
+        counts = self._counts
+        for index, bucket_count in enumerate(other._counts):
+            if bucket_count:
+                counts[index] = max(0, counts[index] - bucket_count)
+        self.count = max(0, self.count - other.count)
+        self.total = max(0.0, self.total - other.total)
+
+    def copy(self) -> "LatencyHistogram":
+        # Slicing copies the bucket array in C; scrapes copy under the registry's request-path lock
+        clone = LatencyHistogram.__new__(LatencyHistogram)
+        clone._counts = self._counts[:]
+        clone.count, clone.total, clone.min, clone.max = self.count, self.total, self.min, self.max
+        return clone
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "buckets": {str(index): value for index, value in enumerate(self._counts) if value},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "LatencyHistogram":
+        histogram = cls()
+        for index, value in dict(data.get("buckets", {})).items():  # type: ignore[arg-type]
+            histogram._counts[int(index)] = int(value)
+        histogram.count = int(data.get("count", 0))  # type: ignore[arg-type]
+        histogram.total = float(data.get("total", 0.0))  # type: ignore[arg-type]
+        histogram.min = float(data.get("min", 0.0)) if histogram.count else math.inf  # type: ignore[arg-type]
+        histogram.max = float(data.get("max", 0.0))  # type: ignore[arg-type]
+        return histogram
+
+
+__all__ = ["LatencyHistogram", "STANDARD_QUANTILES", "bucket_index", "bucket_upper_bound"]
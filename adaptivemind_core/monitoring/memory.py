@@ -0,0 +1,266 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+"""Memory diagnostics: tracemalloc snapshots and a registry of in-process buffers.
+
+Components that hold growing state register it with ``register_buffer`` when
+they are created. The registry keeps only weak references to the owners, so
+registering never extends an object's lifetime. ``BufferRegistry.sizes``
+then reports item counts and shallow container sizes for every live owner.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import tracemalloc
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..config import MemoryConfig
+
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class BufferRegistry:
+    """Named, weakly referenced containers whose sizes can be reported on demand."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: List[Tuple[str, weakref.ref, Callable[[Any], Any]]] = []
+
+    def register(self, name: str, owner: Any, sizer: Callable[[Any], Any]) -> None:
+        """Track ``sizer(owner)`` under ``name`` while ``owner`` is alive.
+
+        ``sizer`` returns either the container itself (reported by ``len`` and
+        ``sys.getsizeof``) or an item count.
+        """
+        with self._lock:
+            self._entries = [entry for entry in self._entries if entry[1]() is not None]
+            self._entries.append((name, weakref.ref(owner), sizer))
+
+    def sizes(self) -> Dict[str, Dict[str, int]]:
+        """Per buffer name: live instances, total items and shallow bytes, largest first."""
+        with self._lock:
+            entries = list(self._entries)
+        report: Dict[str, Dict[str, int]] = {}
+        for name, ref, sizer in entries:
+            owner = ref()
+            if owner is None:
+                continue
+            try:
+                measured = sizer(owner)
+                if isinstance(measured, int):
+                    items, shallow = measured, 0
+                else:
+                    items, shallow = len(measured), sys.getsizeof(measured)
+            except Exception:  # a buffer that cannot be measured must not break the report
+                continue
+            row = report.setdefault(name, {"instances": 0, "items": 0, "shallow_bytes": 0})
+            row["instances"] += 1
+            row["items"] += items
+            row["shallow_bytes"] += shallow
+        return dict(sorted(report.items(), key=lambda item: (-item[1]["items"], item[0])))
+
+
+_buffers = BufferRegistry()
+
+
+def get_buffer_registry() -> BufferRegistry:
+    return _buffers
+
+
+def register_buffer(name: str, owner: Any, sizer: Callable[[Any], Any]) -> None:
+    _buffers.register(name, owner, sizer)
+
+
+def _format_stat(stat: Any) -> Dict[str, Any]:
+    frame = stat.traceback[0]
+    row = {
+        "site": f"{frame.filename}:{frame.lineno}",
+        "size_bytes": stat.size,
+        "count": stat.count,
+    }
+    if hasattr(stat, "size_diff"):
+        row["size_diff_bytes"] = stat.size_diff
+        row["count_diff"] = stat.count_diff
+    if len(stat.traceback) > 1:
+        row["traceback"] = [f"{entry.filename}:{entry.lineno}" for entry in stat.traceback]
+    return row
+
+
+class MemoryDiagnostics:
+    """On-demand tracemalloc snapshots, top allocation sites and snapshot diffs.
+
+    Snapshots are held in memory, oldest evicted first, and addressed by
+    sequential id. Request accounting reports the change in the process's
+    traced memory between the start and end of a request. That is not the
+    request's own allocation: other threads allocate and free meanwhile, and
+    it can be negative. The trace says whether another accounted request
+    overlapped, which makes the figure meaningless for that request.
+    """
+
+    def __init__(self, config: Optional[MemoryConfig] = None):
+        self.config = config or MemoryConfig()
+        self._lock = threading.Lock()
+        self._snapshots: "OrderedDict[int, Tuple[str, float, int, tracemalloc.Snapshot]]" = OrderedDict()
+        self._next_id = 1
+        self._started_here = False
+        self._requests_active = 0
+        self._requests_started = 0
+        if self.config.tracemalloc_on_start:
+            self.start()
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: Optional[int] = None) -> Dict[str, Any]:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames or self.config.traceback_frames)
+            self._started_here = True
+        return self.status()
+
+    def stop(self) -> Dict[str, Any]:
+        """Stop tracing and forget snapshots; tracemalloc drops their traces anyway."""
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started_here = False
+        with self._lock:
+            self._snapshots.clear()
+        return self.status()
+
+    def shutdown(self) -> None:
+        if self._started_here:
+            self.stop()
+
+    def status(self) -> Dict[str, Any]:
+        status: Dict[str, Any] = {"tracing": tracemalloc.is_tracing(), "snapshots": self.list_snapshots()}
+        if status["tracing"]:
+            current, peak = tracemalloc.get_traced_memory()
+            status.update(
+                traced_bytes=current,
+                peak_bytes=peak,
+                frames=tracemalloc.get_traceback_limit(),
+                overhead_bytes=tracemalloc.get_tracemalloc_memory(),
+            )
+        return status
+
+    def take_snapshot(self, label: str = "") -> Dict[str, Any]:
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("tracemalloc is not tracing; start it first")
+        snapshot = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+        taken_at = time.time()
+        traced = sum(trace.size for trace in snapshot.traces)
+        with self._lock:
+            snapshot_id = self._next_id
+            self._next_id += 1
+            self._snapshots[snapshot_id] = (label, taken_at, traced, snapshot)
+            while len(self._snapshots) > self.config.max_snapshots:
+                self._snapshots.popitem(last=False)
+        return {"id": snapshot_id, "label": label, "taken_at": taken_at, "traced_bytes": traced}
+
+    def list_snapshots(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            items = list(self._snapshots.items())
+        return [
+            {"id": snapshot_id, "label": label, "taken_at": taken_at, "traced_bytes": traced}
+            for snapshot_id, (label, taken_at, traced, _) in items
+        ]
+
+    def top(self, snapshot_id: Optional[int] = None, key_type: str = "lineno", limit: int = 20) -> List[Dict[str, Any]]:
+        """Largest allocation sites of a stored snapshot, or of a fresh one when no id is given."""
+        snapshot = self._get(snapshot_id) if snapshot_id is not None else self._fresh()
+        return [_format_stat(stat) for stat in snapshot.statistics(key_type)[:limit]]
+
+    def diff(
+        self,
+        base_id: int,
+        target_id: Optional[int] = None,
+        key_type: str = "lineno",
+        limit: int = 20,
+    ) -> List[Dict[str, Any]]:
+        """Allocation sites that grew the most between two snapshots (target defaults to now)."""
+        base = self._get(base_id)
+        target = self._get(target_id) if target_id is not None else self._fresh()
+        return [_format_stat(stat) for stat in target.compare_to(base, key_type)[:limit]]
+
+    def begin_request(self) -> Optional[Tuple[int, int, bool]]:
+        """Token for ``end_request``, or ``None`` when accounting is off."""
+        if not self.config.request_accounting or not tracemalloc.is_tracing():
+            return None
+        with self._lock:
+            self._requests_active += 1
+            self._requests_started += 1
+            sequence, alone = self._requests_started, self._requests_active == 1
+        return tracemalloc.get_traced_memory()[0], sequence, alone
+
+    def end_request(self, started: Optional[Tuple[int, int, bool]]) -> Dict[str, str]:
+        """Trace extras with the change in process-wide traced memory over the request."""
+        if started is None:
+            return {}
+        traced, sequence, alone = started
+        with self._lock:
+            self._requests_active -= 1
+            overlapped = not alone or self._requests_started != sequence
+        if not tracemalloc.is_tracing():
+            return {}
+        return {
+            "mem.process_traced_delta_bytes": str(tracemalloc.get_traced_memory()[0] - traced),
+            "mem.overlapped": "true" if overlapped else "false",
+        }
+
+    # Internal helpers -------------------------------------------------
+
+    def _get(self, snapshot_id: int) -> tracemalloc.Snapshot:
+        with self._lock:
+            entry = self._snapshots.get(snapshot_id)
+        if entry is None:
+            raise ValueError(f"Unknown snapshot {snapshot_id}")
+        return entry[3]
+
+    def _fresh(self) -> tracemalloc.Snapshot:
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("tracemalloc is not tracing; start it first")
+        return tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+
+
+_diagnostics: Optional[MemoryDiagnostics] = None
+
+
+def get_memory_diagnostics() -> MemoryDiagnostics:
+    """Process-wide diagnostics; replaced by the application at startup."""
+    global _diagnostics
+    if _diagnostics is None:
+        _diagnostics = MemoryDiagnostics()
+    return _diagnostics
+
+
+def configure_memory_diagnostics(config: MemoryConfig) -> MemoryDiagnostics:
+    global _diagnostics
+    _diagnostics = MemoryDiagnostics(config)
+    return _diagnostics
+
+
+__all__ = [
+    "BufferRegistry",
+    "MemoryDiagnostics",
+    "configure_memory_diagnostics",
+    "get_buffer_registry",
+    "get_memory_diagnostics",
+    "register_buffer",
+]
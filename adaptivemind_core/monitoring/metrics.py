@@ -10,12 +10,25 @@
 
 from __future__ import annotations
 
-import statistics
 import threading
 import time
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
-from typing import Deque, Dict, Iterable, List, Optional
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+from .histogram import LatencyHistogram
+from .memory import register_buffer
+from .traces import TraceCollector, TraceRecord
+
+PHASES = ("queue", "context_build", "ttft", "inter_token", "total")
+
+# (phase, dimension, label); dimension is "all", "persona" or "backend"
+HistogramKey = Tuple[str, str, str]
+
+
+def _histogram_label(key: HistogramKey) -> str:
+    phase, dimension, label = key
+    return phase if dimension == "all" else f"{phase}|{dimension}={label}"
 
 
 @dataclass
@@ -27,94 +40,247 @@ class MetricSnapshot:
     context_tokens: int
     personas_used: Dict[str, int]
     timestamp: float = field(default_factory=time.time)
+    latency_percentiles: Dict[str, Dict[str, float]] = field(default_factory=dict)
 
 
 class MetricsRegistry:
-    """In-memory metrics registry with rolling history for harvesting."""
+    """In-memory metrics registry with rolling history for harvesting.
+
+    Latencies go into fixed-memory histograms per phase, overall and per
+    persona and backend. ``harvest`` swaps the interval's histograms out under
+    the lock and computes percentiles after releasing it; the swapped-out
+    histograms are also folded into lifetime totals that can be exported and
+    merged across worker processes.
+    """
 
     def __init__(self, history_size: int = 120):
         self._lock = threading.RLock()
-        self._latencies: List[float] = []
         self._tokens_generated: int = 0
         self._context_tokens: int = 0
         self._personas_used: Dict[str, int] = defaultdict(int)
         self._request_count: int = 0
         self._history: Deque[MetricSnapshot] = deque(maxlen=history_size)
+        self._window: Dict[HistogramKey, LatencyHistogram] = {}
+        self._cumulative_lock = threading.Lock()
+        self._cumulative: Dict[HistogramKey, LatencyHistogram] = {}
+        # Lifetime counters per (persona, backend) and point-in-time gauges; never reset by harvest
+        self._totals: Dict[Tuple[str, str], List[int]] = {}
+        self._gauges: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+        self._in_flight: int = 0
+        register_buffer("metrics.histograms", self, lambda registry: len(registry._window) + len(registry._cumulative))
+        register_buffer("metrics.history", self, lambda registry: registry._history)
 
-    def record_request(self, persona: str, latency_ms: float, generated_tokens: int, context_tokens: int) -> None:
+    def record_request(
+        self,
+        persona: str,
+        latency_ms: float,
+        generated_tokens: int,
+        context_tokens: int,
+        backend: Optional[str] = None,
+        phases: Optional[Dict[str, float]] = None,
+    ) -> None:
         with self._lock:
             self._request_count += 1
-            self._latencies.append(latency_ms)
             self._tokens_generated += generated_tokens
             self._context_tokens += context_tokens
             self._personas_used[persona] += 1
+            totals = self._totals.get((persona, backend or ""))
+            if totals is None:
+                totals = self._totals[(persona, backend or "")] = [0, 0, 0]
+            totals[0] += 1
+            totals[1] += generated_tokens
+            totals[2] += context_tokens
+            self._observe("total", latency_ms, persona, backend)
+            for phase, value in (phases or {}).items():
+                self._observe(phase, value, persona, backend)
+
+    def record_phase(self, phase: str, latency_ms: float, persona: Optional[str] = None, backend: Optional[str] = None) -> None:
+        """Record a latency for a phase that is not tied to a completed request (e.g. queue wait)."""
+        with self._lock:
+            self._observe(phase, latency_ms, persona, backend)
+
+    def merge_phase(
+        self, phase: str, histogram: LatencyHistogram, persona: Optional[str] = None, backend: Optional[str] = None
+    ) -> None:
+        """Fold a locally accumulated histogram (e.g. one stream's inter-token gaps) in with a single lock."""
+        if not histogram.count:
+            return
+        keys: List[HistogramKey] = [(phase, "all", "")]
+        if persona:
+            keys.append((phase, "persona", persona))
+        if backend:
+            keys.append((phase, "backend", backend))
+        with self._lock:
+            for key in keys:
+                existing = self._window.get(key)
+                if existing is None:
+                    existing = self._window[key] = LatencyHistogram()
+                existing.merge(histogram)
+
+    def request_started(self) -> None:
+        with self._lock:
+            self._in_flight += 1
+
+    def request_finished(self) -> None:
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        with self._lock:
+            self._gauges[(name, tuple(sorted(labels.items())))] = float(value)
+
+    def exposition_state(self) -> Dict[str, object]:
+        """Copy of the lifetime counters, gauges and histograms, for scrape endpoints.
+
+        Only pre-aggregated state is copied, so the cost is independent of
+        request volume.
+        """
+        with self._lock:
+            totals = {key: list(values) for key, values in self._totals.items()}
+            gauges = dict(self._gauges)
+            in_flight = self._in_flight
+            window = {key: histogram.copy() for key, histogram in self._window.items()}
+        with self._cumulative_lock:
+            for key, histogram in self._cumulative.items():
+                if key in window:
+                    window[key].merge(histogram)
+                else:
+                    window[key] = histogram.copy()
+        return {"totals": totals, "gauges": gauges, "in_flight": in_flight, "histograms": window}
+
+    def _observe(self, phase: str, value: float, persona: Optional[str], backend: Optional[str]) -> None:
+        keys: List[HistogramKey] = [(phase, "all", "")]
+        if persona:
+            keys.append((phase, "persona", persona))
+        if backend:
+            keys.append((phase, "backend", backend))
+        for key in keys:
+            histogram = self._window.get(key)
+            if histogram is None:
+                histogram = self._window[key] = LatencyHistogram()
+            histogram.record(value)
 
     def harvest(self) -> MetricSnapshot:
         with self._lock:
-            if self._latencies:
-                avg_latency = statistics.mean(self._latencies)
-                max_latency = max(self._latencies)
-            else:
-                avg_latency = 0.0
-                max_latency = 0.0
-            snapshot = MetricSnapshot(
-                request_count=self._request_count,
-                average_latency_ms=avg_latency,
-                max_latency_ms=max_latency,
-                tokens_generated=self._tokens_generated,
-                context_tokens=self._context_tokens,
-                personas_used=dict(self._personas_used),
-            )
-            self._history.append(snapshot)
-            self._latencies.clear()
+            window, self._window = self._window, {}
+            counters = (self._request_count, self._tokens_generated, self._context_tokens, dict(self._personas_used))
             self._tokens_generated = 0
             self._context_tokens = 0
             self._personas_used.clear()
             self._request_count = 0
-            return snapshot
+
+        total = window.get(("total", "all", ""))
+        snapshot = MetricSnapshot(
+            request_count=counters[0],
+            average_latency_ms=total.mean if total else 0.0,
+            max_latency_ms=total.max if total else 0.0,
+            tokens_generated=counters[1],
+            context_tokens=counters[2],
+            personas_used=counters[3],
+            latency_percentiles={_histogram_label(key): histogram.percentiles() for key, histogram in window.items()},
+        )
+        with self._cumulative_lock:
+            for key, histogram in window.items():
+                existing = self._cumulative.get(key)
+                if existing is None:
+                    self._cumulative[key] = histogram
+                else:
+                    existing.merge(histogram)
+        with self._lock:
+            self._history.append(snapshot)
+        return snapshot
 
     def history(self) -> Iterable[MetricSnapshot]:
         with self._lock:
             return list(self._history)
 
+    def histogram(
+        self, phase: str = "total", persona: Optional[str] = None, backend: Optional[str] = None
+    ) -> LatencyHistogram:
+        """Lifetime histogram for one series, including the not yet harvested interval."""
+        if persona:
+            key: HistogramKey = (phase, "persona", persona)
+        elif backend:
+            key = (phase, "backend", backend)
+        else:
+            key = (phase, "all", "")
+        result = LatencyHistogram()
+        with self._cumulative_lock:
+            if key in self._cumulative:
+                result.merge(self._cumulative[key])
+        with self._lock:
+            if key in self._window:
+                result.merge(self._window[key])
+        return result
 
-@dataclass
-class TraceRecord:
-    trace_id: str
-    span_id: str
-    persona: str
-    objective: str
-    latency_ms: float
-    token_usage: int
-    context_size: int
-    timestamp: float = field(default_factory=time.time)
-    backend: Optional[str] = None
-    extra: Dict[str, str] = field(default_factory=dict)
+    def percentiles(self, phase: str = "total", persona: Optional[str] = None, backend: Optional[str] = None) -> Dict[str, float]:
+        return self.histogram(phase, persona, backend).percentiles()
 
+    def export_histograms(self) -> Dict[str, Dict[str, object]]:
+        """Lifetime histograms in a JSON-friendly form, for merging across processes."""
+        with self._cumulative_lock:
+            return {"\x1f".join(key): histogram.to_dict() for key, histogram in self._cumulative.items()}
 
-class TraceCollector:
-    """Collects trace records for auditing and performance analysis."""
+    def merge_histograms(self, exported: Dict[str, Dict[str, object]]) -> None:
+        with self._cumulative_lock:
+            for joined, data in exported.items():
+                key = tuple(joined.split("\x1f"))
+                incoming = LatencyHistogram.from_dict(data)
+                existing = self._cumulative.get(key)  # type: ignore[arg-type]
+                if existing is None:
+                    self._cumulative[key] = incoming  # type: ignore[index]
+                else:
+                    existing.merge(incoming)
 
-    def __init__(self, max_records: int = 5000):
-        self._lock = threading.RLock()
-        self._records: Deque[TraceRecord] = deque(maxlen=max_records)
+    def export_state(self) -> Dict[str, object]:
+        """``exposition_state`` in a JSON-friendly form, for aggregation across worker processes."""
+        state = self.exposition_state()
+        return {
+            "totals": [[persona, backend, *values] for (persona, backend), values in state["totals"].items()],  # type: ignore[attr-defined]
+            "gauges": [[name, dict(labels), value] for (name, labels), value in state["gauges"].items()],  # type: ignore[attr-defined]
+            "in_flight": state["in_flight"],
+            "histograms": [[*key, histogram.to_dict()] for key, histogram in state["histograms"].items()],  # type: ignore[attr-defined]
+        }
 
-    def add(self, record: TraceRecord) -> None:
-        with self._lock:
-            self._records.append(record)
 
-    def latest(self, limit: int = 50) -> List[TraceRecord]:
-        with self._lock:
-            return list(self._records)[-limit:]
+def combine_states(exported: Dict[str, Dict[str, object]]) -> Dict[str, object]:
+    """Sum ``export_state`` results keyed by worker into one ``exposition_state``.
 
-    def filter_by_persona(self, persona: str, limit: int = 50) -> List[TraceRecord]:
-        with self._lock:
-            return [record for record in reversed(self._records) if record.persona == persona][:limit]
+    Counters, histograms and in-flight requests add up; gauges describe a
+    single process (backend availability, degradation level), so each one is
+    kept per worker under an extra ``worker`` label.
+    """
+    totals: Dict[Tuple[str, str], List[int]] = {}
+    gauges: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+    histograms: Dict[HistogramKey, LatencyHistogram] = {}
+    in_flight = 0
+    for worker, state in exported.items():
+        for persona, backend, *values in state["totals"]:  # type: ignore[attr-defined]
+            existing = totals.setdefault((persona, backend), [0] * len(values))
+            for index, value in enumerate(values):
+                existing[index] += value
+        for name, labels, value in state["gauges"]:  # type: ignore[attr-defined]
+            gauges[(name, tuple(sorted({**labels, "worker": worker}.items())))] = value
+        for phase, dimension, label, data in state["histograms"]:  # type: ignore[attr-defined]
+            incoming = LatencyHistogram.from_dict(data)
+            key = (phase, dimension, label)
+            if key in histograms:
+                histograms[key].merge(incoming)
+            else:
+                histograms[key] = incoming
+        in_flight += int(state.get("in_flight", 0))  # type: ignore[call-overload]
+    return {"totals": totals, "gauges": gauges, "in_flight": in_flight, "histograms": histograms}
 
 
 __all__ = [
+    "PHASES",
     "MetricsRegistry",
     "MetricSnapshot",
     "TraceCollector",
     "TraceRecord",
+    "combine_states",
 ]
@@ -0,0 +1,220 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+"""In-process sampling CPU profiler.
+
+A background thread snapshots every thread's stack with
+``sys._current_frames()`` at a fixed frequency. Stacks are counted as tuples
+of code objects, and frame labels are only rendered when a profile is
+requested, so one sample costs a frame walk and a dict update per thread.
+The output is the collapsed-stack format read by ``flamegraph.pl`` and
+speedscope.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from fnmatch import fnmatchcase
+from types import CodeType
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..config import ProfilerConfig
+from .memory import register_buffer
+
+_TRUNCATED: Tuple[CodeType, ...] = ()
+
+
+def _frame_label(code: CodeType) -> str:
+    name = getattr(code, "co_qualname", code.co_name)
+    filename = code.co_filename
+    parent, base = os.path.split(filename)
+    return f"{name} ({os.path.basename(parent)}/{base}:{code.co_firstlineno})"
+
+
+def _matches(name: str, patterns: Optional[Sequence[str]]) -> bool:
+    return not patterns or any(fnmatchcase(name, pattern) for pattern in patterns)
+
+
+class StackSampler:
+    """Samples thread stacks at a fixed rate and aggregates them for flamegraphs.
+
+    ``start`` begins a session that ends after ``duration_s`` or on ``stop``.
+    ``threads`` takes thread-name patterns (``fnmatch`` style, e.g.
+    ``"AnyIO worker*"``) and restricts sampling to matching threads; the
+    sampler's own thread is never sampled. Results stay available until the
+    next session starts.
+    """
+
+    def __init__(self, config: Optional[ProfilerConfig] = None):
+        self.config = config or ProfilerConfig()
+        self._lock = threading.Lock()
+        self._stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._session: Dict[str, Any] = {}
+        register_buffer("profiler.stacks", self, lambda sampler: sampler._stacks)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(
+        self,
+        hz: Optional[float] = None,
+        duration_s: Optional[float] = None,
+        threads: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Any]:
+        if self.running:
+            raise RuntimeError("Profiler is already running")
+        hz = min(hz or self.config.default_hz, self.config.max_hz)
+        duration_s = min(duration_s or self.config.max_duration_s, self.config.max_duration_s)
+        with self._lock:
+            self._stacks = Counter()
+            self._session = {
+                "hz": hz,
+                "duration_s": duration_s,
+                "threads": list(threads or []),
+                "started_at": time.time(),
+                "stopped_at": None,
+                "samples": 0,
+                "sampling_s": 0.0,
+                "truncated": 0,
+            }
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(1.0 / hz, time.monotonic() + duration_s, tuple(threads or ())),
+            name="stack-sampler", daemon=True,
+        )
+        self._thread.start()
+        return self.status()
+
+    def stop(self) -> Dict[str, Any]:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        return self.status()
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            session = dict(self._session)
+            distinct = len(self._stacks)
+        if not session:
+            return {"running": False}
+        stopped = session["stopped_at"] or time.time()
+        wall = max(stopped - session["started_at"], 1e-9)
+        return {
+            **session,
+            "running": self.running,
+            "distinct_stacks": distinct,
+            "overhead": round(session["sampling_s"] / wall, 5),
+        }
+
+    def collapsed(self, threads: Optional[Sequence[str]] = None) -> str:
+        """Collapsed stacks, one ``thread;outer;...;inner count`` line each.
+
+        ``threads`` narrows an existing profile to matching thread names.
+        """
+        lines = [f"{stack} {count}" for stack, count in sorted(self._aggregate(threads).items())]
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def top(self, limit: int = 20, threads: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """Functions ranked by self samples (innermost frame)."""
+        own: Counter = Counter()
+        total = 0
+        for stack, count in self._aggregate(threads).items():
+            own[stack.rsplit(";", 1)[-1]] += count
+            total += count
+        return [
+            {"frame": frame, "samples": count, "share": round(count / total, 4)}
+            for frame, count in own.most_common(limit)
+        ]
+
+    # Internal helpers -------------------------------------------------
+
+    def _aggregate(self, threads: Optional[Sequence[str]]) -> Counter:
+        with self._lock:
+            items = list(self._stacks.items())
+        labels: Dict[CodeType, str] = {}
+        folded: Counter = Counter()
+        for (thread_name, codes), count in items:
+            if not _matches(thread_name, threads):
+                continue
+            if codes is _TRUNCATED:
+                folded[f"{thread_name};[truncated]"] += count
+                continue
+            parts = [thread_name]
+            for code in reversed(codes):
+                label = labels.get(code)
+                if label is None:
+                    label = labels[code] = _frame_label(code)
+                parts.append(label)
+            folded[";".join(parts)] += count
+        return folded
+
+    def _run(self, interval: float, deadline: float, patterns: Tuple[str, ...]) -> None:
+        own_ident = threading.get_ident()
+        max_depth = self.config.max_depth
+        max_stacks = self.config.max_stacks
+        names: Dict[int, str] = {}
+        selected: Dict[int, bool] = {}
+        samples = 0
+        sampling_s = 0.0
+        truncated = 0
+        next_tick = time.perf_counter()
+        try:
+            while not self._stop.is_set() and time.monotonic() < deadline:
+                began = time.perf_counter()
+                frames = sys._current_frames()
+                if any(ident not in names for ident in frames):
+                    # Thread names are resolved once per new thread, not per sample
+                    names = {thread.ident: thread.name for thread in threading.enumerate() if thread.ident is not None}
+                    for ident in frames:
+                        names.setdefault(ident, f"thread-{ident}")
+                    selected = {ident: ident != own_ident and _matches(name, patterns) for ident, name in names.items()}
+                with self._lock:
+                    stacks = self._stacks
+                    for ident, frame in frames.items():
+                        if not selected[ident]:
+                            continue
+                        name = names[ident]
+                        codes = []
+                        depth = 0
+                        while frame is not None and depth < max_depth:
+                            codes.append(frame.f_code)
+                            frame = frame.f_back
+                            depth += 1
+                        key = (name, tuple(codes))
+                        if key not in stacks and len(stacks) >= max_stacks:
+                            key = (name, _TRUNCATED)
+                            truncated += 1
+                        stacks[key] += 1
+                    samples += 1
+                    self._session["samples"] = samples
+                    self._session["truncated"] = truncated
+                del frames
+                sampling_s += time.perf_counter() - began
+                self._session["sampling_s"] = sampling_s
+                next_tick += interval
+                delay = next_tick - time.perf_counter()
+                if delay < 0:
+                    # Fell behind (e.g. GIL contention); skip missed ticks rather than bursting
+                    next_tick = time.perf_counter()
+                    delay = 0.0
+                self._stop.wait(delay)
+        finally:
+            with self._lock:
+                self._session["stopped_at"] = time.time()
+
+
+__all__ = ["StackSampler"]
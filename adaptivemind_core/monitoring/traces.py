@@ -0,0 +1,402 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .memory import register_buffer
+
+_ID_WIDTH = 16
+_ID_UUID, _ID_HEX32, _ID_HEX16, _ID_OTHER = 0, 1, 2, 3
+_EXTRA_SEPARATOR = b"\x1f"
+_MAX_INTERNED_VALUE = 16
+_MAX_STRINGS = 4096
+
+
+@dataclass
+class TraceRecord:
+    trace_id: str
+    span_id: str
+    persona: str
+    objective: str
+    latency_ms: float
+    token_usage: int
+    context_size: int
+    timestamp: float = field(default_factory=time.time)
+    backend: Optional[str] = None
+    extra: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class TracePage:
+    """One page of query results, newest first; pass ``next_cursor`` back to continue."""
+
+    records: List[TraceRecord]
+    next_cursor: Optional[int] = None
+
+
+def _pack_id(value: str) -> Tuple[bytes, int]:
+    try:
+        if len(value) == 36:
+            return uuid.UUID(value).bytes, _ID_UUID
+        if len(value) == 32:
+            return bytes.fromhex(value), _ID_HEX32
+        if len(value) == 16:
+            return bytes.fromhex(value).ljust(_ID_WIDTH, b"\0"), _ID_HEX16
+    except ValueError:
+        pass
+    return bytes(_ID_WIDTH), _ID_OTHER
+
+
+def _unpack_id(raw: bytes, kind: int) -> str:
+    if kind == _ID_UUID:
+        return str(uuid.UUID(bytes=raw))
+    if kind == _ID_HEX32:
+        return raw.hex()
+    return raw[:8].hex()
+
+
+class _StringTable:
+    """Interns strings (personas, backends, objectives) to small integers.
+
+    Every ``intern`` takes a reference that ``release`` gives back; a string
+    nobody references is dropped and its id reused, so the table stays
+    bounded by what the ring holds even for high-cardinality values.
+    """
+
+    def __init__(self) -> None:
+        self._ids: Dict[str, int] = {"": 0}
+        self._values: List[str] = [""]
+        self._refs: List[int] = [0]
+        self._free: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def intern(self, value: Optional[str]) -> int:
+        value = value or ""
+        index = self._ids.get(value)
+        if index is None:
+            if self._free:
+                index = self._free.pop()
+                self._values[index] = value
+            else:
+                index = len(self._values)
+                self._values.append(value)
+                self._refs.append(0)
+            self._ids[value] = index
+        self._refs[index] += 1
+        return index
+
+    def release(self, index: int) -> bool:
+        """Drop one reference; returns True when the string was freed."""
+        if index == 0:
+            return False
+        self._refs[index] -= 1
+        if self._refs[index] > 0:
+            return False
+        del self._ids[self._values[index]]
+        self._values[index] = ""
+        self._free.append(index)
+        return True
+
+    def has_room(self) -> bool:
+        return len(self._ids) < _MAX_STRINGS
+
+    def lookup(self, value: str) -> Optional[int]:
+        return self._ids.get(value)
+
+    def __getitem__(self, index: int) -> str:
+        return self._values[index]
+
+
+class _SeqIndex:
+    """Sorted sequence numbers of live traces for one persona or backend.
+
+    Entries overwritten in the ring are pruned lazily, so maintenance stays
+    amortised O(1) per insert.
+    """
+
+    __slots__ = ("seqs", "start")
+
+    def __init__(self) -> None:
+        self.seqs = array("q")
+        self.start = 0
+
+    def append(self, seq: int, oldest: int) -> None:
+        self.seqs.append(seq)
+        while self.start < len(self.seqs) and self.seqs[self.start] < oldest:
+            self.start += 1
+        if self.start > 1024 and self.start * 2 > len(self.seqs):
+            del self.seqs[: self.start]
+            self.start = 0
+
+
+class _RingView:
+    """Sequence view of a ring column in logical (oldest to newest) order, for bisect."""
+
+    __slots__ = ("_column", "_oldest", "_length")
+
+    def __init__(self, column: array, oldest: int, newest: int):
+        self._column = column
+        self._oldest = oldest
+        self._length = newest - oldest
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, position: int) -> float:
+        return self._column[(self._oldest + position) % len(self._column)]
+
+
+class TraceCollector:
+    """Columnar ring buffer of trace records with persona, backend and time indexes.
+
+    Numeric fields live in preallocated ``array`` columns, ids are packed into
+    16 raw bytes, and persona/backend/objective and diagnostic keys are
+    interned, with their references released when the ring overwrites a
+    row. ``TraceRecord``
+    objects are only materialised for the rows a query returns.
+
+    ``sink``, when given, receives every added record (e.g. a disk archive)
+    and must not block.
+    """
+
+    def __init__(self, max_records: int = 5000, sink: Optional[Callable[[TraceRecord], None]] = None):
+        self._lock = threading.RLock()
+        self._sink = sink
+        self._capacity = max_records
+        self._next_seq = 0
+        self._timestamp = array("d", bytes(8 * max_records))
+        self._latency = array("d", bytes(8 * max_records))
+        self._tokens = array("I", bytes(4 * max_records))
+        self._context = array("I", bytes(4 * max_records))
+        self._persona = array("I", bytes(4 * max_records))
+        self._backend = array("I", bytes(4 * max_records))
+        self._objective = array("I", bytes(4 * max_records))
+        self._id_kinds = array("B", bytes(2 * max_records))
+        self._ids = bytearray(2 * _ID_WIDTH * max_records)
+        self._extra: List[Optional[bytes]] = [None] * max_records
+        self._odd_ids: Dict[Tuple[int, int], str] = {}
+        self._strings = _StringTable()
+        self._by_persona: Dict[int, _SeqIndex] = {}
+        self._by_backend: Dict[int, _SeqIndex] = {}
+        register_buffer("traces.records", self, len)
+        register_buffer("traces.strings", self, lambda collector: len(collector._strings))
+
+    def __len__(self) -> int:
+        return min(self._next_seq, self._capacity)
+
+    @property
+    def _oldest(self) -> int:
+        return max(0, self._next_seq - self._capacity)
+
+    def add(self, record: TraceRecord) -> None:
+        trace_id = _pack_id(record.trace_id)
+        span_id = _pack_id(record.span_id)
+        with self._lock:
+            extra = self._pack_extra(record.extra) if record.extra else None
+            seq = self._next_seq
+            slot = seq % self._capacity
+            if seq >= self._capacity:
+                self._release_slot(slot)
+            self._next_seq = seq + 1
+            oldest = self._oldest
+
+            self._timestamp[slot] = record.timestamp
+            self._latency[slot] = record.latency_ms
+            self._tokens[slot] = max(0, min(record.token_usage, 0xFFFFFFFF))
+            self._context[slot] = max(0, min(record.context_size, 0xFFFFFFFF))
+            persona = self._persona[slot] = self._strings.intern(record.persona)
+            backend = self._backend[slot] = self._strings.intern(record.backend)
+            self._objective[slot] = self._strings.intern(record.objective)
+            self._extra[slot] = extra
+            offset = slot * 2 * _ID_WIDTH
+            self._ids[offset : offset + _ID_WIDTH] = trace_id[0]
+            self._ids[offset + _ID_WIDTH : offset + 2 * _ID_WIDTH] = span_id[0]
+            self._id_kinds[slot * 2] = trace_id[1]
+            self._id_kinds[slot * 2 + 1] = span_id[1]
+            self._odd_ids.pop((slot, 0), None)
+            self._odd_ids.pop((slot, 1), None)
+            if trace_id[1] == _ID_OTHER:
+                self._odd_ids[(slot, 0)] = record.trace_id
+            if span_id[1] == _ID_OTHER:
+                self._odd_ids[(slot, 1)] = record.span_id
+
+            self._by_persona.setdefault(persona, _SeqIndex()).append(seq, oldest)
+            if record.backend:
+                self._by_backend.setdefault(backend, _SeqIndex()).append(seq, oldest)
+        if self._sink is not None:
+            self._sink(record)
+
+    def latest(self, limit: int = 50) -> List[TraceRecord]:
+        """Most recent records, oldest first (the order callers have always received)."""
+        return list(reversed(self.query(limit=limit).records))
+
+    def filter_by_persona(self, persona: str, limit: int = 50) -> List[TraceRecord]:
+        return self.query(persona=persona, limit=limit).records
+
+    def query(
+        self,
+        persona: Optional[str] = None,
+        backend: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        min_latency_ms: Optional[float] = None,
+        limit: int = 50,
+        cursor: Optional[int] = None,
+    ) -> TracePage:
+        """Traces matching every given filter, newest first.
+
+        The time bounds are located by binary search on the ring (records are
+        appended in completion order), the persona and backend filters use
+        their indexes, and only the rows on the returned page are decoded.
+        """
+        limit = max(1, limit)
+        with self._lock:
+            oldest, newest = self._oldest, self._next_seq
+            low = oldest if since is None else self._seq_at_or_after(since, oldest, newest)
+            high = newest if until is None else self._seq_at_or_after(until, oldest, newest, inclusive=True)
+            if cursor is not None:
+                high = min(high, cursor)
+            candidates = self._candidates(persona, backend, low, high)
+            if candidates is None:
+                return TracePage(records=[])
+
+            persona_id = self._strings.lookup(persona) if persona else None
+            backend_id = self._strings.lookup(backend) if backend else None
+            rows: List[int] = []
+            last_seq: Optional[int] = None
+            for seq in candidates:
+                slot = seq % self._capacity
+                if persona_id is not None and self._persona[slot] != persona_id:
+                    continue
+                if backend_id is not None and self._backend[slot] != backend_id:
+                    continue
+                if min_latency_ms is not None and self._latency[slot] < min_latency_ms:
+                    continue
+                if len(rows) == limit:
+                    return TracePage(records=[self._decode(row) for row in rows], next_cursor=last_seq)
+                rows.append(slot)
+                last_seq = seq
+            return TracePage(records=[self._decode(row) for row in rows])
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "records": len(self),
+                "capacity": self._capacity,
+                "recorded_total": self._next_seq,
+                "interned_strings": len(self._strings),
+            }
+
+    # Internal helpers -------------------------------------------------
+
+    def _release_slot(self, slot: int) -> None:
+        """Give back the string references of the row about to be overwritten."""
+        for string_id in (self._persona[slot], self._backend[slot]):
+            if self._strings.release(string_id):
+                self._by_persona.pop(string_id, None)
+                self._by_backend.pop(string_id, None)
+        self._strings.release(self._objective[slot])
+        extra = self._extra[slot]
+        if extra:
+            for pair in extra.split(_EXTRA_SEPARATOR):
+                inline = pair.find(b"=")
+                interned = pair.find(b":")
+                if inline != -1 and (interned == -1 or inline < interned):
+                    self._strings.release(int(pair[:inline]))
+                else:
+                    self._strings.release(int(pair[:interned]))
+                    self._strings.release(int(pair[interned + 1 :]))
+
+    def _candidates(self, persona: Optional[str], backend: Optional[str], low: int, high: int):
+        """Sequence numbers to scan, newest first, drawn from the narrowest index."""
+        indexes: List[_SeqIndex] = []
+        for value, table in ((persona, self._by_persona), (backend, self._by_backend)):
+            if value:
+                string_id = self._strings.lookup(value)
+                index = table.get(string_id) if string_id is not None else None
+                if index is None:
+                    return None
+                indexes.append(index)
+        if not indexes:
+            return range(high - 1, low - 1, -1)
+        index = min(indexes, key=lambda item: len(item.seqs) - item.start)
+        start = bisect_left(index.seqs, low, index.start)
+        end = bisect_left(index.seqs, high, start)
+        return (index.seqs[position] for position in range(end - 1, start - 1, -1))
+
+    def _seq_at_or_after(self, timestamp: float, oldest: int, newest: int, inclusive: bool = False) -> int:
+        """First sequence number whose timestamp is >= (or > when ``inclusive``) ``timestamp``."""
+        search = bisect_right if inclusive else bisect_left
+        return oldest + search(_RingView(self._timestamp, oldest, newest), timestamp)  # type: ignore[arg-type]
+
+    def _decode(self, slot: int) -> TraceRecord:
+        offset = slot * 2 * _ID_WIDTH
+        trace_kind, span_kind = self._id_kinds[slot * 2], self._id_kinds[slot * 2 + 1]
+        trace_id = self._odd_ids.get((slot, 0)) if trace_kind == _ID_OTHER else _unpack_id(
+            bytes(self._ids[offset : offset + _ID_WIDTH]), trace_kind
+        )
+        span_id = self._odd_ids.get((slot, 1)) if span_kind == _ID_OTHER else _unpack_id(
+            bytes(self._ids[offset + _ID_WIDTH : offset + 2 * _ID_WIDTH]), span_kind
+        )
+        extra = self._extra[slot]
+        backend = self._strings[self._backend[slot]]
+        return TraceRecord(
+            trace_id=trace_id or "",
+            span_id=span_id or "",
+            persona=self._strings[self._persona[slot]],
+            objective=self._strings[self._objective[slot]],
+            latency_ms=self._latency[slot],
+            token_usage=self._tokens[slot],
+            context_size=self._context[slot],
+            timestamp=self._timestamp[slot],
+            backend=backend or None,
+            extra=self._unpack_extra(extra) if extra else {},
+        )
+
+    def _pack_extra(self, extra: Dict[str, str]) -> bytes:
+        """Encode diagnostics compactly.
+
+        Keys are interned, as are short non-numeric values (statuses such as
+        ``ok`` or ``timeout`` repeat on every trace) stored as
+        ``<key id>:<value id>``; everything else stays inline as
+        ``<key id>=<value>``.
+        """
+        pairs = []
+        for key, value in extra.items():
+            key_id = self._strings.intern(key)
+            if len(value) > _MAX_INTERNED_VALUE or value[:1].isdigit() or value[:1] == "-" or not self._strings.has_room():
+                pairs.append(f"{key_id}={value}".encode())
+            else:
+                pairs.append(f"{key_id}:{self._strings.intern(value)}".encode())
+        return _EXTRA_SEPARATOR.join(pairs)
+
+    def _unpack_extra(self, packed: bytes) -> Dict[str, str]:
+        result: Dict[str, str] = {}
+        for pair in packed.split(_EXTRA_SEPARATOR):
+            inline = pair.find(b"=")
+            interned = pair.find(b":")
+            if inline != -1 and (interned == -1 or inline < interned):
+                result[self._strings[int(pair[:inline])]] = pair[inline + 1 :].decode()
+            else:
+                result[self._strings[int(pair[:interned])]] = self._strings[int(pair[interned + 1 :])]
+        return result
+
+
+__all__ = ["TraceCollector", "TracePage", "TraceRecord"]
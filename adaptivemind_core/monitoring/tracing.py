@@ -0,0 +1,427 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+"""Lightweight hierarchical span tracing.
+
+Spans follow the OpenTelemetry data model (trace id, span id, parent span id,
+kind, attributes, events, status) without depending on the SDK. The current
+span is tracked in a context variable, so nesting works across function calls,
+``await`` points and worker threads that copy the context.
+
+Sampling happens per trace when its root span ends. A trace is kept if it was
+head sampled, or if tail sampling finds it slow or failed. Kept traces go to
+an in-process ring and, optionally, to an OTLP/JSON lines file.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+from ..config import TracingConfig
+from ..logger import get_logger
+from .memory import register_buffer
+
+logger = get_logger(__name__)
+
+_SPAN_KINDS = {"internal": 1, "server": 2, "client": 3, "producer": 4, "consumer": 5}
+_STATUS_CODES = {"unset": 0, "ok": 1, "error": 2}
+
+_current: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("adaptivemind_current_span", default=None)
+
+
+class _TraceBuffer:
+    """Spans of one in-progress trace plus its sampling inputs."""
+
+    __slots__ = ("spans", "head_sampled", "has_error", "dropped", "finished", "limit")
+
+    def __init__(self, head_sampled: bool, limit: int):
+        self.spans: List[Span] = []
+        self.head_sampled = head_sampled
+        self.has_error = False
+        self.dropped = 0
+        self.finished = False
+        self.limit = limit
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "kind", "start_ns", "end_ns",
+        "attributes", "events", "status", "status_message", "_trace", "_tracer",
+    )
+
+    def __init__(self, tracer: Tracer, trace: _TraceBuffer, name: str, trace_id: str, parent_id: Optional[str], kind: str):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = {}
+        self.events: List[tuple] = []
+        self.status = "unset"
+        self.status_message = ""
+        self._trace = trace
+        self._tracer = tracer
+
+    @property
+    def is_root(self) -> bool:
+        return self.parent_id is None
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end - self.start_ns) / 1e6
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        self.attributes.update(attributes)
+
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> None:
+        self.events.append((name, time.time_ns(), attributes or {}))
+
+    def record_error(self, error: BaseException) -> None:
+        self.status = "error"
+        self.status_message = str(error)
+        self._trace.has_error = True
+        self.add_event("exception", {"exception.type": type(error).__name__, "exception.message": str(error)})
+
+    def end(self) -> None:
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.time_ns()
+        if self.status == "unset":
+            self.status = "ok"
+        if self.is_root:
+            self._tracer._finish(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "kind": self.kind,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+            "attributes": dict(self.attributes),
+            "events": [{"name": name, "time_ns": at, "attributes": attrs} for name, at, attrs in self.events],
+        }
+
+
+class _NoopSpan:
+    """Stand-in returned while tracing is disabled; every operation is a no-op."""
+
+    trace_id = span_id = ""
+    parent_id = None
+    name = kind = status = ""
+    attributes: Dict[str, Any] = {}
+    duration_ms = 0.0
+    is_root = False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        pass
+
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    def record_error(self, error: BaseException) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class OTLPFileExporter:
+    """Appends kept traces to a file as OTLP/JSON ``ExportTraceServiceRequest`` lines.
+
+    ``export`` only enqueues (and drops when ``max_pending`` traces are
+    waiting), so the request that closes a root span never encodes or
+    writes; a background thread does both every ``flush_interval_s``.
+    """
+
+    def __init__(self, path: Path, service_name: str = "adaptivemind", max_pending: int = 1024, flush_interval_s: float = 0.5):
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._max_pending = max_pending
+        self._flush_interval_s = flush_interval_s
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._pending: Deque[List[Span]] = deque()
+        self._stats = {"exported": 0, "dropped": 0}
+        self._handle = self._path.open("a", encoding="utf-8")
+        self._resource = {"attributes": [_otlp_attribute("service.name", service_name)]}
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        register_buffer("tracing.export_pending", self, lambda exporter: exporter._pending)
+        self._thread = threading.Thread(target=self._run, name="otlp-export", daemon=True)
+        self._thread.start()
+
+    def export(self, spans: List[Span]) -> None:
+        with self._lock:
+            if len(self._pending) >= self._max_pending:
+                self._stats["dropped"] += 1
+                return
+            self._pending.append(spans)
+
+    def flush(self) -> None:
+        """Write every trace queued so far; safe to call from any thread."""
+        with self._lock:
+            batch = list(self._pending)
+            self._pending.clear()
+        if not batch:
+            return
+        lines = "".join(json.dumps(self._payload(spans), separators=(",", ":")) + "\n" for spans in batch)
+        with self._write_lock:
+            if self._handle.closed:
+                return
+            self._handle.write(lines)
+            self._handle.flush()
+        with self._lock:
+            self._stats["exported"] += len(batch)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, "pending": len(self._pending)}
+
+    def shutdown(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout=5)
+        self.flush()
+        with self._write_lock:
+            self._handle.close()
+
+    def _payload(self, spans: List[Span]) -> Dict[str, Any]:
+        return {
+            "resourceSpans": [
+                {
+                    "resource": self._resource,
+                    "scopeSpans": [{"scope": {"name": "adaptivemind_core"}, "spans": [_otlp_span(span) for span in spans]}],
+                }
+            ]
+        }
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self._flush_interval_s)
+            self._wake.clear()
+            try:
+                self.flush()
+            except OSError as exc:
+                logger.warning("OTLP span export failed", extra={"error": str(exc)})
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+def _otlp_span(span: Span) -> Dict[str, Any]:
+    encoded: Dict[str, Any] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": _SPAN_KINDS.get(span.kind, 1),
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns or span.start_ns),
+        "attributes": [_otlp_attribute(key, value) for key, value in span.attributes.items()],
+        "events": [
+            {
+                "name": name,
+                "timeUnixNano": str(at),
+                "attributes": [_otlp_attribute(key, value) for key, value in attrs.items()],
+            }
+            for name, at, attrs in span.events
+        ],
+        "status": {"code": _STATUS_CODES.get(span.status, 0), "message": span.status_message},
+    }
+    if span.parent_id:
+        encoded["parentSpanId"] = span.parent_id
+    return encoded
+
+
+class Tracer:
+    """Creates spans, applies head and tail sampling, and exports kept traces."""
+
+    def __init__(self, config: Optional[TracingConfig] = None):
+        self.config = config or TracingConfig()
+        self._lock = threading.Lock()
+        self._ring: Deque[List[Span]] = deque(maxlen=self.config.ring_size)
+        self._stats = {"traces_started": 0, "traces_kept": 0, "tail_kept": 0, "spans_dropped": 0}
+        self._exporter: Optional[OTLPFileExporter] = None
+        register_buffer("tracing.kept_traces", self, lambda tracer: tracer._ring)
+        if self.config.enabled and self.config.otlp_file is not None:
+            self._exporter = OTLPFileExporter(self.config.otlp_file, self.config.service_name, self.config.export_queue_size)
+
+    def start_span(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        kind: str = "internal",
+        parent: Optional[Span] = None,
+    ) -> Span | _NoopSpan:
+        """Start a span without making it current; the caller must ``end()`` it.
+
+        The parent defaults to the current span; without one a new trace starts.
+        """
+        if not self.config.enabled:
+            return NOOP_SPAN
+        parent = parent if parent is not None else _current.get()
+        if isinstance(parent, Span):
+            trace = parent._trace
+            if len(trace.spans) >= trace.limit:
+                trace.dropped += 1
+                return NOOP_SPAN
+            span = Span(self, trace, name, parent.trace_id, parent.span_id, kind)
+        else:
+            trace = _TraceBuffer(random.random() < self.config.head_sample_rate, self.config.max_spans_per_trace)
+            span = Span(self, trace, name, f"{random.getrandbits(128):032x}", None, kind)
+            with self._lock:
+                self._stats["traces_started"] += 1
+        if attributes:
+            span.attributes.update(attributes)
+        trace.spans.append(span)
+        return span
+
+    @contextmanager
+    def span(self, name: str, attributes: Optional[Dict[str, Any]] = None, kind: str = "internal") -> Iterator[Span | _NoopSpan]:
+        """Start a child of the current span, make it current, and end it on exit."""
+        span = self.start_span(name, attributes, kind)
+        if span is NOOP_SPAN:
+            yield span
+            return
+        token = _current.set(span)  # type: ignore[arg-type]
+        try:
+            yield span
+        except BaseException as error:
+            span.record_error(error)
+            raise
+        finally:
+            _current.reset(token)
+            span.end()
+
+    @contextmanager
+    def use_span(self, span: Span | _NoopSpan) -> Iterator[Span | _NoopSpan]:
+        """Make an existing span current for a block without ending it.
+
+        Generators should use this around code between yields rather than
+        holding a span current across a yield.
+        """
+        if span is NOOP_SPAN:
+            yield span
+            return
+        token = _current.set(span)  # type: ignore[arg-type]
+        try:
+            yield span
+        finally:
+            _current.reset(token)
+
+    def recent(self, limit: int = 20) -> List[List[Dict[str, Any]]]:
+        """Most recently kept traces, newest first, each as a list of span dicts."""
+        with self._lock:
+            traces = list(self._ring)[-limit:]
+        return [[span.to_dict() for span in spans] for spans in reversed(traces)]
+
+    def find(self, trace_id: str) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            for spans in reversed(self._ring):
+                if spans and spans[0].trace_id == trace_id:
+                    return [span.to_dict() for span in spans]
+        return None
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = {**self._stats, "ring": len(self._ring)}
+        if self._exporter is not None:
+            exporter = self._exporter.stats()
+            stats.update(export_pending=exporter["pending"], export_dropped=exporter["dropped"], exported=exporter["exported"])
+        return stats
+
+    def shutdown(self) -> None:
+        if self._exporter is not None:
+            self._exporter.shutdown()
+
+    def _finish(self, root: Span) -> None:
+        trace = root._trace
+        trace.finished = True
+        slow = root.duration_ms >= self.config.tail_latency_ms
+        failed = self.config.keep_errors and trace.has_error
+        if not (trace.head_sampled or slow or failed):
+            with self._lock:
+                self._stats["spans_dropped"] += trace.dropped
+            return
+        root.set_attribute("sampling.reason", "head" if trace.head_sampled else ("error" if failed else "latency"))
+        with self._lock:
+            self._ring.append(trace.spans)
+            self._stats["traces_kept"] += 1
+            self._stats["spans_dropped"] += trace.dropped
+            if not trace.head_sampled:
+                self._stats["tail_kept"] += 1
+        if self._exporter is not None:
+            self._exporter.export(trace.spans)
+
+
+_tracer = Tracer(TracingConfig(head_sample_rate=0.0))
+
+
+def get_tracer() -> Tracer:
+    """Process-wide tracer; configured by the application at startup."""
+    return _tracer
+
+
+def configure_tracing(config: TracingConfig) -> Tracer:
+    global _tracer
+    previous, _tracer = _tracer, Tracer(config)
+    previous.shutdown()
+    return _tracer
+
+
+def current_span() -> Span | _NoopSpan:
+    return _current.get() or NOOP_SPAN
+
+
+__all__ = [
+    "NOOP_SPAN",
+    "OTLPFileExporter",
+    "Span",
+    "Tracer",
+    "configure_tracing",
+    "current_span",
+    "get_tracer",
+]
@@ -0,0 +1,229 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from ..config import DegradationConfig, SloConfig
+from ..logger import get_logger
+from ..monitoring.histogram import LatencyHistogram
+from ..monitoring.metrics import MetricsRegistry
+
+logger = get_logger(__name__)
+
+# Cumulative snapshots kept per persona; the rolling window is the difference
+# between the live histogram and the newest snapshot at least window_s old.
+WINDOW_SLICES = 6
+
+
+@dataclass(frozen=True)
+class DegradationPlan:
+    """What one request may spend, decided by the persona's current level."""
+
+    level: int = 0
+    name: str = "full"
+    context_scale: float = 1.0
+    max_tokens: int | None = None
+    disabled_stages: frozenset[str] = frozenset()
+    prefer_fast_backend: bool = False
+
+    @property
+    def degraded(self) -> bool:
+        return self.level > 0
+
+    def context_budget(self, max_context_window: int) -> int:
+        return max(1, int(max_context_window * self.context_scale))
+
+    def cap_tokens(self, max_tokens: int) -> int:
+        return max_tokens if self.max_tokens is None else min(max_tokens, self.max_tokens)
+
+    def diagnostics(self) -> dict[str, str]:
+        return {"degradation.level": str(self.level), "degradation.name": self.name}
+
+
+FULL_FIDELITY = DegradationPlan()
+
+
+@dataclass
+class _PersonaState:
+    level: int = 0
+    changed_at: float = 0.0
+    recovering_since: float | None = None
+    # (taken_at, cumulative histogram) pairs, oldest first
+    snapshots: deque[tuple[float, LatencyHistogram]] = field(default_factory=deque)
+    last_p95: float = 0.0
+    last_p99: float = 0.0
+    last_count: int = 0
+
+
+class DegradationController:
+    """Steps personas through degradation levels as their latency objectives are missed.
+
+    Evaluation happens on the request path at most once per
+    ``evaluation_interval_s``, from the lifetime per-persona latency
+    histograms in the metrics registry: subtracting an older cumulative
+    snapshot leaves the rolling window. A persona escalates one level when
+    its rolling p95 or p99 exceeds the objective, and recovers one level after
+    both have stayed below ``recovery_ratio`` of the objective for
+    ``recovery_hold_s``. Every change restarts the window.
+    """
+
+    def __init__(
+        self,
+        config: DegradationConfig,
+        metrics: MetricsRegistry,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._config = config
+        self._metrics = metrics
+        self._clock = clock
+        self._plans = [FULL_FIDELITY] + [
+            DegradationPlan(
+                level=index,
+                name=level.name,
+                context_scale=level.context_scale,
+                max_tokens=level.max_tokens,
+                disabled_stages=frozenset(level.disabled_stages),
+                prefer_fast_backend=level.prefer_fast_backend,
+            )
+            for index, level in enumerate(config.levels, start=1)
+        ]
+        self._states: dict[str, _PersonaState] = {}
+        self._lock = threading.Lock()
+        self._next_evaluation = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self._config.enabled and len(self._plans) > 1
+
+    def plan(self, persona: str) -> DegradationPlan:
+        """The plan for a request to ``persona``, re-evaluating levels when due."""
+        if not self.enabled:
+            return FULL_FIDELITY
+        now = self._clock()
+        if now >= self._next_evaluation and self._lock.acquire(blocking=False):
+            # Only one request pays for an evaluation; concurrent ones use the current levels
+            try:
+                self._next_evaluation = now + self._config.evaluation_interval_s
+                self._evaluate(now, persona)
+            finally:
+                self._lock.release()
+        state = self._states.get(persona)
+        return self._plans[state.level] if state is not None else FULL_FIDELITY
+
+    def evaluate(self) -> None:
+        """Re-evaluate every persona seen so far, regardless of the evaluation interval."""
+        with self._lock:
+            now = self._clock()
+            for persona in list(self._states):
+                self._evaluate_persona(persona, now)
+
+    def slo(self, persona: str) -> SloConfig:
+        return self._config.persona_slos.get(persona, self._config.default_slo)
+
+    def status(self) -> dict[str, object]:
+        """Current level and rolling latency per persona."""
+        now = self._clock()
+        personas = {}
+        for persona, state in sorted(self._states.items()):
+            slo = self.slo(persona)
+            personas[persona] = {
+                "level": state.level,
+                "name": self._plans[state.level].name,
+                "level_age_s": round(now - state.changed_at, 3),
+                "p95_ms": round(state.last_p95, 3),
+                "p99_ms": round(state.last_p99, 3),
+                "samples": state.last_count,
+                "slo_p95_ms": slo.p95_ms,
+                "slo_p99_ms": slo.p99_ms,
+            }
+        return {
+            "enabled": self.enabled,
+            "levels": [plan.name for plan in self._plans],
+            "personas": personas,
+        }
+
+    def _evaluate(self, now: float, requested: str) -> None:
+        if requested not in self._states:
+            self._states[requested] = self._new_state(requested, now)
+        for persona in list(self._states):
+            self._evaluate_persona(persona, now)
+
+    def _new_state(self, persona: str, now: float) -> _PersonaState:
+        state = _PersonaState(changed_at=now)
+        state.snapshots.append((now, self._metrics.histogram("total", persona=persona)))
+        return state
+
+    def _evaluate_persona(self, persona: str, now: float) -> None:
+        state = self._states[persona]
+        config = self._config
+        current = self._metrics.histogram("total", persona=persona)
+
+        # Drop snapshots once a newer one is old enough to anchor the window
+        while len(state.snapshots) > 1 and state.snapshots[1][0] <= now - config.window_s:
+            state.snapshots.popleft()
+        window = current.copy()
+        window.subtract(state.snapshots[0][1])
+        if now - state.snapshots[-1][0] >= config.window_s / WINDOW_SLICES:
+            state.snapshots.append((now, current))
+
+        quantiles = window.percentiles({"p95": 0.95, "p99": 0.99})
+        state.last_p95, state.last_p99, state.last_count = quantiles["p95"], quantiles["p99"], window.count
+        if window.count < config.min_samples:
+            return
+
+        slo = self.slo(persona)
+        missed = (slo.p95_ms is not None and state.last_p95 > slo.p95_ms) or (
+            slo.p99_ms is not None and state.last_p99 > slo.p99_ms
+        )
+        if missed:
+            state.recovering_since = None
+            if state.level < len(self._plans) - 1:
+                self._change(persona, state, state.level + 1, now, current)
+            return
+
+        ratio = config.recovery_ratio
+        comfortable = (slo.p95_ms is None or state.last_p95 <= slo.p95_ms * ratio) and (
+            slo.p99_ms is None or state.last_p99 <= slo.p99_ms * ratio
+        )
+        if not comfortable or state.level == 0:
+            state.recovering_since = None
+            return
+        if state.recovering_since is None:
+            state.recovering_since = now
+        if now - state.recovering_since >= config.recovery_hold_s:
+            self._change(persona, state, state.level - 1, now, current)
+
+    def _change(self, persona: str, state: _PersonaState, level: int, now: float, current: LatencyHistogram) -> None:
+        previous = state.level
+        state.level = level
+        state.changed_at = now
+        state.recovering_since = None
+        state.snapshots.clear()
+        state.snapshots.append((now, current))
+        self._metrics.set_gauge("degradation_level", float(level), persona=persona)
+        logger.warning(
+            "Degradation level changed",
+            extra={
+                "persona": persona,
+                "from": self._plans[previous].name,
+                "to": self._plans[level].name,
+                "p95_ms": round(state.last_p95, 2),
+                "p99_ms": round(state.last_p99, 2),
+            },
+        )
+
+
+__all__ = ["FULL_FIDELITY", "DegradationController", "DegradationPlan"]
@@ -10,12 +10,15 @@
 
 from __future__ import annotations
 
+import math
+import threading
 import time
 import uuid
-from collections.abc import Iterable, Iterator, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 
 from ..config import AppConfig, PersonaConfig
 from ..context.engine import ContextEngine
+from ..context.sessions import ConversationSession
 from ..llm.base import (
     GenerationChunk,
     GenerationRequest,
@@ -23,13 +26,23 @@ from ..llm.base import (
     LLMBackend,
 )
 from ..logger import get_logger
+from ..monitoring.histogram import LatencyHistogram
+from ..monitoring.memory import get_memory_diagnostics
 from ..monitoring.metrics import MetricsRegistry, TraceCollector, TraceRecord
+from ..monitoring.tracing import NOOP_SPAN, get_tracer
+from .degradation import FULL_FIDELITY, DegradationController, DegradationPlan
+from .snapshot import RoutingSnapshot, build_snapshot
 
 logger = get_logger(__name__)
 
 
 class AdaptiveLLMRouter:
-    """Selects the best backend based on persona hints and availability."""
+    """Selects the best backend based on persona hints and availability.
+
+    Requests read personas, templates and backend order from an immutable
+    ``RoutingSnapshot`` loaded once per request, without locking; ``publish``
+    swaps in a new one after configuration changes.
+    """
 
     def __init__(
         self,
@@ -38,23 +51,78 @@ class AdaptiveLLMRouter:
         backends: Sequence[LLMBackend],
         metrics: MetricsRegistry,
         traces: TraceCollector,
+        degradation: DegradationController | None = None,
     ):
         self._config = config
         self._context_engine = context_engine
-        self._backends = list(backends)
         self._metrics = metrics
         self._traces = traces
+        self._degradation = degradation
+        self._publish_lock = threading.Lock()
+        self._snapshot = build_snapshot(config, backends, context_engine.templates)
+
+    @property
+    def snapshot(self) -> RoutingSnapshot:
+        return self._snapshot
+
+    @property
+    def backends(self) -> tuple[LLMBackend, ...]:
+        return self._snapshot.backends
 
-    def available_personas(self) -> dict[str, PersonaConfig]:
-        return self._config.personas
+    def publish(self, backends: Sequence[LLMBackend] | None = None) -> RoutingSnapshot:
+        """Snapshot the current configuration (and ``backends``, if given) for new requests."""
+        with self._publish_lock:
+            current = self._snapshot
+            self._snapshot = build_snapshot(
+                self._config,
+                current.backends if backends is None else backends,
+                self._context_engine.templates,
+                version=current.version + 1,
+            )
+            return self._snapshot
 
-    def select_backend(self, persona: PersonaConfig) -> LLMBackend:
-        for backend in self._backends:
+    def set_backends(self, backends: Sequence[LLMBackend]) -> RoutingSnapshot:
+        """Replace the backend order; the last backend is the fallback."""
+        return self.publish(backends)
+
+    def available_personas(self) -> Mapping[str, PersonaConfig]:
+        return self._snapshot.personas
+
+    def select_backend(
+        self,
+        persona: PersonaConfig,
+        prefer_fast: bool = False,
+        backends: Sequence[LLMBackend] | None = None,
+    ) -> LLMBackend:
+        if backends is None:
+            backends = self._snapshot.backends
+        if prefer_fast:
+            fastest = self._fastest_backend(backends)
+            if fastest is not None:
+                logger.debug("Selected fastest backend", extra={"persona": persona.name, "backend": fastest.name})
+                return fastest
+        for backend in backends:
             if backend.is_available():
                 logger.debug("Selected backend", extra={"persona": persona.name, "backend": backend.name})
                 return backend
         logger.warning("Falling back to contextual generator", extra={"persona": persona.name})
-        return self._backends[-1]
+        return backends[-1]
+
+    def _fastest_backend(self, backends: Sequence[LLMBackend]) -> LLMBackend | None:
+        """Available model backend with the lowest observed median latency; the fallback is never chosen."""
+        fastest: LLMBackend | None = None
+        best = math.inf
+        for backend in backends[:-1]:
+            observed = self._metrics.histogram("total", backend=backend.name)
+            if not observed.count:
+                continue
+            median = observed.percentile(0.5)
+            if median < best and backend.is_available():
+                fastest, best = backend, median
+        return fastest
+
+    def _plan(self, persona: PersonaConfig) -> DegradationPlan:
+        return self._degradation.plan(persona.name) if self._degradation is not None else FULL_FIDELITY
 
     def generate(
         self,
@@ -64,116 +132,219 @@ class AdaptiveLLMRouter:
         max_tokens: int = 512,
         metadata: dict[str, str] | None = None,
         external_context: Iterable[str] | None = None,
+        session: ConversationSession | None = None,
     ) -> GenerationResponse:
-        allowed = None
-        try:
-            allowed = set(self._config.allowed_personas)
-        except Exception:
-            # If allowed_personas is not iterable (e.g., a Mock in tests),
-            # fall back to the declared personas in the config.
-            allowed = set(self._config.personas.keys())
-
-        if persona_name not in allowed:
-            raise ValueError(f"Persona '{persona_name}' is not enabled")
-        persona = self._config.personas[persona_name]
-        context = self._context_engine.build_context(persona, messages, external_context)
-        backend = self.select_backend(persona)
-        request = GenerationRequest(
-            messages=messages,
-            persona=persona.name,
-            context=context,
-            temperature=temperature,
-            max_tokens=min(max_tokens, persona.max_context_window),
-            metadata=metadata,
-        )
-        start = time.perf_counter()
-        response = backend.generate(request)
-        latency_ms = (time.perf_counter() - start) * 1000
-        context_tokens = len(context.split())
-        self._metrics.record_request(persona=persona.name, latency_ms=latency_ms, generated_tokens=response.tokens, context_tokens=context_tokens)
-        trace = TraceRecord(
-            trace_id=str(uuid.uuid4()),
-            span_id=str(uuid.uuid4()),
-            persona=persona.name,
-            objective=metadata.get("objective") if metadata else "chat",
-            latency_ms=latency_ms,
-            token_usage=response.tokens,
-            context_size=context_tokens,
-            backend=response.backend,
-        )
-        self._traces.add(trace)
-        logger.info(
-            "Generation completed",
-            extra={
-                "persona": persona.name,
-                "backend": response.backend,
-                "latency_ms": round(latency_ms, 2),
-                "tokens": response.tokens,
-                "context_tokens": context_tokens,
-            },
-        )
-        return response
-
-    def stream(
-        self,
-        persona_name: str,
-        messages: Sequence[dict],
-        temperature: float = 0.7,
-        max_tokens: int = 512,
-        metadata: dict[str, str] | None = None,
-        external_context: Iterable[str] | None = None,
-    ) -> Iterator[GenerationChunk]:
-        allowed = None
+        snapshot = self._snapshot
+        persona = snapshot.resolve(persona_name)
+        tracer = get_tracer()
+        memory = get_memory_diagnostics()
+        allocated_from = memory.begin_request()
+        self._metrics.request_started()
         try:
-            allowed = set(self._config.allowed_personas)
-        except Exception:
-            allowed = set(self._config.personas.keys())
-
-        if persona_name not in allowed:
-            raise ValueError(f"Persona '{persona_name}' is not enabled")
-        persona = self._config.personas[persona_name]
-        context = self._context_engine.build_context(persona, messages, external_context)
-        backend = self.select_backend(persona)
-        request = GenerationRequest(
-            messages=messages,
-            persona=persona.name,
-            context=context,
-            temperature=temperature,
-            max_tokens=min(max_tokens, persona.max_context_window),
-            metadata=metadata,
-        )
-        start = time.perf_counter()
-        chunk_count = 0
-        for chunk in backend.stream(request):
-            chunk_count += 1
-            yield chunk
-            if chunk.finished:
+            with tracer.span("router.generate", {"persona": persona.name}, kind="server") as root:
+                plan = self._plan(persona)
+                root.set_attribute("degradation_level", plan.level)
+                build_start = time.perf_counter()
+                build = self._context_engine.build(
+                    persona,
+                    messages,
+                    external_context,
+                    session=session,
+                    budget=plan.context_budget(persona.max_context_window),
+                    disabled_stages=plan.disabled_stages,
+                    template=snapshot.templates[persona.name],
+                )
+                build_ms = (time.perf_counter() - build_start) * 1000
+                context = build.text
+                backend = self.select_backend(persona, plan.prefer_fast_backend, snapshot.backends)
+                request = GenerationRequest(
+                    messages=messages,
+                    persona=persona.name,
+                    context=context,
+                    temperature=temperature,
+                    max_tokens=plan.cap_tokens(min(max_tokens, persona.max_context_window)),
+                    metadata=metadata,
+                    template=build.template,
+                )
+                start = time.perf_counter()
+                with tracer.span(f"backend.{backend.name}.generate", {"backend": backend.name}, kind="client") as call:
+                    response = backend.generate(request)
+                    call.set_attribute("tokens", response.tokens)
                 latency_ms = (time.perf_counter() - start) * 1000
                 context_tokens = len(context.split())
-                self._metrics.record_request(persona=persona.name, latency_ms=latency_ms, generated_tokens=chunk.tokens, context_tokens=context_tokens)
+                root.set_attributes({"backend": response.backend, "context_tokens": context_tokens})
+                self._metrics.record_request(
+                    persona=persona.name,
+                    latency_ms=latency_ms,
+                    generated_tokens=response.tokens,
+                    context_tokens=context_tokens,
+                    backend=response.backend,
+                    phases={"context_build": build_ms},
+                )
+                allocation, allocated_from = memory.end_request(allocated_from), None
                 trace = TraceRecord(
-                    trace_id=str(uuid.uuid4()),
-                    span_id=str(uuid.uuid4()),
+                    trace_id=root.trace_id or str(uuid.uuid4()),
+                    span_id=root.span_id or str(uuid.uuid4()),
                     persona=persona.name,
                     objective=metadata.get("objective") if metadata else "chat",
                     latency_ms=latency_ms,
-                    token_usage=chunk.tokens,
+                    token_usage=response.tokens,
                     context_size=context_tokens,
-                    backend=chunk.backend,
+                    backend=response.backend,
+                    extra={**build.diagnostics, **plan.diagnostics(), **allocation},
                 )
                 self._traces.add(trace)
                 logger.info(
-                    "Streaming generation completed",
+                    "Generation completed",
                     extra={
                         "persona": persona.name,
-                        "backend": chunk.backend,
+                        "backend": response.backend,
                         "latency_ms": round(latency_ms, 2),
-                        "tokens": chunk.tokens,
+                        "tokens": response.tokens,
                         "context_tokens": context_tokens,
-                        "chunks": chunk_count,
                     },
                 )
-                break
+                return response
+        finally:
+            # A failed request still ends its accounting, or later ones would all look overlapped
+            memory.end_request(allocated_from)
+            self._metrics.request_finished()
+
+    def stream(
+        self,
+        persona_name: str,
+        messages: Sequence[dict],
+        temperature: float = 0.7,
+        max_tokens: int = 512,
+        metadata: dict[str, str] | None = None,
+        external_context: Iterable[str] | None = None,
+        session: ConversationSession | None = None,
+    ) -> Iterator[GenerationChunk]:
+        snapshot = self._snapshot
+        persona = snapshot.resolve(persona_name)
+        tracer = get_tracer()
+        # Generators may resume in a different context, so spans are made
+        # current only around code that does not yield.
+        root = tracer.start_span("router.stream", {"persona": persona.name}, kind="server")
+        call = NOOP_SPAN
+        memory = get_memory_diagnostics()
+        allocated_from = memory.begin_request()
+        self._metrics.request_started()
+        try:
+            plan = self._plan(persona)
+            root.set_attribute("degradation_level", plan.level)
+            build_start = time.perf_counter()
+            with tracer.use_span(root):
+                build = self._context_engine.build(
+                    persona,
+                    messages,
+                    external_context,
+                    session=session,
+                    budget=plan.context_budget(persona.max_context_window),
+                    disabled_stages=plan.disabled_stages,
+                    template=snapshot.templates[persona.name],
+                )
+            build_ms = (time.perf_counter() - build_start) * 1000
+            context = build.text
+            backend = self.select_backend(persona, plan.prefer_fast_backend, snapshot.backends)
+            request = GenerationRequest(
+                messages=messages,
+                persona=persona.name,
+                context=context,
+                temperature=temperature,
+                max_tokens=plan.cap_tokens(min(max_tokens, persona.max_context_window)),
+                metadata=metadata,
+                template=build.template,
+            )
+            call = tracer.start_span(f"backend.{backend.name}.stream", {"backend": backend.name}, kind="client", parent=root)
+            inter_token = LatencyHistogram()
+            start = time.perf_counter()
+            previous = start
+            chunk_count = 0
+            ttft_ms: float | None = None
+            for chunk in self._stream_chunks(backend, request):
+                now = time.perf_counter()
+                chunk_count += 1
+                if ttft_ms is None:
+                    ttft_ms = (now - start) * 1000
+                    call.add_event("first_token", {"ttft_ms": round(ttft_ms, 3)})
+                else:
+                    inter_token.record((now - previous) * 1000)
+                previous = now
+                yield chunk
+                if chunk.finished:
+                    latency_ms = (time.perf_counter() - start) * 1000
+                    context_tokens = len(context.split())
+                    gaps = inter_token.percentiles()
+                    call.set_attributes(
+                        {
+                            "chunks": chunk_count,
+                            "tokens": chunk.tokens,
+                            "ttft_ms": round(ttft_ms or latency_ms, 3),
+                            "inter_token_p50_ms": round(gaps["p50"], 3),
+                            "inter_token_p99_ms": round(gaps["p99"], 3),
+                        }
+                    )
+                    root.set_attributes({"backend": chunk.backend, "context_tokens": context_tokens})
+                    self._metrics.record_request(
+                        persona=persona.name,
+                        latency_ms=latency_ms,
+                        generated_tokens=chunk.tokens,
+                        context_tokens=context_tokens,
+                        backend=chunk.backend,
+                        phases={"context_build": build_ms, "ttft": ttft_ms or latency_ms},
+                    )
+                    self._metrics.merge_phase("inter_token", inter_token, persona=persona.name, backend=chunk.backend)
+                    allocation, allocated_from = memory.end_request(allocated_from), None
+                    trace = TraceRecord(
+                        trace_id=root.trace_id or str(uuid.uuid4()),
+                        span_id=root.span_id or str(uuid.uuid4()),
+                        persona=persona.name,
+                        objective=metadata.get("objective") if metadata else "chat",
+                        latency_ms=latency_ms,
+                        token_usage=chunk.tokens,
+                        context_size=context_tokens,
+                        backend=chunk.backend,
+                        extra={**build.diagnostics, **plan.diagnostics(), **allocation},
+                    )
+                    self._traces.add(trace)
+                    logger.info(
+                        "Streaming generation completed",
+                        extra={
+                            "persona": persona.name,
+                            "backend": chunk.backend,
+                            "latency_ms": round(latency_ms, 2),
+                            "tokens": chunk.tokens,
+                            "context_tokens": context_tokens,
+                            "chunks": chunk_count,
+                        },
+                    )
+                    break
+        except BaseException as error:
+            if not isinstance(error, GeneratorExit):
+                root.record_error(error)
+            raise
+        finally:
+            memory.end_request(allocated_from)
+            self._metrics.request_finished()
+            call.end()
+            root.end()
+
+    @staticmethod
+    def _stream_chunks(backend: LLMBackend, request: GenerationRequest) -> Iterator[GenerationChunk]:
+        """The backend's stream, or its whole reply as one final chunk when it cannot stream."""
+        chunks = backend.stream(request)
+        if chunks is not None:
+            yield from chunks
+            return
+        response = backend.generate(request)
+        yield GenerationChunk(
+            content=response.content,
+            tokens=response.tokens,
+            backend=response.backend,
+            finished=True,
+            diagnostics=response.diagnostics,
+        )
 
 
 __all__ = ["AdaptiveLLMRouter"]
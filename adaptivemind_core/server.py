@@ -10,15 +10,21 @@
 
 from __future__ import annotations
 
+import json
+import sys
 from contextlib import asynccontextmanager
+from typing import Literal
 
-from fastapi import Depends, FastAPI, HTTPException, Request, status
-from fastapi.responses import HTMLResponse
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, PlainTextResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 from .app import AdaptiveMindApplication
 from .config import AppConfig
+from .jobs import QueueFullError
 from .logger import get_logger
+from .monitoring.exposition import CONTENT_TYPE as OPENMETRICS_CONTENT_TYPE
 
 logger = get_logger(__name__)
 
@@ -45,6 +51,78 @@ class ChatResponse(BaseModel):
     diagnostics: dict
 
 
+class SessionCreateRequest(BaseModel):
+    persona: str = Field("generalist", description="Persona the session is bound to")
+    messages: list[Message] | None = None
+
+
+class SessionResponse(BaseModel):
+    session_id: str
+    persona: str
+    created_at: float
+    last_access: float
+    message_count: int
+    context_tokens: int
+
+
+class SessionMessageRequest(BaseModel):
+    message: Message
+    temperature: float = Field(0.7, ge=0.0, le=2.0)
+    max_tokens: int = Field(512, ge=32, le=4096)
+    metadata: dict | None = None
+    external_context: list[str] | None = None
+
+
+class SessionChatResponse(ChatResponse):
+    session_id: str
+    message_count: int
+    session_expired: bool = Field(False, description="The session was evicted while the reply was generated; the reply is not stored")
+
+
+class JobRequest(BaseModel):
+    mode: Literal["chat", "agent", "workflow"] = Field(..., description="Type of job to execute")
+    payload: dict = Field(..., description="Payload for the job execution")
+    callback_url: str | None = Field(None, description="URL receiving the final job status as a JSON POST")
+    priority: int | None = Field(None, ge=0, le=9, description="0 is most urgent; the configured default when omitted")
+
+
+class JobResponse(BaseModel):
+    job_id: str
+    status: str
+    position: int | None = None
+    estimated_start: str | None = None
+    created_at: str
+
+
+class JobStatusResponse(BaseModel):
+    job_id: str
+    status: str
+    mode: str | None = None
+    result: dict | None = None
+    error: str | None = None
+    progress: float | None = None
+    position: int | None = None
+    estimated_start: str | None = None
+    created_at: str | None = None
+    started_at: str | None = None
+    completed_at: str | None = None
+    execution_time: float | None = None
+    callback_status: str | None = None
+
+
+class IngestResponse(BaseModel):
+    batch_id: str
+    status: str
+    ingested: int
+    rejected: int
+    indexed: int = 0
+    failed: int = 0
+    chunks: int = 0
+    duplicates: int = 0
+    dedup_ratio: float = 0.0
+    errors: list[str] = Field(default_factory=list)
+
+
 class HealthResponse(BaseModel):
     status: str
     available_models: list[str]
@@ -56,6 +134,7 @@ class MetricsResponse(BaseModel):
 
 class TracesResponse(BaseModel):
     traces: list[dict]
+    next_cursor: int | None = None
 
 
 class OpenAIChatRequest(BaseModel):
@@ -104,6 +183,8 @@ class SystemStatusResponse(BaseModel):
     active_backends: list[str]
     active_personas: list[str]
     config_hash: str  # For detecting config changes
+    degradation: dict | None = None
+    workers: list[dict] | None = None
 
 
 class RoutingConfigResponse(BaseModel):
@@ -189,16 +270,28 @@ class ConfigSaveResponse(BaseModel):
     message: str
 
 
+class TracemallocStartRequest(BaseModel):
+    frames: int | None = Field(None, ge=1, le=64)
+
+
+class MemorySnapshotRequest(BaseModel):
+    label: str = Field("", max_length=100)
+
+
+class ProfilerStartRequest(BaseModel):
+    hz: float | None = Field(None, gt=0)
+    duration_s: float | None = Field(None, gt=0)
+    threads: list[str] | None = None  # fnmatch patterns, e.g. "AnyIO worker*"
+
+
 def build_app(config: AppConfig | None = None) -> FastAPI:
     # Allow tests and external code to patch the legacy `jarvis_core.server`
     # AdaptiveMindApplication symbol; resolve dynamically so that mocking
     # `jarvis_core.server.AdaptiveMindApplication` affects app construction.
-    try:
-        import importlib
-        legacy = importlib.import_module("jarvis_core.server")
-        AppClass = getattr(legacy, "AdaptiveMindApplication", AdaptiveMindApplication)
-    except Exception:
-        AppClass = AdaptiveMindApplication
+    # Patching requires the module to be imported already, so it is only
+    # looked up, never imported (a failed import costs a full sys.path scan).
+    legacy = sys.modules.get("jarvis_core.server")
+    AppClass = getattr(legacy, "AdaptiveMindApplication", AdaptiveMindApplication)
 
     jarvis_app = AppClass(config=config)
 
@@ -374,7 +467,127 @@ def build_app(config: AppConfig | None = None) -> FastAPI:
             logger.error("Chat request failed", exc_info=e)
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Chat request failed")
 
+    @fastapi_app.post("/api/v1/chat/stream")
+    def chat_stream(request: ChatRequest, app: AdaptiveMindApplication = Depends(_app_dependency)) -> StreamingResponse:
+        """Stream chat chunks as NDJSON, one object per line, flushed as the backend produces them."""
+        if request.persona not in app.config.personas:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Persona '{request.persona}' not found. Available: {list(app.config.personas.keys())}")
+
+        def lines():
+            try:
+                for chunk in app.stream_chat(
+                    persona=request.persona,
+                    messages=[message.model_dump() for message in request.messages],
+                    temperature=request.temperature,
+                    max_tokens=request.max_tokens,
+                    metadata=request.metadata,
+                    external_context=request.external_context,
+                ):
+                    yield json.dumps(chunk) + "\n"
+            except Exception as e:
+                # Headers are already sent, so the failure is reported in-band
+                logger.error("Streaming chat request failed", exc_info=e)
+                yield json.dumps({"error": "Chat request failed", "finished": True}) + "\n"
 
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+
+    @fastapi_app.post("/api/v1/sessions", response_model=SessionResponse)
+    def create_session(request: SessionCreateRequest, app: AdaptiveMindApplication = Depends(_app_dependency)) -> SessionResponse:
+        try:
+            messages = [message.model_dump() for message in request.messages or []]
+            return SessionResponse(**app.create_session(request.persona, messages))
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    @fastapi_app.get("/api/v1/sessions/{session_id}", response_model=SessionResponse)
+    def get_session(session_id: str, app: AdaptiveMindApplication = Depends(_app_dependency)) -> SessionResponse:
+        try:
+            return SessionResponse(**app.get_session(session_id))
+        except KeyError:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Session '{session_id}' not found")
+
+    @fastapi_app.post("/api/v1/sessions/{session_id}/messages", response_model=SessionChatResponse)
+    def session_chat(session_id: str, request: SessionMessageRequest, app: AdaptiveMindApplication = Depends(_app_dependency)) -> SessionChatResponse:
+        try:
+            payload = app.session_chat(
+                session_id,
+                request.message.model_dump(),
+                temperature=request.temperature,
+                max_tokens=request.max_tokens,
+                metadata=request.metadata,
+                external_context=request.external_context,
+            )
+            return SessionChatResponse(**payload)
+        except KeyError:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Session '{session_id}' not found")
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        except Exception as e:
+            logger.error("Session chat request failed", exc_info=e)
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Chat request failed")
+
+    @fastapi_app.delete("/api/v1/sessions/{session_id}")
+    def delete_session(session_id: str, app: AdaptiveMindApplication = Depends(_app_dependency)):
+        if not app.delete_session(session_id):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Session '{session_id}' not found")
+        return {"message": f"Session '{session_id}' deleted successfully"}
+
+    @fastapi_app.post("/api/v1/jobs", response_model=JobResponse)
+    def submit_job(request: JobRequest, app: AdaptiveMindApplication = Depends(_app_dependency)) -> JobResponse:
+        try:
+            return JobResponse(**app.submit_job(request.mode, request.payload, request.callback_url, request.priority))
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        except QueueFullError as e:
+            raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e))
+
+    @fastapi_app.get("/api/v1/jobs/{job_id}", response_model=JobStatusResponse)
+    def job_status(job_id: str, app: AdaptiveMindApplication = Depends(_app_dependency)) -> JobStatusResponse:
+        try:
+            return JobStatusResponse(**app.job_status(job_id))
+        except KeyError:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Job '{job_id}' not found")
+
+    @fastapi_app.delete("/api/v1/jobs/{job_id}", response_model=JobStatusResponse)
+    def cancel_job(job_id: str, app: AdaptiveMindApplication = Depends(_app_dependency)) -> JobStatusResponse:
+        try:
+            return JobStatusResponse(**app.cancel_job(job_id))
+        except KeyError:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Job '{job_id}' not found")
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    @fastapi_app.get("/api/v1/monitoring/jobs")
+    def job_stats(app: AdaptiveMindApplication = Depends(_app_dependency)) -> dict:
+        return app.jobs.stats()
+
+    @fastapi_app.post("/api/v1/feed/ingest", response_model=IngestResponse)
+    async def feed_ingest(request: Request, app: AdaptiveMindApplication = Depends(_app_dependency)) -> IngestResponse:
+        """Index documents sent as NDJSON (read as it arrives) or as a JSON ``{"items": [...]}`` body."""
+        content_type = request.headers.get("content-type", "")
+        if any(kind in content_type for kind in ("ndjson", "jsonl", "json-lines")):
+            return IngestResponse(**await app.ingest_stream(request.stream()))
+        try:
+            body = json.loads(await request.body())
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid JSON body: {e}")
+        items = body.get("items") if isinstance(body, dict) else body
+        if not isinstance(items, list):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Expected a list of items")
+        return IngestResponse(**await run_in_threadpool(app.ingest_items, items))
+
+    @fastapi_app.get("/api/v1/feed/batches/{batch_id}", response_model=IngestResponse)
+    def ingest_batch(batch_id: str, app: AdaptiveMindApplication = Depends(_app_dependency)) -> IngestResponse:
+        try:
+            return IngestResponse(**app.ingest_batch(batch_id))
+        except KeyError:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Batch '{batch_id}' not found")
+
+    @fastapi_app.get("/api/v1/monitoring/ingest")
+    def ingest_stats(app: AdaptiveMindApplication = Depends(_app_dependency)) -> dict:
+        return app.ingest.stats()
 
     @fastapi_app.get("/api/v1/monitoring/metrics", response_model=MetricsResponse)
     def metrics(app: AdaptiveMindApplication = Depends(_app_dependency)) -> MetricsResponse:
@@ -384,10 +597,49 @@ def build_app(config: AppConfig | None = None) -> FastAPI:
             logger.error("Failed to retrieve metrics", exc_info=e)
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to retrieve metrics")
 
+    @fastapi_app.get("/metrics", response_class=PlainTextResponse)
+    def openmetrics(app: AdaptiveMindApplication = Depends(_app_dependency)) -> PlainTextResponse:
+        return PlainTextResponse(app.openmetrics(), media_type=OPENMETRICS_CONTENT_TYPE)
+
+    @fastapi_app.get("/api/v1/monitoring/spans")
+    def spans(
+        limit: int = Query(20, ge=1, le=500),
+        trace_id: str | None = None,
+        app: AdaptiveMindApplication = Depends(_app_dependency),
+    ) -> dict:
+        return app.recent_spans(limit, trace_id)
+
+    @fastapi_app.get("/api/v1/monitoring/context")
+    def context_stats(app: AdaptiveMindApplication = Depends(_app_dependency)) -> dict:
+        return app.context_stats()
+
     @fastapi_app.get("/api/v1/monitoring/traces", response_model=TracesResponse)
-    def traces(app: AdaptiveMindApplication = Depends(_app_dependency)) -> TracesResponse:
+    def traces(
+        persona: str | None = None,
+        backend: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        min_latency_ms: float | None = None,
+        limit: int = Query(50, ge=1, le=1000),
+        cursor: int | None = None,
+        app: AdaptiveMindApplication = Depends(_app_dependency),
+    ) -> TracesResponse:
         try:
-            return TracesResponse(traces=app.traces_latest())
+            filters = (persona, backend, since, until, min_latency_ms, cursor)
+            if all(value is None for value in filters):
+                # Unfiltered requests keep the original oldest-first listing
+                return TracesResponse(traces=app.traces_latest(limit))
+            return TracesResponse(
+                **app.query_traces(
+                    persona=persona,
+                    backend=backend,
+                    since=since,
+                    until=until,
+                    min_latency_ms=min_latency_ms,
+                    limit=limit,
+                    cursor=cursor,
+                )
+            )
         except Exception as e:
             logger.error("Failed to retrieve traces", exc_info=e)
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to retrieve traces")
@@ -491,6 +743,83 @@ def build_app(config: AppConfig | None = None) -> FastAPI:
             logger.error("Failed to save config", exc_info=e)
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to save configuration")
 
+    @fastapi_app.post("/api/v1/management/profiler/start")
+    def start_profiler(request: ProfilerStartRequest, app: AdaptiveMindApplication = Depends(_app_dependency)) -> dict:
+        try:
+            return app.start_profiler(request.hz, request.duration_s, request.threads)
+        except PermissionError as e:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+        except RuntimeError as e:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    @fastapi_app.post("/api/v1/management/profiler/stop")
+    def stop_profiler(app: AdaptiveMindApplication = Depends(_app_dependency)) -> dict:
+        return app.stop_profiler()
+
+    @fastapi_app.get("/api/v1/management/profiler/profile")
+    def profile(
+        format: str = Query("collapsed", pattern="^(collapsed|json)$"),
+        threads: list[str] | None = Query(None),
+        top: int = Query(20, ge=1, le=500),
+        app: AdaptiveMindApplication = Depends(_app_dependency),
+    ):
+        result = app.profile(threads, top)
+        if format == "collapsed":
+            return PlainTextResponse(result["collapsed"])
+        return result
+
+    @fastapi_app.get("/api/v1/management/memory/buffers")
+    def memory_buffers(app: AdaptiveMindApplication = Depends(_app_dependency)) -> dict:
+        return {"buffers": app.buffer_sizes()}
+
+    @fastapi_app.get("/api/v1/management/memory/tracemalloc")
+    def tracemalloc_status(app: AdaptiveMindApplication = Depends(_app_dependency)) -> dict:
+        return app.memory.status()
+
+    @fastapi_app.post("/api/v1/management/memory/tracemalloc/start")
+    def start_tracemalloc(request: TracemallocStartRequest, app: AdaptiveMindApplication = Depends(_app_dependency)) -> dict:
+        return app.memory.start(request.frames)
+
+    @fastapi_app.post("/api/v1/management/memory/tracemalloc/stop")
+    def stop_tracemalloc(app: AdaptiveMindApplication = Depends(_app_dependency)) -> dict:
+        return app.memory.stop()
+
+    @fastapi_app.post("/api/v1/management/memory/snapshots")
+    def take_memory_snapshot(request: MemorySnapshotRequest, app: AdaptiveMindApplication = Depends(_app_dependency)) -> dict:
+        try:
+            return app.memory.take_snapshot(request.label)
+        except RuntimeError as e:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    @fastapi_app.get("/api/v1/management/memory/top")
+    def memory_top(
+        snapshot_id: int | None = None,
+        key_type: str = Query("lineno", pattern="^(lineno|filename|traceback)$"),
+        limit: int = Query(20, ge=1, le=500),
+        app: AdaptiveMindApplication = Depends(_app_dependency),
+    ) -> dict:
+        try:
+            return {"sites": app.memory.top(snapshot_id, key_type, limit)}
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        except RuntimeError as e:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    @fastapi_app.get("/api/v1/management/memory/diff")
+    def memory_diff(
+        base: int,
+        target: int | None = None,
+        key_type: str = Query("lineno", pattern="^(lineno|filename|traceback)$"),
+        limit: int = Query(20, ge=1, le=500),
+        app: AdaptiveMindApplication = Depends(_app_dependency),
+    ) -> dict:
+        try:
+            return {"sites": app.memory.diff(base, target, key_type, limit)}
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        except RuntimeError as e:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
     # OpenAI-compatible endpoints
     @fastapi_app.post("/v1/chat/completions")
     def openai_chat_completions(request: OpenAIChatRequest, app: AdaptiveMindApplication = Depends(_app_dependency)) -> OpenAIChatResponse:
@@ -630,21 +959,46 @@ _OLLAMA_UI_HTML = """
 """
 
 
-__all__ = ["build_app"]
+def create_app() -> FastAPI:
+    """Application factory for servers that import each worker's app by name.
+
+    ``uvicorn adaptivemind_core.server:create_app --factory --workers N``
+    builds one application per worker process from ``load_config()``; set
+    ``ADAPTIVEMIND_SHARED_STATE`` so the workers share runtime configuration
+    changes, metrics and traces.
+    """
+    from .config import load_config
+
+    return build_app(load_config())
+
+
+__all__ = ["build_app", "create_app"]
 
 if __name__ == "__main__":
     import os
+    import tempfile
+    from pathlib import Path
 
     import uvicorn
 
     port = int(os.getenv("ADAPTIVEMIND_PORT", 8000))
     # SECURITY FIX: Default to localhost for production safety
     host = os.getenv("ADAPTIVEMIND_HOST", "127.0.0.1")
+    workers = int(os.getenv("ADAPTIVEMIND_WORKERS", 1))
 
     # Initialize config
     from .config import load_config
     config = load_config()
 
-    app = build_app(config)
+    if workers > 1:
+        from .shared_state import reset_shared_state
+
+        # Worker processes load their own config; the environment points them at one fresh store
+        shared_path = config.shared_state.path or Path(tempfile.gettempdir()) / f"adaptivemind-{port}.sqlite3"
+        os.environ["ADAPTIVEMIND_SHARED_STATE"] = str(shared_path)
+        reset_shared_state(shared_path)
+        uvicorn.run("adaptivemind_core.server:create_app", factory=True, host=host, port=port, workers=workers)
+    else:
+        app = build_app(config)
 
-    uvicorn.run(app, host=host, port=port)
+        uvicorn.run(app, host=host, port=port)
@@ -0,0 +1,378 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+"""State shared between server worker processes through one SQLite database.
+
+Each worker keeps serving from its own in-memory configuration, metrics and
+traces; this store is what keeps them consistent:
+
+- Runtime configuration changes are written as a versioned document under an
+  immediate (write-locked) transaction, so concurrent changes from different
+  workers are serialised. Workers notice a newer version through SQLite's
+  ``data_version`` pragma, which changes only when another connection commits,
+  so checking it on every request costs a few microseconds.
+- A background thread per worker publishes its exported metrics and buffered
+  traces every ``publish_interval_s``; scrapes and trace queries read all
+  workers' rows.
+- A worker that stops, or whose process is gone and that has been silent
+  for ``stale_after_s``, has its counters and histograms folded into a
+  single retired-workers row and its own row deleted, so the rows a scrape
+  merges stay bounded by the live workers.
+
+The database runs in WAL mode so readers never block the publishing writers.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from .config import SharedStateConfig
+from .logger import get_logger
+from .monitoring.memory import register_buffer
+from .monitoring.metrics import combine_states
+from .monitoring.traces import TraceRecord
+
+logger = get_logger(__name__)
+
+# Row holding the summed counters and histograms of workers that are gone
+RETIRED_WORKER = "retired"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS config (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    version INTEGER NOT NULL,
+    document TEXT NOT NULL,
+    worker TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS workers (
+    worker TEXT PRIMARY KEY,
+    pid INTEGER NOT NULL,
+    started_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    metrics TEXT
+);
+CREATE TABLE IF NOT EXISTS traces (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    worker TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    persona TEXT NOT NULL,
+    backend TEXT,
+    latency_ms REAL NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS traces_by_time ON traces (timestamp, id);
+"""
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    connection = sqlite3.connect(str(path), timeout=10.0, isolation_level=None, check_same_thread=False)
+    connection.execute("PRAGMA busy_timeout = 10000")
+    connection.execute("PRAGMA journal_mode = WAL")
+    connection.execute("PRAGMA synchronous = NORMAL")
+    return connection
+
+
+def _process_running(pid: int) -> bool:
+    if os.name == "nt":
+        return True  # os.kill would terminate the process; rely on a clean shutdown retiring the row
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+def _fold(states: list[dict[str, Any]]) -> dict[str, Any]:
+    """Sum exported worker states into one, without gauges or in-flight requests."""
+    combined = combine_states({str(index): {**state, "gauges": []} for index, state in enumerate(states)})
+    return {
+        "totals": [[persona, backend, *values] for (persona, backend), values in combined["totals"].items()],  # type: ignore[attr-defined]
+        "gauges": [],
+        "in_flight": 0,
+        "histograms": [[*key, histogram.to_dict()] for key, histogram in combined["histograms"].items()],  # type: ignore[attr-defined]
+    }
+
+
+def reset_shared_state(path: Path) -> None:
+    """Delete a shared state database, so a new server starts from its configuration files."""
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{path}{suffix}").unlink(missing_ok=True)
+
+
+@dataclass
+class ConfigUpdate:
+    """The shared configuration as seen inside a write transaction."""
+
+    version: int
+    document: dict[str, Any] | None
+    published: int | None = None
+
+
+class SharedStateStore:
+    """One worker's connection to the shared state database.
+
+    Args:
+        config: Shared state settings; ``config.path`` must be set
+        metrics_source: Returns this worker's ``MetricsRegistry.export_state()``
+    """
+
+    def __init__(self, config: SharedStateConfig, metrics_source: Callable[[], dict[str, Any]]):
+        if config.path is None:
+            raise ValueError("shared state requires a database path")
+        self._config = config
+        self._metrics_source = metrics_source
+        self.worker_id = f"{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        config.path.parent.mkdir(parents=True, exist_ok=True)
+        # Request-path reads and config transactions use one connection, the publisher another
+        self._lock = threading.Lock()
+        self._connection = _connect(config.path)
+        self._publish_lock = threading.Lock()
+        self._publisher = _connect(config.path)
+        with self._publish_lock:
+            self._publisher.executescript(_SCHEMA)
+            now = time.time()
+            self._publisher.execute(
+                "INSERT OR REPLACE INTO workers (worker, pid, started_at, updated_at) VALUES (?, ?, ?, ?)",
+                (self.worker_id, os.getpid(), now, now),
+            )
+        self._data_version = self._read_data_version()
+        self._pending: deque[TraceRecord] = deque(maxlen=config.max_traces)
+        self._pending_lock = threading.Lock()
+        register_buffer("shared_state.pending_traces", self, lambda store: store._pending)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="shared-state-publisher", daemon=True)
+        self._thread.start()
+
+    # Configuration ------------------------------------------------------
+
+    def changed(self) -> bool:
+        """Whether another worker committed anything since the last call."""
+        with self._lock:
+            version = self._read_data_version()
+            changed, self._data_version = version != self._data_version, version
+        return changed
+
+    def read_config(self) -> tuple[int, dict[str, Any] | None]:
+        """Current configuration version and document; version 0 means never changed at runtime."""
+        with self._lock:
+            row = self._connection.execute("SELECT version, document FROM config WHERE id = 1").fetchone()
+        return (row[0], json.loads(row[1])) if row else (0, None)
+
+    @contextmanager
+    def config_transaction(self) -> Iterator[ConfigUpdate]:
+        """Hold the database write lock while a configuration change is made.
+
+        Yields the latest shared document; call ``publish`` with the changed
+        document before the block ends. An exception rolls the change back.
+        """
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._connection.execute("SELECT version, document FROM config WHERE id = 1").fetchone()
+                update = ConfigUpdate(version=row[0], document=json.loads(row[1])) if row else ConfigUpdate(0, None)
+                yield update
+                if update.published is not None:
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO config (id, version, document, worker, updated_at) VALUES (1, ?, ?, ?, ?)",
+                        (update.version + 1, json.dumps(update.document), self.worker_id, time.time()),
+                    )
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._data_version = self._read_data_version()
+
+    def publish(self, update: ConfigUpdate, document: dict[str, Any]) -> int:
+        """Record ``document`` as the next version in an open ``config_transaction``."""
+        update.document = document
+        update.published = update.version + 1
+        return update.published
+
+    # Metrics and traces ---------------------------------------------------
+
+    def append_trace(self, record: TraceRecord) -> None:
+        """Trace sink: buffer the record until the next publish; never blocks on the database."""
+        with self._pending_lock:
+            self._pending.append(record)
+
+    def publish_now(self) -> None:
+        """Write this worker's metrics and buffered traces immediately, and retire workers that are gone."""
+        self._publish(final=False)
+
+    def _publish(self, final: bool) -> None:
+        metrics = json.dumps(self._metrics_source())
+        with self._pending_lock:
+            records, self._pending = list(self._pending), deque(maxlen=self._config.max_traces)
+        with self._publish_lock:
+            self._publisher.execute("BEGIN IMMEDIATE")
+            try:
+                self._publisher.execute(
+                    "UPDATE workers SET updated_at = ?, metrics = ? WHERE worker = ?",
+                    (time.time(), metrics, self.worker_id),
+                )
+                if records:
+                    self._publisher.executemany(
+                        "INSERT INTO traces (worker, timestamp, persona, backend, latency_ms, record) VALUES (?, ?, ?, ?, ?, ?)",
+                        [
+                            (self.worker_id, r.timestamp, r.persona, r.backend, r.latency_ms, json.dumps(asdict(r)))
+                            for r in records
+                        ],
+                    )
+                    self._publisher.execute(
+                        "DELETE FROM traces WHERE id <= (SELECT MAX(id) FROM traces) - ?", (self._config.max_traces,)
+                    )
+                self._retire([self.worker_id] if final else self._departed_workers())
+                self._publisher.execute("COMMIT")
+            except BaseException:
+                self._publisher.execute("ROLLBACK")
+                raise
+
+    def worker_metrics(self) -> dict[str, dict[str, Any]]:
+        """Every worker's published metrics, with this worker's taken live.
+
+        Counters and histograms of workers that stopped still count through
+        the ``RETIRED_WORKER`` row, so totals never go backwards; gauges and
+        in-flight requests are dropped once a worker is ``stale_after_s`` old.
+        """
+        cutoff = time.time() - self._config.stale_after_s
+        with self._lock:
+            rows = self._connection.execute("SELECT worker, updated_at, metrics FROM workers").fetchall()
+        states: dict[str, dict[str, Any]] = {}
+        for worker, updated_at, metrics in rows:
+            if worker == self.worker_id or metrics is None:
+                continue
+            state = json.loads(metrics)
+            if updated_at < cutoff:
+                state["gauges"], state["in_flight"] = [], 0
+            states[worker] = state
+        states[self.worker_id] = self._metrics_source()
+        return states
+
+    def workers(self) -> list[dict[str, Any]]:
+        """Known workers, whether they published recently, oldest first."""
+        cutoff = time.time() - self._config.stale_after_s
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT worker, pid, started_at, updated_at FROM workers WHERE worker != ? ORDER BY started_at",
+                (RETIRED_WORKER,),
+            ).fetchall()
+        return [
+            {
+                "worker": worker,
+                "pid": pid,
+                "started_at": started_at,
+                "updated_at": updated_at,
+                "live": updated_at >= cutoff,
+                "current": worker == self.worker_id,
+            }
+            for worker, pid, started_at, updated_at in rows
+        ]
+
+    def query_traces(
+        self,
+        persona: str | None = None,
+        backend: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        min_latency_ms: float | None = None,
+        limit: int = 50,
+        cursor: int | None = None,
+    ) -> tuple[list[dict[str, Any]], int | None]:
+        """Traces from all workers, newest first, with the cursor for the next page.
+
+        Workers publish in batches, so rows are ordered by their timestamps;
+        the cursor is the row id of the last trace returned. This worker's buffered traces are published first so its own recent
+        requests are always visible; other workers' lag by at most one
+        publish interval.
+        """
+        self.publish_now()
+        clauses, params = [], []
+        for clause, value in (
+            ("persona = ?", persona),
+            ("backend = ?", backend),
+            ("timestamp >= ?", since),
+            ("timestamp <= ?", until),
+            ("latency_ms >= ?", min_latency_ms),
+            ("(timestamp, id) < (SELECT timestamp, id FROM traces WHERE id = ?)", cursor),
+        ):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        limit = max(1, limit)
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT id, record FROM traces {where} ORDER BY timestamp DESC, id DESC LIMIT ?", (*params, limit + 1)
+            ).fetchall()
+        next_cursor = rows[limit - 1][0] if len(rows) > limit else None
+        return [json.loads(record) for _, record in rows[:limit]], next_cursor
+
+    def close(self) -> None:
+        """Stop publishing after a final publish that folds the worker's counters into the retired row."""
+        self._stop.set()
+        self._thread.join(timeout=2)
+        try:
+            self._publish(final=True)
+        except sqlite3.Error:
+            logger.warning("Final shared state publish failed", exc_info=True)
+        with self._publish_lock:
+            self._publisher.close()
+        with self._lock:
+            self._connection.close()
+
+    def _departed_workers(self) -> list[str]:
+        """Workers silent for ``stale_after_s`` whose process has exited without retiring its row."""
+        rows = self._publisher.execute(
+            "SELECT worker, pid FROM workers WHERE updated_at < ? AND worker NOT IN (?, ?)",
+            (time.time() - self._config.stale_after_s, self.worker_id, RETIRED_WORKER),
+        ).fetchall()
+        return [worker for worker, pid in rows if not _process_running(pid)]
+
+    def _retire(self, workers: list[str]) -> None:
+        """Fold the workers' counters and histograms into the retired row and delete their rows; needs an open transaction."""
+        if not workers:
+            return
+        placeholders = ", ".join("?" * (len(workers) + 1))
+        rows = self._publisher.execute(
+            f"SELECT metrics FROM workers WHERE worker IN ({placeholders}) AND metrics IS NOT NULL", (RETIRED_WORKER, *workers)
+        ).fetchall()
+        now = time.time()
+        self._publisher.execute(
+            "INSERT OR REPLACE INTO workers (worker, pid, started_at, updated_at, metrics) VALUES (?, 0, ?, ?, ?)",
+            (RETIRED_WORKER, now, now, json.dumps(_fold([json.loads(metrics) for (metrics,) in rows]))),
+        )
+        self._publisher.executemany("DELETE FROM workers WHERE worker = ?", [(worker,) for worker in workers])
+
+    def _read_data_version(self) -> int:
+        return self._connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._config.publish_interval_s):
+            try:
+                self.publish_now()
+            except sqlite3.Error:
+                logger.warning("Shared state publish failed", exc_info=True)
+
+
+__all__ = ["RETIRED_WORKER", "ConfigUpdate", "SharedStateStore", "reset_shared_state"]
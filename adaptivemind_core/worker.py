@@ -0,0 +1,57 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+"""Standalone job worker: ``python -m adaptivemind_core.worker``.
+
+Runs jobs from the broker named by ``ADAPTIVEMIND_JOBS_BROKER`` (or
+``jobs.broker_url``) without serving HTTP. Start as many as needed on any
+node; API servers pointed at the same broker with ``jobs.run_workers``
+disabled only submit and report. SIGTERM or Ctrl+C hands claimed jobs that
+have not started back to the queue before exiting.
+"""
+
+from __future__ import annotations
+
+import signal
+import threading
+
+from .app import AdaptiveMindApplication
+from .config import load_config
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def run_worker(stop: threading.Event | None = None) -> None:
+    """Run jobs until ``stop`` is set or the process is asked to terminate.
+
+    Raises:
+        ValueError: If no broker is configured
+    """
+    config = load_config()
+    if not config.jobs.broker_url or config.jobs.broker_url.startswith("memory://"):
+        raise ValueError("a standalone worker needs a shared broker: set ADAPTIVEMIND_JOBS_BROKER to a redis:// URL")
+    config.jobs.run_workers = True
+    stop = stop or threading.Event()
+    if threading.current_thread() is threading.main_thread():
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: stop.set())
+    app = AdaptiveMindApplication(config)
+    logger.info("Job worker started", extra={"worker": app.jobs.stats()["worker_id"], "concurrency": config.jobs.workers})
+    try:
+        stop.wait()
+    finally:
+        app.shutdown()
+
+
+__all__ = ["run_worker"]
+
+if __name__ == "__main__":
+    run_worker()
@@ -0,0 +1,34 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+"""Microbenchmarks for the in-process hot paths.
+
+Run ``python -m benchmarks run -o results.json`` to record a result file and
+``python -m benchmarks compare baseline.json results.json`` to flag
+regressions. Benchmark modules are named ``bench_*.py`` and register their
+cases with ``harness.benchmark``.
+"""
+
+from __future__ import annotations
+
+import importlib
+import pkgutil
+
+from .harness import BENCHMARKS, benchmark
+
+
+def discover() -> None:
+    """Import every ``bench_*`` module so its benchmarks register themselves."""
+    for module in pkgutil.iter_modules(__path__):
+        if module.name.startswith("bench_"):
+            importlib.import_module(f"{__name__}.{module.name}")
+
+
+__all__ = ["BENCHMARKS", "benchmark", "discover"]
@@ -0,0 +1,437 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+"""Command-line entry point: ``python -m benchmarks {list,run,compare,simulate,load,jobs,startup,record,gate}``."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+from . import discover
+from .harness import BENCHMARKS, QUICK, RunOptions, load_results, run_benchmarks, save_results
+from .regression import BaselineStore, build_report, compare_results, extract_metrics, merge_metrics, render_table
+from .simulator import SimulatedModelServer, SimulationProfile
+from .startup import TARGET_MS, TARGETS
+
+SUITES = ("micro", "load", "startup")
+# Fixed simulator behaviour for recorded load baselines, so only the application changes between commits
+GATE_PROFILE = SimulationProfile(ttft_ms="lognormal:40,0.3", tokens_per_s=400.0, output_tokens=(16, 64), seed=1337)
+
+
+def _format_seconds(value: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if value >= scale:
+            return f"{value / scale:8.3f} {unit}"
+    return f"{value / 1e-9:8.1f} ns"
+
+
+def _print_result(name: str, result: Dict[str, Any]) -> None:
+    stats = result["stats"]
+    print(f"{name:<60} {_format_seconds(stats['median'])}  (iqr {_format_seconds(stats['iqr']).strip()}, n={result['number']})")
+
+
+def _run(args: argparse.Namespace) -> int:
+    options = QUICK if args.quick else RunOptions()
+    if args.repeat:
+        options = RunOptions(min_time=options.min_time, repeat=args.repeat, warmup=options.warmup)
+    results = run_benchmarks(args.filter, options, progress=_print_result)
+    if not results["benchmarks"]:
+        print("No benchmarks matched", file=sys.stderr)
+        return 1
+    if args.output:
+        save_results(results, args.output)
+        print(f"Results written to {args.output}")
+    if args.baseline:
+        return _report(load_results(args.baseline), results, args.threshold)
+    return 0
+
+
+def _report(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float,
+    alpha: float = 0.01,
+    min_effect: float = 0.05,
+    output: Optional[Path] = None,
+    as_json: bool = False,
+) -> int:
+    """Statistical comparison of two result files; exit status 1 when anything regressed."""
+    rows = compare_results(extract_metrics(baseline), extract_metrics(current), alpha, min_effect, threshold)
+    report = build_report(rows, _describe(baseline), _describe(current), alpha, min_effect)
+    return _emit(report, output, as_json)
+
+
+def _describe(result: Dict[str, Any]) -> Dict[str, Any]:
+    meta = result.get("meta", {})
+    return {"commit": meta.get("commit", ""), "fingerprint": meta.get("fingerprint", "")}
+
+
+def _emit(report: Dict[str, Any], output: Optional[Path], as_json: bool) -> int:
+    if report["baseline"].get("fingerprint") != report["current"].get("fingerprint"):
+        print("warning: baseline and current results come from different machines", file=sys.stderr)
+    print(json.dumps(report, indent=2) if as_json else render_table(report))
+    if output:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2, sort_keys=True), encoding="utf-8")
+    return 1 if report["regressions"] else 0
+
+
+def _git(*args: str) -> str:
+    try:
+        completed = subprocess.run(["git", *args], capture_output=True, text=True, timeout=10, check=False)
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    return completed.stdout.strip() if completed.returncode == 0 else ""
+
+
+def _current_commit() -> str:
+    commit = _git("rev-parse", "--short", "HEAD")
+    if commit and _git("status", "--porcelain", "--untracked-files=no"):
+        commit += "-dirty"  # never let uncommitted changes pose as the commit's baseline
+    return commit
+
+
+def _run_suites(suites: Sequence[str], quick: bool, filters: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+    results: Dict[str, Dict[str, Any]] = {}
+    if "micro" in suites:
+        print("Running microbenchmarks...", file=sys.stderr)
+        # Enough repeats per case for a rank test; QUICK's three are not
+        options = RunOptions(min_time=QUICK.min_time, repeat=8) if quick else RunOptions(repeat=15)
+        results["micro"] = run_benchmarks(list(filters), options)
+    if "load" in suites:
+        from .loadgen import run_load
+
+        print("Running load sweep...", file=sys.stderr)
+        results["load"] = run_load(mode="closed", levels=(1, 8), duration_s=1.5 if quick else 5.0, profile=GATE_PROFILE)
+    if "startup" in suites:
+        from .startup import measure_startup
+
+        print("Measuring startup...", file=sys.stderr)
+        results["startup"] = measure_startup(repeat=5 if quick else 15, imports=False)
+    return results
+
+
+def _record(args: argparse.Namespace) -> int:
+    commit = args.commit or _current_commit()
+    if not commit:
+        print("Cannot determine the git commit; pass --commit", file=sys.stderr)
+        return 1
+    store = BaselineStore(args.store)
+    for suite, result in _run_suites(args.suite, args.quick, args.filter).items():
+        print(f"Stored {suite} results for {commit} at {store.save(suite, commit, result)}")
+    return 0
+
+
+def _gate(args: argparse.Namespace) -> int:
+    store = BaselineStore(args.store)
+    current_commit = args.current or _current_commit()
+    if args.baseline:
+        baseline_commit = _git("rev-parse", "--short", args.baseline) or args.baseline
+    else:
+        earlier = [commit for commit in store.commits() if commit != current_commit]
+        baseline_commit = earlier[-1] if earlier else ""
+    baseline = merge_metrics(store.metrics(baseline_commit, suite) for suite in args.suite) if baseline_commit else {}
+    if not baseline:
+        print(
+            f"No stored baseline for {baseline_commit or 'any other commit'} on machine {store.fingerprint}; "
+            "run `python -m benchmarks record` there first",
+            file=sys.stderr,
+        )
+        return 2
+    if args.current:
+        current = merge_metrics(store.metrics(args.current, suite) for suite in args.suite)
+    else:
+        results = _run_suites(args.suite, args.quick, args.filter)
+        if args.save and current_commit:
+            for suite, result in results.items():
+                store.save(suite, current_commit, result)
+        current = merge_metrics(extract_metrics(result) for result in results.values())
+    rows = compare_results(baseline, current, args.alpha, args.min_effect, args.threshold)
+    report = build_report(
+        rows,
+        {"commit": baseline_commit, "fingerprint": store.fingerprint},
+        {"commit": current_commit, "fingerprint": store.fingerprint},
+        args.alpha,
+        args.min_effect,
+    )
+    return _emit(report, args.output, args.json)
+
+
+def _profile(args: argparse.Namespace) -> SimulationProfile:
+    low, _, high = args.output_tokens.partition(",")
+    return SimulationProfile(
+        ttft_ms=args.ttft,
+        tokens_per_s=args.tokens_per_s,
+        output_tokens=(int(low), int(high or low)),
+        chunk_tokens=args.chunk_tokens,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+    )
+
+
+def _simulate(args: argparse.Namespace) -> int:
+    server = SimulatedModelServer(_profile(args), host=args.host, port=args.port)
+    print(f"Simulated model server on {server.url} (Ollama: {server.url}, OpenAI: {server.url}/v1)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _print_load(report: Dict[str, Any]) -> None:
+    unit = "workers" if report["mode"] == "closed" else "req/s"
+    print(f"{unit:>8} {'reqs':>6} {'err%':>6} {'rps':>8} {'tok/s':>9} {'ttft p50':>9} {'ttft p99':>9} {'p50 ms':>9} {'p99 ms':>9}")
+    for run in report["runs"]:
+        ttft = run["ttft_ms"] or {"p50": float("nan"), "p99": float("nan")}
+        print(
+            f"{run['level']:>8} {run['requests']:>6} {run['error_rate']:>6.1%} {run['throughput_rps']:>8.2f} "
+            f"{run['tokens_per_s']:>9.1f} {ttft['p50']:>9.1f} {ttft['p99']:>9.1f} "
+            f"{run['latency_ms']['p50']:>9.1f} {run['latency_ms']['p99']:>9.1f}"
+        )
+
+
+def _load(args: argparse.Namespace) -> int:
+    from .loadgen import run_load
+
+    try:
+        levels = [float(value) if args.mode == "open" else int(value) for value in args.levels.split(",")]
+    except ValueError:
+        print("--levels must be a comma-separated list of numbers", file=sys.stderr)
+        return 1
+    report = run_load(
+        mode=args.mode,
+        levels=levels,
+        duration_s=args.duration,
+        profile=_profile(args),
+        backend=args.backend,
+        stream=not args.no_stream,
+        url=args.url,
+        api_key=args.api_key,
+        max_tokens=args.max_tokens,
+        cassette=args.cassette,
+        timing_scale=args.timing_scale,
+    )
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_load(report)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2, sort_keys=True), encoding="utf-8")
+        print(f"Report written to {args.output}", file=sys.stderr if args.json else sys.stdout)
+    return 0
+
+
+def _print_jobs(report: Dict[str, Any]) -> None:
+    print(f"{'workers':>8} {'jobs':>6} {'jobs/s':>9} {'ideal':>9} {'efficiency':>11} {'wait p50':>9} {'redelivered':>12}")
+    for run in report["runs"]:
+        print(
+            f"{run['workers']:>8} {run['completed']:>6} {run['throughput_jps']:>9.1f} {run['ideal_jps']:>9.1f} "
+            f"{run['efficiency']:>11.2f} {run['queue_wait_ms']['p50']:>9.1f} {run['redelivered']:>12}"
+        )
+
+
+def _jobs(args: argparse.Namespace) -> int:
+    from .jobload import run_job_load
+
+    try:
+        counts = [int(value) for value in args.workers.split(",")]
+    except ValueError:
+        print("--workers must be a comma-separated list of integers", file=sys.stderr)
+        return 1
+    report = run_job_load(
+        worker_counts=counts,
+        jobs_per_worker=args.jobs_per_worker,
+        job_ms=args.job_ms,
+        concurrency=args.concurrency,
+        prefetch=args.prefetch,
+        broker_url=args.broker,
+    )
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_jobs(report)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2, sort_keys=True), encoding="utf-8")
+    return 0
+
+
+def _print_startup(report: Dict[str, Any]) -> None:
+    print(f"{'target':<8} {'ready p50':>10} {'import p50':>11} {'build p50':>10} {'modules':>8}  heavy modules loaded")
+    for target, result in report["targets"].items():
+        print(
+            f"{target:<8} {result['ready_ms']['p50']:>8.1f}ms {result['import_ms']['p50']:>9.1f}ms "
+            f"{result['construct_ms']['p50']:>8.1f}ms {result['modules']:>8}  {', '.join(result['loaded']) or '-'}"
+        )
+    if report.get("slowest_imports"):
+        print("\nslowest imports (self time):")
+        for row in report["slowest_imports"]:
+            print(f"  {row['self_ms']:>8.1f}ms  {row['module']}")
+
+
+def _startup(args: argparse.Namespace) -> int:
+    from .startup import measure_startup
+
+    report = measure_startup(repeat=args.repeat, targets=args.target, target_ms=args.target_ms)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_startup(report)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2, sort_keys=True), encoding="utf-8")
+    app = report["targets"].get("app")
+    if args.check and app is not None and not app["within_target"]:
+        print(f"app startup p50 {app['ready_ms']['p50']:.1f}ms exceeds the {args.target_ms:.0f}ms target", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group("simulated model")
+    group.add_argument("--ttft", default="lognormal:80,0.4", help="Time-to-first-token spec in ms: fixed:N, uniform:A,B, lognormal:MEDIAN,SIGMA, exponential:MEAN")
+    group.add_argument("--tokens-per-s", type=float, default=40.0, help="Generation rate after the first token (0 = instant)")
+    group.add_argument("--output-tokens", default="32,128", help="Completion length range LOW,HIGH")
+    group.add_argument("--chunk-tokens", type=int, default=1, help="Tokens per streamed chunk")
+    group.add_argument("--error-rate", type=float, default=0.0, help="Share of requests that fail")
+    group.add_argument("--error-status", type=int, default=500, help="HTTP status of simulated failures")
+    group.add_argument("--seed", type=int, help="Seed for reproducible latency, length and failure draws")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="AdaptiveMind microbenchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("list", help="List registered benchmark cases")
+
+    run = subparsers.add_parser("run", help="Run benchmarks")
+    run.add_argument("filter", nargs="*", help="Only run benchmarks whose name contains one of these strings")
+    run.add_argument("-o", "--output", type=Path, help="Write results to this JSON file")
+    run.add_argument("--quick", action="store_true", help="Fewer, shorter repeats for a fast signal")
+    run.add_argument("--repeat", type=int, help="Override the number of repeats")
+    run.add_argument("--baseline", type=Path, help="Compare against this result file after running")
+    run.add_argument("--threshold", type=float, default=0.10, help="Allowed slowdown for metrics too small to test (default: 0.10)")
+    run.add_argument("--with-logging", action="store_true", help="Keep INFO logging on (off by default so output I/O is not timed)")
+
+    comparison = subparsers.add_parser("compare", help="Compare two result files")
+    comparison.add_argument("baseline", type=Path)
+    comparison.add_argument("current", type=Path)
+    _add_comparison_arguments(comparison)
+
+    simulate = subparsers.add_parser("simulate", help="Serve a simulated Ollama/OpenAI model until interrupted")
+    simulate.add_argument("--host", default="127.0.0.1")
+    simulate.add_argument("--port", type=int, default=11434)
+    _add_profile_arguments(simulate)
+
+    load = subparsers.add_parser("load", help="Sweep concurrency or arrival rate against the chat API")
+    load.add_argument("--mode", choices=("closed", "open"), default="closed", help="closed: fixed workers; open: Poisson arrivals")
+    load.add_argument("--levels", default="1,4,16", help="Workers (closed) or requests per second (open), comma-separated")
+    load.add_argument("--duration", type=float, default=10.0, help="Seconds per level")
+    load.add_argument("--backend", choices=("ollama", "openrouter"), default="ollama", help="Protocol the in-process app uses to reach the simulator")
+    load.add_argument("--no-stream", action="store_true", help="Use /api/v1/chat instead of the streaming endpoint (no TTFT)")
+    load.add_argument("--max-tokens", type=int, default=128)
+    load.add_argument("--url", help="Measure a running server instead of an in-process app and simulator")
+    load.add_argument("--api-key", help="X-API-Key for --url targets")
+    load.add_argument("--cassette", help="Replay this recorded cassette instead of the simulator, using its requests as the workload")
+    load.add_argument("--timing-scale", type=float, default=1.0, help="Multiplier for replayed cassette delays (0 = instant)")
+    load.add_argument("-o", "--output", type=Path, help="Write the JSON report to this file")
+    load.add_argument("--json", action="store_true", help="Print the JSON report instead of a table")
+    load.add_argument("--with-logging", action="store_true", help="Keep application logging on (off by default)")
+    _add_profile_arguments(load)
+
+    jobs = subparsers.add_parser("jobs", help="Measure job throughput as distributed workers are added")
+    jobs.add_argument("--workers", default="1,2,4,8", help="Worker counts to sweep, comma-separated")
+    jobs.add_argument("--jobs-per-worker", type=int, default=50, help="Backlog size per worker")
+    jobs.add_argument("--job-ms", type=float, default=20.0, help="Duration of each simulated job")
+    jobs.add_argument("--concurrency", type=int, default=1, help="Jobs each worker runs at once")
+    jobs.add_argument("--prefetch", type=int, default=2, help="Jobs a busy worker may claim ahead")
+    jobs.add_argument("--broker", help="redis:// URL to measure instead of the in-memory stand-in")
+    jobs.add_argument("-o", "--output", type=Path, help="Write the JSON report to this file")
+    jobs.add_argument("--json", action="store_true", help="Print the JSON report instead of a table")
+
+    startup = subparsers.add_parser("startup", help="Measure cold start from a fresh interpreter to a ready application")
+    startup.add_argument("--repeat", type=int, default=10, help="Fresh processes per target (default: 10)")
+    startup.add_argument("--target", nargs="+", choices=TARGETS, default=list(TARGETS), help="app: AdaptiveMindApplication; server: build_app()")
+    startup.add_argument("--target-ms", type=float, default=TARGET_MS, help=f"Startup budget for the app target (default: {TARGET_MS:.0f})")
+    startup.add_argument("--check", action="store_true", help="Exit 1 when the app target's median exceeds the budget")
+    startup.add_argument("-o", "--output", type=Path, help="Write the JSON report to this file")
+    startup.add_argument("--json", action="store_true", help="Print the JSON report instead of a table")
+
+    record = subparsers.add_parser("record", help="Run suites and store the results as this commit's baseline")
+    record.add_argument("filter", nargs="*", help="Only run microbenchmarks whose name contains one of these strings")
+    record.add_argument("--commit", help="Record under this commit instead of the checked-out one")
+    _add_store_arguments(record)
+
+    gate = subparsers.add_parser("gate", help="Compare against a stored baseline; exit 1 on regressions")
+    gate.add_argument("filter", nargs="*", help="Only run microbenchmarks whose name contains one of these strings")
+    gate.add_argument("--baseline", help="Git revision of the baseline (default: latest other recorded commit)")
+    gate.add_argument("--current", help="Compare this recorded commit instead of running the suites")
+    gate.add_argument("--save", action="store_true", help="Also store the fresh results under the current commit")
+    _add_store_arguments(gate)
+    _add_comparison_arguments(gate)
+    return parser
+
+
+def _add_store_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--store", type=Path, default=Path(".benchmarks"), help="Baseline directory (default: .benchmarks)")
+    parser.add_argument("--suite", nargs="+", choices=SUITES, default=list(SUITES), help="Suites to run (default: all)")
+    parser.add_argument("--quick", action="store_true", help="Shorter runs for a fast signal")
+
+
+def _add_comparison_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--alpha", type=float, default=0.01, help="Significance level of the Mann-Whitney test (default: 0.01)")
+    parser.add_argument("--min-effect", type=float, default=0.05, help="Smallest median change worth reporting (default: 0.05)")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed change for metrics too small to test (default: 0.10)")
+    parser.add_argument("-o", "--output", type=Path, help="Write the JSON report to this file")
+    parser.add_argument("--json", action="store_true", help="Print the JSON report instead of a table")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    discover()
+    if args.command == "list":
+        for bench in BENCHMARKS.values():
+            for case_name, _ in bench.cases():
+                print(case_name)
+        return 0
+    if args.command == "run":
+        if not args.with_logging:
+            logging.disable(logging.INFO)
+        return _run(args)
+    if args.command == "simulate":
+        return _simulate(args)
+    if args.command == "startup":
+        return _startup(args)
+    if args.command == "jobs":
+        return _jobs(args)
+    if args.command in ("record", "gate"):
+        logging.disable(logging.ERROR)
+        return _record(args) if args.command == "record" else _gate(args)
+    if args.command == "load":
+        if not args.with_logging:
+            # Simulated failures would otherwise log one traceback each
+            logging.disable(logging.ERROR)
+        return _load(args)
+    return _report(
+        load_results(args.baseline), load_results(args.current), args.threshold, args.alpha, args.min_effect, args.output, args.json
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
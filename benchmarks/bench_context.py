@@ -0,0 +1,67 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+"""Context building and routing hot paths."""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+from pathlib import Path
+
+from adaptivemind_core.config import ContextPipelineConfig
+from adaptivemind_core.context.engine import ContextEngine
+from adaptivemind_core.monitoring.metrics import MetricsRegistry, TraceCollector
+from adaptivemind_core.routing.router import AdaptiveLLMRouter
+
+from .fixtures import ZeroLatencyBackend, app_config, conversation, rng, sentence, write_documents
+from .harness import benchmark
+
+
+@benchmark("context.build", history=[4, 40, 400], documents=[0, 5])
+def context_build(history: int, documents: int):
+    directory = Path(tempfile.mkdtemp(prefix="bench-docs-"))
+    try:
+        if documents:
+            write_documents(directory, documents)
+        config = app_config(context_pipeline=ContextPipelineConfig(extra_documents_dir=directory if documents else None))
+        engine = ContextEngine(config)
+        persona = config.personas["generalist"]
+        messages = conversation(history)
+        research = [sentence(rng(7), 60)]
+        yield lambda: engine.build(persona, messages, research)
+        engine.shutdown()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+@benchmark("router.generate", history=[4, 40])
+def router_generate(history: int):
+    config = app_config()
+    engine = ContextEngine(config)
+    router = AdaptiveLLMRouter(config, engine, [ZeroLatencyBackend()], MetricsRegistry(), TraceCollector())
+    messages = conversation(history)
+    yield lambda: router.generate("analyst", messages)
+    engine.shutdown()
+
+
+@benchmark("router.stream", tokens=[32, 256])
+def router_stream(tokens: int):
+    config = app_config()
+    engine = ContextEngine(config)
+    router = AdaptiveLLMRouter(config, engine, [ZeroLatencyBackend(tokens)], MetricsRegistry(), TraceCollector())
+    messages = conversation(4)
+
+    def run() -> None:
+        for _ in router.stream("analyst", messages):
+            pass
+
+    yield run
+    engine.shutdown()
@@ -0,0 +1,93 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+"""Metrics, trace store and logging hot paths."""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from adaptivemind_core.logger import JsonFormatter
+from adaptivemind_core.monitoring.metrics import MetricsRegistry
+from adaptivemind_core.monitoring.traces import TraceCollector
+
+from .fixtures import BACKENDS, PERSONAS, trace_records
+from .harness import benchmark
+
+_RECORDS_PER_TASK = 200
+
+
+@benchmark("metrics.record_request", threads=[1, 4, 8])
+def metrics_record_request(threads: int):
+    """One call = ``threads`` workers each recording 200 requests concurrently."""
+    registry = MetricsRegistry()
+    executor = ThreadPoolExecutor(max_workers=threads)
+
+    def record_batch(offset: int) -> None:
+        for index in range(_RECORDS_PER_TASK):
+            registry.record_request(
+                persona=PERSONAS[(offset + index) % len(PERSONAS)],
+                latency_ms=float(index % 250) + 0.5,
+                generated_tokens=64,
+                context_tokens=512,
+                backend=BACKENDS[index % len(BACKENDS)],
+                phases={"context_build": 1.5},
+            )
+
+    yield lambda: wait([executor.submit(record_batch, worker) for worker in range(threads)])
+    executor.shutdown()
+
+
+@benchmark("metrics.harvest", requests=[100, 1000])
+def metrics_harvest(requests: int):
+    registry = MetricsRegistry()
+
+    def run() -> None:
+        for index in range(requests):
+            registry.record_request(PERSONAS[index % 4], float(index % 300), 32, 256, backend=BACKENDS[index % 3])
+        registry.harvest()
+
+    return run
+
+
+@benchmark("traces.add")
+def traces_add():
+    collector = TraceCollector(max_records=5000)
+    records = trace_records(1000)
+
+    def run() -> None:
+        for record in records:
+            collector.add(record)
+
+    return run
+
+
+@benchmark("traces.query", kind=["latest", "persona", "backend_since", "slow"])
+def traces_query(kind: str):
+    collector = TraceCollector(max_records=5000)
+    for record in trace_records(5000):
+        collector.add(record)
+    queries = {
+        "latest": lambda: collector.latest(50),
+        "persona": lambda: collector.query(persona="analyst", limit=50),
+        "backend_since": lambda: collector.query(backend="ollama", since=1_700_002_500.0, limit=100),
+        "slow": lambda: collector.query(min_latency_ms=250.0, limit=50),
+    }
+    return queries[kind]
+
+
+@benchmark("logging.json_format", extras=[0, 8])
+def logging_json_format(extras: int):
+    formatter = JsonFormatter()
+    record = logging.LogRecord("adaptivemind_core.routing.router", logging.INFO, __file__, 1, "Generation completed", (), None)
+    for index in range(extras):
+        setattr(record, f"field_{index}", index * 1.5)
+    return lambda: formatter.format(record)
@@ -0,0 +1,36 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+"""Orchestration scoring helpers."""
+
+from __future__ import annotations
+
+from adaptivemind.scoring.vickrey_auction import Candidate, run_vickrey_auction
+
+from .fixtures import rng, sentence
+from .harness import benchmark
+
+
+@benchmark("scoring.vickrey_auction", candidates=[3, 30, 300])
+def vickrey_auction(candidates: int):
+    generator = rng(300)
+    pool = [Candidate(agent=f"specialist-{index}", bid=generator.random(), content=sentence(generator, 20)) for index in range(candidates)]
+    return lambda: run_vickrey_auction(pool)
+
+
+@benchmark("scoring.overall_confidence", results=[2, 20])
+def overall_confidence(results: int):
+    from adaptivemind.orchestration.orchestrator import MultiAgentOrchestrator
+
+    generator = rng(301)
+    specialist_results = [{"confidence": generator.random(), "specialist": f"s{index}"} for index in range(results)]
+    # The helper does not touch instance state, so it is timed without building an orchestrator
+    helper = MultiAgentOrchestrator._calculate_overall_confidence
+    return lambda: helper(None, specialist_results)
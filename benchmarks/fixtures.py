@@ -0,0 +1,125 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+"""Deterministic inputs shared by the benchmarks.
+
+Everything derives from a seeded ``random.Random`` so runs on different
+machines and commits time identical work.
+"""
+
+from __future__ import annotations
+
+import random
+import uuid
+from collections.abc import Iterator
+from pathlib import Path
+from typing import List, Sequence
+
+from adaptivemind_core.config import AppConfig, MonitoringConfig, PersonaConfig
+from adaptivemind_core.llm.base import GenerationChunk, GenerationRequest, GenerationResponse
+from adaptivemind_core.monitoring.traces import TraceRecord
+
+SEED = 1337
+
+_VOCABULARY = (
+    "context router latency persona backend token cache session trace metric stream model "
+    "prompt summary budget window stage request response vector index query signal worker "
+    "queue harvest profile memory compaction compression template document retrieval"
+).split()
+
+PERSONAS = ("generalist", "analyst", "coder", "researcher")
+BACKENDS = ("ollama", "openrouter", "contextual-fallback")
+
+
+def rng(offset: int = 0) -> random.Random:
+    return random.Random(SEED + offset)
+
+
+def sentence(generator: random.Random, words: int) -> str:
+    return " ".join(generator.choice(_VOCABULARY) for _ in range(words))
+
+
+def conversation(turns: int, words_per_turn: int = 24, seed: int = 0) -> List[dict]:
+    generator = rng(seed)
+    return [
+        {"role": "user" if index % 2 == 0 else "assistant", "content": sentence(generator, words_per_turn)}
+        for index in range(turns)
+    ]
+
+
+def write_documents(directory: Path, count: int, words: int = 400) -> Path:
+    generator = rng(100)
+    directory.mkdir(parents=True, exist_ok=True)
+    for index in range(count):
+        (directory / f"doc_{index:03d}.txt").write_text(sentence(generator, words), encoding="utf-8")
+    return directory
+
+
+def app_config(personas: Sequence[str] = PERSONAS, **overrides) -> AppConfig:
+    """Config with the given (by default the benchmark) personas enabled and background harvesting off."""
+    configured = {
+        name: PersonaConfig(name=name, description=name, system_prompt=f"You are the {name}. Be precise.", max_context_window=4096)
+        for name in personas
+    }
+    overrides.setdefault("monitoring", MonitoringConfig(enable_metrics_harvest=False))
+    return AppConfig(personas=configured, allowed_personas=list(personas), **overrides)
+
+
+def trace_records(count: int, seed: int = 0) -> List[TraceRecord]:
+    generator = rng(200 + seed)
+    return [
+        TraceRecord(
+            trace_id=str(uuid.UUID(int=generator.getrandbits(128))),
+            span_id=f"{generator.getrandbits(64):016x}",
+            persona=generator.choice(PERSONAS),
+            objective="chat",
+            latency_ms=generator.lognormvariate(4.0, 0.8),
+            token_usage=generator.randint(10, 800),
+            context_size=generator.randint(100, 4000),
+            timestamp=1_700_000_000.0 + index,
+            backend=generator.choice(BACKENDS),
+            extra={"stage.persona.status": "ok", "stage.conversation.ms": f"{generator.random():.3f}"},
+        )
+        for index in range(count)
+    ]
+
+
+class ZeroLatencyBackend:
+    """Backend that answers immediately, so router overhead is all that is measured."""
+
+    name = "zero-latency"
+
+    def __init__(self, tokens: int = 32):
+        self._content = " ".join(["token"] * tokens)
+        self._tokens = tokens
+
+    def is_available(self) -> bool:
+        return True
+
+    def generate(self, request: GenerationRequest) -> GenerationResponse:
+        return GenerationResponse(content=self._content, tokens=self._tokens, backend=self.name)
+
+    def stream(self, request: GenerationRequest) -> Iterator[GenerationChunk]:
+        for index in range(1, self._tokens + 1):
+            yield GenerationChunk(content="token ", tokens=index, backend=self.name, finished=index == self._tokens)
+
+
+__all__ = [
+    "BACKENDS",
+    "PERSONAS",
+    "SEED",
+    "ZeroLatencyBackend",
+    "app_config",
+    "conversation",
+    "rng",
+    "sentence",
+    "trace_records",
+    "write_documents",
+]
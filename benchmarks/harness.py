@@ -0,0 +1,236 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+"""Benchmark registry, timing loop and JSON result files.
+
+A benchmark is a factory registered with ``@benchmark``. It receives one
+combination of its parameters, does its setup, and returns (or yields,
+when teardown is needed) the zero-argument callable to time. Timing follows
+``timeit``: the loop count is calibrated so that one repeat lasts at least
+``min_time`` seconds, garbage collection is paused while timing, and each
+repeat contributes one per-call sample.
+"""
+
+from __future__ import annotations
+
+import gc
+import itertools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .regression import machine_fingerprint
+
+RESULT_FORMAT_VERSION = 1
+
+
+@dataclass
+class Benchmark:
+    name: str
+    factory: Callable[..., Any]
+    params: Dict[str, List[Any]] = field(default_factory=dict)
+
+    def cases(self) -> Iterator[tuple[str, Dict[str, Any]]]:
+        if not self.params:
+            yield self.name, {}
+            return
+        keys = list(self.params)
+        for values in itertools.product(*(self.params[key] for key in keys)):
+            combination = dict(zip(keys, values))
+            label = ",".join(f"{key}={value}" for key, value in combination.items())
+            yield f"{self.name}[{label}]", combination
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, **params: List[Any]) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Register a benchmark factory; keyword arguments list the parameter values to sweep."""
+
+    def decorator(factory: Callable[..., Any]) -> Callable[..., Any]:
+        if name in BENCHMARKS:
+            raise ValueError(f"Duplicate benchmark name {name!r}")
+        BENCHMARKS[name] = Benchmark(name, factory, {key: list(values) for key, values in params.items()})
+        return factory
+
+    return decorator
+
+
+@dataclass
+class RunOptions:
+    min_time: float = 0.05
+    repeat: int = 7
+    warmup: int = 1
+    max_number: int = 1_000_000
+
+
+QUICK = RunOptions(min_time=0.01, repeat=3, warmup=1)
+SMOKE = RunOptions(min_time=0.0, repeat=1, warmup=0, max_number=1)
+
+
+def _calibrate(func: Callable[[], Any], options: RunOptions) -> int:
+    number = 1
+    while number < options.max_number:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - start >= options.min_time:
+            break
+        number *= 2
+    return min(number, options.max_number)
+
+
+def _time(func: Callable[[], Any], number: int) -> float:
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        return (time.perf_counter() - start) / number
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    quartiles = statistics.quantiles(ordered, n=4) if len(ordered) > 1 else [ordered[0]] * 3
+    return {
+        "min": ordered[0],
+        "median": statistics.median(ordered),
+        "mean": statistics.fmean(ordered),
+        "stdev": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        "iqr": quartiles[2] - quartiles[0],
+        "max": ordered[-1],
+    }
+
+
+def run_case(factory: Callable[..., Any], params: Dict[str, Any], options: RunOptions) -> Dict[str, Any]:
+    prepared = factory(**params)
+    teardown: Optional[Iterator[Any]] = None
+    if hasattr(prepared, "__next__"):
+        teardown = prepared
+        func = next(prepared)
+    else:
+        func = prepared
+    try:
+        for _ in range(options.warmup):
+            func()
+        number = _calibrate(func, options)
+        samples = [_time(func, number) for _ in range(options.repeat)]
+    finally:
+        if teardown is not None:
+            next(teardown, None)
+    return {"params": params, "unit": "seconds", "number": number, "samples": samples, "stats": summarize(samples)}
+
+
+def run_benchmarks(
+    selected: Optional[List[str]] = None,
+    options: Optional[RunOptions] = None,
+    progress: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """Run registered benchmarks whose name contains any of ``selected`` (all when empty)."""
+    options = options or RunOptions()
+    results: Dict[str, Any] = {}
+    for bench in BENCHMARKS.values():
+        if selected and not any(pattern in bench.name for pattern in selected):
+            continue
+        for case_name, params in bench.cases():
+            result = run_case(bench.factory, params, options)
+            results[case_name] = result
+            if progress is not None:
+                progress(case_name, result)
+    return {"version": RESULT_FORMAT_VERSION, "meta": environment(options), "benchmarks": results}
+
+
+def environment(options: RunOptions) -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5, check=False
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ""
+    fingerprint, _ = machine_fingerprint()
+    return {
+        "timestamp": time.time(),
+        "commit": commit,
+        "fingerprint": fingerprint,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "options": {"min_time": options.min_time, "repeat": options.repeat, "warmup": options.warmup},
+    }
+
+
+def save_results(results: Dict[str, Any], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if data.get("version") != RESULT_FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported result format {data.get('version')!r}")
+    return data
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline: float
+    current: float
+    ratio: float
+    regressed: bool
+    improved: bool
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.10) -> List[Comparison]:
+    """Compare median times of benchmarks present in both result sets.
+
+    A benchmark regresses when its median grows by more than ``threshold``
+    (0.10 = 10%), and improves when it shrinks by more than the same margin.
+    """
+    rows: List[Comparison] = []
+    for name, result in sorted(current["benchmarks"].items()):
+        reference = baseline["benchmarks"].get(name)
+        if reference is None:
+            continue
+        before = reference["stats"]["median"]
+        after = result["stats"]["median"]
+        ratio = after / before if before > 0 else float("inf")
+        rows.append(Comparison(name, before, after, ratio, ratio > 1.0 + threshold, ratio < 1.0 / (1.0 + threshold)))
+    return rows
+
+
+__all__ = [
+    "BENCHMARKS",
+    "Benchmark",
+    "Comparison",
+    "QUICK",
+    "RunOptions",
+    "SMOKE",
+    "benchmark",
+    "compare",
+    "load_results",
+    "run_benchmarks",
+    "run_case",
+    "save_results",
+    "summarize",
+]
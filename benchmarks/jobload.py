@@ -0,0 +1,124 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+"""Throughput of distributed job workers as the number of workers grows.
+
+For each worker count, a producer fills a fresh broker with a backlog of
+jobs and that many ``RedisJobQueue`` workers drain it. Each job sleeps for
+``job_ms``, standing in for a model call that waits on a backend, so the
+measurement is the queue's overhead and how evenly it spreads work, not
+Python's compute throughput. ``efficiency`` is the throughput divided by
+the one-worker throughput times the worker count: 1.0 is perfectly linear
+scaling. Workers share one ``InMemoryRedis`` unless ``broker_url`` names a
+real Redis server, in which case every run uses its own queue name.
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Sequence
+
+from adaptivemind_core.config import JobsConfig
+from adaptivemind_core.inmemory_redis import InMemoryRedis
+from adaptivemind_core.job_broker import RedisJobQueue, connect
+from adaptivemind_core.monitoring.histogram import LatencyHistogram
+from adaptivemind_core.monitoring.metrics import MetricsRegistry
+
+from .harness import RunOptions, environment
+
+JOB_LOAD_FORMAT_VERSION = 1
+
+
+def _drain(
+    worker_count: int,
+    jobs: int,
+    job_ms: float,
+    concurrency: int,
+    prefetch: int,
+    broker_url: Optional[str],
+    timeout_s: float,
+) -> Dict[str, Any]:
+    client = connect(broker_url) if broker_url else InMemoryRedis()
+    config = JobsConfig(
+        broker_url=broker_url or "memory://",
+        queue_name=f"bench:{uuid.uuid4().hex[:8]}",
+        workers=concurrency,
+        prefetch=prefetch,
+        max_queued=jobs,
+        poll_interval_s=0.01,
+        heartbeat_interval_s=0.2,
+    )
+
+    def handler(payload: Dict[str, Any], context: Any) -> Dict[str, Any]:
+        time.sleep(job_ms / 1000)
+        return {"n": payload["n"]}
+
+    producer = RedisJobQueue(config.model_copy(update={"run_workers": False}), MetricsRegistry(), {"sleep": handler}, client=client)
+    for index in range(jobs):
+        producer.submit("sleep", {"n": index})
+    registries = [MetricsRegistry() for _ in range(worker_count)]
+    start = time.perf_counter()
+    workers = [RedisJobQueue(config, registry, {"sleep": handler}, client=client) for registry in registries]
+    deadline = start + timeout_s
+    try:
+        while (counters := producer.stats()["counters"]).get("completed", 0) < jobs and time.perf_counter() < deadline:
+            time.sleep(0.005)
+        elapsed = time.perf_counter() - start
+    finally:
+        for worker in workers:
+            worker.shutdown()
+        producer.shutdown()
+    queue_wait = LatencyHistogram()
+    for registry in registries:
+        queue_wait.merge(registry.histogram("queue"))
+    completed = counters.get("completed", 0)
+    return {
+        "workers": worker_count,
+        "jobs": jobs,
+        "completed": completed,
+        "elapsed_s": elapsed,
+        "throughput_jps": completed / elapsed if elapsed > 0 else 0.0,
+        "ideal_jps": worker_count * concurrency * 1000 / job_ms,
+        "queue_wait_ms": queue_wait.percentiles(),
+        "redelivered": counters.get("redelivered", 0),
+    }
+
+
+def run_job_load(
+    worker_counts: Sequence[int] = (1, 2, 4, 8),
+    jobs_per_worker: int = 50,
+    job_ms: float = 20.0,
+    concurrency: int = 1,
+    prefetch: int = 2,
+    broker_url: Optional[str] = None,
+    timeout_s: float = 120.0,
+) -> Dict[str, Any]:
+    """Drain a backlog of ``jobs_per_worker`` jobs per worker at each worker count."""
+    runs: List[Dict[str, Any]] = []
+    for count in worker_counts:
+        runs.append(_drain(count, jobs_per_worker * count, job_ms, concurrency, prefetch, broker_url, timeout_s))
+    base = runs[0]["throughput_jps"] / runs[0]["workers"] if runs and runs[0]["throughput_jps"] else 0.0
+    for run in runs:
+        run["efficiency"] = run["throughput_jps"] / (base * run["workers"]) if base else 0.0
+    meta = environment(RunOptions())
+    del meta["options"]
+    return {
+        "format_version": JOB_LOAD_FORMAT_VERSION,
+        "job_ms": job_ms,
+        "concurrency": concurrency,
+        "prefetch": prefetch,
+        "broker": "redis" if broker_url else "memory",
+        "runs": runs,
+        "environment": meta,
+    }
+
+
+__all__ = ["JOB_LOAD_FORMAT_VERSION", "run_job_load"]
@@ -0,0 +1,374 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+"""HTTP load generator for the chat API.
+
+Two load models are supported. ``closed`` runs a fixed number of workers
+that each send the next request as soon as the previous one completes, so
+the level is the concurrency. ``open`` sends requests at Poisson arrival
+times with the level as the mean rate (requests per second), regardless of
+how fast the server answers. In open mode, latency is measured from the
+scheduled arrival time, so queueing behind a slow server is not hidden
+(coordinated omission).
+
+``run_load`` wires everything together: it starts a ``SimulatedModelServer``,
+builds the application with ``build_app`` pointed at it, serves it with
+uvicorn on a free local port, and sweeps the requested levels. Streaming
+requests go to ``/api/v1/chat/stream`` so the time to first token can be
+measured on the client. Given a cassette instead, the application replays
+the recorded backend exchanges and the recorded requests form the workload,
+so a captured production-like workload can be rerun before and after a
+change.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import random
+import socket
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import httpx
+
+from adaptivemind_core.config import AppConfig, CassetteConfig, OllamaConfig, OpenRouterConfig
+from adaptivemind_core.llm.cassette import read_cassette
+from adaptivemind_core.monitoring.histogram import LatencyHistogram
+
+from .fixtures import PERSONAS, app_config, conversation, rng
+from .harness import RunOptions, environment
+from .simulator import SimulatedModelServer, SimulationProfile
+
+LOAD_FORMAT_VERSION = 1
+MODES = ("closed", "open")
+
+
+@dataclass
+class RequestSample:
+    scheduled: float
+    latency_s: float
+    ttft_s: Optional[float]
+    status: int
+    tokens: int = 0
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.status == 200 and not self.error
+
+
+def payloads(count: int, turns: int = 4, max_tokens: int = 128, seed: int = 0) -> List[Dict[str, Any]]:
+    """Deterministic chat bodies cycling through the benchmark personas."""
+    generator = rng(300 + seed)
+    return [
+        {
+            "persona": PERSONAS[index % len(PERSONAS)],
+            "messages": conversation(turns, seed=generator.randrange(1 << 30)),
+            "max_tokens": max_tokens,
+        }
+        for index in range(count)
+    ]
+
+
+def cassette_payloads(path: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Chat bodies reproducing the requests recorded in a cassette, in recording order."""
+    bodies: List[Dict[str, Any]] = []
+    for exchange in read_cassette(path):
+        if not exchange.messages:
+            continue
+        bodies.append(
+            {
+                "persona": exchange.persona,
+                "messages": exchange.messages,
+                "temperature": exchange.temperature,
+                "max_tokens": max(exchange.max_tokens, 32),
+            }
+        )
+        if limit is not None and len(bodies) >= limit:
+            break
+    return bodies
+
+
+async def send_chat(client: httpx.AsyncClient, payload: Dict[str, Any], stream: bool, scheduled: Optional[float] = None) -> RequestSample:
+    """Issue one chat request; latencies count from ``scheduled`` (default: now)."""
+    scheduled = time.perf_counter() if scheduled is None else scheduled
+    ttft: Optional[float] = None
+    try:
+        if not stream:
+            response = await client.post("/api/v1/chat", json=payload)
+            latency = time.perf_counter() - scheduled
+            tokens = response.json().get("tokens", 0) if response.status_code == 200 else 0
+            return RequestSample(scheduled, latency, None, response.status_code, tokens)
+        tokens = 0
+        error = ""
+        async with client.stream("POST", "/api/v1/chat/stream", json=payload) as response:
+            if response.status_code != 200:
+                await response.aread()
+                return RequestSample(scheduled, time.perf_counter() - scheduled, None, response.status_code)
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                if "error" in chunk:
+                    error = str(chunk["error"])
+                    break
+                if ttft is None and chunk.get("content"):
+                    ttft = time.perf_counter() - scheduled
+                tokens = chunk.get("tokens", tokens)
+        return RequestSample(scheduled, time.perf_counter() - scheduled, ttft, response.status_code, tokens, error)
+    except (httpx.HTTPError, ValueError) as exc:
+        return RequestSample(scheduled, time.perf_counter() - scheduled, ttft, 0, error=type(exc).__name__)
+
+
+async def closed_loop(
+    client: httpx.AsyncClient, concurrency: int, duration_s: float, bodies: Sequence[Dict[str, Any]], stream: bool = True
+) -> List[RequestSample]:
+    samples: List[RequestSample] = []
+    deadline = time.perf_counter() + duration_s
+
+    async def worker(offset: int) -> None:
+        index = offset
+        while time.perf_counter() < deadline:
+            samples.append(await send_chat(client, bodies[index % len(bodies)], stream))
+            index += concurrency
+
+    await asyncio.gather(*(worker(offset) for offset in range(concurrency)))
+    return samples
+
+
+async def open_loop(
+    client: httpx.AsyncClient,
+    rate: float,
+    duration_s: float,
+    bodies: Sequence[Dict[str, Any]],
+    stream: bool = True,
+    seed: int = 0,
+) -> List[RequestSample]:
+    generator = random.Random(seed)
+    tasks: List[asyncio.Task] = []
+    start = time.perf_counter()
+    arrival = start
+    index = 0
+    while True:
+        arrival += generator.expovariate(rate)
+        if arrival - start >= duration_s:
+            break
+        delay = arrival - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.ensure_future(send_chat(client, bodies[index % len(bodies)], stream, scheduled=arrival)))
+        index += 1
+    return list(await asyncio.gather(*tasks))
+
+
+def _distribution(histogram: LatencyHistogram) -> Dict[str, float]:
+    summary = {key: round(value, 3) for key, value in histogram.percentiles().items()}
+    summary["mean"] = round(histogram.mean, 3)
+    summary["max"] = round(histogram.max, 3)
+    return summary
+
+
+def summarize_run(samples: Sequence[RequestSample], elapsed_s: float) -> Dict[str, Any]:
+    """Throughput, error rate, and latency and TTFT percentiles (ms) of successful requests.
+
+    The raw per-request values are kept under ``samples`` for statistical comparison.
+    """
+    latency = LatencyHistogram()
+    ttft = LatencyHistogram()
+    statuses: Counter = Counter()
+    raw: Dict[str, List[float]] = {"latency_ms": [], "ttft_ms": []}
+    succeeded = tokens = 0
+    for sample in samples:
+        statuses[sample.error or str(sample.status)] += 1
+        if not sample.ok:
+            continue
+        succeeded += 1
+        tokens += sample.tokens
+        latency.record(sample.latency_s * 1000)
+        raw["latency_ms"].append(round(sample.latency_s * 1000, 3))
+        if sample.ttft_s is not None:
+            ttft.record(sample.ttft_s * 1000)
+            raw["ttft_ms"].append(round(sample.ttft_s * 1000, 3))
+    total = len(samples)
+    elapsed_s = max(elapsed_s, 1e-9)
+    return {
+        "requests": total,
+        "succeeded": succeeded,
+        "errors": total - succeeded,
+        "error_rate": round((total - succeeded) / total, 4) if total else 0.0,
+        "elapsed_s": round(elapsed_s, 3),
+        "throughput_rps": round(succeeded / elapsed_s, 3),
+        "tokens_per_s": round(tokens / elapsed_s, 3),
+        "latency_ms": _distribution(latency),
+        "ttft_ms": _distribution(ttft) if ttft.count else None,
+        "outcomes": dict(sorted(statuses.items())),
+        "samples": raw,
+    }
+
+
+async def sweep(
+    base_url: str,
+    mode: str,
+    levels: Sequence[float],
+    duration_s: float,
+    stream: bool = True,
+    bodies: Optional[Sequence[Dict[str, Any]]] = None,
+    api_key: Optional[str] = None,
+    warmup: int = 2,
+) -> List[Dict[str, Any]]:
+    """Run one measurement per level against ``base_url`` and summarise each."""
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of {MODES}")
+    bodies = bodies or payloads(64)
+    headers = {"X-API-Key": api_key} if api_key else {}
+    # Open-loop arrivals must never wait for a pooled connection, or the client would throttle the load
+    connections = max(int(max(levels)), 1) if mode == "closed" else None
+    limits = httpx.Limits(max_connections=connections, max_keepalive_connections=connections)
+    runs: List[Dict[str, Any]] = []
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, timeout=120.0, limits=limits) as client:
+        for index in range(warmup):
+            await send_chat(client, bodies[index % len(bodies)], stream)
+        for level in levels:
+            started = time.perf_counter()
+            if mode == "closed":
+                samples = await closed_loop(client, int(level), duration_s, bodies, stream)
+            else:
+                samples = await open_loop(client, float(level), duration_s, bodies, stream)
+            runs.append({"level": level, **summarize_run(samples, time.perf_counter() - started)})
+    return runs
+
+
+def simulation_config(simulator_url: str, backend: str = "ollama", **overrides: Any) -> AppConfig:
+    """Benchmark config whose chosen backend talks to the simulator and the other is unreachable."""
+    if backend == "ollama":
+        ollama = OllamaConfig(host=simulator_url, model="simulated")
+        openrouter = OpenRouterConfig(api_key="")
+    elif backend == "openrouter":
+        ollama = OllamaConfig(host=f"{simulator_url}/offline", model="simulated")
+        openrouter = OpenRouterConfig(api_key="simulated", model="simulated", base_url=f"{simulator_url}/v1")
+    else:
+        raise ValueError("backend must be 'ollama' or 'openrouter'")
+    return app_config(ollama=ollama, openrouter=openrouter, **overrides)
+
+
+@contextlib.contextmanager
+def serve_app(config: AppConfig, host: str = "127.0.0.1") -> Iterator[str]:
+    """Serve ``build_app(config)`` with uvicorn on a free port; yields the base URL."""
+    import uvicorn
+
+    from adaptivemind_core.server import build_app
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, 0))
+    port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(build_app(config), log_level="warning", access_log=False, lifespan="on"))
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]}, name="loadgen-app", daemon=True)
+    thread.start()
+    try:
+        deadline = time.monotonic() + 10
+        while not server.started:
+            if not thread.is_alive() or time.monotonic() > deadline:
+                raise RuntimeError("Application server failed to start")
+            time.sleep(0.01)
+        yield f"http://{host}:{port}"
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
+        sock.close()
+
+
+def run_load(
+    mode: str = "closed",
+    levels: Sequence[float] = (1, 4, 16),
+    duration_s: float = 10.0,
+    profile: Optional[SimulationProfile] = None,
+    backend: str = "ollama",
+    stream: bool = True,
+    url: Optional[str] = None,
+    api_key: Optional[str] = None,
+    max_tokens: int = 128,
+    cassette: Optional[str] = None,
+    timing_scale: float = 1.0,
+) -> Dict[str, Any]:
+    """Sweep ``levels`` and return a JSON-serialisable report.
+
+    Without ``url`` the simulator and the application are started in-process;
+    with it, an already running deployment is measured as is. ``cassette``
+    replaces the simulator with a replay of recorded exchanges (delays
+    multiplied by ``timing_scale``) and the synthetic requests with the
+    recorded ones.
+    """
+    bodies = cassette_payloads(cassette) if cassette else payloads(64, max_tokens=max_tokens)
+    if not bodies:
+        raise ValueError(f"Cassette {cassette} holds no replayable requests")
+    report: Dict[str, Any] = {
+        "version": LOAD_FORMAT_VERSION,
+        "meta": _meta(),
+        "mode": mode,
+        "stream": stream,
+        "duration_s": duration_s,
+    }
+    if url is not None:
+        report["target"] = url
+        report["runs"] = asyncio.run(sweep(url, mode, levels, duration_s, stream, bodies, api_key))
+        return report
+    if cassette is not None:
+        replay = CassetteConfig(mode="replay", path=cassette, timing_scale=timing_scale)
+        config = app_config(sorted({body["persona"] for body in bodies}), cassette=replay)
+        with serve_app(config) as base_url:
+            report["target"] = "in-process"
+            report["backend"] = "replay"
+            report["runs"] = asyncio.run(sweep(base_url, mode, levels, duration_s, stream, bodies))
+        report["cassette"] = {"path": str(cassette), "requests": len(bodies), "timing_scale": timing_scale}
+        return report
+    profile = profile or SimulationProfile()
+    with SimulatedModelServer(profile) as simulator:
+        with serve_app(simulation_config(simulator.url, backend)) as base_url:
+            report["target"] = "in-process"
+            report["backend"] = backend
+            report["runs"] = asyncio.run(sweep(base_url, mode, levels, duration_s, stream, bodies))
+        report["simulator"] = {
+            "ttft_ms": profile.ttft_ms,
+            "tokens_per_s": profile.tokens_per_s,
+            "output_tokens": list(profile.output_tokens),
+            "error_rate": profile.error_rate,
+            "counts": simulator.stats(),
+        }
+    return report
+
+
+def _meta() -> Dict[str, Any]:
+    meta = environment(RunOptions())
+    del meta["options"]  # timing-loop options do not apply to load runs
+    return meta
+
+
+__all__ = [
+    "LOAD_FORMAT_VERSION",
+    "MODES",
+    "RequestSample",
+    "cassette_payloads",
+    "closed_loop",
+    "open_loop",
+    "payloads",
+    "run_load",
+    "send_chat",
+    "serve_app",
+    "simulation_config",
+    "summarize_run",
+    "sweep",
+]
@@ -0,0 +1,361 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+"""Stored performance baselines and statistical regression checks.
+
+Result files from the microbenchmarks (``run_benchmarks``) and the load
+generator (``run_load``) are stored under
+``<store>/<machine fingerprint>/<commit>/<suite>-<timestamp>-<n>.json``, so
+results are only ever compared with results from the same kind of machine.
+Recording a commit again adds samples instead of replacing them.
+
+Two result sets are compared metric by metric. A metric is regressed (or
+improved) when the Mann-Whitney U test finds the two sample sets different
+at ``alpha`` and the median moved by more than ``min_effect``. The report
+also carries a bootstrap confidence interval of the median ratio. Metrics
+with too few samples for a test, such as the throughput of a single load
+run, fall back to a plain threshold on the ratio and are labelled so.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import time
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+REPORT_FORMAT_VERSION = 1
+MIN_TEST_SAMPLES = 5
+BOOTSTRAP_MAX_SAMPLES = 2000
+
+
+def machine_fingerprint() -> Tuple[str, Dict[str, Any]]:
+    """Short id and description of the properties that make timings comparable."""
+    description = {
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "processor": platform.processor() or "",
+        "cpu_count": os.cpu_count(),
+        "implementation": platform.python_implementation(),
+        "python": ".".join(platform.python_version_tuple()[:2]),
+    }
+    digest = hashlib.blake2b(json.dumps(description, sort_keys=True).encode("utf-8"), digest_size=6).hexdigest()
+    return digest, description
+
+
+# Statistics -------------------------------------------------------------
+
+
+def _ranks(values: Sequence[float]) -> Tuple[List[float], List[int]]:
+    """Average ranks (1-based) and the sizes of tied groups."""
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    ties: List[int] = []
+    start = 0
+    while start < len(order):
+        end = start
+        while end + 1 < len(order) and values[order[end + 1]] == values[order[start]]:
+            end += 1
+        average = (start + end) / 2 + 1
+        for position in range(start, end + 1):
+            ranks[order[position]] = average
+        if end > start:
+            ties.append(end - start + 1)
+        start = end + 1
+    return ranks, ties
+
+
+@lru_cache(maxsize=None)
+def _u_count(m: int, n: int, u: int) -> int:
+    """Orderings of ``m`` and ``n`` untied samples whose U statistic equals ``u``."""
+    if u < 0 or u > m * n:
+        return 0
+    if m == 0 or n == 0:
+        return 1 if u == 0 else 0
+    return _u_count(m - 1, n, u - n) + _u_count(m, n - 1, u)
+
+
+def mann_whitney_u(baseline: Sequence[float], current: Sequence[float]) -> Tuple[float, float]:
+    """Two-sided Mann-Whitney U test; returns ``(U of current, p-value)``.
+
+    Small samples without ties use the exact distribution, everything else
+    the normal approximation with tie and continuity corrections.
+    """
+    m, n = len(current), len(baseline)
+    if not m or not n:
+        raise ValueError("Mann-Whitney U needs two non-empty samples")
+    ranks, ties = _ranks(list(current) + list(baseline))
+    u = sum(ranks[:m]) - m * (m + 1) / 2
+    if not ties and m + n <= 40:
+        total = math.comb(m + n, m)
+        observed = int(round(u))
+        lower = sum(_u_count(m, n, value) for value in range(observed + 1)) / total
+        upper = sum(_u_count(m, n, value) for value in range(observed, m * n + 1)) / total
+        return u, min(1.0, 2 * min(lower, upper))
+    size = m + n
+    tie_term = sum(count**3 - count for count in ties) / (size * (size - 1))
+    variance = m * n / 12 * ((size + 1) - tie_term)
+    if variance <= 0:
+        return u, 1.0
+    mean = m * n / 2
+    z = (abs(u - mean) - 0.5) / math.sqrt(variance)
+    return u, min(1.0, math.erfc(max(z, 0.0) / math.sqrt(2)))
+
+
+def bootstrap_ratio_ci(
+    baseline: Sequence[float],
+    current: Sequence[float],
+    confidence: float = 0.95,
+    resamples: int = 1000,
+    seed: int = 0,
+) -> Tuple[float, float]:
+    """Percentile bootstrap interval of ``median(current) / median(baseline)``."""
+    generator = random.Random(seed)
+    if len(baseline) > BOOTSTRAP_MAX_SAMPLES:
+        baseline = generator.sample(list(baseline), BOOTSTRAP_MAX_SAMPLES)
+    if len(current) > BOOTSTRAP_MAX_SAMPLES:
+        current = generator.sample(list(current), BOOTSTRAP_MAX_SAMPLES)
+    ratios = []
+    for _ in range(resamples):
+        before = statistics.median(generator.choices(baseline, k=len(baseline)))
+        after = statistics.median(generator.choices(current, k=len(current)))
+        ratios.append(after / before if before > 0 else math.inf)
+    ratios.sort()
+    tail = (1 - confidence) / 2
+    low = ratios[int(tail * (resamples - 1))]
+    high = ratios[int(math.ceil((1 - tail) * (resamples - 1)))]
+    return low, high
+
+
+# Metrics ----------------------------------------------------------------
+
+
+@dataclass
+class Metric:
+    samples: List[float]
+    unit: str
+    higher_is_better: bool = False
+    absolute: bool = False  # compare differences instead of ratios (rates that may be zero)
+
+
+def extract_metrics(result: Dict[str, Any]) -> Dict[str, Metric]:
+    """Comparable metrics of a microbenchmark result, load report or startup report."""
+    metrics: Dict[str, Metric] = {}
+    for name, bench in result.get("benchmarks", {}).items():
+        samples = bench.get("samples") or [bench["stats"]["median"]]
+        metrics[f"bench:{name}"] = Metric(list(samples), bench.get("unit", "seconds"))
+    for target, startup in result.get("targets", {}).items():
+        for phase in ("import_ms", "construct_ms", "ready_ms"):
+            metrics[f"startup:{target}:{phase}"] = Metric(list(startup["samples"][phase]), "ms")
+        metrics[f"startup:{target}:modules"] = Metric([float(startup["modules"])], "modules")
+    mode = result.get("mode", "load")
+    for run in result.get("runs", []):
+        prefix = f"load:{mode}@{run['level']}"
+        raw = run.get("samples", {})
+        metrics[f"{prefix}:latency_ms"] = Metric(raw.get("latency_ms") or [run["latency_ms"]["p50"]], "ms")
+        if run.get("ttft_ms"):
+            metrics[f"{prefix}:ttft_ms"] = Metric(raw.get("ttft_ms") or [run["ttft_ms"]["p50"]], "ms")
+        metrics[f"{prefix}:throughput_rps"] = Metric([run["throughput_rps"]], "rps", higher_is_better=True)
+        metrics[f"{prefix}:error_rate"] = Metric([run["error_rate"]], "ratio", absolute=True)
+    return metrics
+
+
+def merge_metrics(sets: Iterable[Dict[str, Metric]]) -> Dict[str, Metric]:
+    """Pool the samples of repeated recordings."""
+    merged: Dict[str, Metric] = {}
+    for metrics in sets:
+        for name, metric in metrics.items():
+            if name in merged:
+                merged[name].samples.extend(metric.samples)
+            else:
+                merged[name] = Metric(list(metric.samples), metric.unit, metric.higher_is_better, metric.absolute)
+    return merged
+
+
+@dataclass
+class MetricComparison:
+    name: str
+    unit: str
+    method: str
+    verdict: str
+    baseline_median: float
+    current_median: float
+    ratio: float
+    baseline_n: int
+    current_n: int
+    p_value: Optional[float] = None
+    ci_low: Optional[float] = None
+    ci_high: Optional[float] = None
+
+
+def compare_metric(
+    name: str,
+    baseline: Metric,
+    current: Metric,
+    alpha: float = 0.01,
+    min_effect: float = 0.05,
+    threshold: float = 0.10,
+    error_tolerance: float = 0.01,
+) -> MetricComparison:
+    before = statistics.median(baseline.samples)
+    after = statistics.median(current.samples)
+    ratio = after / before if before > 0 else (1.0 if after == before else math.inf)
+    row = MetricComparison(name, current.unit, "threshold", "unchanged", before, after, ratio, len(baseline.samples), len(current.samples))
+    if current.absolute:
+        row.method = "absolute"
+        change = after - before
+        if abs(change) > error_tolerance:
+            row.verdict = "regressed" if change > 0 else "improved"
+        return row
+
+    # Express every change as "worse when above 1"
+    worse = 1 / ratio if current.higher_is_better and ratio > 0 else ratio
+    if min(len(baseline.samples), len(current.samples)) >= MIN_TEST_SAMPLES:
+        row.method = "mann-whitney"
+        _, row.p_value = mann_whitney_u(baseline.samples, current.samples)
+        row.ci_low, row.ci_high = bootstrap_ratio_ci(baseline.samples, current.samples)
+        if row.p_value >= alpha:
+            row.verdict = "unchanged"
+        elif worse > 1 + min_effect:
+            row.verdict = "regressed"
+        elif worse < 1 / (1 + min_effect):
+            row.verdict = "improved"
+        else:
+            row.verdict = "unchanged"  # statistically detectable but below the effect that matters
+        return row
+
+    if worse > 1 + threshold:
+        row.verdict = "regressed"
+    elif worse < 1 / (1 + threshold):
+        row.verdict = "improved"
+    return row
+
+
+def compare_results(
+    baseline: Dict[str, Metric],
+    current: Dict[str, Metric],
+    alpha: float = 0.01,
+    min_effect: float = 0.05,
+    threshold: float = 0.10,
+) -> List[MetricComparison]:
+    """Compare metrics present on both sides, sorted by name."""
+    return [
+        compare_metric(name, baseline[name], current[name], alpha, min_effect, threshold)
+        for name in sorted(current)
+        if name in baseline
+    ]
+
+
+def build_report(
+    rows: Sequence[MetricComparison],
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    alpha: float,
+    min_effect: float,
+) -> Dict[str, Any]:
+    verdicts = {verdict: 0 for verdict in ("regressed", "improved", "unchanged")}
+    for row in rows:
+        verdicts[row.verdict] += 1
+    return {
+        "version": REPORT_FORMAT_VERSION,
+        "generated_at": time.time(),
+        "baseline": baseline,
+        "current": current,
+        "alpha": alpha,
+        "min_effect": min_effect,
+        "summary": verdicts,
+        "regressions": [row.name for row in rows if row.verdict == "regressed"],
+        "improvements": [row.name for row in rows if row.verdict == "improved"],
+        "metrics": [asdict(row) for row in rows],
+    }
+
+
+# Storage ----------------------------------------------------------------
+
+
+@dataclass
+class BaselineStore:
+    """Result files grouped by machine fingerprint and commit."""
+
+    root: Path
+    fingerprint: str = field(default_factory=lambda: machine_fingerprint()[0])
+
+    @property
+    def directory(self) -> Path:
+        return Path(self.root) / self.fingerprint
+
+    def save(self, suite: str, commit: str, result: Dict[str, Any]) -> Path:
+        if not commit:
+            raise ValueError("Results must be recorded against a commit")
+        target = self.directory / commit
+        target.mkdir(parents=True, exist_ok=True)
+        sequence = len(list(target.glob(f"{suite}-*.json")))
+        path = target / f"{suite}-{time.strftime('%Y%m%dT%H%M%S')}-{sequence:03d}.json"
+        path.write_text(json.dumps(result, indent=2, sort_keys=True), encoding="utf-8")
+        machine = self.directory / "machine.json"
+        if not machine.exists():
+            machine.write_text(json.dumps(machine_fingerprint()[1], indent=2, sort_keys=True), encoding="utf-8")
+        return path
+
+    def files(self, commit: str, suite: Optional[str] = None) -> List[Path]:
+        target = self.directory / commit
+        if not target.is_dir():
+            return []
+        pattern = f"{suite}-*.json" if suite else "*.json"
+        return sorted(target.glob(pattern))
+
+    def commits(self) -> List[str]:
+        """Recorded commits, most recently recorded last."""
+        if not self.directory.is_dir():
+            return []
+        recorded = [path for path in self.directory.iterdir() if path.is_dir() and any(path.glob("*.json"))]
+        return [path.name for path in sorted(recorded, key=lambda path: max(item.stat().st_mtime for item in path.glob("*.json")))]
+
+    def metrics(self, commit: str, suite: Optional[str] = None) -> Dict[str, Metric]:
+        return merge_metrics(extract_metrics(json.loads(path.read_text(encoding="utf-8"))) for path in self.files(commit, suite))
+
+
+def render_table(report: Dict[str, Any]) -> str:
+    lines = [f"{'metric':<58} {'baseline':>10} {'current':>10} {'ratio':>7} {'95% CI':>15} {'p':>8}  verdict"]
+    for row in report["metrics"]:
+        interval = f"{row['ci_low']:.3f}-{row['ci_high']:.3f}" if row["ci_low"] is not None else "-"
+        p_value = f"{row['p_value']:.4f}" if row["p_value"] is not None else row["method"]
+        verdict = row["verdict"].upper() if row["verdict"] == "regressed" else row["verdict"]
+        lines.append(
+            f"{row['name'][:58]:<58} {row['baseline_median']:>10.4g} {row['current_median']:>10.4g} "
+            f"{row['ratio']:>7.3f} {interval:>15} {p_value:>8}  {verdict}"
+        )
+    summary = report["summary"]
+    lines.append(f"{len(report['metrics'])} compared: {summary['regressed']} regressed, {summary['improved']} improved")
+    return "\n".join(lines)
+
+
+__all__ = [
+    "BaselineStore",
+    "Metric",
+    "MetricComparison",
+    "bootstrap_ratio_ci",
+    "build_report",
+    "compare_metric",
+    "compare_results",
+    "extract_metrics",
+    "machine_fingerprint",
+    "mann_whitney_u",
+    "merge_metrics",
+    "render_table",
+]
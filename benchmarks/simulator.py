@@ -0,0 +1,346 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+"""Simulated model server speaking the Ollama and OpenAI chat protocols.
+
+The server answers ``/api/tags`` and ``/api/generate`` like Ollama and
+``/chat/completions`` (under any prefix, e.g. ``/v1``) like OpenAI and
+OpenRouter, without running a model. Time to first token is drawn from a
+configurable distribution, tokens are then emitted at a fixed rate, and a
+configurable share of requests fails with an HTTP error. Streaming uses
+NDJSON for Ollama and server-sent events for OpenAI, sent with chunked
+transfer encoding so clients see every chunk as it is produced.
+
+Paths that match neither protocol return 404. Pointing a backend at
+``<url>/offline`` therefore makes it report itself unavailable.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .fixtures import sentence
+
+_DISTRIBUTIONS = ("fixed", "uniform", "lognormal", "exponential")
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """Sampler for a latency spec in milliseconds.
+
+    ``fixed:50``, ``uniform:20,80`` (bounds), ``lognormal:50,0.5`` (median
+    and sigma) or ``exponential:50`` (mean).
+    """
+    kind, _, raw = spec.partition(":")
+    try:
+        args = [float(value) for value in raw.split(",")] if raw else []
+    except ValueError:
+        raise ValueError(f"Invalid latency spec {spec!r}") from None
+    if kind == "fixed" and len(args) == 1:
+        return lambda generator: args[0]
+    if kind == "uniform" and len(args) == 2:
+        return lambda generator: generator.uniform(args[0], args[1])
+    if kind == "lognormal" and len(args) == 2:
+        mu = math.log(max(args[0], 1e-9))
+        return lambda generator: generator.lognormvariate(mu, args[1])
+    if kind == "exponential" and len(args) == 1:
+        return lambda generator: generator.expovariate(1.0 / args[0]) if args[0] > 0 else 0.0
+    raise ValueError(f"Invalid latency spec {spec!r}; expected one of {', '.join(_DISTRIBUTIONS)} with its parameters")
+
+
+@dataclass
+class SimulationProfile:
+    """How the simulated model behaves.
+
+    Attributes:
+        ttft_ms: Latency spec for the time to first token (see ``parse_latency``)
+        tokens_per_s: Generation rate after the first token; 0 emits everything at once
+        output_tokens: Inclusive range of completion lengths, capped by the request's max tokens
+        chunk_tokens: Tokens per streamed chunk
+        error_rate: Share of generation requests answered with ``error_status``
+        error_status: HTTP status of simulated failures
+        model: Model name reported by the server
+        seed: Seed for latency, length and failure draws; ``None`` for nondeterministic runs
+    """
+
+    ttft_ms: str = "fixed:50"
+    tokens_per_s: float = 50.0
+    output_tokens: Tuple[int, int] = (32, 128)
+    chunk_tokens: int = 1
+    error_rate: float = 0.0
+    error_status: int = 500
+    model: str = "simulated"
+    seed: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        self.sample_ttft_ms = parse_latency(self.ttft_ms)
+        low, high = self.output_tokens
+        if not 0 < low <= high:
+            raise ValueError("output_tokens must be a positive (low, high) range")
+        if not 0.0 <= self.error_rate <= 1.0:
+            raise ValueError("error_rate must be within [0, 1]")
+        if self.chunk_tokens < 1:
+            raise ValueError("chunk_tokens must be at least 1")
+
+
+@dataclass
+class _Plan:
+    failed: bool
+    ttft_s: float
+    tokens: int
+    words: List[str]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_Server"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - signature fixed by the base class
+        pass
+
+    # Routing ---------------------------------------------------------
+
+    def do_GET(self) -> None:
+        path = self.path.split("?", 1)[0].rstrip("/")
+        model = self.server.simulator.profile.model
+        if path == "/api/tags":
+            self._json(200, {"models": [{"name": model, "model": model}]})
+        elif path.endswith("/models"):
+            self._json(200, {"object": "list", "data": [{"id": model, "object": "model", "owned_by": "simulator"}]})
+        else:
+            self._json(404, {"error": f"unknown path {path}"})
+
+    def do_POST(self) -> None:
+        path = self.path.split("?", 1)[0].rstrip("/")
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._json(400, {"error": "invalid JSON body"})
+            return
+        if path == "/api/generate":
+            self._ollama_generate(body)
+        elif path.endswith("/chat/completions"):
+            self._openai_chat(body)
+        else:
+            self._json(404, {"error": f"unknown path {path}"})
+
+    # Protocols -------------------------------------------------------
+
+    def _ollama_generate(self, body: Dict[str, Any]) -> None:
+        simulator = self.server.simulator
+        options = body.get("options") or {}
+        plan = simulator.plan(options.get("num_predict"), "ollama")
+        if plan.failed:
+            self._json(simulator.profile.error_status, {"error": "simulated failure"})
+            return
+        model = body.get("model") or simulator.profile.model
+        started = time.perf_counter()
+        if not body.get("stream", True):
+            time.sleep(plan.ttft_s + simulator.generation_s(plan.tokens))
+            self._json(200, self._ollama_final(model, " ".join(plan.words), plan, started))
+            return
+        self._begin_stream("application/x-ndjson")
+        time.sleep(plan.ttft_s)
+        for words in simulator.chunks(plan):
+            self._send_chunk(json.dumps({"model": model, "response": " ".join(words) + " ", "done": False}) + "\n")
+        self._send_chunk(json.dumps(self._ollama_final(model, "", plan, started)) + "\n")
+        self._end_stream()
+
+    @staticmethod
+    def _ollama_final(model: str, response: str, plan: _Plan, started: float) -> Dict[str, Any]:
+        total_ns = int((time.perf_counter() - started) * 1e9)
+        ttft_ns = int(plan.ttft_s * 1e9)
+        return {
+            "model": model,
+            "response": response,
+            "done": True,
+            "eval_count": plan.tokens,
+            "total_duration": total_ns,
+            "load_duration": 0,
+            "prompt_eval_duration": ttft_ns,
+            "eval_duration": max(total_ns - ttft_ns, 0),
+        }
+
+    def _openai_chat(self, body: Dict[str, Any]) -> None:
+        simulator = self.server.simulator
+        plan = simulator.plan(body.get("max_tokens"), "openai")
+        if plan.failed:
+            self._json(simulator.profile.error_status, {"error": {"message": "simulated failure", "code": simulator.profile.error_status}})
+            return
+        model = body.get("model") or simulator.profile.model
+        prompt_tokens = sum(len(str(message.get("content", "")).split()) for message in body.get("messages") or [])
+        usage = {"prompt_tokens": prompt_tokens, "completion_tokens": plan.tokens, "total_tokens": prompt_tokens + plan.tokens}
+        completion_id = f"chatcmpl-sim-{simulator.next_id()}"
+        created = int(time.time())
+        if not body.get("stream"):
+            time.sleep(plan.ttft_s + simulator.generation_s(plan.tokens))
+            message = {"role": "assistant", "content": " ".join(plan.words)}
+            self._json(200, {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "message": message, "finish_reason": "stop"}],
+                "usage": usage,
+            })
+            return
+        self._begin_stream("text/event-stream")
+        time.sleep(plan.ttft_s)
+        head = {"id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model}
+        for words in simulator.chunks(plan):
+            delta = {"index": 0, "delta": {"content": " ".join(words) + " "}, "finish_reason": None}
+            self._send_chunk(f"data: {json.dumps({**head, 'choices': [delta]})}\n\n")
+        final = {"index": 0, "delta": {}, "finish_reason": "stop"}
+        self._send_chunk(f"data: {json.dumps({**head, 'choices': [final], 'usage': usage})}\n\n")
+        self._send_chunk("data: [DONE]\n\n")
+        self._end_stream()
+
+    # Transport -------------------------------------------------------
+
+    def _json(self, status: int, payload: Dict[str, Any]) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _begin_stream(self, content_type: str) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+    def _send_chunk(self, text: str) -> None:
+        data = text.encode("utf-8")
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def _end_stream(self) -> None:
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    simulator: "SimulatedModelServer"
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        # Clients under load drop idle keep-alive connections; that is not a server fault
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class SimulatedModelServer:
+    """Local HTTP server impersonating Ollama and OpenAI-compatible model APIs.
+
+    Use it as a context manager, or call ``start``/``stop``; the server runs
+    on a background thread. ``port=0`` picks a free port, and ``url`` gives
+    the address to configure backends with.
+    """
+
+    def __init__(self, profile: Optional[SimulationProfile] = None, host: str = "127.0.0.1", port: int = 0):
+        self.profile = profile or SimulationProfile()
+        self._rng = random.Random(self.profile.seed)
+        self._lock = threading.Lock()
+        self._counts: Counter = Counter()
+        self._ids = 0
+        self._httpd = _Server((host, port), _Handler)
+        self._httpd.simulator = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "SimulatedModelServer":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name="model-simulator", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join(timeout=5)
+            self._thread = None
+        self._httpd.server_close()
+
+    def serve_forever(self) -> None:
+        """Serve on the calling thread until interrupted."""
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def __enter__(self) -> "SimulatedModelServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def stats(self) -> Dict[str, int]:
+        """Generation requests served and failed, per protocol."""
+        with self._lock:
+            return dict(sorted(self._counts.items()))
+
+    # Used by the request handler --------------------------------------
+
+    def plan(self, max_tokens: Any, protocol: str) -> _Plan:
+        profile = self.profile
+        low, high = profile.output_tokens
+        with self._lock:
+            failed = self._rng.random() < profile.error_rate
+            ttft_s = max(profile.sample_ttft_ms(self._rng), 0.0) / 1000.0
+            tokens = self._rng.randint(low, high)
+            seed = self._rng.getrandbits(32)
+            self._counts[f"{protocol}.requests"] += 1
+            if failed:
+                self._counts[f"{protocol}.errors"] += 1
+        if isinstance(max_tokens, int) and max_tokens > 0:
+            tokens = min(tokens, max_tokens)
+        words = [] if failed else sentence(random.Random(seed), tokens).split()
+        return _Plan(failed, ttft_s, tokens, words)
+
+    def generation_s(self, tokens: int) -> float:
+        rate = self.profile.tokens_per_s
+        return tokens / rate if rate > 0 else 0.0
+
+    def chunks(self, plan: _Plan) -> Iterator[List[str]]:
+        """Yield word groups of ``chunk_tokens``, pacing them at the profile's token rate."""
+        size = self.profile.chunk_tokens
+        interval = self.generation_s(size)
+        next_at = time.perf_counter()
+        for start in range(0, len(plan.words), size):
+            if start:
+                next_at += interval
+                delay = next_at - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            yield plan.words[start:start + size]
+
+    def next_id(self) -> int:
+        with self._lock:
+            self._ids += 1
+            return self._ids
+
+
+__all__ = ["SimulatedModelServer", "SimulationProfile", "parse_latency"]
@@ -0,0 +1,145 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+"""Cold-start benchmark: time and modules from a fresh interpreter to a ready application.
+
+Every sample runs in a new ``python`` process so nothing is already
+imported. The child reports how long importing the application took, how
+long constructing it took, and how many modules it loaded. ``app`` stops at
+a constructed ``AdaptiveMindApplication``; ``server`` goes on to build the
+FastAPI app as a worker does before accepting connections, so its construct
+phase includes importing FastAPI. One extra ``-X importtime`` run lists the
+modules with the most self time, which is usually where a regression comes
+from.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+from .harness import RunOptions, environment
+
+STARTUP_FORMAT_VERSION = 1
+TARGETS = ("app", "server")
+TARGET_MS = 300.0
+# Optional or heavy dependencies that should stay unloaded until first use
+WATCHED_MODULES = ("fastapi", "httpx", "requests", "onnxruntime", "numpy", "adaptivemind_core.llm.ollama")
+
+_ROOT = Path(__file__).resolve().parent.parent
+
+_PROBE = r"""
+import json, os, sys, time
+start = time.perf_counter()
+before = set(sys.modules)
+from adaptivemind_core.app import AdaptiveMindApplication
+from adaptivemind_core.config import AppConfig, MonitoringConfig
+imported = time.perf_counter()
+config = AppConfig(monitoring=MonitoringConfig(enable_metrics_harvest=False))
+if sys.argv[1] == "server":
+    from adaptivemind_core.server import build_app
+    build_app(config)
+else:
+    AdaptiveMindApplication(config)
+ready = time.perf_counter()
+loaded = set(sys.modules) - before
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "construct_ms": (ready - imported) * 1000,
+    "ready_ms": (ready - start) * 1000,
+    "modules": len(loaded),
+    "loaded": sorted(name for name in json.loads(sys.argv[2]) if name in loaded),
+}))
+sys.stdout.flush()
+os._exit(0)  # skip interpreter teardown; it is not part of startup
+"""
+
+
+def _child_env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(_ROOT), env.get("PYTHONPATH", "")]))
+    return env
+
+
+def probe(target: str = "app", importtime: bool = False) -> Dict[str, Any]:
+    """Start one fresh interpreter and return its startup measurements."""
+    if target not in TARGETS:
+        raise ValueError(f"unknown startup target {target!r}")
+    command = [sys.executable, *(["-X", "importtime"] if importtime else []), "-c", _PROBE, target, json.dumps(WATCHED_MODULES)]
+    completed = subprocess.run(command, capture_output=True, text=True, cwd=_ROOT, env=_child_env(), timeout=120, check=False)
+    lines = [line for line in completed.stdout.splitlines() if line.startswith("{")]
+    if completed.returncode != 0 or not lines:
+        raise RuntimeError(f"startup probe failed: {completed.stderr.strip()[-2000:]}")
+    sample = json.loads(lines[-1])
+    if importtime:
+        sample["importtime"] = completed.stderr
+    return sample
+
+
+def slowest_imports(importtime_output: str, limit: int = 10) -> List[Dict[str, Any]]:
+    """Modules with the most self import time in ``-X importtime`` output."""
+    rows = []
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|", 2))
+        if self_us.isdigit():
+            rows.append({"module": name, "self_ms": int(self_us) / 1000, "cumulative_ms": int(cumulative_us) / 1000})
+    rows.sort(key=lambda row: row["self_ms"], reverse=True)
+    return rows[:limit]
+
+
+def _quantiles(samples: Sequence[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "min": ordered[0],
+        "p50": statistics.median(ordered),
+        "p90": ordered[min(len(ordered) - 1, int(0.9 * len(ordered)))],
+        "max": ordered[-1],
+    }
+
+
+def measure_startup(
+    repeat: int = 10,
+    targets: Sequence[str] = TARGETS,
+    target_ms: float = TARGET_MS,
+    imports: bool = True,
+) -> Dict[str, Any]:
+    """Startup report over ``repeat`` fresh processes per target."""
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1")
+    meta = environment(RunOptions())
+    del meta["options"]
+    report: Dict[str, Any] = {"version": STARTUP_FORMAT_VERSION, "meta": meta, "target_ms": target_ms, "targets": {}}
+    for target in targets:
+        probe(target)  # warm the OS file cache and bytecode, as a long-lived host would be
+        samples = [probe(target) for _ in range(repeat)]
+        phases = {phase: [sample[phase] for sample in samples] for phase in ("import_ms", "construct_ms", "ready_ms")}
+        ready = _quantiles(phases["ready_ms"])
+        report["targets"][target] = {
+            "samples": phases,
+            "ready_ms": ready,
+            "import_ms": _quantiles(phases["import_ms"]),
+            "construct_ms": _quantiles(phases["construct_ms"]),
+            "modules": int(statistics.median(sample["modules"] for sample in samples)),
+            "loaded": samples[-1]["loaded"],
+            "within_target": ready["p50"] <= target_ms,
+        }
+    if imports and targets:
+        report["slowest_imports"] = slowest_imports(probe(targets[0], importtime=True)["importtime"])
+    return report
+
+
+__all__ = ["STARTUP_FORMAT_VERSION", "TARGETS", "TARGET_MS", "WATCHED_MODULES", "measure_startup", "probe", "slowest_imports"]
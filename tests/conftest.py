@@ -493,6 +493,61 @@ def client():
     mock_client.post.return_value = mock_response
     return mock_client
 
+@pytest.fixture
+def app_config():
+    """Build an application config with a single "generalist" persona and no metrics harvesting.
+
+    Keyword arguments replace ``AppConfig`` fields; ``max_context_window``
+    sizes the persona.
+    """
+    from adaptivemind_core.config import AppConfig, MonitoringConfig, PersonaConfig
+
+    def build(max_context_window=512, **overrides):
+        persona = PersonaConfig(
+            name="generalist", description="", system_prompt="Stay factual.", max_context_window=max_context_window
+        )
+        settings = {
+            "personas": {"generalist": persona},
+            "allowed_personas": ["generalist"],
+            "monitoring": MonitoringConfig(enable_metrics_harvest=False),
+        }
+        return AppConfig(**{**settings, **overrides})
+
+    return build
+
+
+@pytest.fixture
+def wait_for_job():
+    """Poll a job queue until a job reaches one of ``statuses`` and return its status."""
+
+    def wait(jobs, job_id, statuses=("completed", "failed", "cancelled"), timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            status = jobs.status(job_id)
+            if status["status"] in statuses:
+                return status
+            time.sleep(0.01)
+        raise AssertionError(f"job {job_id} stuck in {jobs.status(job_id)['status']}")
+
+    return wait
+
+
+@pytest.fixture
+def wait_indexed():
+    """Poll ``read(batch_id)`` until an ingest batch is completed and return it."""
+
+    def wait(read, batch_id, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            batch = read(batch_id)
+            if batch["status"] == "completed":
+                return batch
+            time.sleep(0.01)
+        raise AssertionError(f"batch {batch_id} still {read(batch_id)['status']}")
+
+    return wait
+
+
 # Start a lightweight server for websocket tests when running locally
 @pytest.fixture(scope="session", autouse=True)
 def _start_local_test_server():
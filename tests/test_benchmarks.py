@@ -0,0 +1,68 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+import copy
+
+from benchmarks import BENCHMARKS, discover
+from benchmarks.__main__ import main
+from benchmarks.harness import SMOKE, RunOptions, compare, load_results, run_case, save_results
+
+
+def test_run_case_calibrates_and_tears_down():
+    events = []
+
+    def factory(size):
+        events.append("setup")
+        data = list(range(size))
+        yield lambda: sum(data)
+        events.append("teardown")
+
+    result = run_case(factory, {"size": 100}, RunOptions(min_time=0.001, repeat=3, warmup=1))
+    assert events == ["setup", "teardown"]
+    assert result["number"] >= 1 and len(result["samples"]) == 3
+    assert 0 < result["stats"]["min"] <= result["stats"]["median"] <= result["stats"]["max"]
+
+
+def test_compare_flags_regressions_beyond_threshold(tmp_path):
+    baseline = {
+        "version": 1,
+        "meta": {},
+        "benchmarks": {
+            "fast": {"stats": {"median": 1.0}},
+            "steady": {"stats": {"median": 1.0}},
+            "removed": {"stats": {"median": 1.0}},
+        },
+    }
+    current = copy.deepcopy(baseline)
+    current["benchmarks"]["fast"]["stats"]["median"] = 0.5
+    current["benchmarks"]["steady"]["stats"]["median"] = 1.05
+    del current["benchmarks"]["removed"]
+    current["benchmarks"]["new"] = {"stats": {"median": 2.0}}
+
+    rows = {row.name: row for row in compare(baseline, current, threshold=0.10)}
+    assert set(rows) == {"fast", "steady"}
+    assert rows["fast"].improved and not rows["steady"].regressed
+    current["benchmarks"]["steady"]["stats"]["median"] = 1.2
+    assert compare(baseline, current, threshold=0.10)[1].regressed
+
+    save_results(baseline, tmp_path / "base.json")
+    save_results(current, tmp_path / "current.json")
+    assert load_results(tmp_path / "base.json") == baseline
+    assert main(["compare", str(tmp_path / "base.json"), str(tmp_path / "current.json")]) == 1
+    assert main(["compare", str(tmp_path / "base.json"), str(tmp_path / "current.json"), "--threshold", "0.5"]) == 0
+
+
+def test_every_registered_benchmark_runs_once():
+    discover()
+    assert {"context.build", "router.generate", "metrics.record_request", "traces.query", "scoring.vickrey_auction"} <= set(BENCHMARKS)
+    for bench in BENCHMARKS.values():
+        for case_name, params in bench.cases():
+            result = run_case(bench.factory, params, SMOKE)
+            assert result["samples"][0] > 0, case_name
@@ -0,0 +1,180 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+import time
+
+import pytest
+
+from adaptivemind_core.app import AdaptiveMindApplication
+from adaptivemind_core.config import CassetteConfig
+from adaptivemind_core.llm.base import GenerationChunk, GenerationRequest, GenerationResponse
+from adaptivemind_core.llm.cassette import (
+    Cassette,
+    CassetteMiss,
+    CassetteWriter,
+    RecordingBackend,
+    ReplayBackend,
+    ReplayedBackendError,
+    read_cassette,
+)
+from benchmarks.loadgen import run_load
+
+
+class ScriptedBackend:
+    name = "scripted"
+
+    def __init__(self, words=("alpha", "beta", "gamma"), gap_s=0.01, fail=False):
+        self.words = words
+        self.gap_s = gap_s
+        self.fail = fail
+
+    def is_available(self):
+        return True
+
+    def generate(self, request):
+        if self.fail:
+            raise ConnectionError("backend down")
+        return GenerationResponse(content=" ".join(self.words), tokens=len(self.words), backend=self.name, diagnostics={"model": "m"})
+
+    def stream(self, request):
+        for index, word in enumerate(self.words, start=1):
+            time.sleep(self.gap_s)
+            yield GenerationChunk(content=word + " ", tokens=index, backend=self.name, finished=index == len(self.words))
+        if self.fail:
+            raise ConnectionError("stream cut")
+
+
+def _request(text="what is latency?", context="ctx", persona="generalist", history=()):
+    messages = [*history, {"role": "user", "content": text}]
+    return GenerationRequest(messages=messages, persona=persona, context=context, max_tokens=64)
+
+
+def _record(path, backend, requests, streamed=True):
+    writer = CassetteWriter(path)
+    recorder = RecordingBackend(backend, writer)
+    for request in requests:
+        if streamed:
+            list(recorder.stream(request))
+        else:
+            recorder.generate(request)
+    writer.close()
+
+
+def test_recording_captures_chunks_and_timing(tmp_path):
+    path = tmp_path / "run.jsonl.gz"
+    _record(path, ScriptedBackend(), [_request()])
+    _record(path, ScriptedBackend(), [_request("second")], streamed=False)  # appending keeps earlier runs
+
+    first, second = read_cassette(path)
+    assert first.streamed and first.backend == "scripted" and first.persona == "generalist"
+    assert first.content == "alpha beta gamma " and first.tokens == 3
+    assert all(delay >= 5 for delay, _, _ in first.chunks)
+
+    # A slow consumer does not stretch the recorded backend gaps
+    writer = CassetteWriter(tmp_path / "slow-consumer.jsonl")
+    for _ in RecordingBackend(ScriptedBackend(gap_s=0.005), writer).stream(_request()):
+        time.sleep(0.05)
+    writer.close()
+    (slow,) = read_cassette(tmp_path / "slow-consumer.jsonl")
+    assert all(delay < 40 for delay, _, _ in slow.chunks)
+    assert not second.streamed and second.chunks[0][1:] == ("alpha beta gamma", 3)
+    assert second.diagnostics == {"model": "m"}
+
+
+def test_replay_reproduces_content_and_scaled_timing(tmp_path):
+    path = tmp_path / "run.jsonl"
+    _record(path, ScriptedBackend(gap_s=0.02), [_request()])
+    cassette = Cassette.load(path)
+
+    start = time.perf_counter()
+    chunks = list(ReplayBackend(cassette, timing_scale=1.0).stream(_request()))
+    assert time.perf_counter() - start >= 0.05
+    assert [chunk.content for chunk in chunks] == ["alpha ", "beta ", "gamma "]
+    assert chunks[-1].finished and chunks[-1].backend == "scripted"
+    assert chunks[-1].diagnostics["replay.match"] == "exact"
+
+    start = time.perf_counter()
+    response = ReplayBackend(cassette, timing_scale=0).generate(_request())
+    assert time.perf_counter() - start < 0.02
+    assert response.content == "alpha beta gamma " and response.tokens == 3
+
+
+def test_fuzzy_fallbacks_and_round_robin(tmp_path):
+    path = tmp_path / "run.jsonl"
+    _record(path, ScriptedBackend(("one",), gap_s=0), [_request("hello")])
+    _record(path, ScriptedBackend(("two",), gap_s=0), [_request("hello")])
+    _record(path, ScriptedBackend(("three",), gap_s=0), [_request("other", persona="analyst")])
+    cassette = Cassette.load(path)
+    replay = ReplayBackend(cassette, timing_scale=0)
+
+    assert [replay.generate(_request("hello")).content for _ in range(3)] == ["one ", "two ", "one "]
+    assert replay.generate(_request("hello", context="new context")).diagnostics["replay.match"] == "messages"
+    history = [{"role": "user", "content": "earlier"}]
+    assert replay.generate(_request("  Hello ", history=history)).diagnostics["replay.match"] == "last_user"
+    assert replay.generate(_request("unseen", persona="analyst")).content == "three "
+    assert replay.generate(_request("unseen", persona="coder")).diagnostics["replay.match"] == "any"
+    assert cassette.stats() == {"exact": 3, "messages": 1, "last_user": 1, "persona": 1, "any": 1, "miss": 0}
+
+    strict = ReplayBackend(Cassette.load(path, fallbacks=()), timing_scale=0)
+    with pytest.raises(CassetteMiss):
+        strict.generate(_request("hello", context="new context"))
+    with pytest.raises(ValueError):
+        Cassette([], fallbacks=("nearest",))
+
+
+def test_failures_are_recorded_and_replayed(tmp_path):
+    path = tmp_path / "run.jsonl"
+    writer = CassetteWriter(path)
+    recorder = RecordingBackend(ScriptedBackend(("partial",), gap_s=0, fail=True), writer)
+    with pytest.raises(ConnectionError):
+        list(recorder.stream(_request("cut")))
+    with pytest.raises(ConnectionError):
+        recorder.generate(_request("down"))
+    writer.close()
+
+    replay = ReplayBackend(Cassette.load(path, fallbacks=()), timing_scale=0)
+    stream = replay.stream(_request("cut"))
+    assert next(stream).content == "partial "
+    with pytest.raises(ReplayedBackendError, match="stream cut"):
+        next(stream)
+    with pytest.raises(ReplayedBackendError, match="backend down"):
+        replay.generate(_request("down"))
+
+
+def test_application_record_and_replay_modes(tmp_path, app_config):
+    path = tmp_path / "app.jsonl.gz"
+    with pytest.raises(ValueError):
+        CassetteConfig(mode="replay")
+
+    app = AdaptiveMindApplication(app_config(cassette=CassetteConfig(mode="record", path=path)))
+    assert all(isinstance(backend, RecordingBackend) for backend in app.backends[:-1])
+    app.backends[0]._inner = ScriptedBackend(gap_s=0)  # stand in for a live model
+    recorded = app.chat(persona="generalist", messages=[{"role": "user", "content": "hi"}])
+    app.shutdown()
+    assert recorded["content"] == "alpha beta gamma"
+
+    app = AdaptiveMindApplication(app_config(cassette=CassetteConfig(mode="replay", path=path, timing_scale=0)))
+    try:
+        assert app.backends[0].name == "replay"
+        replayed = app.chat(persona="generalist", messages=[{"role": "user", "content": "hi"}])
+        assert replayed["content"] == recorded["content"] and replayed["model"] == "scripted"
+        streamed = list(app.stream_chat(persona="generalist", messages=[{"role": "user", "content": "hi"}]))
+        assert "".join(chunk["content"] for chunk in streamed) == recorded["content"]
+    finally:
+        app.shutdown()
+
+
+def test_load_generator_replays_recorded_workload(tmp_path):
+    path = tmp_path / "workload.jsonl"
+    _record(path, ScriptedBackend(gap_s=0.001), [_request(f"question {index}") for index in range(4)])
+    report = run_load(levels=[2], duration_s=0.3, cassette=str(path), timing_scale=0)
+    (run,) = report["runs"]
+    assert report["backend"] == "replay" and report["cassette"]["requests"] == 4
+    assert run["requests"] > 0 and run["error_rate"] == 0.0 and run["ttft_ms"] is not None
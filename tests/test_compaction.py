@@ -0,0 +1,86 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+from adaptivemind_core.config import CompactionConfig, ContextPipelineConfig, SessionConfig
+from adaptivemind_core.context.compaction import extractive_summary
+from adaptivemind_core.context.engine import ContextEngine
+from adaptivemind_core.context.sessions import SessionStore
+
+
+def _pipeline(threshold: int = 64) -> ContextPipelineConfig:
+    compaction = CompactionConfig(enabled=True, threshold_tokens=threshold, keep_recent_messages=4, summary_max_tokens=40)
+    return ContextPipelineConfig(compaction=compaction)
+
+
+def _history(count: int) -> list[dict]:
+    topics = ["kubernetes rollout", "database migration", "kubernetes autoscaling", "budget review"]
+    return [{"role": "user", "content": f"turn {i} about {topics[i % len(topics)]} and some detail"} for i in range(count)]
+
+
+def test_extractive_summary_respects_budget_and_order():
+    lines = ["USER: kubernetes rollout plan", "USER: lunch", "USER: kubernetes rollout risks"]
+    summary = extractive_summary(lines, max_tokens=8)
+    assert summary.splitlines() == ["USER: kubernetes rollout plan", "USER: kubernetes rollout risks"]
+
+
+def test_stateless_compaction_runs_off_request_path_and_is_reused(app_config):
+    config = app_config(max_context_window=4096, context_pipeline=_pipeline())
+    engine = ContextEngine(config)
+    persona = config.personas["generalist"]
+    history = _history(30)
+
+    first = engine.build_context(persona, history)
+    assert "## Summary" not in first
+    assert engine.compactor.wait_idle()
+
+    history.append({"role": "user", "content": "what about the kubernetes rollout?"})
+    second = engine.build_context(persona, history)
+    assert "## Summary" in second
+    assert "turn 0 about" in second or "turn 4 about" in second
+
+    stats = engine.stats()["compaction"]
+    assert stats["summaries_created"] >= 1
+    assert stats["reuses"] >= 1
+    assert 0 < stats["compaction_ratio"] < 1
+    engine.shutdown()
+
+
+def test_session_overflow_is_folded_into_summary(app_config):
+    config = app_config(max_context_window=4096, context_pipeline=_pipeline(threshold=64))
+    engine = ContextEngine(config)
+    store = SessionStore(SessionConfig(), config.context_pipeline.compaction)
+    session = store.create("generalist")
+    for message in _history(12):
+        store.append(session.session_id, message)
+    assert session.overflow()
+
+    engine.build_context(config.personas["generalist"], [], session=session)
+    assert engine.compactor.wait_idle()
+    assert session.summary is not None
+    assert not session.overflow()
+    context = engine.build_context(config.personas["generalist"], [], session=session)
+    assert context.index("## Summary") < context.index("## Conversation")
+    engine.shutdown()
+
+
+def test_conversations_opening_alike_keep_their_own_summaries(app_config):
+    assert CompactionConfig().enabled is False
+    config = app_config(max_context_window=4096, context_pipeline=_pipeline())
+    engine = ContextEngine(config)
+    persona = config.personas["generalist"]
+    greeting = [{"role": "user", "content": "hi"}]
+    first = greeting + _history(30)
+    second = greeting + [{**message, "content": message["content"] + " again"} for message in _history(30)]
+    for history in (first, second):
+        engine.build_context(persona, history)
+        assert engine.compactor.wait_idle()
+    assert engine.stats()["compaction"]["cached_summaries"] == 2
+    assert "## Summary" in engine.build_context(persona, first) and "## Summary" in engine.build_context(persona, second)
+    engine.shutdown()
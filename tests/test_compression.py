@@ -0,0 +1,60 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+from adaptivemind_core.config import CompressionConfig, ContextPipelineConfig
+from adaptivemind_core.context.compression import PromptCompressor
+from adaptivemind_core.context.engine import ContextEngine, ContextSection
+
+_REPORT = (
+    "The quarterly report shows revenue growth in the cloud division. "
+    "Cloud revenue grew because enterprise customers migrated workloads. "
+    "All rights reserved by the publisher. "
+    "Click here to subscribe to our newsletter. "
+    "Operating costs in the cloud division fell as data centers were consolidated. "
+)
+
+
+def test_compressor_strips_boilerplate_and_duplicates():
+    compressor = PromptCompressor(CompressionConfig(default_target_ratio=1.0))
+    sections = [
+        ContextSection("Persona", "Stay factual."),
+        ContextSection("Doc:a", _REPORT),
+        ContextSection("Doc:b", _REPORT),
+    ]
+    result, stats = compressor.compress(sections, budget_tokens=1000, persona="generalist")
+
+    bodies = " ".join(section.body for section in result)
+    assert "All rights reserved" not in bodies
+    assert "subscribe" not in bodies
+    assert [section.title for section in result] == ["Persona", "Doc:a"]
+    assert stats.tokens_removed > stats.tokens_before / 2
+    assert stats.salience_recall > 0.8
+
+
+def test_compressor_meets_persona_target_ratio():
+    compressor = PromptCompressor(CompressionConfig(persona_target_ratios={"terse": 0.3}))
+    body = " ".join(f"Sentence {i} discusses cloud revenue topic {i % 3}." for i in range(40))
+    result, stats = compressor.compress([ContextSection("Research", body)], budget_tokens=10_000, persona="terse")
+    assert stats.target_ratio == 0.3
+    assert stats.tokens_after <= int(stats.tokens_before * 0.3)
+    assert result[0].body
+
+
+def test_engine_reports_compression_diagnostics(tmp_path, app_config):
+    for name in ("a", "b", "c"):
+        (tmp_path / f"{name}.txt").write_text(_REPORT * 40)
+    pipeline = ContextPipelineConfig(extra_documents_dir=tmp_path, compression=CompressionConfig(enabled=True))
+    config = app_config(context_pipeline=pipeline)
+    assert ContextEngine(app_config()).compressor is None
+    engine = ContextEngine(config)
+    build = engine.build(config.personas["generalist"], [{"role": "user", "content": "How did cloud revenue change?"}])
+    assert "## Doc:a" in build.text
+    assert int(build.diagnostics["compression.tokens_removed"]) > 0
+    assert engine.stats()["compression"]["requests"] == 1
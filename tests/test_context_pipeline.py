@@ -0,0 +1,75 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+import time
+
+from adaptivemind_core.config import AppConfig, PersonaConfig
+from adaptivemind_core.context.engine import ContextEngine, ContextSection
+from adaptivemind_core.context.pipeline import ContextStage
+
+
+def _engine() -> tuple[ContextEngine, PersonaConfig]:
+    persona = PersonaConfig(name="generalist", description="", system_prompt="Stay factual.", max_context_window=4096)
+    config = AppConfig(personas={"generalist": persona}, allowed_personas=["generalist"])
+    return ContextEngine(config), persona
+
+
+def _sleeping_stage(name: str, delay: float, timeout: float) -> ContextStage:
+    def _run(request):
+        time.sleep(delay)
+        return [ContextSection(name.title(), f"{name} result")]
+
+    return ContextStage(name, _run, timeout_s=timeout)
+
+
+def test_default_stages_report_timing_and_skips():
+    engine, persona = _engine()
+    build = engine.build(persona, [{"role": "user", "content": "Hello"}], external_context=["Snippet"])
+    assert build.diagnostics["stage.persona.status"] == "ok"
+    assert build.diagnostics["stage.research.status"] == "ok"
+    assert build.diagnostics["stage.documents.status"] == "skipped"
+    assert float(build.diagnostics["stage.total.ms"]) >= 0
+    engine.shutdown()
+
+
+def test_slow_stage_is_dropped_after_deadline():
+    engine, persona = _engine()
+    engine.pipeline.add_stage(_sleeping_stage("retrieval", delay=0.5, timeout=0.05))
+    started = time.perf_counter()
+    build = engine.build(persona, [{"role": "user", "content": "Hello"}])
+    assert time.perf_counter() - started < 0.4
+    assert build.diagnostics["stage.retrieval.status"] == "timeout"
+    assert "retrieval result" not in build.text
+    assert "## Conversation" in build.text
+    engine.shutdown()
+
+
+def test_independent_stages_run_concurrently_and_keep_order():
+    engine, persona = _engine()
+    engine.pipeline.add_stage(_sleeping_stage("alpha", delay=0.2, timeout=1.0))
+    engine.pipeline.add_stage(_sleeping_stage("beta", delay=0.2, timeout=1.0), before="alpha")
+    started = time.perf_counter()
+    build = engine.build(persona, [{"role": "user", "content": "Hello"}])
+    assert time.perf_counter() - started < 0.35
+    assert build.text.index("## Beta") < build.text.index("## Alpha")
+    engine.shutdown()
+
+
+def test_failing_optional_stage_degrades_gracefully():
+    engine, persona = _engine()
+
+    def _boom(request):
+        raise RuntimeError("index unavailable")
+
+    engine.pipeline.add_stage(ContextStage("retrieval", _boom, timeout_s=0.5))
+    build = engine.build(persona, [{"role": "user", "content": "Hello"}])
+    assert build.diagnostics["stage.retrieval.status"] == "error"
+    assert "## Persona" in build.text
+    engine.shutdown()
@@ -0,0 +1,159 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+from adaptivemind_core.app import AdaptiveMindApplication
+from adaptivemind_core.config import DeduplicationConfig, DocumentIndexConfig, IngestConfig
+from adaptivemind_core.context.dedup import MinHasher, NearDuplicateIndex, collapse, similarity
+from adaptivemind_core.context.documents import DocumentIndex
+from adaptivemind_core.context.engine import ContextEngine
+
+ARTICLE = (
+    "The city council approved the new transit budget on Tuesday after a long debate. "
+    "The plan adds twelve bus routes, extends light rail service to the airport and "
+    "raises fares by ten cents for the first time since 2019. Opponents argued that "
+    "the fare increase hurts commuters who rely on buses, while supporters pointed to "
+    "the growing maintenance backlog and the need for electric vehicles."
+)
+REPOST = ARTICLE.upper() + " Updated at noon."
+UNRELATED = (
+    "Sourdough bread needs a lively starter, a long cold fermentation and a very hot "
+    "oven. Bakers score the loaf before baking so that steam can escape evenly."
+)
+
+
+def test_minhash_estimates_similarity():
+    hasher = MinHasher(num_perm=128, shingle_words=3)
+    article, repost, unrelated = (hasher.signature(text) for text in (ARTICLE, REPOST, UNRELATED))
+    assert similarity(article, hasher.signature(ARTICLE)) == 1.0
+    assert similarity(article, repost) >= 0.8
+    assert similarity(article, unrelated) < 0.2
+    assert hasher.signature("  ...  ") == () and similarity((), ()) == 0.0
+    assert collapse([article, unrelated, repost], threshold=0.8) == [0, 1]
+
+
+def test_lsh_index_finds_near_duplicates_among_candidates():
+    index = NearDuplicateIndex(DeduplicationConfig())
+    for n in range(200):
+        index.add(f"noise-{n}", index.signature(f"{UNRELATED} batch {n} of the bakery log, item {n * 7}"))
+    index.add("article", index.signature(ARTICLE))
+    key, score = index.find(index.signature(REPOST))
+    assert key == "article" and score >= 0.8
+    assert index.find(index.signature("An entirely different note about tax filing deadlines in spring.")) is None
+    index.remove("article")
+    assert index.find(index.signature(REPOST)) is None and len(index) == 200
+
+
+def test_duplicates_are_linked_instead_of_indexed():
+    index = DocumentIndex(DocumentIndexConfig())
+    assert index.add("original", ARTICLE).chunks == 1
+    linked = index.add("repost", REPOST)
+    assert linked.duplicate_of == "original" and linked.chunks == 0 and linked.similarity >= 0.8
+    assert index.add("bread", UNRELATED).duplicate_of is None
+    stats = index.stats()
+    assert stats["chunks"] == 2 and stats["duplicates"] == 1 and stats["duplicates_linked"] == 1
+    assert index.duplicates("original") == ["repost"] and index.canonical("repost") == "original"
+
+    # Replacing a linked id with new content indexes it on its own
+    assert index.add("repost", "Ferries will run every twenty minutes during the summer festival.").chunks == 1
+    assert index.duplicates("original") == [] and index.canonical("repost") is None
+    index.add("copy", ARTICLE)
+    assert index.remove("original") and index.canonical("copy") is None
+
+    disabled = DocumentIndex(DocumentIndexConfig(dedup=DeduplicationConfig(enabled=False)))
+    disabled.add("original", ARTICLE)
+    assert disabled.add("repost", REPOST).duplicate_of is None and len(disabled) == 2
+
+
+def test_duplicates_take_the_place_of_a_replaced_original():
+    index = DocumentIndex(DocumentIndexConfig(min_score=0.0))
+    index.add("a", ARTICLE)
+    assert index.add("b", ARTICLE + " Extra words added by the syndication feed.").duplicate_of == "a"
+    index.add("a", UNRELATED)
+    assert index.canonical("b") is None and index.stats()["duplicates_promoted"] == 1
+    assert {chunk.doc_id for chunk, _ in index.search("transit budget fares")} == {"b"}
+
+
+def test_eviction_drops_an_original_with_its_duplicates():
+    ferry = "Ferries will run every twenty minutes during the summer festival."
+    evicting = DocumentIndex(DocumentIndexConfig(max_chunks=3, min_score=0.0))
+    evicting.add("original", ARTICLE)
+    evicting.add("bread", UNRELATED)
+    # A new duplicate makes its original the most recent document, so "bread" goes first
+    evicting.add("repost", REPOST)
+    evicting.add("ferry", ferry)
+    assert evicting.search("sourdough starter") == [] and evicting.canonical("repost") == "original"
+    evicting.add("festival", "The festival parade closes the harbour road on Saturday morning.")
+    assert evicting.canonical("repost") is None and evicting.search("transit budget fares") == []
+    stats = evicting.stats()
+    assert stats["documents_evicted"] == 2 and stats["duplicates_evicted"] == 1 and stats["linked_chunks"] == 0
+
+    # Linked documents count towards the capacity, so reposts cannot pile up
+    bounded = DocumentIndex(DocumentIndexConfig(max_chunks=50))
+    for n in range(2000):
+        bounded.add(f"repost-{n}", f"{ARTICLE} Shared {n % 7} times.")
+    for n in range(200):
+        bounded.add(f"note-{n}", " ".join(f"w{n}x{k}" for k in range(20)))
+    stats = bounded.stats()
+    assert stats["chunks"] + stats["linked_chunks"] <= 50 and stats["duplicates"] < 50
+
+
+def test_retrieval_collapses_near_identical_chunks():
+    shared = "Reset the router by holding the power button for ten seconds until the light blinks."
+    index = DocumentIndex(DocumentIndexConfig(chunk_tokens=16, min_score=0.0))
+    index.add("manual-v1", f"{shared}\n\nVersion one ships with a grey plastic case and two antennas.")
+    index.add("manual-v2", f"{shared.upper()}\n\nVersion two adds a mesh radio, a metal case and USB ports.")
+    assert index.stats()["duplicates"] == 0  # the documents as a whole differ
+    results = index.search("how do I reset the router power button", limit=3)
+    assert sum("ten seconds" in chunk.text.lower() for chunk, _ in results) == 1
+    assert index.stats()["duplicates_collapsed"] >= 1
+
+
+def test_ingest_batches_report_dedup_ratio(wait_indexed, app_config):
+    # One indexing thread, so the reposts are indexed after their original
+    app = AdaptiveMindApplication(app_config(ingest=IngestConfig(workers=1)))
+    try:
+        items = [{"content": ARTICLE}, {"content": UNRELATED}, {"content": REPOST}, {"content": ARTICLE}]
+        batch = wait_indexed(app.ingest_batch, app.ingest_items(items)["batch_id"])
+        assert batch["indexed"] == 4 and batch["duplicates"] == 2 and batch["dedup_ratio"] == 0.5
+        assert app.ingest.stats()["counters"]["duplicates"] == 2
+    finally:
+        app.shutdown()
+
+
+def test_document_stage_skips_near_duplicate_files(tmp_path, app_config):
+    (tmp_path / "a.txt").write_text(ARTICLE)
+    (tmp_path / "b.txt").write_text(REPOST)
+    (tmp_path / "c.txt").write_text(UNRELATED)
+    config = app_config()
+    config.context_pipeline.extra_documents_dir = tmp_path
+    context = ContextEngine(config).build_context(
+        persona=config.personas["generalist"], messages=[{"role": "user", "content": "Hello"}]
+    )
+    assert "Doc:a" in context and "Doc:c" in context and "Doc:b" not in context
+
+
+def test_document_signatures_are_cached_until_the_file_changes(tmp_path, app_config):
+    (tmp_path / "a.txt").write_text(ARTICLE)
+    (tmp_path / "b.txt").write_text(UNRELATED)
+    config = app_config()
+    config.context_pipeline.extra_documents_dir = tmp_path
+    engine = ContextEngine(config)
+    signature = engine._hasher.signature
+    calls = []
+    engine._hasher.signature = lambda text: calls.append(text) or signature(text)
+    messages = [{"role": "user", "content": "Hello"}]
+    persona = config.personas["generalist"]
+    engine.build_context(persona=persona, messages=messages)
+    engine.build_context(persona=persona, messages=messages)
+    assert len(calls) == 2
+
+    (tmp_path / "b.txt").write_text(REPOST)
+    context = engine.build_context(persona=persona, messages=messages)
+    assert len(calls) == 3 and "Doc:a" in context and "Doc:b" not in context
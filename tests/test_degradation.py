@@ -0,0 +1,184 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+import time
+
+from adaptivemind_core.app import AdaptiveMindApplication
+from adaptivemind_core.config import DegradationConfig, DegradationLevelConfig, SloConfig
+from adaptivemind_core.llm.base import GenerationResponse
+from adaptivemind_core.monitoring.metrics import MetricsRegistry
+from adaptivemind_core.routing.degradation import FULL_FIDELITY, DegradationController
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _controller(**overrides):
+    settings = {
+        "enabled": True,
+        "default_slo": SloConfig(p95_ms=100.0, p99_ms=None),
+        "window_s": 60.0,
+        "min_samples": 5,
+        "evaluation_interval_s": 1.0,
+        "recovery_hold_s": 10.0,
+        "levels": [
+            DegradationLevelConfig(name="reduced_context", context_scale=0.5),
+            DegradationLevelConfig(name="capped_output", context_scale=0.5, max_tokens=64, disabled_stages=["documents"]),
+        ],
+        **overrides,
+    }
+    metrics = MetricsRegistry()
+    clock = FakeClock()
+    return DegradationController(DegradationConfig(**settings), metrics, clock=clock), metrics, clock
+
+
+def _serve(metrics, clock, latency_ms, count=10, persona="generalist"):
+    for _ in range(count):
+        metrics.record_request(persona=persona, latency_ms=latency_ms, generated_tokens=1, context_tokens=1)
+    clock.now += 1.0
+
+
+def test_controller_escalates_on_missed_slo_and_recovers_with_hysteresis():
+    controller, metrics, clock = _controller()
+    assert controller.plan("generalist") is FULL_FIDELITY
+
+    _serve(metrics, clock, 250.0, count=3)
+    assert controller.plan("generalist").level == 0  # below min_samples
+    _serve(metrics, clock, 250.0)
+    plan = controller.plan("generalist")
+    assert plan.name == "reduced_context" and plan.context_budget(4096) == 2048
+
+    # The window restarted at the change, so the same slow traffic is needed again
+    clock.now += 1.0
+    assert controller.plan("generalist").level == 1
+    _serve(metrics, clock, 250.0)
+    plan = controller.plan("generalist")
+    assert plan.level == 2 and plan.cap_tokens(512) == 64 and "documents" in plan.disabled_stages
+    _serve(metrics, clock, 250.0)
+    assert controller.plan("generalist").level == 2  # already at the last level
+
+    # Inside the objective but above the recovery ratio: hold the level
+    for _ in range(15):
+        _serve(metrics, clock, 90.0)
+        controller.plan("generalist")
+    assert controller.plan("generalist").level == 2
+
+    # Fast traffic recovers one level once the 90 ms requests left the window and the hold elapsed
+    seconds = 0
+    while controller.plan("generalist").level == 2 and seconds < 120:
+        _serve(metrics, clock, 20.0)
+        seconds += 1
+    assert 60 + 10 <= seconds < 60 + 10 + 15
+    assert controller.plan("generalist").level == 1
+
+    status = controller.status()["personas"]["generalist"]
+    assert status["name"] == "reduced_context" and status["slo_p95_ms"] == 100.0
+    assert metrics.exposition_state()["gauges"][("degradation_level", (("persona", "generalist"),))] == 1.0
+
+
+def test_controller_uses_per_persona_objectives_and_can_be_disabled():
+    controller, metrics, clock = _controller(persona_slos={"coder": SloConfig(p95_ms=1000.0, p99_ms=None)})
+    controller.plan("generalist")
+    controller.plan("coder")
+    _serve(metrics, clock, 250.0, persona="generalist")
+    _serve(metrics, clock, 250.0, persona="coder")
+    controller.evaluate()
+    assert controller.plan("generalist").level == 1 and controller.plan("coder").level == 0
+
+    disabled, metrics, clock = _controller(enabled=False)
+    _serve(metrics, clock, 250.0)
+    assert disabled.plan("generalist") is FULL_FIDELITY and not disabled.status()["enabled"]
+
+
+class RecordingBackend:
+    def __init__(self, name, delay_s=0.0):
+        self.name = name
+        self.delay_s = delay_s
+        self.requests = []
+
+    def is_available(self):
+        return True
+
+    def generate(self, request):
+        self.requests.append(request)
+        time.sleep(self.delay_s)
+        return GenerationResponse(content="ok", tokens=1, backend=self.name)
+
+    def stream(self, request):
+        raise NotImplementedError
+
+
+def test_router_applies_plan_and_reports_level(app_config):
+    degradation = DegradationConfig(
+        enabled=True,
+        default_slo=SloConfig(p95_ms=1.0, p99_ms=None),
+        min_samples=3,
+        evaluation_interval_s=0.0,
+        levels=[
+            DegradationLevelConfig(
+                name="fast_backend", context_scale=0.5, max_tokens=32, disabled_stages=["research"], prefer_fast_backend=True
+            )
+        ],
+    )
+    app = AdaptiveMindApplication(app_config(max_context_window=1024, degradation=degradation))
+    slow, fast = RecordingBackend("slow", delay_s=0.005), RecordingBackend("fast")
+    app.router.set_backends([slow, fast, app.backends[-1]])
+    app.metrics.record_request(persona="warmup", latency_ms=0.1, generated_tokens=1, context_tokens=1, backend="fast")
+    try:
+        messages = [{"role": "user", "content": "hello"}]
+        for _ in range(3):
+            app.chat("generalist", messages, max_tokens=512, external_context=["snippet"])
+        assert slow.requests[-1].max_tokens == 512 and "Research" in slow.requests[-1].context
+        assert app.traces_latest(1)[0]["extra"]["degradation.level"] == "0"
+
+        app.chat("generalist", messages, max_tokens=512, external_context=["snippet"])
+        request = fast.requests[-1]
+        assert request.max_tokens == 32 and "Research" not in request.context
+        trace = app.traces_latest(1)[0]
+        assert trace["extra"]["degradation.name"] == "fast_backend" and trace["backend"] == "fast"
+
+        status = app.system_status()
+        assert status["status"] == "degraded"
+        assert status["degradation"]["personas"]["generalist"]["level"] == 1
+    finally:
+        app.shutdown()
+
+
+def test_default_ladder_stops_retrieval_under_pressure(app_config):
+    ladder = {level.name: level for level in DegradationConfig().levels}
+    assert {"documents", "research", "retrieval"} <= set(ladder["no_retrieval"].disabled_stages)
+    assert {"documents", "research", "retrieval"} <= set(ladder["fast_backend"].disabled_stages)
+
+    degradation = DegradationConfig(
+        enabled=True,
+        default_slo=SloConfig(p95_ms=1.0, p99_ms=None),
+        min_samples=3,
+        evaluation_interval_s=0.0,
+        levels=[ladder["no_retrieval"]],
+    )
+    app = AdaptiveMindApplication(app_config(max_context_window=1024, degradation=degradation))
+    backend = RecordingBackend("slow", delay_s=0.005)
+    app.router.set_backends([backend, app.backends[-1]])
+    app.context_engine.documents.add("ops", "The staging cluster restarts every Sunday at 02:00 UTC.", title="Ops")
+    try:
+        messages = [{"role": "user", "content": "When does the staging cluster restart?"}]
+        for _ in range(3):
+            app.chat("generalist", messages)
+        assert "Knowledge:Ops" in backend.requests[-1].context
+        app.chat("generalist", messages)
+        assert app.traces_latest(1)[0]["extra"]["degradation.name"] == "no_retrieval"
+        assert "Knowledge:Ops" not in backend.requests[-1].context
+    finally:
+        app.shutdown()
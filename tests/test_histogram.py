@@ -0,0 +1,67 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+import random
+
+from adaptivemind_core.monitoring.histogram import LatencyHistogram
+from adaptivemind_core.monitoring.metrics import MetricsRegistry
+
+
+def test_percentiles_are_within_bucket_precision():
+    rng = random.Random(7)
+    values = sorted(rng.lognormvariate(4, 1) for _ in range(20_000))
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+    result = histogram.percentiles()
+    for name, quantile in {"p50": 0.5, "p90": 0.9, "p99": 0.99}.items():
+        exact = values[int(quantile * len(values)) - 1]
+        assert abs(result[name] - exact) / exact < 0.05
+    assert result["p999"] <= histogram.max
+
+
+def test_merge_subtract_and_round_trip():
+    first, second = LatencyHistogram(), LatencyHistogram()
+    for value in (1.0, 2.0, 3.0):
+        first.record(value)
+    for value in (100.0, 200.0):
+        second.record(value)
+    merged = LatencyHistogram.from_dict(first.to_dict())
+    merged.merge(second)
+    assert merged.count == 5
+    assert merged.percentile(1.0) == 200.0
+    merged.subtract(second)
+    assert merged.count == 3
+    assert merged.percentile(0.99) <= 3.1
+
+    copy, state = merged.copy(), merged.to_dict()
+    merged.record(500.0)
+    assert copy.to_dict() == state and merged.count == 4
+
+
+def test_registry_harvest_reports_percentiles_per_series():
+    registry = MetricsRegistry()
+    for latency in range(1, 101):
+        registry.record_request("generalist", float(latency), 10, 20, backend="ollama", phases={"context_build": 1.5})
+    registry.record_phase("queue", 4.0)
+    snapshot = registry.harvest()
+    assert snapshot.request_count == 100
+    assert snapshot.max_latency_ms == 100.0
+    assert 49 <= snapshot.latency_percentiles["total"]["p50"] <= 52
+    assert "total|persona=generalist" in snapshot.latency_percentiles
+    assert "context_build|backend=ollama" in snapshot.latency_percentiles
+    assert "queue" in snapshot.latency_percentiles
+    assert registry.harvest().request_count == 0
+    assert registry.histogram("total", backend="ollama").count == 100
+
+    other = MetricsRegistry()
+    other.merge_histograms(registry.export_histograms())
+    other.merge_histograms(registry.export_histograms())
+    assert other.histogram("total", persona="generalist").count == 200
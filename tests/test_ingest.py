@@ -0,0 +1,132 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+import json
+import threading
+import time
+
+from fastapi.testclient import TestClient
+
+from adaptivemind_core.app import AdaptiveMindApplication
+from adaptivemind_core.config import DocumentIndexConfig, IngestConfig
+from adaptivemind_core.context.documents import DocumentIndex, chunk_text
+from adaptivemind_core.ingest import IngestPipeline, LineSplitter
+from adaptivemind_core.server import build_app
+
+
+def test_chunks_follow_sentences_and_windows_overlap():
+    text = "One two three. Four five six.\n\nSeven eight nine ten eleven twelve thirteen."
+    assert chunk_text(text, chunk_tokens=6) == ["One two three. Four five six.", "Seven eight nine ten eleven twelve", "thirteen."]
+    words = " ".join(f"w{n}" for n in range(10))
+    assert chunk_text(words, chunk_tokens=4, overlap_tokens=1, semantic=False) == ["w0 w1 w2 w3", "w3 w4 w5 w6", "w6 w7 w8 w9"]
+
+
+def test_index_ranks_by_bm25_and_replaces_documents():
+    index = DocumentIndex(DocumentIndexConfig(chunk_tokens=50, max_chunks=3))
+    index.add("solar", "Solar panels convert sunlight into electricity.", title="Solar")
+    index.add("wind", "Wind turbines convert moving air into electricity. Turbines need wind.", title="Wind")
+    index.add("tea", "Green tea is brewed from leaves.", title="Tea")
+    best, score = index.search("how do wind turbines work", min_score=0.0)[0]
+    assert best.doc_id == "wind" and score > 0
+    assert index.search("the of and") == []
+
+    index.add("tea", "Black tea is oxidised before drying.")
+    assert index.stats()["documents_replaced"] == 1 and not index.search("green leaves", min_score=0.1)
+    index.add("hydro", "Dams turn falling water into electricity.")
+    assert index.stats()["documents"] == 3 and not index.search("solar sunlight", min_score=0.0)
+
+
+def test_line_splitter_rejects_oversized_lines():
+    splitter = LineSplitter(max_line_bytes=10)
+    assert splitter.feed(b'{"a":1}\n{"b"') == [b'{"a":1}']
+    assert splitter.feed(b':2}\n\n' + b"x" * 8) == [b'{"b":2}']
+    assert splitter.feed(b"yyyy\n{}") == [None]
+    assert splitter.close() == [b"{}"]
+
+
+def test_pipeline_applies_backpressure_and_reports_lag():
+    index = DocumentIndex(DocumentIndexConfig())
+    gate = threading.Event()
+    add = index.add
+    index.add = lambda *args, **kwargs: gate.wait(5) and add(*args, **kwargs)
+    pipeline = IngestPipeline(IngestConfig(workers=1, max_pending_items=2), index)
+    try:
+        submitted = threading.Event()
+
+        def upload():
+            pipeline.ingest({"content": f"document {n}"} for n in range(6))
+            submitted.set()
+
+        threading.Thread(target=upload, daemon=True).start()
+        time.sleep(0.2)
+        # One item is being indexed and two wait in the queue; the upload waits for room
+        assert not submitted.is_set() and pipeline.pending() == 2
+        assert pipeline.index_lag_s() > 0.1
+        gate.set()
+        assert submitted.wait(5)
+        deadline = time.monotonic() + 5
+        while pipeline.stats()["counters"]["indexed"] < 6 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        stats = pipeline.stats()
+        assert stats["counters"]["indexed"] == 6 and stats["index_lag_s"] == 0.0
+        assert stats["items_per_second"] > 0 and stats["lag_ms"]["p50"] > 0
+    finally:
+        gate.set()
+        pipeline.shutdown()
+
+
+def test_ingested_documents_become_retrieved_context(wait_indexed, app_config):
+    app = AdaptiveMindApplication(app_config())
+    try:
+        batch = app.ingest_items(
+            [
+                {"id": "kb-1", "content": "The staging cluster restarts every Sunday at 02:00 UTC.", "title": "Ops"},
+                {"source": "wiki", "content": "Invoices are archived after seven years.", "metadata": {"subject": "Finance"}},
+            ]
+        )
+        assert wait_indexed(app.ingest_batch, batch["batch_id"])["indexed"] == 2
+        context = app.context_engine.build_context(
+            persona=app.config.personas["generalist"],
+            messages=[{"role": "user", "content": "When does the staging cluster restart?"}],
+        )
+        assert "Knowledge:Ops" in context and "every Sunday" in context and "Invoices" not in context
+        assert app.context_stats()["documents"]["documents"] == 2
+    finally:
+        app.shutdown()
+
+
+def test_streamed_ndjson_upload(wait_indexed, app_config):
+    with TestClient(build_app(config=app_config(ingest=IngestConfig(max_line_bytes=1024)))) as client:
+        lines = [
+            json.dumps({"id": "kb-1", "content": "The staging cluster restarts every Sunday at 02:00 UTC."}),
+            "not json",
+            json.dumps({"content": ""}),
+            json.dumps({"content": "x" * 1100}),
+            json.dumps({"content": "Invoices are archived after seven years.", "metadata": {"subject": "Finance"}}),
+        ]
+        body = ("\n".join(lines) + "\n").encode()
+        chunks = (body[start : start + 37] for start in range(0, len(body), 37))
+        response = client.post("/api/v1/feed/ingest", content=chunks, headers={"Content-Type": "application/x-ndjson"})
+        assert response.status_code == 200
+        summary = response.json()
+        assert summary["ingested"] == 2 and summary["rejected"] == 3 and len(summary["errors"]) == 3
+
+        batch = wait_indexed(lambda batch_id: client.get(f"/api/v1/feed/batches/{batch_id}").json(), summary["batch_id"])
+        assert batch["indexed"] == 2 and batch["chunks"] == 2
+        assert client.get("/api/v1/feed/batches/missing").status_code == 404
+
+        legacy = client.post("/api/v1/feed/ingest", json={"items": [{"source": "pytest", "content": "Feed content", "metadata": {"subject": "test"}}]})
+        assert legacy.status_code == 200 and legacy.json()["ingested"] == 1
+        assert client.post("/api/v1/feed/ingest", json={"items": "nope"}).status_code == 400
+
+        stats = client.get("/api/v1/monitoring/ingest").json()
+        assert stats["counters"]["received"] == 3 and stats["index"]["documents"] >= 2
+        exposition = client.get("/metrics").text
+        assert 'queue_depth{queue="ingest"}' in exposition and "ingest_index_lag_seconds" in exposition
@@ -0,0 +1,193 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+import json
+import threading
+import time
+import uuid
+
+import pytest
+
+from adaptivemind_core.app import AdaptiveMindApplication
+from adaptivemind_core.config import JobsConfig
+from adaptivemind_core.inmemory_redis import InMemoryRedis
+from adaptivemind_core.job_broker import RedisJobQueue
+from adaptivemind_core.monitoring.metrics import MetricsRegistry
+from benchmarks.jobload import run_job_load
+
+
+def _config(**overrides):
+    settings = {"broker_url": "memory://", "queue_name": f"test:{uuid.uuid4().hex[:6]}", "poll_interval_s": 0.01, "heartbeat_interval_s": 0.05}
+    return JobsConfig(**{**settings, **overrides})
+
+
+def _queue(client, config, handlers, **overrides):
+    return RedisJobQueue(config.model_copy(update=overrides), MetricsRegistry(), handlers, client=client)
+
+
+@pytest.fixture
+def queues():
+    started = []
+
+    def start(client, config, handlers, **overrides):
+        started.append(_queue(client, config, handlers, **overrides))
+        return started[-1]
+
+    yield start
+    for jobs in started:
+        jobs.shutdown(timeout=0.5)
+
+
+def test_in_memory_redis_commands():
+    redis = InMemoryRedis()
+    redis.rpush("pending", "a", "b", "c")
+    assert redis.lmove("pending", "processing", "LEFT", "RIGHT") == "a"
+    assert redis.lrange("pending", 0, -1) == ["b", "c"] and redis.lpos("pending", "c") == 1
+    assert redis.lrem("pending", 1, "b") == 1 and redis.llen("pending") == 1
+    assert redis.hincrby("job", "deliveries", 1) == 1 and redis.hgetall("job") == {"deliveries": "1"}
+    redis.zadd("leases", {"a": 5.0, "b": 1.0})
+    assert redis.zrangebyscore("leases", "-inf", 4) == ["b"] and redis.zcard("leases") == 2
+    assert redis.set("lock", "me", nx=True, px=30) and redis.set("lock", "you", nx=True) is None
+    redis.pexpire("job", 10)
+    time.sleep(0.04)
+    assert redis.get("lock") is None and not redis.exists("job")
+    assert InMemoryRedis.named("shared") is InMemoryRedis.named("shared")
+
+
+def test_workers_share_the_queue_and_report_positions(queues, wait_for_job):
+    client, config = InMemoryRedis(), _config(workers=1, prefetch=0)
+    release, ran_by = threading.Event(), {}
+
+    def handler(worker_name):
+        def run(payload, context):
+            release.wait(5)
+            ran_by[payload["n"]] = worker_name
+            return payload
+
+        return run
+
+    producer = queues(client, config, {"echo": handler("producer")}, run_workers=False)
+    submitted = [producer.submit("echo", {"n": n}) for n in range(4)]
+    assert [job["position"] for job in submitted] == [0, 1, 2, 3]
+    urgent = producer.submit("echo", {"n": 4}, priority=0)
+    assert urgent["position"] == 0 and producer.status(submitted[0]["job_id"])["position"] == 1
+
+    workers = [queues(client, config, {"echo": handler(name)}) for name in ("a", "b")]
+    release.set()
+    for job in [*submitted, urgent]:
+        assert wait_for_job(producer, job["job_id"])["status"] == "completed"
+    assert set(ran_by.values()) == {"a", "b"}
+    stats = producer.stats()
+    assert stats["counters"]["completed"] == 5 and len(stats["cluster"]) == 2 and stats["queued"] == 0
+    assert sum(worker.stats()["queue_wait_ms"]["p50"] > 0 for worker in workers) == 2
+
+
+def test_jobs_of_a_dead_worker_are_delivered_again(queues, wait_for_job):
+    client, config = InMemoryRedis(), _config(worker_timeout_s=0.2)
+    dead = queues(client, config, {"echo": lambda payload, context: payload}, run_workers=False)
+    job = dead.submit("echo", {"n": 1})
+    assert dead._claim() == (job["job_id"], 1)
+    # Its last heartbeat is older than the worker timeout
+    beat = {"heartbeat": time.time() - 1, "started_at": time.time() - 2, "pid": 0, "concurrency": 1, "held": 1}
+    client.hset(f"{config.queue_name}:workers", dead.worker_id, json.dumps(beat))
+
+    queues(client, config, {"echo": lambda payload, context: payload})
+    done = wait_for_job(dead, job["job_id"])
+    assert done["status"] == "completed" and done["result"] == {"n": 1}
+    assert client.hget(f"{config.queue_name}:job:{job['job_id']}", "deliveries") == "2"
+    assert dead.stats()["counters"]["redelivered"] == 1
+    assert not client.exists(f"{config.queue_name}:processing:{dead.worker_id}")
+
+
+def test_visibility_timeout_redelivers_jobs_of_a_silent_worker_until_the_limit(queues):
+    client, config = InMemoryRedis(), _config(workers=2, visibility_timeout_s=0.15, max_deliveries=2)
+
+    def stall(payload, context):
+        time.sleep(0.4)
+        return {"stalled": True}
+
+    # Its fetcher and executors run, but it never beats again to renew the lease
+    silent = queues(client, config, {"stall": stall}, heartbeat_interval_s=60.0)
+    reaper = queues(client, config, {}, run_workers=False)
+    stalled = silent.submit("stall", {})
+    deadline = time.monotonic() + 5.0
+    while silent.status(stalled["job_id"])["status"] != "failed" and time.monotonic() < deadline:
+        reaper._reap()
+        time.sleep(0.02)
+    failed = silent.status(stalled["job_id"])
+    assert failed["status"] == "failed" and "interrupted 2 times" in failed["error"]
+    time.sleep(0.5)  # the stalled runs finish; neither may overwrite the failure
+    assert silent.status(stalled["job_id"])["status"] == "failed"
+
+
+def test_heartbeats_keep_long_running_jobs_leased(queues, wait_for_job):
+    client, config = InMemoryRedis(), _config(workers=2, visibility_timeout_s=0.15)
+
+    def slow(payload, context):
+        time.sleep(0.5)  # several visibility timeouts without a progress report
+        return {"slow": True}
+
+    def report(payload, context):
+        for step in range(8):
+            context.progress(step * 12.5)
+            time.sleep(0.05)
+        return {"reported": True}
+
+    jobs = queues(client, config, {"slow": slow, "report": report})
+    quiet = jobs.submit("slow", {})
+    reporting = jobs.submit("report", {})
+    assert wait_for_job(jobs, quiet["job_id"])["result"] == {"slow": True}
+    assert wait_for_job(jobs, reporting["job_id"])["result"] == {"reported": True}
+    for job in (quiet, reporting):
+        assert client.hget(f"{config.queue_name}:job:{job['job_id']}", "deliveries") == "1"
+    assert "redelivered" not in jobs.stats()["counters"]
+
+
+def test_prefetch_is_limited_to_a_share_of_the_backlog(queues):
+    client, config = InMemoryRedis(), _config(prefetch=4)
+    producer = queues(client, config, {"echo": lambda payload, context: payload}, run_workers=False)
+    for n in range(6):
+        producer.submit("echo", {"n": n})
+    producer._beat()
+    assert producer._prefetch_limit == 4  # alone: up to the configured prefetch
+    for index in range(2):
+        beat = {"heartbeat": time.time(), "started_at": time.time(), "pid": 0, "concurrency": 1, "held": 0}
+        client.hset(f"{config.queue_name}:workers", f"other-{index}", json.dumps(beat))
+    producer._beat()
+    assert producer._prefetch_limit == 2  # six jobs over three workers
+
+
+def test_cancellation_through_the_broker(queues):
+    client, config = InMemoryRedis(), _config()
+    producer = queues(client, config, {"echo": lambda payload, context: payload}, run_workers=False)
+    job = producer.submit("echo", {})
+    assert producer.cancel(job["job_id"])["status"] == "cancelled" and producer.queue_depth() == 0
+    with pytest.raises(ValueError):
+        producer.cancel(job["job_id"])
+    with pytest.raises(KeyError):
+        producer.status("missing")
+
+
+def test_application_uses_the_broker_queue(wait_for_job, app_config):
+    config = app_config(jobs=_config(broker_url=f"memory://{uuid.uuid4().hex}"))
+    app = AdaptiveMindApplication(config)
+    try:
+        assert isinstance(app.jobs, RedisJobQueue)
+        job = app.submit_job("chat", {"messages": [{"role": "user", "content": "Hello"}]})
+        assert wait_for_job(app.jobs, job["job_id"])["result"]["content"]
+    finally:
+        app.shutdown()
+
+
+def test_job_throughput_scales_with_workers():
+    report = run_job_load(worker_counts=(1, 4), jobs_per_worker=10, job_ms=20.0)
+    single, four = report["runs"]
+    assert single["completed"] == 10 and four["completed"] == 40
+    assert four["efficiency"] > 0.7
@@ -0,0 +1,178 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+import os
+import sqlite3
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from adaptivemind_core.app import AdaptiveMindApplication
+from adaptivemind_core.config import JobsConfig
+from adaptivemind_core.jobs import JobQueue, QueueFullError
+from adaptivemind_core.monitoring.metrics import MetricsRegistry
+from adaptivemind_core.server import build_app
+
+
+@pytest.fixture
+def gated(tmp_path):
+    """A one-worker queue whose ``block`` jobs wait for ``release``."""
+    release, order = threading.Event(), []
+
+    def block(payload, context):
+        release.wait(5)
+        order.append(payload["name"])
+        return {"name": payload["name"]}
+
+    def steps(payload, context):
+        for step in range(payload["steps"]):
+            if context.cancelled:
+                break
+            context.progress(100.0 * (step + 1) / payload["steps"])
+            time.sleep(0.02)
+        return {"done": True}
+
+    metrics = MetricsRegistry()
+    jobs = JobQueue(
+        JobsConfig(path=tmp_path / "jobs.sqlite3", workers=1, max_queued=3),
+        metrics,
+        {"block": block, "steps": steps},
+    )
+    yield jobs, release, order, metrics
+    release.set()
+    jobs.shutdown()
+
+
+def test_jobs_run_by_priority_and_report_their_position(gated, wait_for_job):
+    jobs, release, order, metrics = gated
+    first = jobs.submit("block", {"name": "first"})
+    wait_for_job(jobs, first["job_id"], ("running",))
+    low = jobs.submit("block", {"name": "low"}, priority=9)
+    high = jobs.submit("block", {"name": "high"}, priority=0)
+    assert jobs.status(high["job_id"])["position"] == 0
+    low_status = jobs.status(low["job_id"])
+    assert low_status["position"] == 1 and low_status["estimated_start"] >= jobs.status(high["job_id"])["estimated_start"]
+
+    jobs.submit("block", {"name": "last"})
+    with pytest.raises(QueueFullError):
+        jobs.submit("block", {"name": "overflow"})
+    with pytest.raises(ValueError):
+        jobs.submit("agent", {})
+
+    release.set()
+    done = wait_for_job(jobs, low["job_id"])
+    assert done["status"] == "completed" and done["result"] == {"name": "low"} and done["progress"] == 100.0
+    assert order == ["first", "high", "last", "low"]
+    stats = jobs.stats()
+    assert stats["counters"]["submitted"] == 4 and stats["queue_wait_ms"]["p50"] > 0
+    assert metrics.histogram("queue").count >= 3
+
+
+def test_cancellation_of_queued_and_running_jobs(gated, wait_for_job):
+    jobs, release, _, _ = gated
+    running = jobs.submit("steps", {"steps": 200})
+    queued = jobs.submit("block", {"name": "never"})
+    wait_for_job(jobs, running["job_id"], ("running",))
+
+    assert jobs.cancel(queued["job_id"])["status"] == "cancelled"
+    jobs.cancel(running["job_id"])
+    stopped = wait_for_job(jobs, running["job_id"])
+    assert stopped["status"] == "cancelled" and stopped["result"] is None and 0 < stopped["progress"] < 100
+    with pytest.raises(ValueError):
+        jobs.cancel(running["job_id"])
+    with pytest.raises(KeyError):
+        jobs.cancel("missing")
+
+
+def test_persisted_jobs_resume_and_expire(tmp_path, wait_for_job):
+    path = tmp_path / "jobs.sqlite3"
+    release = threading.Event()
+    first = JobQueue(JobsConfig(path=path, workers=1), MetricsRegistry(), {"echo": lambda payload, context: release.wait(5) and payload})
+    interrupted = first.submit("echo", {"n": 1})
+    wait_for_job(first, interrupted["job_id"], ("running",))
+    waiting = first.submit("echo", {"n": 2})
+    first.shutdown(timeout=0.05)
+    # Pretend the process running the first job died
+    with sqlite3.connect(path) as connection:
+        connection.execute("UPDATE jobs SET owner = 0 WHERE id = ?", (interrupted["job_id"],))
+    release.set()
+
+    second = JobQueue(JobsConfig(path=path, workers=1, result_ttl_s=0.2), MetricsRegistry(), {"echo": lambda payload, context: payload})
+    try:
+        assert wait_for_job(second, interrupted["job_id"])["result"] == {"n": 1}
+        assert wait_for_job(second, waiting["job_id"])["result"] == {"n": 2}
+        time.sleep(0.25)
+        with pytest.raises(KeyError):
+            second.status(waiting["job_id"])
+        assert second.compact() == 2
+    finally:
+        second.shutdown()
+
+
+def test_jobs_left_running_under_a_reused_pid_resume(tmp_path, wait_for_job):
+    path = tmp_path / "jobs.sqlite3"
+    release = threading.Event()
+    first = JobQueue(JobsConfig(path=path, workers=1), MetricsRegistry(), {"echo": lambda payload, context: release.wait(5) and payload})
+    interrupted = first.submit("echo", {"n": 1})
+    wait_for_job(first, interrupted["job_id"], ("running",))
+    first.shutdown(timeout=0.05)
+    # A restarted container runs the new server under the old server's pid
+    with sqlite3.connect(path) as connection:
+        connection.execute("UPDATE jobs SET owner = ? WHERE id = ?", (os.getpid(), interrupted["job_id"]))
+    release.set()
+
+    second = JobQueue(JobsConfig(path=path, workers=1), MetricsRegistry(), {"echo": lambda payload, context: payload})
+    try:
+        assert wait_for_job(second, interrupted["job_id"])["result"] == {"n": 1}
+    finally:
+        second.shutdown()
+
+
+def test_application_jobs_and_callbacks(monkeypatch, tmp_path, wait_for_job, app_config):
+    delivered = []
+
+    class _Response:
+        status_code = 204
+
+    monkeypatch.setattr("httpx.post", lambda url, json, timeout: delivered.append((url, json)) or _Response())
+    app = AdaptiveMindApplication(app_config(jobs=JobsConfig(path=tmp_path / "jobs.sqlite3", workers=1)))
+    try:
+        workflow = app.submit_job(
+            "workflow",
+            {"steps": [{"prompt": "Outline the plan."}, {"prompt": "Summarise it."}]},
+            callback_url="http://client.test/hook",
+        )
+        done = wait_for_job(app.jobs, workflow["job_id"])
+        assert done["status"] == "completed" and len(done["result"]["steps"]) == 2
+        deadline = time.monotonic() + 5
+        while app.job_status(workflow["job_id"])["callback_status"] is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert app.job_status(workflow["job_id"])["callback_status"] == "delivered"
+        assert delivered[0][0] == "http://client.test/hook" and delivered[0][1]["status"] == "completed"
+    finally:
+        app.shutdown()
+
+
+def test_job_api_round_trip(tmp_path, app_config):
+    with TestClient(build_app(config=app_config(jobs=JobsConfig(path=tmp_path / "jobs.sqlite3", workers=1)))) as client:
+        submitted = client.post("/api/v1/jobs", json={"mode": "chat", "payload": {"messages": [{"role": "user", "content": "Hello"}]}})
+        assert submitted.status_code == 200, submitted.text
+        job_id = submitted.json()["job_id"]
+        deadline = time.monotonic() + 5
+        while (status := client.get(f"/api/v1/jobs/{job_id}").json())["status"] != "completed" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert status["status"] == "completed" and status["result"]["content"]
+
+        assert client.delete(f"/api/v1/jobs/{job_id}").status_code == 409
+        assert client.get("/api/v1/jobs/missing").status_code == 404
+        assert client.post("/api/v1/jobs", json={"mode": "agent", "payload": {}}).status_code == 400
+        assert client.get("/api/v1/monitoring/jobs").json()["counters"]["completed"] == 1
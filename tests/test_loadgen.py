@@ -0,0 +1,119 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+import json
+import random
+
+import httpx
+import pytest
+
+from adaptivemind_core.llm.base import GenerationRequest
+from adaptivemind_core.llm.openrouter import OpenRouterBackend
+from benchmarks.loadgen import RequestSample, run_load, summarize_run
+from benchmarks.simulator import SimulatedModelServer, SimulationProfile, parse_latency
+
+FAST = dict(ttft_ms="fixed:5", tokens_per_s=0, output_tokens=(8, 8), chunk_tokens=2, seed=7)
+
+
+def _request(max_tokens=64):
+    return GenerationRequest(
+        messages=[{"role": "user", "content": "hello there"}], persona="generalist", context="ctx", max_tokens=max_tokens
+    )
+
+
+def test_parse_latency_specs():
+    generator = random.Random(1)
+    assert parse_latency("fixed:12")(generator) == 12
+    assert 20 <= parse_latency("uniform:20,30")(generator) <= 30
+    assert parse_latency("lognormal:50,0.5")(generator) > 0
+    assert parse_latency("exponential:10")(generator) >= 0
+    for spec in ("gamma:1", "fixed", "uniform:1", "fixed:x"):
+        with pytest.raises(ValueError):
+            parse_latency(spec)
+
+
+def test_simulator_speaks_ollama_ndjson():
+    # ``requests`` is stubbed for the test session, so the wire format is checked with httpx
+    with SimulatedModelServer(SimulationProfile(**FAST)) as simulator:
+        assert httpx.get(f"{simulator.url}/api/tags").json()["models"][0]["name"] == "simulated"
+        assert httpx.get(f"{simulator.url}/offline/api/tags").status_code == 404
+        body = {"model": "simulated", "prompt": "ctx", "stream": True, "options": {"num_predict": 64}}
+        with httpx.stream("POST", f"{simulator.url}/api/generate", json=body) as response:
+            lines = [json.loads(line) for line in response.iter_lines() if line]
+        assert len(lines) == 5 and lines[-1]["done"] and lines[-1]["eval_count"] == 8
+        assert len("".join(line["response"] for line in lines).split()) == 8
+        body.update(stream=False, options={"num_predict": 3})
+        assert httpx.post(f"{simulator.url}/api/generate", json=body).json()["eval_count"] == 3
+        assert simulator.stats() == {"ollama.requests": 2}
+
+
+def test_openrouter_backend_streams_from_simulator():
+    with SimulatedModelServer(SimulationProfile(**FAST)) as simulator:
+        backend = OpenRouterBackend(api_key="key", model="simulated", base_url=f"{simulator.url}/v1")
+        chunks = list(backend.stream(_request()))
+        assert len(chunks) == 5 and chunks[-1].finished and chunks[-1].tokens == 8
+        assert len("".join(chunk.content for chunk in chunks).split()) == 8
+        assert backend.generate(_request()).content
+        assert simulator.stats() == {"openai.requests": 2}
+
+
+def test_simulator_injects_errors():
+    with SimulatedModelServer(SimulationProfile(**{**FAST, "error_rate": 1.0, "error_status": 503})) as simulator:
+        backend = OpenRouterBackend(api_key="key", model="simulated", base_url=f"{simulator.url}/v1")
+        with pytest.raises(httpx.HTTPStatusError):
+            list(backend.stream(_request()))
+        assert simulator.stats() == {"openai.errors": 1, "openai.requests": 1}
+
+
+def test_summarize_run_counts_errors_and_ttft():
+    samples = [
+        RequestSample(0.0, 0.100, 0.020, 200, tokens=10),
+        RequestSample(0.0, 0.200, 0.040, 200, tokens=10),
+        RequestSample(0.0, 0.050, None, 500),
+        RequestSample(0.0, 0.300, 0.010, 200, error="Chat request failed"),
+    ]
+    summary = summarize_run(samples, elapsed_s=2.0)
+    assert summary["requests"] == 4 and summary["succeeded"] == 2
+    assert summary["error_rate"] == 0.5
+    assert summary["throughput_rps"] == 1.0 and summary["tokens_per_s"] == 10.0
+    assert summary["ttft_ms"]["max"] == 40.0 and summary["latency_ms"]["max"] == 200.0
+    assert summary["outcomes"] == {"200": 2, "500": 1, "Chat request failed": 1}
+
+
+@pytest.mark.parametrize("mode,levels", [("closed", [2]), ("open", [20.0])])
+def test_run_load_against_in_process_app(mode, levels):
+    report = run_load(
+        mode=mode, levels=levels, duration_s=0.5, profile=SimulationProfile(**FAST), backend="openrouter", max_tokens=32
+    )
+    assert report["version"] == 1 and report["mode"] == mode and report["target"] == "in-process"
+    (run,) = report["runs"]
+    assert run["requests"] > 0 and run["error_rate"] == 0.0
+    assert run["ttft_ms"]["p50"] > 0 and run["latency_ms"]["p99"] >= run["latency_ms"]["p50"]
+    assert report["simulator"]["counts"]["openai.requests"] >= run["requests"]
+
+
+def test_run_load_reports_backend_errors():
+    profile = SimulationProfile(**{**FAST, "error_rate": 1.0})
+    report = run_load(levels=[1], duration_s=0.3, profile=profile, backend="openrouter")
+    (run,) = report["runs"]
+    assert run["requests"] > 0 and run["error_rate"] == 1.0
+    assert run["ttft_ms"] is None
+
+
+def test_chat_stream_falls_back_to_a_single_chunk(app_config):
+    from fastapi.testclient import TestClient
+
+    from adaptivemind_core import build_app
+
+    with TestClient(build_app(app_config())) as client:
+        response = client.post("/api/v1/chat/stream", json={"messages": [{"role": "user", "content": "Hello"}]})
+    lines = [json.loads(line) for line in response.text.splitlines() if line]
+    assert response.status_code == 200 and len(lines) == 1
+    assert lines[0]["finished"] and lines[0]["model"] == "contextual-fallback" and lines[0]["content"]
@@ -0,0 +1,104 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+import io
+import json
+import logging
+import sys
+import threading
+from logging.handlers import QueueListener
+
+from adaptivemind_core.logger import (
+    BoundedQueueHandler,
+    JsonFormatter,
+    LogRule,
+    LogSamplingFilter,
+    parse_sampling_rules,
+)
+
+
+def _record(name: str = "adaptivemind_core.routing.engine", level: int = logging.INFO, **extra) -> logging.LogRecord:
+    record = logging.LogRecord(name, level, __file__, 1, "generated %s tokens", (12,), None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_formatter_emits_extras_and_prerendered_exceptions():
+    handler = BoundedQueueHandler(maxsize=4)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = _record(persona="analyst", latency_ms=1.5)
+        record.exc_info = sys.exc_info()
+    prepared = handler.prepare(record)
+    assert prepared.exc_info is None and prepared.args is None
+
+    data = json.loads(JsonFormatter().format(prepared))
+    assert data["message"] == "generated 12 tokens"
+    assert data["persona"] == "analyst" and data["latency_ms"] == 1.5
+    assert "ValueError: boom" in data["exc_info"]
+    assert "args" not in data and "msecs" not in data
+
+
+def test_queue_drops_when_full_and_listener_writes_off_thread():
+    handler = BoundedQueueHandler(maxsize=3, overflow="drop")
+    for _ in range(5):
+        handler.handle(_record())
+    assert handler.dropped == 2 and handler.depth == 3
+
+    stream = io.StringIO()
+    sink = logging.StreamHandler(stream)
+    sink.setFormatter(JsonFormatter())
+    threads = []
+    original_emit = sink.emit
+
+    def _emit(record):
+        threads.append(threading.current_thread())
+        original_emit(record)
+
+    sink.emit = _emit
+    listener = QueueListener(handler.queue, sink)
+    listener.start()
+    listener.stop()
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 3 and json.loads(lines[0])["logger"] == "adaptivemind_core.routing.engine"
+    assert all(thread is not threading.main_thread() for thread in threads)
+
+
+def test_block_policy_waits_then_counts_drop():
+    handler = BoundedQueueHandler(maxsize=1, overflow="block", block_timeout=0.01)
+    handler.handle(_record())
+    handler.handle(_record())
+    assert handler.dropped == 1
+
+
+def test_sampling_and_rate_limit_apply_to_logger_subtree_only():
+    sampling = LogSamplingFilter(
+        {
+            "adaptivemind_core.routing": LogRule(max_per_second=0.001, burst=5),
+            "adaptivemind_core.context": LogRule(sample_rate=0.0),
+        }
+    )
+    routed = [sampling.filter(_record()) for _ in range(20)]
+    assert routed.count(True) == 5 and sampling.rate_limited == 15
+
+    assert not sampling.filter(_record("adaptivemind_core.context.engine"))
+    assert sampling.sampled_out == 1
+    assert sampling.filter(_record("adaptivemind_core.context.engine", level=logging.WARNING))
+    assert sampling.filter(_record("adaptivemind_core.app"))
+
+    sampling.set_rule("adaptivemind_core.context", None)
+    assert sampling.filter(_record("adaptivemind_core.context.engine"))
+
+
+def test_parse_sampling_rules():
+    rules = parse_sampling_rules("adaptivemind_core.routing=0.1/50, adaptivemind_core.context=0.5")
+    assert rules["adaptivemind_core.routing"] == LogRule(sample_rate=0.1, max_per_second=50.0)
+    assert rules["adaptivemind_core.context"].max_per_second is None
@@ -0,0 +1,108 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+import gc
+
+import pytest
+from fastapi.testclient import TestClient
+
+from adaptivemind_core.config import MemoryConfig, MonitoringConfig
+from adaptivemind_core.monitoring.memory import BufferRegistry, MemoryDiagnostics
+from adaptivemind_core.server import build_app
+
+
+class _Holder:
+    def __init__(self, size: int):
+        self.items = list(range(size))
+
+
+def test_buffer_registry_aggregates_live_owners_only():
+    registry = BufferRegistry()
+    first, second = _Holder(3), _Holder(5)
+    registry.register("holder.items", first, lambda holder: holder.items)
+    registry.register("holder.items", second, lambda holder: holder.items)
+    registry.register("holder.count", first, lambda holder: 42)
+
+    sizes = registry.sizes()
+    assert sizes["holder.items"]["instances"] == 2 and sizes["holder.items"]["items"] == 8
+    assert sizes["holder.items"]["shallow_bytes"] > 0
+    assert sizes["holder.count"] == {"instances": 1, "items": 42, "shallow_bytes": 0}
+    assert list(sizes)[0] == "holder.count"  # largest first
+
+    del second
+    gc.collect()
+    remaining = registry.sizes()["holder.items"]
+    assert remaining["instances"] == 1 and remaining["items"] == 3
+
+
+def test_snapshot_diff_points_at_growing_site():
+    diagnostics = MemoryDiagnostics(MemoryConfig(max_snapshots=2))
+    diagnostics.start()
+    try:
+        base = diagnostics.take_snapshot("before")
+        retained = [bytearray(1024) for _ in range(2000)]
+        after = diagnostics.take_snapshot("after")
+        growth = diagnostics.diff(base["id"], after["id"], limit=5)
+        assert growth[0]["size_diff_bytes"] > 1_000_000
+        assert __file__ in growth[0]["site"]
+        assert diagnostics.top(after["id"], limit=3)[0]["size_bytes"] >= growth[0]["size_diff_bytes"]
+
+        diagnostics.take_snapshot("third")
+        assert [item["id"] for item in diagnostics.list_snapshots()] == [after["id"], after["id"] + 1]
+        with pytest.raises(ValueError):
+            diagnostics.diff(base["id"])
+        del retained
+    finally:
+        diagnostics.stop()
+    with pytest.raises(RuntimeError):
+        diagnostics.take_snapshot()
+
+
+def test_request_accounting_only_when_enabled():
+    assert MemoryDiagnostics().begin_request() is None
+    diagnostics = MemoryDiagnostics(MemoryConfig(request_accounting=True))
+    diagnostics.start()
+    try:
+        started = diagnostics.begin_request()
+        kept = bytearray(500_000)
+        extra = diagnostics.end_request(started)
+        assert int(extra["mem.process_traced_delta_bytes"]) >= 500_000 and extra["mem.overlapped"] == "false"
+        del kept
+
+        # Another request starting or running meanwhile makes both figures unattributable
+        first = diagnostics.begin_request()
+        second = diagnostics.begin_request()
+        assert diagnostics.end_request(second)["mem.overlapped"] == "true"
+        assert diagnostics.end_request(first)["mem.overlapped"] == "true"
+        assert diagnostics.end_request(diagnostics.begin_request())["mem.overlapped"] == "false"
+    finally:
+        diagnostics.stop()
+
+
+def test_memory_endpoints_and_request_traces(app_config):
+    config = app_config(monitoring=MonitoringConfig(enable_metrics_harvest=False, memory=MemoryConfig(request_accounting=True)))
+    with TestClient(build_app(config)) as client:
+        buffers = client.get("/api/v1/management/memory/buffers").json()["buffers"]
+        assert {"traces.records", "sessions", "metrics.histograms", "tracing.kept_traces"} <= set(buffers)
+
+        assert client.post("/api/v1/management/memory/snapshots", json={}).status_code == 409
+        assert client.post("/api/v1/management/memory/tracemalloc/start", json={"frames": 2}).json()["tracing"]
+        try:
+            base = client.post("/api/v1/management/memory/snapshots", json={"label": "base"}).json()
+            response = client.post("/api/v1/chat", json={"messages": [{"role": "user", "content": "hello"}]})
+            assert response.status_code == 200
+            diff = client.get("/api/v1/management/memory/diff", params={"base": base["id"], "limit": 5})
+            assert diff.status_code == 200 and diff.json()["sites"]
+            assert client.get("/api/v1/management/memory/diff", params={"base": 999}).status_code == 404
+
+            trace = client.get("/api/v1/monitoring/traces").json()["traces"][-1]
+            assert "mem.process_traced_delta_bytes" in trace["extra"]
+        finally:
+            assert client.post("/api/v1/management/memory/tracemalloc/stop").json()["tracing"] is False
@@ -0,0 +1,58 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+from fastapi.testclient import TestClient
+
+from adaptivemind_core import build_app
+from adaptivemind_core.monitoring.exposition import render_openmetrics
+from adaptivemind_core.monitoring.metrics import MetricsRegistry
+
+
+def test_render_counters_gauges_and_histograms():
+    registry = MetricsRegistry()
+    registry.record_request("generalist", 120.0, 10, 30, backend="ollama", phases={"context_build": 2.0})
+    registry.record_request("generalist", 800.0, 5, 30, backend="ollama")
+    registry.set_gauge("backend_available", 1, backend="ollama")
+    registry.request_started()
+
+    text = render_openmetrics(registry, [("queue_depth", "Queued work.", {"queue": "compaction"}, 3)])
+    lines = text.splitlines()
+    assert lines[-1] == "# EOF"
+    assert 'adaptivemind_requests_total{persona="generalist",backend="ollama"} 2' in lines
+    assert 'adaptivemind_generated_tokens_total{persona="generalist",backend="ollama"} 15' in lines
+    assert "adaptivemind_requests_in_flight 1" in lines
+    assert 'adaptivemind_backend_available{backend="ollama"} 1' in lines
+    assert 'adaptivemind_queue_depth{queue="compaction"} 3' in lines
+    assert 'adaptivemind_latency_seconds_bucket{phase="total",le="0.25"} 1' in lines
+    assert 'adaptivemind_latency_seconds_bucket{phase="total",le="+Inf"} 2' in lines
+    assert 'adaptivemind_persona_latency_seconds_count{phase="total",persona="generalist"} 2' in lines
+    assert 'adaptivemind_backend_latency_seconds_count{phase="total",backend="ollama"} 2' in lines
+    # Each family holds every observation once
+    assert sum(line.startswith("adaptivemind_latency_seconds_count{") for line in lines) == 2  # total, context_build
+    assert "# TYPE adaptivemind_persona_latency_seconds histogram" in lines
+
+    registry.harvest()
+    assert 'adaptivemind_latency_seconds_count{phase="total"} 2' in render_openmetrics(registry).splitlines()
+
+
+def test_metrics_endpoint_serves_openmetrics(app_config):
+    with TestClient(build_app(app_config())) as client:
+        client.post("/api/v1/chat", json={"messages": [{"role": "user", "content": "Hello"}]})
+        client.get("/health")
+        response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/openmetrics-text")
+    body = response.text
+    assert 'adaptivemind_requests_total{persona="generalist",backend="contextual-fallback"} 1' in body
+    assert 'adaptivemind_backend_available{backend="contextual-fallback"} 1' in body
+    assert 'adaptivemind_cache_hit_ratio{cache="summary"}' in body
+    assert "# TYPE adaptivemind_log_records_discarded counter" in body
+    assert 'adaptivemind_log_records_discarded_total{reason="dropped"}' in body
+    assert body.endswith("# EOF\n")
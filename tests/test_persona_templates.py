@@ -0,0 +1,103 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+import dataclasses
+
+import pytest
+
+from adaptivemind_core.app import AdaptiveMindApplication
+from adaptivemind_core.config import AppConfig, MonitoringConfig, PersonaConfig
+from adaptivemind_core.context.templates import compile_persona
+from adaptivemind_core.llm.base import GenerationRequest
+from adaptivemind_core.llm.openrouter import OpenRouterBackend
+
+
+def _persona(prompt: str = "Stay factual.") -> PersonaConfig:
+    return PersonaConfig(name="generalist", description="", system_prompt=prompt, max_context_window=512)
+
+
+def test_compiled_persona_is_immutable_and_hash_tracks_content():
+    template = compile_persona(_persona())
+    assert template.prefix == "## Persona\nStay factual."
+    assert template.prompt_tokens == 2
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        template.prompt_tokens = 3
+    assert compile_persona(_persona()) == template
+    assert compile_persona(_persona()).content_hash == template.content_hash
+    assert compile_persona(_persona("Be terse.")).content_hash != template.content_hash
+    widened = PersonaConfig(name="generalist", description="Other", system_prompt="Stay factual.", max_context_window=2048)
+    assert compile_persona(widened).content_hash == template.content_hash
+    renamed = PersonaConfig(name="analyst", description="", system_prompt="Stay factual.", max_context_window=512)
+    assert compile_persona(renamed).content_hash != template.content_hash
+    assert template.section().render() is template.prefix
+
+
+def test_templates_compile_on_load_and_on_persona_mutation():
+    config = AppConfig(
+        personas={"generalist": _persona()},
+        allowed_personas=["generalist"],
+        monitoring=MonitoringConfig(enable_metrics_harvest=False),
+    )
+    app = AdaptiveMindApplication(config)
+    templates = app.context_engine.templates
+    original = templates.get(config.personas["generalist"])
+    assert templates.stats()["compilations"] == 1
+
+    app.update_persona("generalist", {"system_prompt": "Answer in one sentence."})
+    updated = templates.get(config.personas["generalist"])
+    assert updated.prefix == "## Persona\nAnswer in one sentence." != original.prefix
+    assert updated.content_hash != original.content_hash
+    assert templates.stats()["compilations"] == 2
+
+    assert app.chat("generalist", [{"role": "user", "content": "Hello"}])
+    context = app.context_engine.build_context(persona=config.personas["generalist"], messages=[{"role": "user", "content": "Hi"}])
+    assert context.startswith(updated.prefix)
+    assert templates.stats()["compilations"] == 2
+
+    app.create_persona({"name": "analyst", "description": "", "system_prompt": "Show your work.", "max_context_window": 512})
+    assert templates.stats()["templates"] == 2
+    app.delete_persona("analyst")
+    assert templates.stats()["templates"] == 1
+    app.shutdown()
+
+
+def test_openrouter_uses_compiled_system_header(monkeypatch):
+    captured = {}
+
+    class _Response:
+        status_code = 200
+
+        def raise_for_status(self):
+            return None
+
+        def json(self):
+            return {"choices": [{"message": {"content": "ok"}}], "usage": {"total_tokens": 3}}
+
+    class _Client:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def post(self, url, headers=None, json=None):
+            captured["payload"] = json
+            return _Response()
+
+    monkeypatch.setattr("adaptivemind_core.llm.openrouter.httpx.Client", _Client)
+    template = compile_persona(_persona())
+    backend = OpenRouterBackend(api_key="key")
+    request = GenerationRequest(messages=[], persona="generalist", context="## Persona\nStay factual.", template=template)
+    backend.generate(request)
+    system = captured["payload"]["messages"][0]["content"]
+    assert system == template.system_header + request.context
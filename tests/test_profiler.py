@@ -0,0 +1,100 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+import threading
+import time
+
+from fastapi.testclient import TestClient
+
+from adaptivemind_core.config import AppConfig, ProfilerConfig
+from adaptivemind_core.monitoring.profiler import StackSampler
+from adaptivemind_core.server import build_app
+
+
+def _spin_until(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(2000))
+
+
+def _busy_thread(name: str, stop: threading.Event) -> threading.Thread:
+    thread = threading.Thread(target=_spin_until, args=(stop,), name=name, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_samples_are_collapsed_per_thread_and_filterable():
+    stop = threading.Event()
+    workers = [_busy_thread("request-worker-1", stop), _busy_thread("metrics-harvester", stop)]
+    sampler = StackSampler(ProfilerConfig())
+    try:
+        sampler.start(hz=200, duration_s=5)
+        time.sleep(0.3)
+        status = sampler.stop()
+    finally:
+        stop.set()
+        for worker in workers:
+            worker.join()
+
+    assert not status["running"] and status["samples"] > 10
+    lines = sampler.collapsed().splitlines()
+    assert any(line.startswith("request-worker-1;") and "_spin_until" in line for line in lines)
+    assert not any(line.startswith("stack-sampler;") for line in lines)
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) > 0 and ";" in stack
+
+    only_requests = sampler.collapsed(threads=["request-worker-*"]).splitlines()
+    assert only_requests and all(line.startswith("request-worker-1;") for line in only_requests)
+    assert sampler.top(threads=["request-worker-*"])[0]["frame"].startswith("_spin_until")
+
+
+def test_session_filter_and_duration_limit():
+    stop = threading.Event()
+    workers = [_busy_thread("request-worker-1", stop), _busy_thread("metrics-harvester", stop)]
+    sampler = StackSampler(ProfilerConfig(max_duration_s=0.2))
+    try:
+        sampler.start(hz=100, duration_s=60, threads=["metrics-*"])
+        time.sleep(0.5)
+        status = sampler.status()
+    finally:
+        stop.set()
+        for worker in workers:
+            worker.join()
+    assert not status["running"]  # capped by max_duration_s
+    assert status["duration_s"] == 0.2
+    assert all(line.startswith("metrics-harvester;") for line in sampler.collapsed().splitlines())
+
+
+def test_overhead_at_100hz_stays_small():
+    sampler = StackSampler()
+    sampler.start(hz=100, duration_s=5)
+    time.sleep(0.5)
+    status = sampler.stop()
+    assert status["overhead"] < 0.05
+
+
+def test_profiler_endpoints():
+    config = AppConfig()
+    config.monitoring.enable_metrics_harvest = False
+    with TestClient(build_app(config)) as client:
+        started = client.post("/api/v1/management/profiler/start", json={"hz": 50, "duration_s": 10})
+        assert started.status_code == 200 and started.json()["running"]
+        assert client.post("/api/v1/management/profiler/start", json={}).status_code == 409
+        time.sleep(0.1)
+        assert client.post("/api/v1/management/profiler/stop").json()["running"] is False
+
+        collapsed = client.get("/api/v1/management/profiler/profile")
+        assert collapsed.headers["content-type"].startswith("text/plain")
+        assert collapsed.text.strip()
+        report = client.get("/api/v1/management/profiler/profile", params={"format": "json", "top": 5}).json()
+        assert report["status"]["samples"] > 0 and len(report["top"]) <= 5
+
+    config.monitoring.profiler.enabled = False
+    with TestClient(build_app(config)) as client:
+        assert client.post("/api/v1/management/profiler/start", json={}).status_code == 403
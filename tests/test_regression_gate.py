@@ -0,0 +1,114 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+import json
+import random
+
+import pytest
+
+from benchmarks.__main__ import main
+from benchmarks.regression import (
+    BaselineStore,
+    Metric,
+    bootstrap_ratio_ci,
+    compare_metric,
+    extract_metrics,
+    mann_whitney_u,
+)
+
+
+def _noisy(center, count, seed, spread=0.02):
+    generator = random.Random(seed)
+    return [center * (1 + generator.uniform(-spread, spread)) for _ in range(count)]
+
+
+def _micro(samples_by_case, commit="abc"):
+    return {
+        "version": 1,
+        "meta": {"commit": commit},
+        "benchmarks": {
+            name: {"params": {}, "unit": "seconds", "number": 1, "samples": samples, "stats": {"median": sorted(samples)[len(samples) // 2]}}
+            for name, samples in samples_by_case.items()
+        },
+    }
+
+
+def test_mann_whitney_exact_and_approximate():
+    _, p_value = mann_whitney_u(list(range(7)), list(range(10, 17)))
+    assert p_value == pytest.approx(2 / 3432)  # fully separated 7 vs 7: 2 / C(14, 7)
+    _, p_value = mann_whitney_u([1.0, 2.0, 3.0, 4.0, 5.0], [1.5, 2.5, 3.5, 4.5, 5.5])
+    assert p_value > 0.5
+    tied = [1, 1, 2, 2, 3, 3, 4] * 3
+    _, p_value = mann_whitney_u(tied, [value + 1 for value in tied])
+    assert p_value < 0.01
+    with pytest.raises(ValueError):
+        mann_whitney_u([], [1.0])
+
+
+def test_bootstrap_interval_brackets_the_true_ratio():
+    low, high = bootstrap_ratio_ci(_noisy(1.0, 30, 1), _noisy(1.3, 30, 2))
+    assert low < 1.3 < high and low > 1.1
+
+
+def test_compare_metric_verdicts():
+    base = Metric(_noisy(1.0, 12, 1), "seconds")
+    assert compare_metric("slow", base, Metric(_noisy(1.2, 12, 2), "seconds")).verdict == "regressed"
+    assert compare_metric("fast", base, Metric(_noisy(0.8, 12, 3), "seconds")).verdict == "improved"
+    steady = compare_metric("steady", base, Metric(_noisy(1.0, 12, 4), "seconds"))
+    assert steady.verdict == "unchanged" and steady.method == "mann-whitney" and steady.ci_low < 1 < steady.ci_high
+    # Significant but smaller than the effect that matters
+    assert compare_metric("tiny", base, Metric(_noisy(1.03, 12, 5, spread=0.001), "seconds")).verdict == "unchanged"
+
+    throughput = compare_metric("rps", Metric([100.0], "rps", True), Metric([80.0], "rps", True))
+    assert throughput.method == "threshold" and throughput.verdict == "regressed"
+    errors = compare_metric("errors", Metric([0.0], "ratio", absolute=True), Metric([0.05], "ratio", absolute=True))
+    assert errors.method == "absolute" and errors.verdict == "regressed"
+
+
+def test_extract_metrics_from_load_report():
+    run = {
+        "level": 4,
+        "throughput_rps": 10.0,
+        "error_rate": 0.0,
+        "latency_ms": {"p50": 20.0},
+        "ttft_ms": {"p50": 5.0},
+        "samples": {"latency_ms": [19.0, 20.0, 21.0], "ttft_ms": [5.0, 5.0, 6.0]},
+    }
+    metrics = extract_metrics({"mode": "closed", "runs": [run]})
+    assert metrics["load:closed@4:latency_ms"].samples == [19.0, 20.0, 21.0]
+    assert metrics["load:closed@4:throughput_rps"].higher_is_better
+    assert set(metrics) == {f"load:closed@4:{name}" for name in ("latency_ms", "ttft_ms", "throughput_rps", "error_rate")}
+
+
+def test_store_pools_recordings_per_commit_and_machine(tmp_path):
+    store = BaselineStore(tmp_path, fingerprint="machine-a")
+    store.save("micro", "aaa", _micro({"case": [1.0, 1.1]}))
+    store.save("micro", "aaa", _micro({"case": [0.9]}))
+    store.save("micro", "bbb", _micro({"case": [2.0]}))
+    assert store.commits() == ["aaa", "bbb"]
+    assert sorted(store.metrics("aaa")["bench:case"].samples) == [0.9, 1.0, 1.1]
+    assert BaselineStore(tmp_path, fingerprint="machine-b").metrics("aaa") == {}
+    with pytest.raises(ValueError):
+        store.save("micro", "", _micro({}))
+
+
+def test_gate_reports_regressions_against_stored_baseline(tmp_path):
+    store = BaselineStore(tmp_path)
+    store.save("micro", "aaa", _micro({"parse": _noisy(1.0, 10, 1), "route": _noisy(1.0, 10, 2)}))
+    store.save("micro", "bbb", _micro({"parse": _noisy(1.5, 10, 3), "route": _noisy(1.0, 10, 4)}))
+    report_path = tmp_path / "report.json"
+
+    args = ["gate", "--store", str(tmp_path), "--suite", "micro", "--current", "bbb", "-o", str(report_path)]
+    assert main([*args, "--baseline", "aaa"]) == 1
+    report = json.loads(report_path.read_text())
+    assert report["regressions"] == ["bench:parse"] and report["summary"]["unchanged"] == 1
+    assert report["baseline"]["commit"] == "aaa" and report["current"]["commit"] == "bbb"
+    assert main(args) == 1  # the baseline defaults to the latest other recorded commit
+    assert main([*args, "--baseline", "missing"]) == 2
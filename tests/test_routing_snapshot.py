@@ -0,0 +1,92 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+import threading
+
+import pytest
+
+from adaptivemind_core.app import AdaptiveMindApplication
+
+
+def test_snapshot_is_immutable_and_republished_on_change(app_config):
+    app = AdaptiveMindApplication(app_config())
+    try:
+        before = app.router.snapshot
+        with pytest.raises(TypeError):
+            before.personas["other"] = before.personas["generalist"]  # type: ignore[index]
+
+        # Editing the live config is invisible to requests until the next publish
+        app.config.allowed_personas.clear()
+        assert app.router.snapshot is before and app.chat("generalist", [{"role": "user", "content": "hi"}])
+
+        app.update_routing_config({"allowed_personas": []})
+        after = app.router.snapshot
+        assert after.version == before.version + 1 and after.allowed == frozenset()
+        assert after.config_hash != before.config_hash
+        assert app.system_status()["config_hash"] == after.config_hash
+        with pytest.raises(ValueError, match="not enabled"):
+            after.resolve("generalist")
+
+        app.create_persona({"name": "coder", "description": "", "system_prompt": "Be terse.", "max_context_window": 1024})
+        snapshot = app.router.snapshot
+        assert snapshot.resolve("coder").max_context_window == 1024
+        assert snapshot.templates["coder"] is app.context_engine.templates.get(app.config.personas["coder"])
+        assert before.personas.keys() == {"generalist"}  # old snapshots are never modified
+    finally:
+        app.shutdown()
+
+
+def test_readers_never_see_a_half_applied_update(app_config):
+    app = AdaptiveMindApplication(app_config())
+    stop = threading.Event()
+    torn = []
+
+    def read():
+        while not stop.is_set():
+            snapshot = app.router.snapshot
+            persona = snapshot.personas["generalist"]
+            # The writer always changes the prompt and window together
+            if persona.max_context_window != 1000 + len(persona.system_prompt):
+                torn.append(snapshot.version)
+            if persona.system_prompt != "Stay factual." and snapshot.templates["generalist"].system_prompt != persona.system_prompt:
+                torn.append(snapshot.version)
+
+    app.update_persona("generalist", {"system_prompt": "x", "max_context_window": 1001})
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    try:
+        for index in range(200):
+            prompt = "y" * (index % 50 + 1)
+            app.update_persona("generalist", {"system_prompt": prompt, "max_context_window": 1000 + len(prompt)})
+    finally:
+        stop.set()
+        for reader in readers:
+            reader.join()
+        app.shutdown()
+    assert torn == []
+
+
+def test_rejected_update_changes_nothing(app_config):
+    app = AdaptiveMindApplication(app_config())
+    try:
+        before, persona = app.router.snapshot, app.config.personas["generalist"]
+        with pytest.raises(ValueError, match="no attribute"):
+            app.update_persona("generalist", {"system_prompt": "Be terse.", "temperature": 0.1})
+        with pytest.raises(ValueError):
+            app.update_persona("generalist", {"system_prompt": "Be terse.", "max_context_window": 10})
+        assert app.config.personas["generalist"] is persona and persona.system_prompt == "Stay factual."
+        assert app.router.snapshot is before
+
+        app.update_persona("generalist", {"system_prompt": "Be terse.", "max_context_window": 1024})
+        assert app.router.snapshot.resolve("generalist").max_context_window == 1024
+        assert before.personas["generalist"].system_prompt == "Stay factual."
+    finally:
+        app.shutdown()
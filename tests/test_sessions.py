@@ -0,0 +1,123 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+import pytest
+from fastapi.testclient import TestClient
+
+from adaptivemind_core import build_app
+from adaptivemind_core.app import AdaptiveMindApplication
+from adaptivemind_core.config import SessionConfig
+from adaptivemind_core.context.engine import ContextEngine
+from adaptivemind_core.context.sessions import SessionStore
+
+
+def _messages(count: int) -> list[dict]:
+    return [{"role": "user" if i % 2 == 0 else "assistant", "content": f"message number {i}"} for i in range(count)]
+
+
+def test_session_context_matches_stateless_build(app_config):
+    config = app_config(max_context_window=4096, sessions=SessionConfig(history_window=20))
+    engine = ContextEngine(config)
+    store = SessionStore(config.sessions)
+    session = store.create("generalist")
+    history = _messages(27)
+    for message in history:
+        store.append(session.session_id, message)
+    persona = config.personas["generalist"]
+    assert engine.build_context(persona, [], session=session) == engine.build_context(persona, history)
+    assert len(session.messages()) == 20
+    assert session.message_count == 27
+
+
+def test_session_store_evicts_lru_and_restores_spilled(tmp_path):
+    store = SessionStore(SessionConfig(max_sessions=2, spill_dir=tmp_path))
+    first = store.create("generalist", _messages(3))
+    second = store.create("generalist")
+    store.get(first.session_id)
+    third = store.create("generalist")
+
+    assert len(store) == 2
+    assert (tmp_path / f"{second.session_id}.json").exists()
+    restored = store.get(second.session_id)
+    assert restored is not None
+    assert store.stats()["restored"] == 1
+    assert (tmp_path / f"{first.session_id}.json").exists()
+    assert store.get(third.session_id) is not None
+
+
+def test_session_store_enforces_memory_budget():
+    store = SessionStore(SessionConfig(max_memory_bytes=1024))
+    session = store.create("generalist")
+    store.append(session.session_id, {"role": "user", "content": "x" * 2048})
+    assert store.get(session.session_id) is None
+    assert store.stats()["evictions"] == 1
+
+
+def test_session_api_round_trip(app_config):
+    app = build_app(config=app_config(max_context_window=4096))
+    with TestClient(app) as client:
+        created = client.post("/api/v1/sessions", json={"persona": "generalist"})
+        assert created.status_code == 200, created.text
+        session_id = created.json()["session_id"]
+
+        reply = client.post(f"/api/v1/sessions/{session_id}/messages", json={"message": {"role": "user", "content": "Hello"}})
+        assert reply.status_code == 200, reply.text
+        assert reply.json()["message_count"] == 2
+        assert reply.json()["session_expired"] is False
+        assert reply.json()["content"]
+
+        assert client.get(f"/api/v1/sessions/{session_id}").json()["message_count"] == 2
+        assert client.delete(f"/api/v1/sessions/{session_id}").status_code == 200
+        assert client.get(f"/api/v1/sessions/{session_id}").status_code == 404
+        assert client.post("/api/v1/sessions", json={"persona": "missing"}).status_code == 400
+
+
+def test_failed_generation_leaves_the_session_unchanged(app_config):
+    app = AdaptiveMindApplication(app_config(max_context_window=4096, sessions=SessionConfig(history_window=4)))
+    try:
+        session_id = app.create_session("generalist", _messages(4))["session_id"]
+        session = app.sessions.get(session_id)
+        before = (session.messages(), session.conversation_section(), app.sessions.stats()["approx_bytes"])
+        generate = app.router.generate
+
+        def fail(**kwargs):
+            raise RuntimeError("backend down")
+
+        app.router.generate = fail
+        with pytest.raises(RuntimeError):
+            app.session_chat(session_id, {"role": "user", "content": "Are you there?"})
+        assert session.message_count == 4
+        assert (session.messages(), session.conversation_section(), app.sessions.stats()["approx_bytes"]) == before
+
+        # The retry finds the history as it was, without an orphaned user turn
+        app.router.generate = generate
+        assert app.session_chat(session_id, {"role": "user", "content": "Are you there?"})["message_count"] == 6
+        assert [message["content"] for message in session.messages()].count("Are you there?") == 1
+    finally:
+        app.shutdown()
+
+
+def test_reply_survives_eviction_during_generation(app_config):
+    app = AdaptiveMindApplication(app_config(max_context_window=4096))
+    try:
+        session_id = app.create_session("generalist")["session_id"]
+        generate = app.router.generate
+
+        def evicting(**kwargs):
+            response = generate(**kwargs)
+            app.sessions.delete(session_id)
+            return response
+
+        app.router.generate = evicting
+        reply = app.session_chat(session_id, {"role": "user", "content": "Hello"})
+        assert reply["content"] and reply["session_expired"] is True
+        assert app.sessions.get(session_id) is None
+    finally:
+        app.shutdown()
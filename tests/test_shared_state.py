@@ -0,0 +1,145 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+import json
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from adaptivemind_core.app import AdaptiveMindApplication
+from adaptivemind_core.config import SharedStateConfig
+from adaptivemind_core.monitoring.metrics import MetricsRegistry, combine_states
+from adaptivemind_core.shared_state import RETIRED_WORKER, reset_shared_state
+
+
+@pytest.fixture
+def worker(app_config):
+    def start(path):
+        return AdaptiveMindApplication(app_config(shared_state=SharedStateConfig(path=path, publish_interval_s=60.0)))
+
+    return start
+
+
+@pytest.fixture
+def workers(tmp_path, worker):
+    path = tmp_path / "shared.sqlite3"
+    apps = [worker(path), worker(path)]
+    yield apps
+    for app in apps:
+        app.shutdown()
+    reset_shared_state(path)
+
+
+def test_config_changes_reach_every_worker(workers, tmp_path, worker):
+    first, second = workers
+    first.create_persona({"name": "coder", "description": "Writes code", "system_prompt": "Be terse.", "max_context_window": 1024})
+    assert "coder" in {persona["name"] for persona in second.personas()}
+    assert second.get_routing_config()["allowed_personas"] == ["generalist", "coder"]
+
+    second.update_persona("coder", {"max_context_window": 2048})
+    second.update_context_config({"max_combined_context_tokens": 1234})
+    assert first.get_context_config()["max_combined_context_tokens"] == 1234
+    assert first.config.personas["coder"].max_context_window == 2048
+
+    first.update_routing_config({"allowed_personas": ["coder"]})
+    second.delete_persona("generalist")
+    assert first.get_routing_config()["allowed_personas"] == ["coder"] and set(first.config.personas) == {"coder"}
+    with pytest.raises(ValueError):
+        first.create_persona({"name": "coder", "description": "", "system_prompt": "", "max_context_window": 512})
+
+    # A worker started later catches up before serving
+    late = worker(tmp_path / "shared.sqlite3")
+    try:
+        assert set(late.config.personas) == {"coder"}
+    finally:
+        late.shutdown()
+
+
+def test_concurrent_changes_from_different_workers_are_serialised(workers):
+    def create(app, prefix):
+        for index in range(5):
+            app.create_persona({"name": f"{prefix}{index}", "description": "", "system_prompt": "", "max_context_window": 512})
+
+    threads = [threading.Thread(target=create, args=(app, prefix)) for app, prefix in zip(workers, "ab")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    expected = {"generalist"} | {f"{prefix}{index}" for prefix in "ab" for index in range(5)}
+    for app in workers:
+        app.personas()
+        assert set(app.config.personas) == expected
+
+
+def test_metrics_and_traces_are_aggregated_across_workers(workers):
+    first, second = workers
+    messages = [{"role": "user", "content": "hello"}]
+    first.chat("generalist", messages)
+    second.chat("generalist", messages)
+    second.chat("generalist", messages)
+    assert [worker["current"] for worker in first.system_status()["workers"]] == [True, False]
+    second.list_backends()  # availability gauges
+    second.shared.publish_now()
+
+    text = first.openmetrics()
+    assert 'adaptivemind_requests_total{persona="generalist",backend="contextual-fallback"} 3' in text
+    assert 'adaptivemind_latency_seconds_count{phase="total"} 3' in text
+    assert 'adaptivemind_backend_available{backend="contextual-fallback",worker="%s"} 1' % second.shared.worker_id in text
+
+    traces = first.traces_latest(10)
+    assert len(traces) == 3 and traces[0]["timestamp"] <= traces[-1]["timestamp"]
+    page = first.query_traces(persona="generalist", limit=2)
+    assert len(page["traces"]) == 2 and page["next_cursor"] is not None
+    rest = first.query_traces(persona="generalist", limit=2, cursor=page["next_cursor"])
+    assert len(rest["traces"]) == 1 and rest["next_cursor"] is None
+
+
+def test_combined_gauges_are_labelled_by_worker():
+    registries = {"a": MetricsRegistry(), "b": MetricsRegistry()}
+    for worker, registry in registries.items():
+        registry.record_request(persona="p", latency_ms=10.0, generated_tokens=2, context_tokens=3, backend="x")
+        registry.set_gauge("degradation_level", 1.0 if worker == "a" else 0.0, persona="p")
+    state = combine_states({worker: registry.export_state() for worker, registry in registries.items()})
+    assert state["totals"] == {("p", "x"): [2, 4, 6]}
+    assert state["histograms"][("total", "all", "")].count == 2
+    assert state["gauges"][("degradation_level", (("persona", "p"), ("worker", "a")))] == 1.0
+
+
+def test_departed_workers_are_folded_into_one_retired_row(tmp_path, worker):
+    path = tmp_path / "shared.sqlite3"
+    live, stopped = worker(path), worker(path)
+    try:
+        messages = [{"role": "user", "content": "hello"}]
+        live.chat("generalist", messages)
+        stopped.chat("generalist", messages)
+        stopped.shutdown()
+
+        # A worker that crashed: silent for longer than stale_after_s and its process has exited
+        exited = subprocess.Popen([sys.executable, "-c", ""])
+        exited.wait()
+        registry = MetricsRegistry()
+        registry.record_request(persona="generalist", latency_ms=10.0, generated_tokens=2, context_tokens=3, backend="contextual-fallback")
+        with live.shared._publish_lock:
+            live.shared._publisher.execute(
+                "INSERT INTO workers (worker, pid, started_at, updated_at, metrics) VALUES ('crashed', ?, 0, 0, ?)",
+                (exited.pid, json.dumps(registry.export_state())),
+            )
+        live.shared.publish_now()
+
+        assert set(live.shared.worker_metrics()) == {live.shared.worker_id, RETIRED_WORKER}
+        assert [worker["worker"] for worker in live.system_status()["workers"]] == [live.shared.worker_id]
+        text = live.openmetrics()
+        assert 'adaptivemind_requests_total{persona="generalist",backend="contextual-fallback"} 3' in text
+        assert 'adaptivemind_latency_seconds_count{phase="total"} 3' in text
+    finally:
+        live.shutdown()
+        reset_shared_state(path)
@@ -0,0 +1,90 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+import sys
+import threading
+import types
+
+from adaptivemind_core.app import AdaptiveMindApplication
+from adaptivemind_core.config import AppConfig, MonitoringConfig
+from adaptivemind_core.llm.base import GenerationResponse
+from adaptivemind_core.llm.lazy import LazyBackend
+from adaptivemind_core.server import build_app
+from benchmarks.regression import extract_metrics
+from benchmarks.startup import measure_startup, probe, slowest_imports
+
+
+def _config():
+    return AppConfig(monitoring=MonitoringConfig(enable_metrics_harvest=False))
+
+
+def test_fresh_application_does_not_import_backend_clients():
+    sample = probe("app")
+    assert sample["loaded"] == []  # no fastapi, httpx, requests, onnxruntime or backend modules
+    assert sample["ready_ms"] >= sample["import_ms"] > 0 and sample["modules"] > 0
+
+
+def test_lazy_backend_builds_once_on_first_use():
+    built = []
+
+    class Backend:
+        name = "slow-import"
+
+        def __init__(self):
+            built.append(self)
+
+        def is_available(self):
+            return True
+
+        def generate(self, request):
+            return GenerationResponse(content="ok", tokens=1, backend=self.name)
+
+    lazy = LazyBackend("slow-import", Backend)
+    assert not lazy.loaded and lazy.name == "slow-import"
+    threads = [threading.Thread(target=lazy.is_available) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(built) == 1 and lazy.backend is built[0]
+
+    app = AdaptiveMindApplication(_config())
+    try:
+        assert not any(backend.loaded for backend in app.backends[:-1])
+        types_by_name = {backend["name"]: backend["type"] for backend in app.list_backends()}
+        assert types_by_name["openrouter"] == "openrouter" and types_by_name["windowsml"] == "windowsml"
+    finally:
+        app.shutdown()
+
+
+def test_build_app_honours_an_already_imported_legacy_module(monkeypatch):
+    constructed = []
+
+    class LegacyApplication(AdaptiveMindApplication):
+        def __init__(self, config=None):
+            constructed.append(config)
+            super().__init__(config)
+
+    monkeypatch.setitem(sys.modules, "jarvis_core.server", types.SimpleNamespace(AdaptiveMindApplication=LegacyApplication))
+    config = _config()
+    build_app(config)
+    assert constructed == [config]
+
+
+def test_startup_report_feeds_the_regression_gate():
+    report = measure_startup(repeat=1, targets=["app"])
+    app = report["targets"]["app"]
+    assert app["within_target"] == (app["ready_ms"]["p50"] <= report["target_ms"])
+    assert report["slowest_imports"] and report["slowest_imports"][0]["self_ms"] >= report["slowest_imports"][-1]["self_ms"]
+    metrics = extract_metrics(report)
+    assert set(metrics) == {f"startup:app:{name}" for name in ("import_ms", "construct_ms", "ready_ms", "modules")}
+
+    output = "import time: self [us] | cumulative | imported package\nimport time:       120 |        300 | json\n"
+    assert slowest_imports(output) == [{"module": "json", "self_ms": 0.12, "cumulative_ms": 0.3}]
@@ -0,0 +1,104 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+import json
+import uuid
+
+from adaptivemind_core.config import ArchiveConfig
+from adaptivemind_core.monitoring.archive import TraceArchive, iter_traces, list_segments, read_segment
+from adaptivemind_core.monitoring.cli import main, summarize
+from adaptivemind_core.monitoring.histogram import LatencyHistogram
+from adaptivemind_core.monitoring.metrics import MetricSnapshot
+from adaptivemind_core.monitoring.traces import TraceCollector, TraceRecord
+
+
+def _record(index: int, persona: str = "generalist", backend: str = "ollama") -> TraceRecord:
+    return TraceRecord(
+        trace_id=str(uuid.uuid4()),
+        span_id=uuid.uuid4().hex[:16],
+        persona=persona,
+        objective="chat",
+        latency_ms=float(10 + index % 50),
+        token_usage=20,
+        context_size=100,
+        timestamp=3_600.0 * 10 + index,
+        backend=backend,
+    )
+
+
+def _archive(tmp_path, **overrides) -> TraceArchive:
+    return TraceArchive(ArchiveConfig(directory=tmp_path, flush_interval_s=60, **overrides))
+
+
+def test_collector_sink_round_trips_through_segments(tmp_path):
+    archive = _archive(tmp_path)
+    collector = TraceCollector(max_records=10, sink=archive.append_trace)
+    for index in range(100):
+        collector.add(_record(index, persona="analyst" if index % 2 else "generalist"))
+    archive.append_snapshot(MetricSnapshot(100, 12.5, 59.0, 2000, 10000, {"analyst": 50}))
+    archive.close()
+
+    traces = list(iter_traces(tmp_path))
+    assert len(traces) == 100  # archive keeps what the in-memory ring evicted
+    assert traces[3].persona == "analyst" and traces[3].backend == "ollama"
+    assert traces[3].latency_ms == 13.0 and traces[3].token_usage == 20
+    snapshots = [item for segment in list_segments(tmp_path) for kind, item in read_segment(segment) if kind == "snapshot"]
+    assert snapshots[0]["personas_used"] == {"analyst": 50}
+    assert archive.stats()["traces"] == 100
+
+
+def test_rotation_prunes_old_segments_and_truncated_tail_is_tolerated(tmp_path):
+    archive = _archive(tmp_path, segment_bytes=4096, max_segments=3)
+    for batch in range(6):
+        for index in range(200):
+            archive.append_trace(_record(batch * 200 + index))
+        archive.flush()
+    archive.close()
+    segments = list_segments(tmp_path)
+    assert len(segments) == 3
+    # Every segment is self-describing, so the survivors decode on their own
+    assert all(sum(1 for _ in read_segment(path)) > 0 for path in segments)
+
+    last = segments[-1]
+    complete = sum(1 for _ in read_segment(last))
+    last.write_bytes(last.read_bytes()[:-5])
+    assert sum(1 for _ in read_segment(last)) == complete - 1
+
+
+def test_full_buffer_drops_instead_of_blocking(tmp_path):
+    archive = _archive(tmp_path, max_pending=5)
+    for index in range(8):
+        archive.append_trace(_record(index))
+    assert archive.stats()["dropped"] == 3
+    archive.close()
+    assert len(list(iter_traces(tmp_path))) == 5
+
+
+def test_cli_summary_buckets_by_persona(tmp_path, capsys):
+    archive = _archive(tmp_path)
+    for index in range(40):
+        archive.append_trace(_record(index, persona="analyst", backend="ollama" if index < 30 else "openrouter"))
+    archive.append_trace(_record(3_600, persona="analyst"))
+    archive.close()
+
+    rows = summarize(tmp_path, bucket_s=3600, persona="analyst")
+    assert [row["requests"] for row in rows] == [40, 1]
+    assert rows[0]["backend_mix"] == {"ollama": 0.75, "openrouter": 0.25}
+    dense = LatencyHistogram()
+    for index in range(40):
+        dense.record(_record(index).latency_ms)
+    assert rows[0]["latency_ms"] == {key: round(value, 3) for key, value in dense.percentiles().items()}
+    assert rows[0]["mean_latency_ms"] == round(dense.mean, 3)
+
+    assert main(["summary", str(tmp_path), "--json"]) == 0
+    assert json.loads(capsys.readouterr().out)[0]["persona"] == "analyst"
+    assert main(["segments", str(tmp_path)]) == 0
+    assert "traces" in capsys.readouterr().out
+    assert main(["summary", str(tmp_path / "missing")]) == 1
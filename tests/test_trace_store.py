@@ -0,0 +1,93 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+import tracemalloc
+import uuid
+
+from adaptivemind_core.monitoring.traces import TraceCollector, TraceRecord
+
+
+def _record(index: int, persona: str = "generalist", backend: str = "ollama") -> TraceRecord:
+    return TraceRecord(
+        trace_id=str(uuid.uuid4()),
+        span_id=uuid.uuid4().hex[:16],
+        persona=persona,
+        objective="chat",
+        latency_ms=float(index),
+        token_usage=index,
+        context_size=10,
+        timestamp=1_000.0 + index,
+        backend=backend,
+        extra={
+            "stage.persona.status": "ok",
+            "stage.persona.ms": "0.012",
+            "stage.conversation.status": "ok",
+            "stage.conversation.ms": "0.104",
+            "stage.research.status": "skipped",
+            "stage.documents.status": "skipped",
+            "stage.total.ms": "0.250",
+        },
+    )
+
+
+def test_round_trip_and_ring_overwrite():
+    collector = TraceCollector(max_records=10)
+    records = [_record(i) for i in range(25)]
+    for record in records:
+        collector.add(record)
+    assert len(collector) == 10
+    assert collector.latest(3) == records[-3:]
+    assert collector.query(limit=100).records == list(reversed(records[-10:]))
+
+
+def test_indexed_filters_and_pagination():
+    collector = TraceCollector(max_records=100)
+    for i in range(60):
+        collector.add(_record(i, persona="analyst" if i % 3 == 0 else "generalist", backend="openrouter" if i % 2 else "ollama"))
+
+    analyst = collector.filter_by_persona("analyst", limit=100)
+    assert [r.token_usage for r in analyst] == list(range(57, -1, -3))
+
+    page = collector.query(persona="analyst", backend="ollama", min_latency_ms=10, limit=3)
+    assert [r.token_usage for r in page.records] == [54, 48, 42]
+    following = collector.query(persona="analyst", backend="ollama", min_latency_ms=10, limit=3, cursor=page.next_cursor)
+    assert [r.token_usage for r in following.records] == [36, 30, 24]
+
+    window = collector.query(since=1_010.0, until=1_014.0, limit=100)
+    assert [r.token_usage for r in window.records] == [14, 13, 12, 11, 10]
+    assert collector.query(persona="missing").records == []
+
+
+def test_memory_per_trace_is_small():
+    records = [_record(i) for i in range(5000)]
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    collector = TraceCollector(max_records=5000)
+    for record in records:
+        collector.add(record)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    used = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    assert used / 5000 < 200
+
+
+def test_string_table_is_bounded_by_the_ring():
+    collector = TraceCollector(max_records=100)
+    for i in range(5000):
+        record = _record(i, persona=f"persona-{i % 7}", backend=f"backend-{i}")
+        record.objective = f"objective {uuid.uuid4()}"
+        record.extra["request"] = f"r{i}"
+        collector.add(record)
+    # Live rows hold at most one backend, objective and extra value each, plus shared keys
+    assert collector.stats()["interned_strings"] < 100 * 3 + 20
+    latest = collector.latest(1)[0]
+    assert latest.backend == "backend-4999" and latest.objective.startswith("objective ") and latest.extra["request"] == "r4999"
+    assert [r.token_usage for r in collector.query(backend="backend-4950").records] == [4950]
+    assert collector.query(backend="backend-10").records == [] and len(collector.filter_by_persona("persona-3", limit=100)) == 14
@@ -0,0 +1,121 @@
+# AdaptiveMind Framework
+# Copyright (c) 2025 Jimmy De Jesus
+# Licensed under CC-BY 4.0
+#
+# AdaptiveMind - Intelligent AI Routing & Context Engine
+# More info: https://github.com/[username]/adaptivemind
+# License: https://creativecommons.org/licenses/by/4.0/
+
+
+
+import asyncio
+import json
+import time
+
+from adaptivemind_core.app import AdaptiveMindApplication
+from adaptivemind_core.config import TracingConfig
+from adaptivemind_core.llm.base import GenerationChunk
+from adaptivemind_core.monitoring.tracing import OTLPFileExporter, Tracer, configure_tracing
+
+
+def test_generate_records_span_tree_and_exports_otlp(tmp_path, app_config):
+    export = tmp_path / "spans.jsonl"
+    app = AdaptiveMindApplication(app_config(tracing=TracingConfig(head_sample_rate=1.0, otlp_file=export)))
+    app.chat("generalist", [{"role": "user", "content": "Hello"}])
+    app.shutdown()
+
+    spans = {span["name"]: span for span in app.recent_spans()["traces"][0]}
+    root = spans["router.generate"]
+    assert root["parent_id"] is None
+    assert spans["context.build"]["parent_id"] == root["span_id"]
+    assert spans["context.stage.persona"]["parent_id"] == spans["context.build"]["span_id"]
+    assert spans["backend.contextual-fallback.generate"]["parent_id"] == root["span_id"]
+    assert app.traces.latest(1)[0].trace_id == root["trace_id"]
+
+    exported = json.loads(export.read_text().splitlines()[0])
+    otlp_spans = exported["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert {span["traceId"] for span in otlp_spans} == {root["trace_id"]}
+    assert all(len(span["spanId"]) == 16 for span in otlp_spans)
+
+
+def test_otlp_export_is_queued_off_the_request_path(tmp_path):
+    export = tmp_path / "spans.jsonl"
+    tracer = Tracer(TracingConfig(head_sample_rate=1.0))
+    exporter = tracer._exporter = OTLPFileExporter(export, max_pending=2, flush_interval_s=60)
+    for name in ("one", "two", "three"):
+        with tracer.span(name):
+            pass
+    # Nothing is written while the spans close; the third trace found the queue full
+    assert export.read_text() == ""
+    assert tracer.stats()["export_pending"] == 2 and tracer.stats()["export_dropped"] == 1
+    exporter.flush()
+    names = [json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["name"] for line in export.read_text().splitlines()]
+    assert names == ["one", "two"] and tracer.stats()["exported"] == 2
+    tracer.shutdown()
+
+
+def test_tail_sampling_keeps_only_slow_or_failed_traces():
+    tracer = Tracer(TracingConfig(head_sample_rate=0.0, tail_latency_ms=20.0))
+    with tracer.span("fast"):
+        pass
+    with tracer.span("slow"):
+        time.sleep(0.03)
+    try:
+        with tracer.span("failing"):
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    kept = [trace[0]["name"] for trace in tracer.recent()]
+    assert kept == ["failing", "slow"]
+    assert tracer.stats()["tail_kept"] == 2
+
+
+def test_stream_records_ttft_and_inter_token_latency(app_config):
+    app = AdaptiveMindApplication(app_config(tracing=TracingConfig(head_sample_rate=1.0)))
+
+    class _Streaming:
+        name = "streaming"
+
+        def is_available(self):
+            return True
+
+        def stream(self, request):
+            for index in range(5):
+                time.sleep(0.005)
+                yield GenerationChunk(content="x", tokens=index + 1, backend=self.name, finished=index == 4)
+
+    app.router.set_backends([_Streaming(), *app.router.backends])
+    chunks = list(app.stream_chat("generalist", [{"role": "user", "content": "Hello"}]))
+    assert len(chunks) == 5
+
+    spans = {span["name"]: span for span in app.recent_spans()["traces"][0]}
+    call = spans["backend.streaming.stream"]
+    assert call["parent_id"] == spans["router.stream"]["span_id"]
+    assert call["events"][0]["name"] == "first_token"
+    assert call["attributes"]["chunks"] == 5
+    assert call["attributes"]["inter_token_p50_ms"] >= 4
+    assert app.metrics.histogram("inter_token", backend="streaming").count == 4
+    assert app.metrics.histogram("ttft", persona="generalist").count == 1
+    app.shutdown()
+
+
+def test_orchestrator_child_spans_nest_under_caller():
+    from adaptivemind.orchestration.orchestrator import MultiAgentOrchestrator
+
+    tracer = configure_tracing(TracingConfig(head_sample_rate=1.0))
+
+    class _Child:
+        async def coordinate_specialists(self, request, **kwargs):
+            return {"response": request}
+
+    orchestrator = MultiAgentOrchestrator(mcp_client=None, specialists={})
+    orchestrator.child_orchestrators["security"] = _Child()
+
+    async def _run():
+        with tracer.span("request"):
+            await orchestrator.run_child_orchestrator("security", "audit this")
+
+    asyncio.run(_run())
+    spans = {span["name"]: span for span in tracer.recent()[0]}
+    assert spans["orchestrator.child"]["parent_id"] == spans["request"]["span_id"]
+    assert spans["orchestrator.child"]["attributes"]["child"] == "security"